@@ -0,0 +1,9 @@
+import sys
+from pathlib import Path
+
+# El motor ETL (`sync_pipeline`) es el mismo que usa la Lambda y vive en
+# lambda/sync_pipeline.py. En la imagen Docker se copia junto al paquete
+# (/app/sync_pipeline.py); en el repositorio se resuelve desde lambda/.
+_LAMBDA_DIR = Path(__file__).resolve().parent.parent / "lambda"
+if _LAMBDA_DIR.is_dir() and str(_LAMBDA_DIR) not in sys.path:
+    sys.path.append(str(_LAMBDA_DIR))
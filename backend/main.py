@@ -1,16 +1,60 @@
+import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-from backend.routers import health, launches, sync
+from backend.routers import events, health, launches, metrics, sync
+from backend.services.deadline import DeadlineExceeded, DeadlineMiddleware, request_deadline_ms
+from backend.services.event_stream import get_broadcaster, get_event_watcher
+from backend.services.health_monitor import get_health_monitor
+from backend.services.launch_cache import get_launch_cache
+from backend.services.launch_replica import get_replica
+from backend.services.metrics import MetricsMiddleware
+from backend.services.profiler import ProfilingMiddleware, profiling_enabled
 
 # ── Logging ───────────────────────────────────────────────────────────────────
 logging.basicConfig(
     level=os.environ.get("LOG_LEVEL", "INFO"),
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
 )
+logger = logging.getLogger(__name__)
+
+# ── Ciclo de vida ─────────────────────────────────────────────────────────────
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # El estado de DynamoDB se refresca en segundo plano; las sondas leen el caché.
+    # El primer chequeo es síncrono: abre la conexión antes de aceptar tráfico.
+    monitor = get_health_monitor()
+    monitor.refresh()
+    monitor.start()
+    # Réplica en memoria: se carga antes de aceptar tráfico y luego se
+    # refresca en segundo plano cuando cambia la generación de datos
+    replica = get_replica()
+    if replica is not None:
+        try:
+            replica.refresh()
+        except Exception as exc:
+            logger.warning("Réplica no disponible al arrancar, se usará DynamoDB: %s", exc)
+        replica.start()
+    # Canal SSE: el watcher de syncs publica desde su hilo en este event loop
+    get_broadcaster().attach(asyncio.get_running_loop())
+    # Caché de detalle: el watcher la invalida por ID con el historial de
+    # cada generación, venga la sync de este proceso, de otro o de la Lambda
+    cache = get_launch_cache()
+    if cache is not None:
+        get_event_watcher().add_listener(cache.refresh_after_sync)
+        get_event_watcher().start()
+    yield
+    get_broadcaster().close()
+    get_event_watcher().stop()
+    if replica is not None:
+        replica.stop()
+    monitor.stop()
+
 
 # ── App ───────────────────────────────────────────────────────────────────────
 app = FastAPI(
@@ -31,6 +75,7 @@ app = FastAPI(
     docs_url    = "/docs",    # Swagger UI
     redoc_url   = "/redoc",   # ReDoc
     openapi_url = "/openapi.json",
+    lifespan    = lifespan,
 )
 
 # ── CORS ──────────────────────────────────────────────────────────────────────
@@ -43,10 +88,30 @@ app.add_middleware(
     allow_headers     = ["*"],
 )
 
+# ── Métricas ──────────────────────────────────────────────────────────────────
+app.add_middleware(MetricsMiddleware)
+
+# ── Límite de tiempo por petición (REQUEST_DEADLINE_MS) ───────────────────────
+if request_deadline_ms() > 0:
+    app.add_middleware(DeadlineMiddleware)
+
+
+@app.exception_handler(DeadlineExceeded)
+async def deadline_exceeded(request: Request, exc: DeadlineExceeded) -> JSONResponse:
+    logger.warning("%s %s: %s", request.method, request.url.path, exc)
+    return JSONResponse(status_code=504, content={"detail": "Tiempo de respuesta agotado"})
+
+
+# ── Profiling bajo demanda (PROFILE_TOKEN / PROFILE_SAMPLE_RATE) ──────────────
+if profiling_enabled():
+    app.add_middleware(ProfilingMiddleware)
+
 # ── Routers ───────────────────────────────────────────────────────────────────
 app.include_router(health.router)
+app.include_router(metrics.router)
 app.include_router(launches.router, prefix="/api/v1")
 app.include_router(sync.router,     prefix="/api/v1")
+app.include_router(events.router,   prefix="/api/v1")
 
 
 # ── Root ──────────────────────────────────────────────────────────────────────
@@ -53,15 +53,44 @@ class LaunchStats(BaseModel):
     success_rate: float = Field(..., description="Tasa de éxito en porcentaje (0-100)")
 
 
+class LaunchChanges(BaseModel):
+    generation:  Optional[int] = Field(None, description="Generación de datos actual (`#sync-generation`)")
+    since:       int           = Field(..., description="Generación desde la que se pidieron los cambios")
+    full_reload: bool          = Field(False, description="True si el historial no cubre `since`: el cliente debe recargar la lista completa")
+    launches:    list[Launch]  = Field(default_factory=list, description="Lanzamientos insertados o actualizados desde `since`")
+
+
+class SyncTelemetry(BaseModel):
+    duration_ms:           float            = Field(..., description="Duración total de la sync (ms)")
+    phases_ms:             dict[str, float] = Field(default_factory=dict, description="Tiempo acumulado por fase: fetch, parse, map, diff, write (ms)")
+    container_peak_rss_mb: float            = Field(0.0, description="Memoria residente pico del proceso desde que arrancó (MB); en un contenedor reutilizado puede venir de una invocación anterior")
+    peak_traced_mb:        Optional[float]  = Field(None, description="Pico de memoria Python de esta sync según tracemalloc (MB), si está activado")
+    consumed_wcu:          float            = Field(0.0, description="WCU consumidas por las escrituras")
+    throttled:             int              = Field(0, description="Escrituras con throttling reintentadas")
+
+
 class SyncResponse(BaseModel):
     total_fetched: int        = Field(..., description="Total de registros obtenidos de la API SpaceX")
     inserted:      int        = Field(..., description="Registros nuevos insertados")
     updated:       int        = Field(..., description="Registros existentes actualizados")
+    unchanged:     int        = Field(0, description="Registros existentes sin cambios (no se reescriben)")
     errors:        int        = Field(..., description="Errores durante el proceso")
     launches:      list[dict] = Field(default_factory=list, description="Preview de los primeros 10 lanzamientos procesados")
+    coalesced:     bool       = Field(False, description="True si el resultado proviene de una sync ya en curso o reciente")
+    generation:    Optional[int] = Field(None, description="Generación de datos publicada por la sync (`#sync-generation`)")
+    complete:      bool       = Field(True, description="False si la Lambda agotó su tiempo y la sync continúa desde un checkpoint")
+    telemetry:     Optional[SyncTelemetry] = Field(None, description="Tiempos por fase, memoria pico y capacidad consumida")
 
 
 class HealthResponse(BaseModel):
-    status:   str = Field(..., description="Estado del servicio: ok | degraded")
-    dynamodb: str = Field(..., description="Estado de la conexión a DynamoDB: ok | error")
-    version:  str = Field("1.0.0", description="Versión de la API")
+    status:      str             = Field(..., description="Estado del servicio: ok | degraded")
+    dynamodb:    str             = Field(..., description="Estado de la conexión a DynamoDB: ok | error | unknown")
+    version:     str             = Field("1.0.0", description="Versión de la API")
+    checked_at:  Optional[str]   = Field(None, description="Fecha ISO-8601 del último chequeo de DynamoDB")
+    age_seconds: Optional[float] = Field(None, description="Segundos desde el último chequeo")
+    stale:       bool            = Field(False, description="True si el chequeo en segundo plano no se ha refrescado a tiempo")
+
+
+class LivenessResponse(BaseModel):
+    status:         str   = Field("ok", description="El proceso atiende peticiones")
+    uptime_seconds: float = Field(..., description="Segundos desde el arranque del proceso")
@@ -0,0 +1,37 @@
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import StreamingResponse
+
+from backend.services.event_stream import get_broadcaster, get_event_watcher
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["Events"])
+
+
+@router.get(
+    "/events",
+    response_class=StreamingResponse,
+    summary="Canal de eventos (Server-Sent Events)",
+    description=(
+        "Stream `text/event-stream` que notifica `sync` (nueva generación de datos con "
+        "sus conteos) y `launch_status` (un lanzamiento cambió de estado). Envía un "
+        "comentario `: ping` como heartbeat. Al reconectar, el navegador manda "
+        "`Last-Event-ID` y se reenvían los eventos perdidos; si ya no están en el buffer "
+        "se emite `reset` y el cliente debe pedir `/launches/changes`."
+    ),
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def events(
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    since: Optional[str] = Query(None, description="Último ID de evento recibido (alternativa a `Last-Event-ID`)"),
+) -> StreamingResponse:
+    # El sondeo de la generación arranca con el primer suscriptor del proceso
+    get_event_watcher().start()
+    return StreamingResponse(
+        get_broadcaster().stream(last_event_id or since),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
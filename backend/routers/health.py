@@ -1,32 +1,66 @@
 import logging
 import os
-import sys
+import time
+from datetime import datetime, timezone
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response, status
 
-from backend.models.launch import HealthResponse
-from backend.services.dynamo_service import DynamoService
+from backend.models.launch import HealthResponse, LivenessResponse
+from backend.services.health_monitor import HealthSnapshot, get_health_monitor
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Health"])
 
 
+def _health_response(snap: HealthSnapshot) -> HealthResponse:
+    ready = bool(snap.dynamo_ok) and not snap.stale
+    if snap.dynamo_ok is None:
+        dynamodb = "unknown"
+    else:
+        dynamodb = "ok" if snap.dynamo_ok else "error"
+    return HealthResponse(
+        status      = "ok" if ready else "degraded",
+        dynamodb    = dynamodb,
+        version     = os.environ.get("APP_VERSION", "1.0.0"),
+        checked_at  = (datetime.fromtimestamp(snap.checked_at, tz=timezone.utc).isoformat()
+                       if snap.checked_at is not None else None),
+        age_seconds = snap.age_seconds,
+        stale       = snap.stale,
+    )
+
+
 @router.get(
     "/health",
     response_model=HealthResponse,
     summary="Health check",
-    description="Verifica el estado del servicio y la conectividad con DynamoDB.",
+    description="Estado del servicio y de DynamoDB según el último chequeo en segundo plano. "
+                "Siempre responde 200, así que no sirve como sonda: el ALB usa `/health/ready` "
+                "(readiness) y el contenedor `/health/live` (liveness).",
 )
 def health_check() -> HealthResponse:
-    dynamo_ok = False
-    try:
-        dynamo_ok = DynamoService().ping()
-    except Exception as exc:
-        logger.warning("DynamoDB health check failed: %s", exc)
+    return _health_response(get_health_monitor().snapshot())
 
-    return HealthResponse(
-        status   = "ok" if dynamo_ok else "degraded",
-        dynamodb = "ok" if dynamo_ok else "error",
-        version  = os.environ.get("APP_VERSION", "1.0.0"),
-    )
+
+@router.get(
+    "/health/live",
+    response_model=LivenessResponse,
+    summary="Liveness",
+    description="Indica que el proceso responde. No consulta dependencias.",
+)
+def liveness() -> LivenessResponse:
+    return LivenessResponse(uptime_seconds=round(time.time() - get_health_monitor().started_at, 1))
+
+
+@router.get(
+    "/health/ready",
+    response_model=HealthResponse,
+    summary="Readiness",
+    description="200 si el último chequeo de DynamoDB fue correcto y está vigente; 503 si falló o está obsoleto.",
+    responses={503: {"description": "DynamoDB no disponible o chequeo obsoleto"}},
+)
+def readiness(response: Response) -> HealthResponse:
+    body = _health_response(get_health_monitor().snapshot())
+    if body.status != "ok":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return body
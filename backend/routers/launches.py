@@ -1,21 +1,50 @@
 import logging
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 
-from backend.models.launch import Launch, LaunchStats, LaunchStatus
-from backend.services.dynamo_service import DynamoService
+from backend.models.launch import Launch, LaunchChanges, LaunchStats, LaunchStatus
+from backend.services.deadline import DeadlineExceeded
+from backend.services.launch_service import open_launch_service
+from backend.services.launch_cache import get_launch_cache
+from backend.services.launch_replica import LaunchReplica, get_replica
+from backend.services.profiler import profiled, route_class
+from backend.services.read_coalescer import CoalescedReads, get_read_coalescer
+from backend.services.wire_format import (
+    COLUMNS_MEDIA_TYPE, ColumnsResponse, WireFormat, encode_columns, negotiate,
+)
+from sync_pipeline import VIEW_SIZE
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/launches", tags=["Launches"])
+# Con PROFILE_TOKEN / PROFILE_SAMPLE_RATE los endpoints y dependencias se
+# ejecutan bajo el perfil de la petición; sin ellos son las funciones originales
+router = APIRouter(prefix="/launches", tags=["Launches"], route_class=route_class())
+
+
+@profiled
+def get_dynamo() -> CoalescedReads | LaunchReplica:
+    # Con READ_REPLICA=true las lecturas salen de la copia en memoria del
+    # proceso; mientras no haya cargado se consulta DynamoDB directamente,
+    # con las consultas idénticas simultáneas coalescidas en una sola y el
+    # detalle por ID servido desde la caché LRU (LAUNCH_CACHE_SIZE > 0).
+    replica = get_replica()
+    if replica is not None and replica.ready:
+        return replica
+    return CoalescedReads(open_launch_service(), get_read_coalescer(), get_launch_cache())
+
+
+DynamoDep = Annotated[CoalescedReads | LaunchReplica, Depends(get_dynamo)]
 
 
-def get_dynamo() -> DynamoService:
-    return DynamoService()
+@profiled
+def get_changelog() -> CoalescedReads:
+    # El historial se lee siempre de DynamoDB (unos pocos GetItem); la réplica
+    # puede ir por detrás de la generación publicada.
+    return CoalescedReads(open_launch_service(), get_read_coalescer())
 
 
-DynamoDep = Annotated[DynamoService, Depends(get_dynamo)]
+ChangelogDep = Annotated[CoalescedReads, Depends(get_changelog)]
 
 
 @router.get(
@@ -23,13 +52,19 @@ DynamoDep = Annotated[DynamoService, Depends(get_dynamo)]
     response_model=list[Launch],
     summary="Listar todos los lanzamientos",
     description="Retorna todos los lanzamientos almacenados en DynamoDB. "
-                "Soporta filtrado opcional por estado.",
+                "Soporta filtrado opcional por estado. Con `format=columns` o "
+                f"`Accept: {COLUMNS_MEDIA_TYPE}` la lista va por columnas, con "
+                "estado, cohete y plataforma codificados por diccionario.",
+    responses={200: {"content": {COLUMNS_MEDIA_TYPE: {}}}},
 )
 def list_launches(
     dynamo: DynamoDep,
+    response: Response,
     status: Optional[LaunchStatus] = Query(None, description="Filtrar por estado del lanzamiento"),
     limit:  Optional[int]          = Query(None, ge=1, le=500, description="Límite de resultados"),
-) -> list[Launch]:
+    wire:   Optional[WireFormat]   = Query(None, alias="format", description="json (defecto) o columns"),
+    accept: Optional[str]          = Header(None),
+) -> list[Launch] | Response:
     try:
         if status:
             items = dynamo.get_by_status(status.value)
@@ -38,7 +73,12 @@ def list_launches(
 
         launches = [dynamo.to_launch(i) for i in items]
         launches.sort(key=lambda l: l.launch_date, reverse=True)
+        if negotiate(accept, wire) is WireFormat.columns:
+            return ColumnsResponse(encode_columns(launches), headers={"Vary": "Accept"})
+        response.headers["Vary"] = "Accept"
         return launches
+    except DeadlineExceeded:
+        raise
     except Exception as exc:
         logger.error("Error listando lanzamientos: %s", exc)
         raise HTTPException(
@@ -56,11 +96,79 @@ def list_launches(
 def get_stats(dynamo: DynamoDep) -> LaunchStats:
     try:
         return dynamo.get_stats()
+    except DeadlineExceeded:
+        raise
     except Exception as exc:
         logger.error("Error calculando estadísticas: %s", exc)
         raise HTTPException(status_code=500, detail="Error al calcular estadísticas") from exc
 
 
+@router.get(
+    "/changes",
+    response_model=LaunchChanges,
+    summary="Cambios desde una generación",
+    description="Retorna los lanzamientos insertados o actualizados desde la generación "
+                "`since` y la generación actual. Con `full_reload=true` el historial no "
+                "cubre `since` y el cliente debe recargar la lista completa.",
+)
+def get_changes(
+    changelog: ChangelogDep,
+    since: int = Query(0, ge=0, description="Última generación que tiene el cliente (0 = ninguna)"),
+) -> LaunchChanges:
+    try:
+        changes = changelog.get_changes(since)
+        launches = [changelog.to_launch(i) for i in changes["items"]]
+        launches.sort(key=lambda l: l.launch_date, reverse=True)
+        return LaunchChanges(
+            generation=changes["generation"], since=since,
+            full_reload=changes["full_reload"], launches=launches,
+        )
+    except DeadlineExceeded:
+        raise
+    except Exception as exc:
+        logger.error("Error obteniendo cambios desde %d: %s", since, exc)
+        raise HTTPException(status_code=500, detail="Error al obtener cambios") from exc
+
+
+def _view(dynamo: CoalescedReads | LaunchReplica, name: str, limit: int) -> list[Launch]:
+    try:
+        return [dynamo.to_launch(i) for i in dynamo.get_view_launches(name, limit)]
+    except DeadlineExceeded:
+        raise
+    except Exception as exc:
+        logger.error("Error leyendo la vista %s: %s", name, exc)
+        raise HTTPException(status_code=500, detail="Error al obtener lanzamientos") from exc
+
+
+# Antes de `/{launch_id}`: si no, "next" y "latest" se tomarían como IDs
+@router.get(
+    "/next",
+    response_model=list[Launch],
+    summary="Próximos lanzamientos",
+    description="Próximos lanzamientos por fecha ascendente, desde la vista `#view#next` "
+                "que publica cada sync (un GetItem, independiente del tamaño de la tabla).",
+)
+def get_next_launches(
+    dynamo: DynamoDep,
+    limit: int = Query(10, ge=1, le=VIEW_SIZE, description="Número de lanzamientos"),
+) -> list[Launch]:
+    return _view(dynamo, "next", limit)
+
+
+@router.get(
+    "/latest",
+    response_model=list[Launch],
+    summary="Últimos lanzamientos completados",
+    description="Lanzamientos exitosos o fallidos más recientes, desde la vista `#view#latest` "
+                "que publica cada sync (un GetItem, independiente del tamaño de la tabla).",
+)
+def get_latest_launches(
+    dynamo: DynamoDep,
+    limit: int = Query(10, ge=1, le=VIEW_SIZE, description="Número de lanzamientos"),
+) -> list[Launch]:
+    return _view(dynamo, "latest", limit)
+
+
 @router.get(
     "/{launch_id}",
     response_model=Launch,
@@ -77,7 +185,7 @@ def get_launch(launch_id: str, dynamo: DynamoDep) -> Launch:
                 detail=f"Lanzamiento '{launch_id}' no encontrado",
             )
         return dynamo.to_launch(item)
-    except HTTPException:
+    except (HTTPException, DeadlineExceeded):
         raise
     except Exception as exc:
         logger.error("Error obteniendo lanzamiento %s: %s", launch_id, exc)
@@ -1,7 +1,7 @@
 import json
 import logging
 import os
-from typing import Any
+from typing import Any, Iterator, Optional
 import urllib.request
 import urllib.error
 
@@ -9,6 +9,14 @@ import boto3
 from fastapi import APIRouter, HTTPException
 
 from backend.models.launch import SyncResponse
+from backend.services.event_stream import get_event_watcher
+from backend.services.launch_cache import get_launch_cache
+from backend.services.read_coalescer import get_read_coalescer
+from backend.services.sync_coordinator import SyncInProgressError, get_coordinator
+from launch_store import SQLITE, open_launch_writer, storage_backend
+from sync_pipeline import PipelineConfig, SyncPipeline, iter_json_array
+from sync_telemetry import SyncTelemetry
+from write_governor import WriteGovernor
 
 logger = logging.getLogger(__name__)
 
@@ -18,84 +26,43 @@ LAMBDA_FUNCTION   = os.environ.get("LAMBDA_FUNCTION_NAME", "spacex-data-collecto
 AWS_REGION        = os.environ.get("AWS_REGION", "us-east-1")
 DYNAMODB_ENDPOINT = os.environ.get("DYNAMODB_ENDPOINT")          # presente solo en local
 DYNAMODB_TABLE    = os.environ.get("DYNAMODB_TABLE", "spacex-launches-dev")
-SPACEX_BASE_URL   = "https://api.spacexdata.com/v4"
+SPACEX_BASE_URL   = os.environ.get("SPACEX_BASE_URL", "https://api.spacexdata.com/v4")
 
 
-def _fetch_json(url: str) -> Any:
-    """Petición GET simple usando urllib (sin dependencias extra)."""
+def _stream_json(url: str, telemetry: Optional[SyncTelemetry] = None) -> Iterator[dict]:
+    """GET con urllib (sin dependencias extra) decodificando el array JSON por trozos."""
     req = urllib.request.Request(url, headers={"Content-Type": "application/json"})
     with urllib.request.urlopen(req, timeout=30) as resp:
-        return json.loads(resp.read())
-
-
-def _resolve_status(launch: dict) -> str:
-    if launch.get("upcoming"):
-        return "upcoming"
-    success = launch.get("success")
-    if success is True:
-        return "success"
-    if success is False:
-        return "failed"
-    return "unknown"
-
-
-def _map_launch(launch: dict) -> dict:
-    return {
-        "launch_id":     launch.get("id", ""),
-        "mission_name":  launch.get("name", ""),
-        "rocket_name":   launch.get("rocket", ""),
-        "launch_date":   launch.get("date_utc", ""),
-        "status":        _resolve_status(launch),
-        "launchpad":     launch.get("launchpad", ""),
-        "flight_number": str(launch.get("flight_number", "")),
-        "details":       launch.get("details") or "",
-        "payloads":      launch.get("payloads", []),
-        "webcast_url":   launch.get("links", {}).get("webcast") or "",
-        "article_url":   launch.get("links", {}).get("article") or "",
-        "wikipedia_url": launch.get("links", {}).get("wikipedia") or "",
-        "patch_small":   launch.get("links", {}).get("patch", {}).get("small") or "",
-        "patch_large":   launch.get("links", {}).get("patch", {}).get("large") or "",
-    }
+        yield from iter_json_array(iter(lambda: resp.read(64 * 1024), b""), telemetry)
 
 
 def _sync_local() -> SyncResponse:
-    """Modo local: llama a SpaceX API y escribe directo en DynamoDB-local."""
+    """Modo local: llama a SpaceX API y escribe directo en DynamoDB-local o en SQLite."""
     logger.info("[LOCAL MODE] Sincronizando desde SpaceX API directamente...")
 
-    past     = _fetch_json(f"{SPACEX_BASE_URL}/launches/past")
-    upcoming = _fetch_json(f"{SPACEX_BASE_URL}/launches/upcoming")
-    all_launches = past + upcoming
-    logger.info("[LOCAL MODE] Lanzamientos obtenidos: %d", len(all_launches))
+    governor  = WriteGovernor.from_env()
+    writer    = open_launch_writer(DYNAMODB_TABLE, governor=governor,
+                                   region_name=AWS_REGION, endpoint_url=DYNAMODB_ENDPOINT)
+    telemetry = SyncTelemetry()
 
-    kwargs = {"region_name": AWS_REGION, "endpoint_url": DYNAMODB_ENDPOINT}
-    dynamodb = boto3.resource("dynamodb", **kwargs)
-    table    = dynamodb.Table(DYNAMODB_TABLE)
-
-    inserted = updated = errors = 0
-    for launch in all_launches:
-        try:
-            item = _map_launch(launch)
-            existing = table.get_item(Key={"launch_id": item["launch_id"]}).get("Item")
-            table.put_item(Item=item)
-            if existing:
-                updated += 1
-            else:
-                inserted += 1
-        except Exception as exc:
-            logger.error("Error upsert %s: %s", launch.get("id"), exc)
-            errors += 1
-
-    preview = [
-        {"launch_id": l.get("id"), "mission_name": l.get("name"), "status": _resolve_status(l)}
-        for l in all_launches[:10]
-    ]
-    return SyncResponse(
-        total_fetched=len(all_launches),
-        inserted=inserted,
-        updated=updated,
-        errors=errors,
-        launches=preview,
+    pipeline = SyncPipeline(writer, PipelineConfig.from_env(), telemetry=telemetry)
+    try:
+        result = pipeline.run([
+            lambda: _stream_json(f"{SPACEX_BASE_URL}/launches/past", telemetry),
+            lambda: _stream_json(f"{SPACEX_BASE_URL}/launches/upcoming", telemetry),
+        ])
+    finally:
+        telemetry.finish()
+    result["generation"] = writer.bump_generation(pipeline.changed_ids, result)
+    # Lectura de lo escrito en este proceso sin esperar al sondeo del watcher
+    cache = get_launch_cache()
+    if cache is not None:
+        cache.invalidate(pipeline.changed_ids)
+    result["telemetry"] = telemetry.snapshot(
+        consumed_wcu=governor.consumed_wcu, throttled=governor.throttle_count,
     )
+    logger.info("[LOCAL MODE] Lanzamientos obtenidos: %d", result["total_fetched"])
+    return SyncResponse(**result)
 
 
 @router.post(
@@ -104,12 +71,27 @@ def _sync_local() -> SyncResponse:
     summary="Invocar sincronización manual",
     description=(
         "En AWS invoca la Lambda. En local llama a SpaceX API directamente. "
-        "Retorna un resumen de registros insertados/actualizados en DynamoDB."
+        "Retorna un resumen de registros insertados/actualizados en DynamoDB. "
+        "Las solicitudes concurrentes o dentro del intervalo mínimo entre syncs "
+        "reciben el resultado de la sync en curso/reciente (`coalesced=true`)."
     ),
 )
 def trigger_sync() -> SyncResponse:
-    # ── Modo local: DYNAMODB_ENDPOINT presente → no hay Lambda disponible ──
-    if DYNAMODB_ENDPOINT:
+    try:
+        result = get_coordinator().run(_run_sync)
+    except SyncInProgressError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    # Las lecturas cacheadas de este proceso quedan vencidas (los demás
+    # workers/tareas las renuevan al cumplirse READ_CACHE_TTL_SECONDS)
+    get_read_coalescer().invalidate()
+    # Los suscriptores SSE de este proceso se enteran sin esperar al sondeo
+    get_event_watcher().poke()
+    return result
+
+
+def _run_sync() -> SyncResponse:
+    # ── Modo local: DYNAMODB_ENDPOINT o SQLite → no hay Lambda disponible ──
+    if DYNAMODB_ENDPOINT or storage_backend() == SQLITE:
         try:
             return _sync_local()
         except Exception as exc:
@@ -139,8 +121,12 @@ def trigger_sync() -> SyncResponse:
             total_fetched = result.get("total_fetched", 0),
             inserted      = result.get("inserted", 0),
             updated       = result.get("updated", 0),
+            unchanged     = result.get("unchanged", 0),
             errors        = result.get("errors", 0),
             launches      = result.get("launches", []),
+            generation    = result.get("generation"),
+            complete      = result.get("complete", True),
+            telemetry     = result.get("telemetry"),
         )
 
     except HTTPException:
@@ -0,0 +1,311 @@
+"""
+Lanzador de producción del backend: varios workers uvicorn con datos precargados.
+
+    python -m backend.server
+
+1. El proceso maestro importa la app, precarga los modelos de servicio de
+   boto3 y, con `READ_REPLICA=true`, la réplica de lanzamientos; después
+   congela el heap (`gc.freeze`) para que el recolector no toque esas páginas.
+2. Abre el socket de escucha y hace fork de `WEB_CONCURRENCY` workers que lo
+   comparten. Los datos precargados se comparten copy-on-write; cada worker
+   abre sus propias conexiones a DynamoDB (lifespan) antes de avisar que está
+   listo.
+3. Señales del maestro:
+   - TERM / INT: parada ordenada; cada worker deja de aceptar conexiones,
+     durante `DRAIN_SECONDS` responde con `Connection: close` para que los
+     clientes keep-alive abran conexión con otro worker, y termina las
+     peticiones en curso (hasta `GRACEFUL_TIMEOUT` segundos).
+   - HUP: recarga ordenada; refresca los datos precargados, arranca una nueva
+     generación de workers y solo cuando están listos detiene los anteriores.
+     El socket nunca se cierra, así que no se rechazan conexiones.
+   Si un worker muere inesperadamente se arranca otro en su lugar.
+"""
+import asyncio
+import gc
+import logging
+import os
+import select
+import signal
+import socket
+import sys
+import threading
+import time
+from typing import Optional
+
+import uvicorn
+
+logger = logging.getLogger("backend.server")
+
+READY_TIMEOUT = 60.0
+
+
+def default_workers() -> int:
+    return int(os.environ.get("WEB_CONCURRENCY", len(os.sched_getaffinity(0))))
+
+
+class _CloseWhenDraining:
+    """ASGI: durante el drenaje responde con `Connection: close` para que el cliente no reutilice la conexión."""
+
+    def __init__(self, app, draining: threading.Event) -> None:
+        self.app = app
+        self.draining = draining
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start" and self.draining.is_set():
+                headers = [(k, v) for k, v in message.get("headers", []) if k.lower() != b"connection"]
+                message = {**message, "headers": headers + [(b"connection", b"close")]}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class _WorkerServer(uvicorn.Server):
+    """
+    Servidor uvicorn que avisa al maestro (pipe) cuando ya acepta tráfico y
+    que, al recibir TERM, drena antes de apagarse: deja de aceptar conexiones
+    (el socket sigue abierto en los demás workers) y durante `drain_seconds`
+    cierra las conexiones keep-alive tras su siguiente respuesta.
+    """
+
+    def __init__(self, config: uvicorn.Config, ready_fd: int,
+                 draining: threading.Event, drain_seconds: float) -> None:
+        super().__init__(config)
+        self._ready_fd = ready_fd
+        self._draining = draining
+        self._drain_seconds = drain_seconds
+
+    async def startup(self, sockets: Optional[list[socket.socket]] = None) -> None:
+        await super().startup(sockets=sockets)
+        if not self.should_exit:
+            os.write(self._ready_fd, b"1")
+        os.close(self._ready_fd)
+
+    def handle_exit(self, sig: int, frame) -> None:
+        if self._draining.is_set() or self.should_exit or not self.started:
+            super().handle_exit(sig, frame)
+            return
+        self._draining.set()
+        for server in self.servers:
+            server.close()
+        # Los streams SSE no terminan solos: se cierran para que el drenaje no
+        # espere a GRACEFUL_TIMEOUT y los clientes reconecten contra otro worker
+        from backend.services.event_stream import get_broadcaster
+        get_broadcaster().close()
+        asyncio.get_event_loop().call_later(self._drain_seconds, super().handle_exit, sig, frame)
+
+
+class Arbiter:
+    """Proceso maestro: precarga, fork de workers, recarga y parada ordenadas."""
+
+    def __init__(self, workers: int, host: str, port: int, graceful_timeout: float,
+                 drain_seconds: float = 2.0) -> None:
+        self.workers = max(1, workers)
+        self.host = host
+        self.port = port
+        self.graceful_timeout = graceful_timeout
+        self.drain_seconds = drain_seconds
+        self.app = None
+        self.sock: Optional[socket.socket] = None
+        self.children: dict[int, int] = {}     # pid → generación
+        self.generation = 0
+        self._signals: list[int] = []
+
+    # ── Maestro ───────────────────────────────────────────────────────────────
+
+    def preload(self) -> None:
+        """Carga lo que los workers compartirán tras el fork."""
+        start = time.perf_counter()
+        import boto3
+
+        from backend.main import app
+        from backend.services.launch_replica import get_replica
+
+        self.app = app
+        # Los modelos de servicio de botocore quedan en la sesión por defecto
+        boto3.resource("dynamodb", region_name=os.environ.get("AWS_REGION", "us-east-1"))
+        replica = get_replica()
+        if replica is not None:
+            try:
+                replica.refresh()
+            except Exception as exc:
+                logger.warning("No se pudo precargar la réplica: %s", exc)
+        gc.collect()
+        gc.freeze()
+        logger.info("Precarga completada en %.0f ms", (time.perf_counter() - start) * 1000)
+
+    def bind(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(2048)
+        sock.set_inheritable(True)
+        return sock
+
+    def run(self) -> int:
+        self.preload()
+        self.sock = self.bind()
+        for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+            signal.signal(sig, lambda signum, _frame: self._signals.append(signum))
+
+        logger.info("Escuchando en http://%s:%d con %d workers", self.host, self.port, self.workers)
+        if not self.spawn_generation():
+            self.stop()
+            return 1
+
+        while True:
+            while self._signals:
+                signum = self._signals.pop(0)
+                if signum == signal.SIGHUP:
+                    self.reload()
+                else:
+                    logger.info("Señal %s: parada ordenada", signal.Signals(signum).name)
+                    self.stop()
+                    return 0
+            self.reap()
+            time.sleep(0.2)
+
+    def spawn_generation(self) -> bool:
+        """Arranca `workers` procesos nuevos y espera a que todos estén listos."""
+        self.generation += 1
+        pending = [self.spawn(self.generation) for _ in range(self.workers)]
+        deadline = time.monotonic() + READY_TIMEOUT
+        ok = True
+        for pid, ready_fd in pending:
+            remaining = max(0.0, deadline - time.monotonic())
+            readable, _, _ = select.select([ready_fd], [], [], remaining)
+            if not readable or not os.read(ready_fd, 1):
+                logger.error("El worker %d no quedó listo", pid)
+                ok = False
+            os.close(ready_fd)
+        return ok
+
+    def spawn(self, generation: int) -> tuple[int, int]:
+        ready_r, ready_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # hijo
+            os.close(ready_r)
+            code = 0
+            try:
+                self._serve_worker(ready_w)
+            except BaseException:
+                logger.exception("Error en el worker %d", os.getpid())
+                code = 1
+            finally:
+                os._exit(code)
+        os.close(ready_w)
+        self.children[pid] = generation
+        return pid, ready_r
+
+    def reload(self) -> None:
+        logger.info("Recarga ordenada: generación %d", self.generation + 1)
+        previous = [pid for pid, gen in self.children.items() if gen == self.generation]
+        from backend.services.launch_replica import get_replica
+
+        replica = get_replica()
+        if replica is not None:
+            gc.unfreeze()
+            try:
+                replica.refresh()
+            except Exception as exc:
+                logger.warning("No se pudo refrescar la réplica precargada: %s", exc)
+            gc.collect()
+            gc.freeze()
+
+        if not self.spawn_generation():
+            logger.error("La nueva generación no arrancó; se mantienen los workers anteriores")
+            self._terminate([pid for pid, gen in self.children.items() if gen == self.generation])
+            self.generation -= 1
+            return
+        self._terminate(previous)
+
+    def reap(self) -> None:
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            generation = self.children.pop(pid, None)
+            if generation == self.generation:
+                logger.warning("Worker %d terminó inesperadamente (%s); arrancando otro",
+                               pid, os.waitstatus_to_exitcode(status))
+                self.spawn_generation_member()
+
+    def spawn_generation_member(self) -> None:
+        pid, ready_fd = self.spawn(self.generation)
+        readable, _, _ = select.select([ready_fd], [], [], READY_TIMEOUT)
+        if not readable or not os.read(ready_fd, 1):
+            logger.error("El worker de reemplazo %d no quedó listo", pid)
+        os.close(ready_fd)
+
+    def _terminate(self, pids: list[int]) -> None:
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self.children.pop(pid, None)
+
+    def stop(self) -> None:
+        self._terminate(list(self.children))
+        deadline = time.monotonic() + self.graceful_timeout + 5
+        while self.children and time.monotonic() < deadline:
+            for pid in list(self.children):
+                try:
+                    done, _ = os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    done = pid
+                if done:
+                    self.children.pop(pid, None)
+            time.sleep(0.1)
+        for pid in list(self.children):
+            logger.warning("Worker %d no terminó a tiempo; SIGKILL", pid)
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        self.children.clear()
+        if self.sock is not None:
+            self.sock.close()
+
+    # ── Worker ────────────────────────────────────────────────────────────────
+
+    def _serve_worker(self, ready_fd: int) -> None:
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, signal.SIG_DFL)
+        # La recarga la gestiona el maestro
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        draining = threading.Event()
+        config = uvicorn.Config(
+            _CloseWhenDraining(self.app, draining),
+            lifespan="on",
+            log_level=os.environ.get("LOG_LEVEL", "info").lower(),
+            access_log=os.environ.get("ACCESS_LOG", "false").lower() == "true",
+            timeout_graceful_shutdown=int(self.graceful_timeout),
+            proxy_headers=True,
+            forwarded_allow_ips="*",
+        )
+        _WorkerServer(config, ready_fd, draining, self.drain_seconds).run(sockets=[self.sock])
+
+
+def serve(workers: Optional[int] = None, host: Optional[str] = None, port: Optional[int] = None) -> int:
+    """Arranca el maestro con la configuración del entorno (o los argumentos)."""
+    arbiter = Arbiter(
+        workers=workers if workers is not None else default_workers(),
+        host=host or os.environ.get("HOST", "0.0.0.0"),
+        port=port if port is not None else int(os.environ.get("PORT", "8000")),
+        graceful_timeout=float(os.environ.get("GRACEFUL_TIMEOUT", "30")),
+        drain_seconds=float(os.environ.get("DRAIN_SECONDS", "2")),
+    )
+    return arbiter.run()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=os.environ.get("LOG_LEVEL", "INFO"),
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+    sys.exit(serve())
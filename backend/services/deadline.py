@@ -0,0 +1,94 @@
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from backend.services.metrics import DEADLINE_EXCEEDED
+
+logger = logging.getLogger(__name__)
+
+# Hora límite (time.monotonic) de la petición en curso; None = sin límite
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """La petición agotó su presupuesto de tiempo (`REQUEST_DEADLINE_MS`)."""
+
+    def __init__(self, operation: str) -> None:
+        super().__init__(f"Tiempo agotado esperando {operation}")
+        self.operation = operation
+
+
+def request_deadline_ms() -> int:
+    """Presupuesto por petición en ms; 0 (defecto) = sin límite."""
+    return int(os.environ.get("REQUEST_DEADLINE_MS", "0"))
+
+
+def remaining() -> Optional[float]:
+    """Segundos que le quedan a la petición en curso (None si no tiene límite)."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def check_deadline(operation: str) -> None:
+    """Lanza `DeadlineExceeded` si la petición ya no tiene tiempo para `operation`."""
+    left = remaining()
+    if left is not None and left <= 0:
+        DEADLINE_EXCEEDED.inc(operation=operation)
+        raise DeadlineExceeded(operation)
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    """Fija la hora límite del contexto actual (la más cercana si ya había una)."""
+    if seconds is None or seconds <= 0:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+# ── botocore ──────────────────────────────────────────────────────────────────
+
+def _before_send(request=None, **kwargs) -> None:
+    # Cada intento (incluidos los reintentos de botocore) pasa por aquí: sin
+    # tiempo restante no se envía, en lugar de reintentar una petición que
+    # el cliente ya no va a esperar
+    operation = kwargs.get("event_name", "dynamodb").rsplit(".", 1)[-1]
+    check_deadline(operation)
+
+
+def attach_deadline(resource) -> None:
+    """Engancha la comprobación del límite a cada intento del cliente de `resource`."""
+    client = getattr(getattr(resource, "meta", None), "client", None)
+    if client is None:
+        return                                  # dobles en proceso (benchmarks.fakes)
+    client.meta.events.register("before-send.dynamodb", _before_send)
+
+
+# ── Middleware ────────────────────────────────────────────────────────────────
+
+class DeadlineMiddleware:
+    """
+    Middleware ASGI que da a cada petición HTTP un presupuesto de
+    `REQUEST_DEADLINE_MS`. Las llamadas a DynamoDB lo consultan: no se
+    reintenta ni se espera más allá, y el endpoint responde 504.
+    """
+
+    def __init__(self, app, deadline_ms: Optional[int] = None) -> None:
+        self.app = app
+        self.seconds = (deadline_ms if deadline_ms is not None else request_deadline_ms()) / 1000
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with deadline_scope(self.seconds):
+            await self.app(scope, receive, send)
@@ -3,28 +3,54 @@ import os
 from typing import Optional
 
 import boto3
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
-from backend.models.launch import Launch, LaunchStats
+from backend.services.deadline import attach_deadline
+from backend.services.hedging import get_hedged_reads
+from backend.services.launch_service import LaunchService
+from backend.services.metrics import DYNAMO_SCAN_PAGES, observe_dynamo
+from backend.services.sync_coordinator import META_PREFIX, is_meta_item
+from sync_pipeline import GENERATION_KEY, MAX_BATCH_GET, changes_key
 
 logger = logging.getLogger(__name__)
 
 
-class DynamoService:
+def client_config() -> Config:
+    """
+    Timeouts y reintentos del cliente de lectura. Los de botocore (60 s de
+    lectura, reintentos `legacy`) convierten una partición o conexión lenta en
+    segundos de p99; aquí un intento lento se corta pronto y se reintenta.
+    """
+    return Config(
+        connect_timeout=float(os.environ.get("DYNAMODB_CONNECT_TIMEOUT", "1")),
+        read_timeout=float(os.environ.get("DYNAMODB_READ_TIMEOUT", "2")),
+        retries={
+            "mode":         os.environ.get("DYNAMODB_RETRY_MODE", "standard"),
+            "max_attempts": int(os.environ.get("DYNAMODB_MAX_ATTEMPTS", "3")),
+        },
+    )
+
+
+class DynamoService(LaunchService):
     """Capa de acceso a DynamoDB para el backend API."""
 
     def __init__(self) -> None:
         region = os.environ.get("AWS_REGION", "us-east-1")
         endpoint = os.environ.get("DYNAMODB_ENDPOINT")  # para DynamoDB local
 
-        kwargs: dict = {"region_name": region}
+        kwargs: dict = {"region_name": region, "config": client_config()}
         if endpoint:
             kwargs["endpoint_url"] = endpoint
 
         self.dynamodb = boto3.resource("dynamodb", **kwargs)
+        # Ningún intento (ni reintento) sale sin tiempo restante en la petición
+        attach_deadline(self.dynamodb)
         self.table_name = os.environ.get("DYNAMODB_TABLE", "spacex-launches-dev")
         self.table = self.dynamodb.Table(self.table_name)
+        # GetItem / Query con hedging y límite por petición
+        self.reads = get_hedged_reads()
 
     # ── Salud ──────────────────────────────────────────────────────────────────
 
@@ -39,20 +65,33 @@ class DynamoService:
     # ── Consultas ──────────────────────────────────────────────────────────────
 
     def get_all(self, limit: Optional[int] = None) -> list[dict]:
-        """Escanea todos los registros con paginación interna."""
+        """
+        Escanea todos los lanzamientos con paginación interna. Los items de
+        control (`#...`) se descartan en el servidor, pero DynamoDB los cuenta
+        en `Limit` antes de filtrar: se sigue paginando hasta reunir `limit`
+        lanzamientos.
+        """
         try:
-            kwargs: dict = {}
+            kwargs: dict = {
+                "FilterExpression":       ~Attr("launch_id").begins_with(META_PREFIX),
+                "ReturnConsumedCapacity": "TOTAL",
+            }
             if limit:
                 kwargs["Limit"] = limit
 
-            response = self.table.scan(**kwargs)
-            items = response.get("Items", [])
-
-            while "LastEvaluatedKey" in response and (limit is None or len(items) < limit):
-                response = self.table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-                items.extend(response.get("Items", []))
-
-            return items
+            items: list[dict] = []
+            pages = 0
+            with observe_dynamo("scan") as consumed:
+                while True:
+                    response = self.table.scan(**kwargs)
+                    consumed(response)
+                    items.extend(i for i in response.get("Items", []) if not is_meta_item(i))
+                    pages += 1
+                    if "LastEvaluatedKey" not in response or (limit and len(items) >= limit):
+                        break
+                    kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+            DYNAMO_SCAN_PAGES.observe(pages, operation="scan")
+            return items[:limit] if limit else items
         except (BotoCoreError, ClientError) as exc:
             logger.error("Error al escanear DynamoDB: %s", exc)
             raise
@@ -60,61 +99,90 @@ class DynamoService:
     def get_by_id(self, launch_id: str) -> Optional[dict]:
         """Obtiene un lanzamiento por su ID primario."""
         try:
-            response = self.table.get_item(Key={"launch_id": launch_id})
+            with observe_dynamo("get_item") as consumed:
+                response = self.reads.call("get_item", lambda: self.table.get_item(
+                    Key={"launch_id": launch_id},
+                    ReturnConsumedCapacity="TOTAL",
+                ))
+                consumed(response)
             return response.get("Item")
         except (BotoCoreError, ClientError) as exc:
             logger.error("Error al obtener lanzamiento %s: %s", launch_id, exc)
             raise
 
+    def get_generation(self) -> Optional[int]:
+        """Generación de datos publicada por la última sync (`#sync-generation`)."""
+        try:
+            with observe_dynamo("get_item") as consumed:
+                response = self.reads.call("get_item", lambda: self.table.get_item(
+                    Key={"launch_id": GENERATION_KEY},
+                    ProjectionExpression="generation",
+                    ReturnConsumedCapacity="TOTAL",
+                ))
+                consumed(response)
+            item = response.get("Item")
+            return int(item["generation"]) if item and "generation" in item else None
+        except (BotoCoreError, ClientError) as exc:
+            logger.error("Error al leer la generación de datos: %s", exc)
+            raise
+
+    def get_view(self, key: str) -> Optional[dict]:
+        """Vista materializada (`#view#next`, `#view#latest`) con un GetItem."""
+        try:
+            with observe_dynamo("get_item") as consumed:
+                response = self.reads.call("get_item", lambda: self.table.get_item(
+                    Key={"launch_id": key},
+                    ReturnConsumedCapacity="TOTAL",
+                ))
+                consumed(response)
+            return response.get("Item")
+        except (BotoCoreError, ClientError) as exc:
+            logger.error("Error al leer la vista %s: %s", key, exc)
+            raise
+
+    def get_by_ids(self, launch_ids: list[str]) -> list[dict]:
+        """Obtiene varios lanzamientos por ID (BatchGetItem); omite los inexistentes."""
+        return self._batch_get(launch_ids)
+
+    def get_changelog(self, first: int, last: int) -> dict[int, dict]:
+        """Items `#changes#<gen>` presentes para first..last (inclusive), por generación."""
+        keys = [changes_key(g) for g in range(first, last + 1)]
+        return {int(e["generation"]): e for e in self._batch_get(keys)}
+
+    def _batch_get(self, launch_ids: list[str], projection: Optional[str] = None) -> list[dict]:
+        """BatchGetItem en lotes de 100 reintentando las claves no procesadas."""
+        items: list[dict] = []
+        try:
+            with observe_dynamo("batch_get_item") as consumed:
+                for start in range(0, len(launch_ids), MAX_BATCH_GET):
+                    request: dict = {"Keys": [{"launch_id": lid} for lid in launch_ids[start:start + MAX_BATCH_GET]]}
+                    if projection:
+                        request["ProjectionExpression"] = projection
+                    pending: Optional[dict] = {self.table_name: request}
+                    while pending:
+                        response = self.dynamodb.batch_get_item(
+                            RequestItems=pending, ReturnConsumedCapacity="TOTAL",
+                        )
+                        for capacity in response.get("ConsumedCapacity", []):
+                            consumed({"ConsumedCapacity": capacity})
+                        items.extend(response["Responses"].get(self.table_name, []))
+                        pending = response.get("UnprocessedKeys") or None
+            return items
+        except (BotoCoreError, ClientError) as exc:
+            logger.error("Error en BatchGetItem: %s", exc)
+            raise
+
     def get_by_status(self, status: str) -> list[dict]:
         """Filtra lanzamientos por estado usando el GSI status-index."""
         try:
-            response = self.table.query(
-                IndexName="status-index",
-                KeyConditionExpression=Key("status").eq(status),
-            )
+            with observe_dynamo("query") as consumed:
+                response = self.reads.call("query", lambda: self.table.query(
+                    IndexName="status-index",
+                    KeyConditionExpression=Key("status").eq(status),
+                    ReturnConsumedCapacity="TOTAL",
+                ))
+                consumed(response)
             return response.get("Items", [])
         except (BotoCoreError, ClientError) as exc:
             logger.error("Error al filtrar por estado %s: %s", status, exc)
             raise
-
-    # ── Estadísticas ───────────────────────────────────────────────────────────
-
-    def get_stats(self) -> LaunchStats:
-        """Calcula estadísticas de todos los lanzamientos."""
-        items = self.get_all()
-        total    = len(items)
-        success  = sum(1 for i in items if i.get("status") == "success")
-        failed   = sum(1 for i in items if i.get("status") == "failed")
-        upcoming = sum(1 for i in items if i.get("status") == "upcoming")
-        rate = round(success / (success + failed) * 100, 1) if (success + failed) > 0 else 0.0
-
-        return LaunchStats(
-            total=total,
-            success=success,
-            failed=failed,
-            upcoming=upcoming,
-            success_rate=rate,
-        )
-
-    # ── Utilidades ────────────────────────────────────────────────────────────
-
-    @staticmethod
-    def to_launch(item: dict) -> Launch:
-        """Convierte un item de DynamoDB a modelo Pydantic."""
-        return Launch(
-            launch_id     = item.get("launch_id", ""),
-            mission_name  = item.get("mission_name", ""),
-            rocket_name   = item.get("rocket_name", ""),
-            launch_date   = item.get("launch_date", ""),
-            status        = item.get("status", "unknown"),
-            launchpad     = item.get("launchpad", ""),
-            flight_number = str(item.get("flight_number", "")),
-            details       = item.get("details", ""),
-            payloads      = list(item.get("payloads", [])),
-            webcast_url   = item.get("webcast_url", ""),
-            article_url   = item.get("article_url", ""),
-            wikipedia_url = item.get("wikipedia_url", ""),
-            patch_small   = item.get("patch_small", ""),
-            patch_large   = item.get("patch_large", ""),
-        )
@@ -0,0 +1,353 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Optional
+
+from backend.services.launch_service import LaunchService, open_launch_service
+from backend.services.metrics import SSE_EVENTS, SSE_SUBSCRIBERS
+
+logger = logging.getLogger(__name__)
+
+EventId = tuple[int, int]   # (generación, secuencia dentro de la generación)
+
+
+@dataclass(frozen=True)
+class Event:
+    """
+    Evento del canal SSE. El ID se deriva de la generación de datos, así que
+    es el mismo en todos los workers/tareas: un cliente puede reconectar contra
+    otro proceso y reanudar con `Last-Event-ID`.
+    """
+
+    generation: int
+    seq:        int
+    type:       str
+    data:       dict = field(default_factory=dict)
+
+    @property
+    def id(self) -> EventId:
+        return (self.generation, self.seq)
+
+    def encode(self) -> bytes:
+        payload = json.dumps(self.data, separators=(",", ":"), default=str)
+        return f"id: {self.generation}-{self.seq}\nevent: {self.type}\ndata: {payload}\n\n".encode()
+
+
+def parse_event_id(value: Optional[str]) -> Optional[EventId]:
+    """`"12-3"` → (12, 3); un ID ausente o malformado se trata como sin cursor."""
+    if not value:
+        return None
+    try:
+        generation, _, seq = value.strip().partition("-")
+        return (int(generation), int(seq or 0))
+    except ValueError:
+        return None
+
+
+def _message(event: str, data: dict) -> bytes:
+    # Mensajes de control sin `id`: no mueven el Last-Event-ID del cliente
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode()
+
+
+class EventBroadcaster:
+    """
+    Difusión en proceso sobre el event loop de asyncio.
+
+    Los eventos recientes viven en un buffer circular compartido; cada
+    suscriptor solo guarda su cursor (último ID enviado) y espera un único
+    `asyncio.Event` que se reemplaza en cada publicación. Una conexión ociosa
+    cuesta una tarea suspendida, sin colas por suscriptor, así que miles de
+    conexiones caben en un worker.
+    """
+
+    def __init__(self, buffer_size: Optional[int] = None, heartbeat: Optional[float] = None,
+                 retry_ms: Optional[int] = None) -> None:
+        self.buffer_size = int(buffer_size if buffer_size is not None
+                               else os.environ.get("EVENTS_BUFFER_SIZE", "1000"))
+        self.heartbeat = float(heartbeat if heartbeat is not None
+                               else os.environ.get("EVENTS_HEARTBEAT_SECONDS", "15"))
+        self.retry_ms = int(retry_ms if retry_ms is not None
+                            else os.environ.get("EVENTS_RETRY_MS", "3000"))
+        self._buffer: deque[Event] = deque()
+        self._lock = threading.Lock()
+        # Desde este cursor el buffer está completo; antes hay que recargar
+        self._floor: Optional[EventId] = None
+        self._generation: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._closed = False
+        self.subscribers = 0
+
+    # ── Publicación (desde cualquier hilo) ────────────────────────────────────
+
+    def attach(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._loop is not loop:
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+
+    def start_at(self, generation: int) -> None:
+        """Punto de partida: se conocen los eventos posteriores a `generation`."""
+        with self._lock:
+            self._generation = generation
+            if self._floor is None:
+                self._floor = (generation, 0)
+
+    def publish(self, events: list[Event]) -> None:
+        if not events:
+            return
+        with self._lock:
+            for event in events:
+                if len(self._buffer) >= self.buffer_size:
+                    self._floor = self._buffer.popleft().id
+                self._buffer.append(event)
+                SSE_EVENTS.inc(type=event.type)
+            self._generation = max(self._generation or 0, events[-1].generation)
+            if self._floor is None:
+                self._floor = (events[0].generation, -1)
+        self._notify()
+
+    def close(self) -> None:
+        """Termina todos los streams (parada del worker): los clientes reconectan a otro."""
+        self._closed = True
+        self._notify()
+
+    def _notify(self) -> None:
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self) -> None:
+        wakeup, self._wakeup = self._wakeup, asyncio.Event()
+        if wakeup is not None:
+            wakeup.set()
+
+    # ── Suscripción ───────────────────────────────────────────────────────────
+
+    def _after(self, cursor: Optional[EventId]) -> Optional[list[Event]]:
+        """
+        Eventos posteriores a `cursor`, o None si el buffer ya no los cubre.
+        Sin cursor (el proceso no conocía ninguna generación al suscribirse)
+        todo el buffer es posterior.
+        """
+        with self._lock:
+            if cursor is None:
+                return list(self._buffer)
+            if self._floor is None or cursor < self._floor:
+                return None
+            pending = []
+            for event in reversed(self._buffer):
+                if event.id <= cursor:
+                    break
+                pending.append(event)
+        pending.reverse()
+        return pending
+
+    def _last_id(self) -> Optional[EventId]:
+        with self._lock:
+            if self._buffer:
+                return self._buffer[-1].id
+            return (self._generation, 0) if self._generation is not None else None
+
+    async def stream(self, last_event_id: Optional[str] = None) -> AsyncIterator[bytes]:
+        """Genera el cuerpo `text/event-stream` de una suscripción."""
+        self.attach(asyncio.get_running_loop())
+        self.subscribers += 1
+        try:
+            yield f"retry: {self.retry_ms}\n\n".encode()
+            cursor = parse_event_id(last_event_id)
+            replay = self._after(cursor) if cursor is not None else []
+            if cursor is None:
+                yield _message("ready", {"generation": self._generation})
+                cursor = self._last_id()
+            elif replay is None:
+                # El cliente se perdió eventos que ya no están: que recargue
+                yield _message("reset", {"generation": self._generation})
+                cursor = self._last_id()
+            else:
+                for event in replay:
+                    yield event.encode()
+                    cursor = event.id
+
+            while not self._closed:
+                # Sin awaits entre la consulta y la espera: una publicación
+                # posterior despierta el `wakeup` que se va a esperar
+                pending = self._after(cursor)
+                if pending is None:
+                    yield _message("reset", {"generation": self._generation})
+                    cursor = self._last_id()
+                    continue
+                if pending:
+                    for event in pending:
+                        yield event.encode()
+                        cursor = event.id
+                    continue
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.heartbeat)
+                except asyncio.TimeoutError:
+                    yield b": ping\n\n"
+        finally:
+            self.subscribers -= 1
+
+
+class SyncEventWatcher:
+    """
+    Detecta syncs nuevas (de cualquier proceso o de la Lambda) consultando
+    `#sync-generation` con un GetItem cada `poll_interval` segundos, lee su
+    historial `#changes#<gen>` y publica:
+
+    - `sync`: generación, conteos de la sync y si requiere recarga completa.
+    - `launch_status`: lanzamientos existentes cuyo estado cambió.
+
+    Los listeners (`add_listener`) reciben además los IDs cambiados en cada
+    avance de generación, o None si hay que descartarlo todo.
+    """
+
+    def __init__(
+        self,
+        broadcaster: EventBroadcaster,
+        service_factory: Callable[[], LaunchService] = open_launch_service,
+        poll_interval: Optional[float] = None,
+    ) -> None:
+        self.broadcaster = broadcaster
+        self.poll_interval = float(
+            poll_interval if poll_interval is not None
+            else os.environ.get("EVENTS_POLL_SECONDS", "2")
+        )
+        self._service_factory = service_factory
+        self._service: Optional[LaunchService] = None
+        self._generation: Optional[int] = None
+        self._statuses: dict[str, str] = {}
+        self._listeners: list[Callable[[LaunchService, Optional[list[str]]], None]] = []
+        self._poll_lock = threading.Lock()
+        self._poke = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ── Ciclo de vida ─────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        """Arranca el hilo de sondeo (idempotente)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="sync-events", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._poke.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval)
+        self._thread = None
+
+    def add_listener(self, listener: Callable[[LaunchService, Optional[list[str]]], None]) -> None:
+        """Registra `listener(service, changed_ids)` para cada avance de generación (idempotente)."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def poke(self) -> None:
+        """Sondea ya (p. ej. tras una sync local) sin esperar al intervalo."""
+        self._poke.set()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as exc:
+                logger.warning("No se pudo sondear la generación de datos: %s", exc)
+                self._service = None
+            self._poke.wait(self.poll_interval)
+            self._poke.clear()
+
+    # ── Sondeo ────────────────────────────────────────────────────────────────
+
+    def poll(self) -> int:
+        """Publica los eventos de las generaciones nuevas. Retorna cuántos publicó."""
+        with self._poll_lock:
+            if self._service is None:
+                self._service = self._service_factory()
+            service = self._service
+            # Sin item de generación (ninguna sync registrada) se parte de 0
+            generation = service.get_generation() or 0
+            if generation == self._generation:
+                return 0
+            if self._generation is None or generation < self._generation:
+                # Primera lectura (o tabla reiniciada): solo fija el punto de partida
+                self._statuses = self._load_statuses(service)
+                self._generation = generation
+                self.broadcaster.start_at(generation)
+                return 0
+
+            first, self._generation = self._generation + 1, generation
+            entries = service.get_changelog(first, generation)
+            events: list[Event] = []
+            for gen in range(first, generation + 1):
+                entry = entries.get(gen) or {"full_reload": True}
+                counts = {k: int(v) for k, v in (entry.get("summary") or {}).items()}
+                events.append(Event(gen, 0, "sync", {
+                    "generation": gen, "full_reload": bool(entry.get("full_reload")), **counts,
+                }))
+
+            complete = all(g in entries and not entries[g].get("full_reload") for g in range(first, generation + 1))
+            if complete:
+                ids = sorted({lid for e in entries.values() for lid in e.get("ids", [])})
+                changed = service.get_by_ids(ids) if ids else []
+            else:
+                changed = service.get_all()
+            # Antes de publicar: un cliente que relee tras el evento ve datos frescos
+            for listener in self._listeners:
+                try:
+                    listener(service, ids if complete else None)
+                except Exception as exc:
+                    logger.warning("Listener de la generación %d falló: %s", generation, exc)
+
+            seq = 0
+            for item in changed:
+                launch_id, status = item.get("launch_id"), item.get("status")
+                previous = self._statuses.get(launch_id)
+                self._statuses[launch_id] = status
+                if previous is not None and previous != status:
+                    seq += 1
+                    events.append(Event(generation, seq, "launch_status", {
+                        "generation":   generation,
+                        "launch_id":    launch_id,
+                        "mission_name": item.get("mission_name", ""),
+                        "previous":     previous,
+                        "status":       status,
+                    }))
+
+            self.broadcaster.publish(events)
+            logger.info("Generación %d: %d eventos publicados", generation, len(events))
+            return len(events)
+
+    @staticmethod
+    def _load_statuses(service: LaunchService) -> dict[str, str]:
+        return {i["launch_id"]: i.get("status") for i in service.get_all()}
+
+
+_broadcaster: Optional[EventBroadcaster] = None
+_watcher: Optional[SyncEventWatcher] = None
+_events_lock = threading.Lock()
+
+
+def get_broadcaster() -> EventBroadcaster:
+    """Broadcaster compartido por todas las conexiones SSE del proceso."""
+    global _broadcaster
+    with _events_lock:
+        if _broadcaster is None:
+            _broadcaster = EventBroadcaster()
+            SSE_SUBSCRIBERS.set_function(lambda: _broadcaster.subscribers)
+        return _broadcaster
+
+
+def get_event_watcher() -> SyncEventWatcher:
+    global _watcher
+    broadcaster = get_broadcaster()
+    with _events_lock:
+        if _watcher is None:
+            _watcher = SyncEventWatcher(broadcaster)
+        return _watcher
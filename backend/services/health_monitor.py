@@ -0,0 +1,136 @@
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from backend.services.launch_service import LaunchService, open_launch_service
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HealthSnapshot:
+    """Último resultado del chequeo de DynamoDB visto por el proceso."""
+
+    dynamo_ok:   Optional[bool]    # None = aún no se ha chequeado
+    checked_at:  Optional[float]   # epoch (s) del último chequeo
+    age_seconds: Optional[float]
+    stale:       bool
+    error:       Optional[str] = None
+
+
+class HealthMonitor:
+    """
+    Chequea DynamoDB en un hilo de fondo y publica el resultado en memoria.
+
+    Las sondas (`/health`, `/health/ready`) leen el último estado sin hacer
+    llamadas: el DescribeTable se ejecuta una vez por intervalo y proceso,
+    no una vez por sonda del ALB/ECS. Si el chequeo se atasca (p. ej. timeout
+    de red largo) el estado deja de refrescarse y se marca `stale`.
+    """
+
+    def __init__(
+        self,
+        check: Optional[Callable[[], bool]] = None,
+        interval: Optional[float] = None,
+        stale_after: Optional[float] = None,
+    ) -> None:
+        self.interval = float(
+            interval if interval is not None
+            else os.environ.get("HEALTH_CHECK_INTERVAL_SECONDS", "15")
+        )
+        self.stale_after = float(
+            stale_after if stale_after is not None
+            else os.environ.get("HEALTH_STALE_AFTER_SECONDS", str(self.interval * 3))
+        )
+        self._check = check or self._ping_dynamo
+        self._service: Optional[LaunchService] = None
+        self._snapshot = HealthSnapshot(dynamo_ok=None, checked_at=None, age_seconds=None, stale=True)
+        self._checked_monotonic: Optional[float] = None
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.started_at = time.time()
+
+    # ── Ciclo de vida ─────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        """Lanza el hilo de refresco (idempotente)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="health-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval)
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _loop(self) -> None:
+        if self._checked_monotonic is None:
+            self.refresh()
+        while not self._stop.wait(self.interval):
+            self.refresh()
+
+    # ── Chequeo ───────────────────────────────────────────────────────────────
+
+    def _ping_dynamo(self) -> bool:
+        # Un único cliente por proceso; se recrea si el anterior falló
+        if self._service is None:
+            self._service = open_launch_service()
+        if not self._service.ping():
+            self._service = None
+            return False
+        return True
+
+    def refresh(self) -> None:
+        """Ejecuta el chequeo y publica el resultado (una ejecución a la vez)."""
+        with self._refresh_lock:
+            error = None
+            try:
+                ok = bool(self._check())
+            except Exception as exc:
+                logger.warning("DynamoDB health check failed: %s", exc)
+                self._service = None
+                ok, error = False, str(exc)
+            self._checked_monotonic = time.monotonic()
+            self._snapshot = HealthSnapshot(
+                dynamo_ok=ok, checked_at=time.time(), age_seconds=0.0, stale=False, error=error,
+            )
+
+    def snapshot(self) -> HealthSnapshot:
+        """Estado cacheado con su antigüedad. Sin hilo ni chequeo previo, chequea una vez."""
+        if self._checked_monotonic is None and not self.running:
+            self.refresh()
+        snap, checked = self._snapshot, self._checked_monotonic
+        if checked is None:
+            return snap
+        age = time.monotonic() - checked
+        return HealthSnapshot(
+            dynamo_ok=snap.dynamo_ok,
+            checked_at=snap.checked_at,
+            age_seconds=round(age, 3),
+            stale=age > self.stale_after,
+            error=snap.error,
+        )
+
+
+_monitor: Optional[HealthMonitor] = None
+_monitor_lock = threading.Lock()
+
+
+def get_health_monitor() -> HealthMonitor:
+    """Monitor compartido por todas las peticiones del proceso."""
+    global _monitor
+    with _monitor_lock:
+        if _monitor is None:
+            _monitor = HealthMonitor()
+        return _monitor
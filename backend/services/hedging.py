@@ -0,0 +1,174 @@
+import contextvars
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
+
+from backend.services.deadline import DeadlineExceeded, check_deadline, remaining
+from backend.services.metrics import DEADLINE_EXCEEDED, DYNAMO_HEDGES_SENT, DYNAMO_HEDGES_WON
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyTracker:
+    """Ventana de las últimas latencias por operación y su cuantil (p. ej. p95)."""
+
+    def __init__(self, quantile: float = 0.95, window: int = 256, min_samples: int = 20) -> None:
+        self.q = quantile
+        self.window = window
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._samples: dict[str, deque] = {}
+        # Cuantil calculado y muestras desde entonces: se recalcula cada `window // 8`
+        self._cached: dict[str, tuple[float, int]] = {}
+
+    def observe(self, operation: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(operation)
+            if samples is None:
+                samples = self._samples[operation] = deque(maxlen=self.window)
+            samples.append(seconds)
+            if operation in self._cached:
+                value, since = self._cached[operation]
+                self._cached[operation] = (value, since + 1)
+
+    def quantile(self, operation: str) -> Optional[float]:
+        """Cuantil de la ventana, o None mientras haya menos de `min_samples`."""
+        with self._lock:
+            samples = self._samples.get(operation)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            cached = self._cached.get(operation)
+            if cached is not None and cached[1] < max(1, self.window // 8):
+                return cached[0]
+            ordered = sorted(samples)
+            value = ordered[min(len(ordered) - 1, int(self.q * len(ordered)))]
+            self._cached[operation] = (value, 0)
+            return value
+
+
+class HedgedReads:
+    """
+    Lecturas idempotentes (GetItem, Query) con hedging y límite por petición.
+
+    - Con `DYNAMODB_HEDGE=true`, si la respuesta no llega en el p95 reciente
+      de esa operación se envía una copia y gana la primera respuesta correcta.
+      Como mucho `DYNAMODB_HEDGE_MAX_RATIO` (defecto 0.1) de las llamadas
+      llevan copia, así que la carga extra sobre DynamoDB está acotada.
+    - Con un límite de petición activo (`REQUEST_DEADLINE_MS`) no se espera
+      más allá: se lanza `DeadlineExceeded` y la llamada en curso termina
+      sola en segundo plano (acotada por `DYNAMODB_READ_TIMEOUT`).
+
+    Sin ninguna de las dos opciones la llamada se ejecuta tal cual en el hilo
+    de la petición.
+    """
+
+    def __init__(self, enabled: Optional[bool] = None, quantile: Optional[float] = None,
+                 min_delay_ms: Optional[float] = None, max_ratio: Optional[float] = None,
+                 workers: Optional[int] = None) -> None:
+        self.enabled = (enabled if enabled is not None
+                        else os.environ.get("DYNAMODB_HEDGE", "false").lower() == "true")
+        self.tracker = LatencyTracker(
+            float(quantile if quantile is not None else os.environ.get("DYNAMODB_HEDGE_QUANTILE", "0.95")),
+        )
+        self.min_delay = float(min_delay_ms if min_delay_ms is not None
+                               else os.environ.get("DYNAMODB_HEDGE_MIN_DELAY_MS", "5")) / 1000
+        self.max_ratio = float(max_ratio if max_ratio is not None
+                               else os.environ.get("DYNAMODB_HEDGE_MAX_RATIO", "0.1"))
+        self.workers = int(workers if workers is not None else os.environ.get("DYNAMODB_HEDGE_WORKERS", "32"))
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._calls = 0
+        self._hedges = 0
+
+    # ── API pública ───────────────────────────────────────────────────────────
+
+    def call(self, operation: str, fn: Callable[[], Any]) -> Any:
+        """Ejecuta `fn` (una lectura de DynamoDB) respetando el hedging y el límite."""
+        if not self.enabled and remaining() is None:
+            return self._timed(operation, fn)
+        check_deadline(operation)
+        with self._lock:
+            self._calls += 1
+
+        primary = self._submit(operation, fn)
+        hedge: Optional[Future] = None
+        delay = self._hedge_delay(operation)
+        if delay is not None:
+            left = remaining()
+            done, _ = wait([primary], timeout=delay if left is None else min(delay, left))
+            if not done and self._take_hedge():
+                hedge = self._submit(operation, fn)
+                DYNAMO_HEDGES_SENT.inc(operation=operation)
+
+        pending = {primary} if hedge is None else {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, timeout=remaining(), return_when=FIRST_COMPLETED)
+            if not done:
+                DEADLINE_EXCEEDED.inc(operation=operation)
+                raise DeadlineExceeded(operation)
+            for future in done:
+                exc = future.exception()
+                if exc is None:
+                    if future is hedge:
+                        DYNAMO_HEDGES_WON.inc(operation=operation)
+                    return future.result()
+                # Si una copia falla se espera a la otra
+                error = error or exc
+        raise error
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    # ── Internos ──────────────────────────────────────────────────────────────
+
+    def _timed(self, operation: str, fn: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        result = fn()
+        self.tracker.observe(operation, time.perf_counter() - start)
+        return result
+
+    def _submit(self, operation: str, fn: Callable[[], Any]) -> Future:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="dynamo-read")
+            executor = self._executor
+        # El hilo hereda el contexto de la petición (límite, perfil)
+        context = contextvars.copy_context()
+        return executor.submit(context.run, self._timed, operation, fn)
+
+    def _hedge_delay(self, operation: str) -> Optional[float]:
+        if not self.enabled:
+            return None
+        p = self.tracker.quantile(operation)
+        return None if p is None else max(self.min_delay, p)
+
+    def _take_hedge(self) -> bool:
+        left = remaining()
+        if left is not None and left <= 0:
+            return False
+        with self._lock:
+            if self._hedges + 1 > self.max_ratio * self._calls:
+                return False
+            self._hedges += 1
+            return True
+
+
+_reads: Optional[HedgedReads] = None
+_reads_lock = threading.Lock()
+
+
+def get_hedged_reads() -> HedgedReads:
+    """Instancia compartida por todas las peticiones del proceso."""
+    global _reads
+    with _reads_lock:
+        if _reads is None:
+            _reads = HedgedReads()
+        return _reads
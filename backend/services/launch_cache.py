@@ -0,0 +1,122 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional
+
+from backend.services.metrics import LAUNCH_CACHE_ENTRIES, record_cache
+from sync_pipeline import VIEW_SIZE
+
+logger = logging.getLogger(__name__)
+
+CACHE_NAME = "launch_detail"
+
+
+class LaunchCache:
+    """
+    LRU acotado delante de `get_by_id` (detalle de un lanzamiento).
+
+    - Aciertos: se guardan `ttl` segundos.
+    - Fallos (ID inexistente): se guardan `negative_ttl` segundos, más corto,
+      así que un bot que repite IDs desconocidos no cuesta una lectura por
+      petición y un lanzamiento recién insertado aparece pronto.
+    - Con más de `max_entries` entradas se descarta la usada hace más tiempo.
+
+    La sync invalida por ID lo que cambió (`invalidate`) y, opcionalmente,
+    precarga los últimos lanzamientos completados (`prefetch`) desde la vista
+    `latest`, hasta `SYNC_VIEW_SIZE`.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None,
+                 negative_ttl: Optional[float] = None, prefetch_count: Optional[int] = None) -> None:
+        self.max_entries = int(max_entries if max_entries is not None
+                               else os.environ.get("LAUNCH_CACHE_SIZE", "0"))
+        self.ttl = float(ttl if ttl is not None else os.environ.get("LAUNCH_CACHE_TTL_SECONDS", "300"))
+        self.negative_ttl = float(negative_ttl if negative_ttl is not None
+                                  else os.environ.get("LAUNCH_CACHE_NEGATIVE_TTL_SECONDS", "30"))
+        self.prefetch_count = int(prefetch_count if prefetch_count is not None
+                                  else os.environ.get("LAUNCH_CACHE_PREFETCH", "0"))
+        self._lock = threading.Lock()
+        # launch_id → (item o None, expira en monotonic)
+        self._entries: OrderedDict[str, tuple[Optional[dict], float]] = OrderedDict()
+        # Cambia con cada invalidación: una lectura iniciada antes no se guarda
+        self._epoch = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ── Lectura ───────────────────────────────────────────────────────────────
+
+    def get(self, launch_id: str, fetch: Callable[[str], Optional[dict]]) -> Optional[dict]:
+        """Item de `launch_id` (o None si no existe), llamando a `fetch` solo en un fallo de caché."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(launch_id)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(launch_id)
+                record_cache(CACHE_NAME, hit=True)
+                return entry[0]
+            epoch = self._epoch
+        record_cache(CACHE_NAME, hit=False)
+
+        item = fetch(launch_id)
+        with self._lock:
+            if epoch == self._epoch:
+                self._store(launch_id, item, time.monotonic())
+        return item
+
+    # ── Mantenimiento (sync) ──────────────────────────────────────────────────
+
+    def invalidate(self, launch_ids: Optional[Iterable[str]] = None) -> None:
+        """Descarta los IDs dados; sin IDs (p. ej. `full_reload`) vacía la caché."""
+        with self._lock:
+            self._epoch += 1
+            if launch_ids is None:
+                self._entries.clear()
+                return
+            for launch_id in launch_ids:
+                self._entries.pop(launch_id, None)
+
+    def prefetch(self, items: Iterable[dict]) -> int:
+        """Guarda items ya leídos (p. ej. los más recientes tras una sync)."""
+        now = time.monotonic()
+        stored = 0
+        with self._lock:
+            for item in items:
+                self._store(item["launch_id"], item, now)
+                stored += 1
+        return stored
+
+    def refresh_after_sync(self, service, changed_ids: Optional[list[str]]) -> None:
+        """Invalida lo que cambió en una generación y precarga los más recientes."""
+        self.invalidate(changed_ids)
+        if self.prefetch_count > 0:
+            # Un GetItem de la vista materializada; más allá de su tamaño haría falta recorrer la tabla
+            launches = service.get_view_launches("latest", min(self.prefetch_count, VIEW_SIZE))
+            count = self.prefetch(launches)
+            logger.info("Caché de detalle: %d lanzamientos recientes precargados", count)
+
+    def _store(self, launch_id: str, item: Optional[dict], now: float) -> None:
+        self._entries[launch_id] = (item, now + (self.ttl if item is not None else self.negative_ttl))
+        self._entries.move_to_end(launch_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+_cache: Optional[LaunchCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_launch_cache() -> Optional[LaunchCache]:
+    """Caché de detalle del proceso, o None si `LAUNCH_CACHE_SIZE` es 0 (defecto)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LaunchCache()
+            LAUNCH_CACHE_ENTRIES.set_function(lambda: len(_cache))
+        return _cache if _cache.enabled else None
@@ -0,0 +1,229 @@
+import logging
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+from backend.models.launch import Launch, LaunchStats, LaunchStatus
+from backend.services.launch_service import LaunchService, open_launch_service
+from sync_pipeline import LAUNCH_VIEWS, VIEW_SIZE
+
+logger = logging.getLogger(__name__)
+
+LAUNCH_FIELDS = tuple(Launch.model_fields)
+
+
+class LaunchRecord:
+    """Lanzamiento en la réplica: atributos con `__slots__` en lugar de un dict por item."""
+
+    __slots__ = LAUNCH_FIELDS
+
+    def __init__(self, item: dict) -> None:
+        launch = LaunchService.to_launch(item)
+        for field in LAUNCH_FIELDS:
+            value = getattr(launch, field)
+            if field == "status":
+                value = value.value
+            elif field == "payloads":
+                value = tuple(value)
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("LaunchRecord es inmutable")
+
+    def get(self, field: str, default=None):
+        """Compatibilidad con el acceso tipo item de DynamoDB (`item.get("status")`)."""
+        return getattr(self, field, default)
+
+
+class ReplicaSnapshot:
+    """Copia inmutable de la tabla con sus índices precalculados."""
+
+    __slots__ = ("generation", "loaded_at", "by_date", "by_id", "by_status", "views", "stats")
+
+    def __init__(self, items: list[dict], generation: Optional[int]) -> None:
+        records = [LaunchRecord(i) for i in items]
+        records.sort(key=lambda r: r.launch_date, reverse=True)
+
+        by_status: dict[str, list[LaunchRecord]] = {}
+        for record in records:
+            by_status.setdefault(record.status, []).append(record)
+
+        self.generation = generation
+        self.loaded_at  = time.monotonic()
+        self.by_date    = tuple(records)
+        self.by_id      = {r.launch_id: r for r in records}
+        self.by_status  = {status: tuple(group) for status, group in by_status.items()}
+        self.views      = {
+            name: tuple(view.order((r for s in view.statuses for r in self.by_status.get(s, ())), VIEW_SIZE))
+            for name, view in LAUNCH_VIEWS.items()
+        }
+
+        success = len(self.by_status.get("success", ()))
+        failed  = len(self.by_status.get("failed", ()))
+        self.stats = LaunchStats(
+            total        = len(records),
+            success      = success,
+            failed       = failed,
+            upcoming     = len(self.by_status.get("upcoming", ())),
+            success_rate = round(success / (success + failed) * 100, 1) if (success + failed) > 0 else 0.0,
+        )
+
+
+class LaunchReplica:
+    """
+    Réplica en memoria de la tabla de lanzamientos (una por proceso).
+
+    Expone la misma API de lectura que `DynamoService` (get_all, get_by_id,
+    get_by_status, get_stats, to_launch) servida desde índices en memoria.
+    Un hilo de fondo consulta cada `poll_interval` segundos el item
+    `#sync-generation` (un GetItem) y solo si la generación cambió relee la
+    tabla completa; la nueva copia se construye aparte y se publica con una
+    única asignación, así que los lectores nunca ven un estado a medias.
+    """
+
+    def __init__(
+        self,
+        service_factory: Callable[[], LaunchService] = open_launch_service,
+        poll_interval: Optional[float] = None,
+        max_age: Optional[float] = None,
+    ) -> None:
+        self.poll_interval = float(
+            poll_interval if poll_interval is not None
+            else os.environ.get("REPLICA_POLL_SECONDS", "5")
+        )
+        # Sin item de generación (tabla sin syncs nuevas) se recarga por antigüedad
+        self.max_age = float(
+            max_age if max_age is not None
+            else os.environ.get("REPLICA_MAX_AGE_SECONDS", "300")
+        )
+        self._service_factory = service_factory
+        self._service: Optional[LaunchService] = None
+        self._snapshot: Optional[ReplicaSnapshot] = None
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.reloads = 0
+
+    # ── Ciclo de vida ─────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="launch-replica", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval)
+        self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.refresh()
+            except Exception as exc:
+                # Se sigue sirviendo la copia anterior hasta el próximo intento
+                logger.warning("No se pudo refrescar la réplica: %s", exc)
+                self._service = None
+
+    def after_fork(self) -> None:
+        """Conserva la copia cargada; descarta el cliente, el lock y el hilo del padre."""
+        self._service = None
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def ready(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def generation(self) -> Optional[int]:
+        return self._snapshot.generation if self._snapshot else None
+
+    @property
+    def snapshot(self) -> Optional[ReplicaSnapshot]:
+        return self._snapshot
+
+    # ── Refresco ──────────────────────────────────────────────────────────────
+
+    def refresh(self, force: bool = False) -> bool:
+        """Recarga la tabla si cambió la generación. Retorna True si hubo recarga."""
+        with self._refresh_lock:
+            if self._service is None:
+                self._service = self._service_factory()
+            generation = self._service.get_generation()
+            current = self._snapshot
+            if not force and current is not None:
+                if generation is not None and generation == current.generation:
+                    return False
+                if generation is None and time.monotonic() - current.loaded_at < self.max_age:
+                    return False
+
+            start = time.perf_counter()
+            snapshot = ReplicaSnapshot(self._service.get_all(), generation)
+            self._snapshot = snapshot
+            self.reloads += 1
+            logger.info("Réplica cargada: %d lanzamientos, generación %s (%.0f ms)",
+                        snapshot.stats.total, generation, (time.perf_counter() - start) * 1000)
+            return True
+
+    # ── Lecturas (misma API que DynamoService) ────────────────────────────────
+
+    def get_all(self, limit: Optional[int] = None) -> list[LaunchRecord]:
+        records = self._snapshot.by_date
+        return list(records[:limit] if limit else records)
+
+    def get_by_id(self, launch_id: str) -> Optional[LaunchRecord]:
+        return self._snapshot.by_id.get(launch_id)
+
+    def get_by_status(self, status: str) -> list[LaunchRecord]:
+        return list(self._snapshot.by_status.get(status, ()))
+
+    def get_view_launches(self, name: str, limit: int) -> list[LaunchRecord]:
+        return list(self._snapshot.views[name][:limit])
+
+    def get_stats(self) -> LaunchStats:
+        return self._snapshot.stats
+
+    @staticmethod
+    def to_launch(record: LaunchRecord) -> Launch:
+        # Los campos ya se validaron al construir el registro
+        values = {f: getattr(record, f) for f in LAUNCH_FIELDS}
+        values["status"] = LaunchStatus(values["status"])
+        values["payloads"] = list(values["payloads"])
+        return Launch.model_construct(**values)
+
+
+_replica: Optional[LaunchReplica] = None
+_replica_lock = threading.Lock()
+
+
+def _after_fork_in_child() -> None:
+    # Un worker creado por fork hereda la copia ya cargada (copy-on-write) pero
+    # no debe reutilizar las conexiones, locks ni hilos del proceso padre
+    global _replica_lock
+    _replica_lock = threading.Lock()
+    if _replica is not None:
+        _replica.after_fork()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def replica_enabled() -> bool:
+    return os.environ.get("READ_REPLICA", "false").lower() == "true"
+
+
+def get_replica() -> Optional[LaunchReplica]:
+    """Réplica compartida por el proceso, o None si `READ_REPLICA` no está activo."""
+    global _replica
+    if not replica_enabled():
+        return None
+    with _replica_lock:
+        if _replica is None:
+            _replica = LaunchReplica()
+        return _replica
@@ -0,0 +1,144 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from backend.models.launch import Launch, LaunchStats
+from launch_store import SQLITE, storage_backend
+from sync_pipeline import CHANGELOG_RETENTION, LAUNCH_VIEWS
+
+
+class LaunchService(ABC):
+    """
+    API de lectura común a los motores de almacenamiento (`STORAGE_BACKEND`):
+    `DynamoService` y `SQLiteService`. Las subclases implementan el acceso a
+    datos (métodos abstractos: un motor incompleto falla al instanciarse);
+    el historial de cambios, las estadísticas y la conversión a modelo se
+    resuelven aquí sobre esas primitivas.
+    """
+
+    # ── Primitivas (cada motor) ───────────────────────────────────────────────
+
+    @abstractmethod
+    def ping(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_all(self, limit: Optional[int] = None) -> list[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_by_id(self, launch_id: str) -> Optional[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_by_ids(self, launch_ids: list[str]) -> list[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_by_status(self, status: str) -> list[dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_generation(self) -> Optional[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_changelog(self, first: int, last: int) -> dict[int, dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_view(self, key: str) -> Optional[dict]:
+        raise NotImplementedError
+
+    # ── Consultas derivadas ───────────────────────────────────────────────────
+
+    def get_view_launches(self, name: str, limit: int) -> list[dict]:
+        """
+        Primeros `limit` lanzamientos de la vista materializada `name` (`next`,
+        `latest`) en su orden. Sin vista publicada (tabla de antes de las
+        vistas) o más corta que `limit`, se calcula consultando por estado.
+        """
+        view = LAUNCH_VIEWS[name]
+        item = self.get_view(view.key)
+        if item is not None and int(item.get("size", 0)) >= limit:
+            return list(item.get("launches", []))[:limit]
+        return view.order((i for status in view.statuses for i in self.get_by_status(status)), limit)
+
+    def get_changes(self, since: int) -> dict:
+        """
+        Lanzamientos cambiados desde la generación `since` según el historial
+        `#changes#<gen>`. Retorna {generation, full_reload, items}; full_reload
+        indica que el historial no cubre el rango pedido.
+        """
+        generation = self.get_generation()
+        result: dict = {"generation": generation, "full_reload": False, "items": []}
+        if generation is not None and since == generation:
+            return result
+        if generation is None or since <= 0 or since > generation or generation - since > CHANGELOG_RETENTION:
+            result["full_reload"] = True
+            return result
+
+        entries = self.get_changelog(since + 1, generation)
+        if len(entries) < generation - since or any(e.get("full_reload") for e in entries.values()):
+            result["full_reload"] = True
+            return result
+
+        ids = sorted({lid for e in entries.values() for lid in e.get("ids", [])})
+        result["items"] = self.get_by_ids(ids)
+        return result
+
+    def get_stats(self) -> LaunchStats:
+        """Calcula estadísticas de todos los lanzamientos."""
+        items = self.get_all()
+        counts: dict[str, int] = {}
+        for item in items:
+            status = item.get("status")
+            counts[status] = counts.get(status, 0) + 1
+        return self.build_stats(len(items), counts)
+
+    @staticmethod
+    def build_stats(total: int, counts: dict[str, int]) -> LaunchStats:
+        success  = counts.get("success", 0)
+        failed   = counts.get("failed", 0)
+        upcoming = counts.get("upcoming", 0)
+        rate = round(success / (success + failed) * 100, 1) if (success + failed) > 0 else 0.0
+
+        return LaunchStats(
+            total=total,
+            success=success,
+            failed=failed,
+            upcoming=upcoming,
+            success_rate=rate,
+        )
+
+    # ── Utilidades ────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def to_launch(item: dict) -> Launch:
+        """Convierte un item almacenado a modelo Pydantic."""
+        return Launch(
+            launch_id     = item.get("launch_id", ""),
+            mission_name  = item.get("mission_name", ""),
+            rocket_name   = item.get("rocket_name", ""),
+            launch_date   = item.get("launch_date", ""),
+            status        = item.get("status", "unknown"),
+            launchpad     = item.get("launchpad", ""),
+            flight_number = str(item.get("flight_number", "")),
+            details       = item.get("details", ""),
+            payloads      = list(item.get("payloads", [])),
+            webcast_url   = item.get("webcast_url", ""),
+            article_url   = item.get("article_url", ""),
+            wikipedia_url = item.get("wikipedia_url", ""),
+            patch_small   = item.get("patch_small", ""),
+            patch_large   = item.get("patch_large", ""),
+        )
+
+
+def open_launch_service() -> LaunchService:
+    """Servicio de lectura del motor configurado en `STORAGE_BACKEND`."""
+    if storage_backend() == SQLITE:
+        from backend.services.sqlite_service import SQLiteService
+
+        return SQLiteService()
+    from backend.services.dynamo_service import DynamoService
+
+    return DynamoService()
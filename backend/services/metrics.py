@@ -0,0 +1,309 @@
+"""
+Métricas en formato de exposición de Prometheus, sin dependencias externas.
+
+Cada proceso (worker de uvicorn) mantiene su propio registro en memoria; el
+scrape de `/metrics` devuelve los valores del proceso que atiende la petición.
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from backend.services.profiler import current_profile
+
+# Buckets de latencia en segundos (de 1 ms a 10 s)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PAGE_BUCKETS    = (1, 2, 3, 5, 10, 20, 50)
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, k)} {v:g}" for k, v in items
+        ]
+
+
+class Gauge(_Metric):
+    """Gauge cuyo valor se calcula al renderizar (callback por conjunto de labels)."""
+
+    kind = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._callbacks: dict[tuple[str, ...], Callable[[], float]] = {}
+
+    def set_function(self, fn: Callable[[], float], **labels: str) -> None:
+        with self._lock:
+            self._callbacks[self._key(labels)] = fn
+
+    def set(self, value: float, **labels: str) -> None:
+        self.set_function(lambda: value, **labels)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._callbacks.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, k)} {fn():g}" for k, fn in items
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels → [conteos por bucket..., suma, total]
+        self._values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            data = self._values.get(key)
+            if data is None:
+                data = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                data[index] += 1
+            data[-2] += value
+            data[-1] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> float:
+        data = self._values.get(self._key(labels))
+        return data[-1] if data else 0.0
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        lines = self.header()
+        for key, data in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, data):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{bound:g}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative:g}")
+            labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{labels} {data[-1]:g}")
+            plain = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{plain} {data[-2]:g}")
+            lines.append(f"{self.name}_count{plain} {data[-1]:g}")
+        return lines
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: list[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# ── HTTP ──────────────────────────────────────────────────────────────────────
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    "http_requests_total", "Peticiones HTTP atendidas", ("method", "route", "status"),
+))
+HTTP_LATENCY = REGISTRY.register(Histogram(
+    "http_request_duration_seconds", "Latencia de las peticiones HTTP", ("method", "route"),
+))
+
+# ── DynamoDB ──────────────────────────────────────────────────────────────────
+DYNAMO_CALLS = REGISTRY.register(Counter(
+    "dynamodb_calls_total", "Llamadas a DynamoDB por operación", ("operation", "outcome"),
+))
+DYNAMO_LATENCY = REGISTRY.register(Histogram(
+    "dynamodb_call_duration_seconds", "Latencia de las llamadas a DynamoDB", ("operation",),
+))
+DYNAMO_SCAN_PAGES = REGISTRY.register(Histogram(
+    "dynamodb_scan_pages", "Páginas leídas por scan completo", ("operation",), buckets=PAGE_BUCKETS,
+))
+DYNAMO_CAPACITY = REGISTRY.register(Counter(
+    "dynamodb_consumed_capacity_units_total", "RCU/WCU consumidas (ReturnConsumedCapacity)", ("operation",),
+))
+DYNAMO_HEDGES_SENT = REGISTRY.register(Counter(
+    "dynamodb_hedges_sent_total", "Peticiones duplicadas (hedge) enviadas tras el retardo p95", ("operation",),
+))
+DYNAMO_HEDGES_WON = REGISTRY.register(Counter(
+    "dynamodb_hedges_won_total", "Hedges cuya respuesta llegó antes que la original", ("operation",),
+))
+DEADLINE_EXCEEDED = REGISTRY.register(Counter(
+    "request_deadline_exceeded_total", "Llamadas abandonadas por agotar REQUEST_DEADLINE_MS", ("operation",),
+))
+
+# ── SQLite (STORAGE_BACKEND=sqlite) ───────────────────────────────────────────
+SQLITE_QUERIES = REGISTRY.register(Counter(
+    "sqlite_queries_total", "Consultas al almacenamiento SQLite por operación", ("operation", "outcome"),
+))
+SQLITE_LATENCY = REGISTRY.register(Histogram(
+    "sqlite_query_duration_seconds", "Latencia de las consultas a SQLite", ("operation",),
+))
+
+# ── Server-Sent Events ────────────────────────────────────────────────────────
+SSE_SUBSCRIBERS = REGISTRY.register(Gauge(
+    "sse_subscribers", "Conexiones abiertas a GET /api/v1/events",
+))
+SSE_EVENTS = REGISTRY.register(Counter(
+    "sse_events_total", "Eventos publicados en el canal SSE", ("type",),
+))
+
+# ── Cachés ────────────────────────────────────────────────────────────────────
+CACHE_REQUESTS = REGISTRY.register(Counter(
+    "cache_requests_total", "Consultas a cachés en memoria", ("cache", "result"),
+))
+CACHE_HIT_RATIO = REGISTRY.register(Gauge(
+    "cache_hit_ratio", "Proporción de aciertos por caché (0-1)", ("cache",),
+))
+LAUNCH_CACHE_ENTRIES = REGISTRY.register(Gauge(
+    "launch_cache_entries", "Entradas en la caché LRU de detalle (incluye IDs inexistentes)",
+))
+READ_COALESCED = REGISTRY.register(Counter(
+    "read_coalesced_total", "Lecturas que esperaron a una consulta idéntica en curso", ("operation",),
+))
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Registra un acierto/fallo de caché y publica su hit ratio."""
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+    CACHE_HIT_RATIO.set_function(lambda: _hit_ratio(cache), cache=cache)
+
+
+def _hit_ratio(cache: str) -> float:
+    hits   = CACHE_REQUESTS.value(cache=cache, result="hit")
+    misses = CACHE_REQUESTS.value(cache=cache, result="miss")
+    return hits / (hits + misses) if hits + misses else 0.0
+
+
+@contextmanager
+def observe_dynamo(operation: str) -> Iterator[Callable[[Optional[dict]], None]]:
+    """
+    Mide una llamada a DynamoDB. El callback devuelto acumula el
+    `ConsumedCapacity` de cada respuesta (página) recibida.
+    """
+    def consumed(response: Optional[dict]) -> None:
+        units = ((response or {}).get("ConsumedCapacity") or {}).get("CapacityUnits")
+        if units:
+            DYNAMO_CAPACITY.inc(float(units), operation=operation)
+
+    start = time.perf_counter()
+    try:
+        yield consumed
+    except Exception:
+        DYNAMO_CALLS.inc(operation=operation, outcome="error")
+        raise
+    else:
+        DYNAMO_CALLS.inc(operation=operation, outcome="ok")
+    finally:
+        elapsed = time.perf_counter() - start
+        DYNAMO_LATENCY.observe(elapsed, operation=operation)
+        profile = current_profile()
+        if profile is not None:
+            profile.add_dynamo(operation, elapsed)
+
+
+@contextmanager
+def observe_sqlite(operation: str) -> Iterator[None]:
+    """Mide una consulta al almacenamiento SQLite."""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        SQLITE_QUERIES.inc(operation=operation, outcome="error")
+        raise
+    else:
+        SQLITE_QUERIES.inc(operation=operation, outcome="ok")
+    finally:
+        SQLITE_LATENCY.observe(time.perf_counter() - start, operation=operation)
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI que registra conteo, código de estado y latencia por ruta.
+    Usa la plantilla de la ruta (`/api/v1/launches/{launch_id}`) como label
+    para no crear una serie por cada ID.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = [500]
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start":
+                status_code[0] = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            method = scope.get("method", "")
+            HTTP_LATENCY.observe(time.perf_counter() - start, method=method, route=path)
+            HTTP_REQUESTS.inc(method=method, route=path, status=str(status_code[0]))
@@ -0,0 +1,238 @@
+import asyncio
+import cProfile
+import functools
+import hmac
+import logging
+import os
+import pstats
+import random
+import re
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, TypeVar
+
+from fastapi.routing import APIRoute
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+PROFILE_HEADER = b"x-profile"
+
+# Fases que se separan del perfil: (nombre, sufijo del fichero, función).
+# El tiempo es acumulado (incluye lo que llaman); las funciones built-in
+# aparecen en pstats con fichero "~".
+PHASES = (
+    ("dynamodb-network",     "botocore/httpsession.py",        "send"),
+    ("dynamodb-parse",       "botocore/parsers.py",            "parse"),
+    ("dynamodb-deserialize", "boto3/dynamodb/transform.py",    "inject_attribute_value_output"),
+    ("boto3-client",         "boto3/session.py",               "resource"),
+    ("to-launch",            "backend/services/launch_service.py", "to_launch"),
+    ("sort",                 "~",                              "<method 'sort' of 'list' objects>"),
+)
+
+_current: ContextVar[Optional["RequestProfile"]] = ContextVar("request_profile", default=None)
+
+
+def _sample_rate() -> float:
+    return float(os.environ.get("PROFILE_SAMPLE_RATE", "0") or 0)
+
+
+def profiling_enabled() -> bool:
+    """Profiling configurado (token o muestreo). Apagado no se instala nada."""
+    return bool(os.environ.get("PROFILE_TOKEN")) or _sample_rate() > 0
+
+
+def current_profile() -> Optional["RequestProfile"]:
+    return _current.get()
+
+
+class RequestProfile:
+    """
+    Perfil de una petición: un `cProfile` por cada tramo de código síncrono
+    (dependencias y endpoint, que FastAPI ejecuta en el threadpool) y el
+    tiempo de cada llamada a DynamoDB registrado por `observe_dynamo`.
+    """
+
+    def __init__(self, trigger: str) -> None:
+        self.id = uuid.uuid4().hex[:12]
+        self.trigger = trigger
+        self.started = time.perf_counter()
+        self.total: Optional[float] = None
+        self.profiled = 0.0
+        self.dynamo: dict[str, list[float]] = {}    # operación → [llamadas, segundos]
+        self._profiles: list[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def add_dynamo(self, operation: str, seconds: float) -> None:
+        with self._lock:
+            entry = self.dynamo.setdefault(operation, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+    def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Ejecuta `fn` bajo un cProfile propio del hilo actual."""
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profiler.disable()
+            with self._lock:
+                self.profiled += time.perf_counter() - started
+                self._profiles.append(profiler)
+
+    def finish(self) -> None:
+        if self.total is None:
+            self.total = time.perf_counter() - self.started
+
+    def stats(self) -> Optional[pstats.Stats]:
+        with self._lock:
+            profiles = list(self._profiles)
+        if not profiles:
+            return None
+        stats = pstats.Stats(profiles[0])
+        for profiler in profiles[1:]:
+            stats.add(profiler)
+        return stats
+
+    def phases(self, stats: Optional[pstats.Stats]) -> dict[str, float]:
+        """Segundos acumulados por fase de `PHASES` presentes en el perfil."""
+        found: dict[str, float] = {}
+        if stats is None:
+            return found
+        for (filename, _, function), (_, _, _, cumulative, _) in stats.stats.items():
+            for name, suffix, wanted in PHASES:
+                if function == wanted and filename.replace("\\", "/").endswith(suffix):
+                    found[name] = found.get(name, 0.0) + cumulative
+        return found
+
+    def server_timing(self, stats: Optional[pstats.Stats]) -> str:
+        """Resumen en formato `Server-Timing` (lo muestran las devtools del navegador)."""
+        self.finish()
+        entries = [f"total;dur={self.total * 1000:.1f}", f"app;dur={self.profiled * 1000:.1f}"]
+        for operation, (calls, seconds) in sorted(self.dynamo.items()):
+            entries.append(f'dynamodb-{operation};dur={seconds * 1000:.1f};desc="{calls} llamadas"')
+        for name, seconds in self.phases(stats).items():
+            entries.append(f"{name};dur={seconds * 1000:.1f}")
+        return ", ".join(entries)
+
+
+# ── Instrumentación (solo con el profiling configurado) ──────────────────────
+
+def profiled(fn: F) -> F:
+    """
+    Perfila `fn` cuando la petición en curso se está perfilando. Sin profiling
+    configurado retorna la función original: ni una llamada extra.
+    """
+    # include_router vuelve a crear las rutas con el endpoint ya envuelto
+    if not profiling_enabled() or getattr(fn, "__profiled__", False):
+        return fn
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        profile = _current.get()
+        if profile is None:
+            return fn(*args, **kwargs)
+        return profile.run(fn, *args, **kwargs)
+
+    wrapper.__profiled__ = True  # type: ignore[attr-defined]
+    return wrapper  # type: ignore[return-value]
+
+
+class ProfiledRoute(APIRoute):
+    """Ruta cuyos endpoints síncronos se ejecutan bajo el perfil de la petición."""
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        if not asyncio.iscoroutinefunction(endpoint):
+            endpoint = profiled(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+
+def route_class() -> type[APIRoute]:
+    return ProfiledRoute if profiling_enabled() else APIRoute
+
+
+class ProfilingMiddleware:
+    """
+    Middleware ASGI que activa el perfil de una petición:
+
+    - `X-Profile: <PROFILE_TOKEN>`: el resumen vuelve en la cabecera
+      `Server-Timing` y el ID del perfil en `X-Profile-Id`.
+    - `PROFILE_SAMPLE_RATE` (0-1): una fracción del tráfico, sin cabeceras
+      en la respuesta.
+
+    En ambos casos el perfil completo se guarda como `.prof` (pstats) en
+    `PROFILE_DIR`, listo para snakeviz / flameprof / gprof2dot.
+    """
+
+    def __init__(self, app, token: Optional[str] = None, sample_rate: Optional[float] = None,
+                 directory: Optional[str] = None, keep: Optional[int] = None) -> None:
+        self.app = app
+        self.token = (token if token is not None else os.environ.get("PROFILE_TOKEN", "")).encode()
+        self.sample_rate = sample_rate if sample_rate is not None else _sample_rate()
+        self.directory = directory or os.environ.get("PROFILE_DIR", "/tmp/profiles")
+        self.keep = int(keep if keep is not None else os.environ.get("PROFILE_KEEP", "200"))
+        self._write_lock = threading.Lock()     # escritura y poda desde varios hilos
+
+    def _trigger(self, scope) -> Optional[str]:
+        if self.token:
+            for name, value in scope.get("headers", ()):
+                if name == PROFILE_HEADER:
+                    return "header" if hmac.compare_digest(value, self.token) else None
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return "sample"
+        return None
+
+    async def __call__(self, scope, receive, send) -> None:
+        trigger = self._trigger(scope) if scope["type"] == "http" else None
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(trigger)
+        reset = _current.set(profile)
+
+        async def send_wrapper(message) -> None:
+            # El endpoint ya terminó cuando se envían las cabeceras
+            if message["type"] == "http.response.start" and trigger == "header":
+                timing = profile.server_timing(profile.stats())
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", timing.encode()),
+                    (b"x-profile-id", profile.id.encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(reset)
+            profile.finish()
+            # Combinar los perfiles y escribir el .prof es CPU y disco: fuera del event loop
+            await asyncio.to_thread(self._store, profile, scope)
+
+    def _store(self, profile: RequestProfile, scope) -> None:
+        stats = profile.stats()
+        route = getattr(scope.get("route"), "path", None) or scope.get("path", "")
+        logger.info("Perfil %s (%s) %s %s: %s", profile.id, profile.trigger, scope.get("method"),
+                    route, profile.server_timing(stats))
+        if stats is None:
+            return
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
+        try:
+            with self._write_lock:
+                os.makedirs(self.directory, exist_ok=True)
+                stats.dump_stats(os.path.join(
+                    self.directory, f"{int(time.time() * 1000)}-{scope.get('method')}-{slug}-{profile.id}.prof",
+                ))
+                self._prune()
+        except OSError as exc:
+            logger.warning("No se pudo guardar el perfil %s: %s", profile.id, exc)
+
+    def _prune(self) -> None:
+        files = sorted(f for f in os.listdir(self.directory) if f.endswith(".prof"))
+        for name in files[:max(0, len(files) - self.keep)]:
+            os.remove(os.path.join(self.directory, name))
@@ -0,0 +1,194 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Any, Callable, Hashable, Optional
+
+from backend.models.launch import LaunchStats
+from backend.services.deadline import DeadlineExceeded, check_deadline, remaining
+from backend.services.launch_cache import LaunchCache
+from backend.services.metrics import READ_COALESCED, record_cache
+
+logger = logging.getLogger(__name__)
+
+CACHE_NAME = "launch_reads"
+
+
+class _Entry:
+    __slots__ = ("value", "fetched_at")
+
+    def __init__(self, value: Any, fetched_at: float) -> None:
+        self.value = value
+        self.fetched_at = fetched_at
+
+
+class ReadCoalescer:
+    """
+    Single-flight por clave para las lecturas del backend.
+
+    Las peticiones concurrentes con la misma clave (p. ej. el scan completo de
+    `/launches` o `/stats`) comparten una única llamada a DynamoDB en curso y
+    reciben su mismo resultado (o su misma excepción).
+
+    Opcionalmente guarda el resultado:
+    - `ttl` segundos: se sirve desde memoria sin consultar DynamoDB.
+    - `stale` segundos adicionales (stale-while-revalidate): se sirve la copia
+      vencida y un único hilo de fondo la refresca.
+    Con ambos a 0 (defecto) solo se coalescen las llamadas simultáneas.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, stale: Optional[float] = None) -> None:
+        self.ttl = float(ttl if ttl is not None else os.environ.get("READ_CACHE_TTL_SECONDS", "0"))
+        self.stale = float(stale if stale is not None else os.environ.get("READ_CACHE_STALE_SECONDS", "0"))
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, Future] = {}
+        self._entries: dict[Hashable, _Entry] = {}
+        # Cambia con cada invalidación: un fetch iniciado antes no publica su resultado
+        self._epoch = 0
+
+    @property
+    def caching(self) -> bool:
+        return self.ttl > 0 or self.stale > 0
+
+    # ── API pública ───────────────────────────────────────────────────────────
+
+    def get(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """
+        Retorna el valor de `key`, ejecutando `fetch` como mucho una vez a la vez.
+        Quien se suma a una lectura en curso espera como mucho lo que le quede
+        a su propia petición y, si la lectura falla porque se agotó el límite
+        de la petición que la lanzó, la repite en lugar de heredar ese error.
+        """
+        operation = str(key[0] if isinstance(key, tuple) else key)
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    age = time.monotonic() - entry.fetched_at
+                    if age < self.ttl:
+                        record_cache(CACHE_NAME, hit=True)
+                        return entry.value
+                    if age < self.ttl + self.stale:
+                        record_cache(CACHE_NAME, hit=True)
+                        if key not in self._inflight:
+                            future = self._begin(key)
+                            threading.Thread(
+                                target=self._fetch, args=(key, fetch, future, self._epoch, True),
+                                name="read-revalidate", daemon=True,
+                            ).start()
+                        return entry.value
+                if self.caching:
+                    record_cache(CACHE_NAME, hit=False)
+
+                future = self._inflight.get(key)
+                leader = future is None
+                if leader:
+                    future = self._begin(key)
+                epoch = self._epoch
+
+            if leader:
+                self._fetch(key, fetch, future, epoch)
+                return future.result()
+
+            READ_COALESCED.inc(operation=operation)
+            left = remaining()
+            try:
+                return future.result(timeout=None if left is None else max(0.0, left))
+            except FutureTimeout as exc:
+                check_deadline(operation)
+                raise DeadlineExceeded(operation) from exc
+            except DeadlineExceeded:
+                logger.info("La lectura %s en curso agotó el límite de su petición; reintentando", operation)
+
+    def invalidate(self) -> None:
+        """
+        Marca todo como vencido (p. ej. tras una sync). Con stale-while-revalidate
+        las copias siguen sirviéndose mientras se refrescan; si no, se descartan.
+        """
+        with self._lock:
+            self._epoch += 1
+            self._inflight.clear()
+            if self.stale > 0:
+                expired = time.monotonic() - self.ttl
+                for entry in self._entries.values():
+                    entry.fetched_at = min(entry.fetched_at, expired)
+            else:
+                self._entries.clear()
+
+    # ── Internos ──────────────────────────────────────────────────────────────
+
+    def _begin(self, key: Hashable) -> Future:
+        future: Future = Future()
+        self._inflight[key] = future
+        return future
+
+    def _fetch(self, key: Hashable, fetch: Callable[[], Any], future: Future, epoch: int,
+               background: bool = False) -> None:
+        try:
+            value = fetch()
+        except BaseException as exc:
+            with self._lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+            if background:
+                # Se sigue sirviendo la copia anterior hasta que venza del todo
+                logger.warning("No se pudo revalidar %s: %s", key, exc)
+            future.set_exception(exc)
+            return
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            if self.caching and epoch == self._epoch:
+                self._entries[key] = _Entry(value, time.monotonic())
+        future.set_result(value)
+
+
+class CoalescedReads:
+    """
+    Misma API de lectura que `DynamoService`, con las consultas amplias
+    (scan completo, filtro por estado, estadísticas) pasadas por el coalescer.
+    El detalle por ID pasa por la caché LRU de detalle si está activa.
+    """
+
+    def __init__(self, service, coalescer: ReadCoalescer, cache: Optional[LaunchCache] = None) -> None:
+        self.service = service
+        self.coalescer = coalescer
+        self.cache = cache
+
+    def get_all(self, limit: Optional[int] = None) -> list[dict]:
+        return list(self.coalescer.get(("get_all", limit), lambda: self.service.get_all(limit=limit)))
+
+    def get_by_status(self, status: str) -> list[dict]:
+        return list(self.coalescer.get(("get_by_status", status), lambda: self.service.get_by_status(status)))
+
+    def get_stats(self) -> LaunchStats:
+        return self.coalescer.get(("get_stats",), self.service.get_stats)
+
+    def get_changes(self, since: int) -> dict:
+        return self.coalescer.get(("get_changes", since), lambda: self.service.get_changes(since))
+
+    def get_view_launches(self, name: str, limit: int) -> list[dict]:
+        return list(self.coalescer.get(("get_view_launches", name, limit),
+                                       lambda: self.service.get_view_launches(name, limit)))
+
+    def get_by_id(self, launch_id: str) -> Optional[dict]:
+        if self.cache is not None:
+            return self.cache.get(launch_id, self.service.get_by_id)
+        return self.service.get_by_id(launch_id)
+
+    def to_launch(self, item: dict):
+        return self.service.to_launch(item)
+
+
+_coalescer: Optional[ReadCoalescer] = None
+_coalescer_lock = threading.Lock()
+
+
+def get_read_coalescer() -> ReadCoalescer:
+    """Coalescer compartido por todas las peticiones del proceso."""
+    global _coalescer
+    with _coalescer_lock:
+        if _coalescer is None:
+            _coalescer = ReadCoalescer()
+        return _coalescer
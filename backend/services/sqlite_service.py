@@ -0,0 +1,83 @@
+import logging
+import sqlite3
+from typing import Optional
+
+from backend.models.launch import LaunchStats
+from backend.services.launch_service import LaunchService
+from backend.services.metrics import observe_sqlite
+from launch_store import SQLiteStore, get_sqlite_store
+from sync_pipeline import changes_key
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteService(LaunchService):
+    """
+    Capa de acceso a SQLite (`STORAGE_BACKEND=sqlite`, fichero `SQLITE_PATH`).
+    Comparte el fichero con la sync local; cada hilo usa su propia conexión.
+    """
+
+    def __init__(self, store: Optional[SQLiteStore] = None) -> None:
+        self.store = store or get_sqlite_store()
+
+    # ── Salud ──────────────────────────────────────────────────────────────────
+
+    def ping(self) -> bool:
+        return self.store.ping()
+
+    # ── Consultas ──────────────────────────────────────────────────────────────
+
+    def get_all(self, limit: Optional[int] = None) -> list[dict]:
+        """Todos los lanzamientos, por fecha descendente."""
+        try:
+            with observe_sqlite("scan"):
+                return self.store.scan(limit)
+        except sqlite3.Error as exc:
+            logger.error("Error al leer los lanzamientos de SQLite: %s", exc)
+            raise
+
+    def get_by_id(self, launch_id: str) -> Optional[dict]:
+        try:
+            with observe_sqlite("get"):
+                return self.store.get_launch(launch_id)
+        except sqlite3.Error as exc:
+            logger.error("Error al obtener lanzamiento %s: %s", launch_id, exc)
+            raise
+
+    def get_by_ids(self, launch_ids: list[str]) -> list[dict]:
+        try:
+            with observe_sqlite("get_many"):
+                return self.store.get_launches(launch_ids)
+        except sqlite3.Error as exc:
+            logger.error("Error al obtener %d lanzamientos: %s", len(launch_ids), exc)
+            raise
+
+    def get_by_status(self, status: str) -> list[dict]:
+        """Filtra por estado sobre el índice (status, launch_date)."""
+        try:
+            with observe_sqlite("query_status"):
+                return self.store.query_status(status)
+        except sqlite3.Error as exc:
+            logger.error("Error al filtrar por estado %s: %s", status, exc)
+            raise
+
+    def get_generation(self) -> Optional[int]:
+        with observe_sqlite("get_meta"):
+            return self.store.get_generation()
+
+    def get_changelog(self, first: int, last: int) -> dict[int, dict]:
+        keys = [changes_key(g) for g in range(first, last + 1)]
+        with observe_sqlite("get_meta"):
+            return {int(e["generation"]): e for e in self.store.get_meta_many(keys)}
+
+    def get_view(self, key: str) -> Optional[dict]:
+        with observe_sqlite("get_meta"):
+            return self.store.get_meta(key)
+
+    # ── Estadísticas ───────────────────────────────────────────────────────────
+
+    def get_stats(self) -> LaunchStats:
+        """Conteo por estado con GROUP BY sobre el índice, sin leer los items."""
+        with observe_sqlite("count_by_status"):
+            counts = self.store.count_by_status()
+        return self.build_stats(sum(counts.values()), counts)
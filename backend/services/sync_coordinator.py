@@ -0,0 +1,249 @@
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Callable, Optional
+
+import boto3
+from botocore.exceptions import ClientError
+
+from backend.models.launch import SyncResponse
+from backend.services.deadline import DeadlineExceeded, check_deadline, remaining
+from launch_store import SQLITE, SQLiteStore, get_sqlite_store, storage_backend
+
+logger = logging.getLogger(__name__)
+
+# Los items de control comparten tabla con los lanzamientos; su clave empieza
+# por "#" y no tienen `status`, así que no aparecen en el GSI status-index.
+META_PREFIX = "#"
+LEASE_KEY   = "#sync-lease"
+
+
+def is_meta_item(item: dict) -> bool:
+    """Indica si un item de la tabla es de control (no es un lanzamiento)."""
+    return str(item.get("launch_id", "")).startswith(META_PREFIX)
+
+
+class SyncInProgressError(Exception):
+    """Otra tarea mantiene el lease de sincronización y no terminó a tiempo."""
+
+
+class SyncCoordinator:
+    """
+    Coalesce las sincronizaciones disparadas desde `/trigger`.
+
+    - Dentro del proceso: single-flight; las llamadas concurrentes se adjuntan
+      a la ejecución en curso y reciben su mismo resultado.
+    - Entre procesos/tareas ECS: lease con escritura condicional sobre el item
+      `#sync-lease`. Quien no obtiene el lease espera a que se libere y devuelve
+      el último resultado publicado. Con `STORAGE_BACKEND=sqlite` el mismo
+      lease se toma en una transacción sobre el fichero compartido.
+    - Intervalo mínimo: si la última sync terminó hace menos de `min_interval`
+      segundos se devuelve ese resultado sin volver a sincronizar.
+    """
+
+    def __init__(
+        self,
+        table=None,
+        store: Optional[SQLiteStore] = None,
+        min_interval: Optional[float] = None,
+        lease_seconds: Optional[float] = None,
+        poll_interval: float = 0.5,
+    ) -> None:
+        if store is None and table is None and storage_backend() == SQLITE:
+            store = get_sqlite_store()
+        self.store = store
+        if table is None and store is None:
+            kwargs: dict = {"region_name": os.environ.get("AWS_REGION", "us-east-1")}
+            endpoint = os.environ.get("DYNAMODB_ENDPOINT")
+            if endpoint:
+                kwargs["endpoint_url"] = endpoint
+            table = boto3.resource("dynamodb", **kwargs).Table(
+                os.environ.get("DYNAMODB_TABLE", "spacex-launches-dev")
+            )
+        self.table = table
+        self.min_interval = float(
+            min_interval if min_interval is not None
+            else os.environ.get("SYNC_MIN_INTERVAL_SECONDS", "60")
+        )
+        self.lease_seconds = float(
+            lease_seconds if lease_seconds is not None
+            else os.environ.get("SYNC_LEASE_SECONDS", "300")
+        )
+        self.poll_interval = poll_interval
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._lock = threading.Lock()
+        self._inflight: Optional[Future] = None
+
+    # ── API pública ───────────────────────────────────────────────────────────
+
+    def run(self, sync_fn: Callable[[], SyncResponse]) -> SyncResponse:
+        """
+        Ejecuta `sync_fn` una sola vez aunque se llame de forma concurrente.
+        Cada llamada espera con su propio límite de petición: si la sync en
+        curso falla porque se agotó el límite de quien la lanzó, las demás no
+        heredan ese error y la reintentan.
+        """
+        while True:
+            with self._lock:
+                future = self._inflight
+                leader = future is None
+                if leader:
+                    future = self._inflight = Future()
+            if leader:
+                return self._lead(sync_fn, future)
+
+            logger.info("Sync en curso en este proceso; adjuntando solicitud")
+            try:
+                result = future.result(timeout=self._wait_seconds())
+            except FutureTimeout as exc:
+                check_deadline("sync")
+                raise SyncInProgressError("Tiempo de espera agotado aguardando la sincronización en curso") from exc
+            except DeadlineExceeded:
+                logger.info("La sync en curso agotó el límite de su petición; reintentando")
+                continue
+            return result.model_copy(update={"coalesced": True})
+
+    def _lead(self, sync_fn: Callable[[], SyncResponse], future: Future) -> SyncResponse:
+        try:
+            result = self._run_with_lease(sync_fn)
+        except BaseException as exc:
+            self._finish(future, exception=exc)
+            raise
+        self._finish(future, result=result)
+        return result
+
+    def _finish(self, future: Future, result: Optional[SyncResponse] = None,
+                exception: Optional[BaseException] = None) -> None:
+        # Se libera el hueco antes de despertar a los seguidores: el que
+        # reintenta no debe encontrarse otra vez con esta ejecución terminada
+        with self._lock:
+            self._inflight = None
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+    def _wait_seconds(self) -> float:
+        """Espera máxima de un seguidor: el lease o lo que le quede a su petición."""
+        left = remaining()
+        return self.lease_seconds if left is None else max(0.0, min(self.lease_seconds, left))
+
+    # ── Lease distribuido ────────────────────────────────────────────────────
+
+    def _run_with_lease(self, sync_fn: Callable[[], SyncResponse]) -> SyncResponse:
+        deadline = time.monotonic() + self.lease_seconds
+        waiting_since: Optional[int] = None
+
+        while True:
+            lease = self._get_lease()
+            completed = int(lease.get("completed_at", 0))
+            if lease.get("last_result") and (
+                self._now_ms() - completed < self.min_interval * 1000
+                or (waiting_since is not None and completed >= waiting_since)
+            ):
+                logger.info("Reutilizando resultado de la sync terminada en %d", completed)
+                return self._decode(lease)
+
+            if self._acquire():
+                break
+
+            if waiting_since is None:
+                waiting_since = self._now_ms()
+                logger.info("Otra tarea mantiene el lease de sync; esperando su resultado")
+            if time.monotonic() >= deadline:
+                raise SyncInProgressError("Tiempo de espera agotado aguardando la sincronización en curso")
+            time.sleep(self.poll_interval)
+
+        try:
+            result = sync_fn()
+        except BaseException:
+            self._release(None)
+            raise
+        self._release(result)
+        return result
+
+    def _now_ms(self) -> int:
+        return int(time.time() * 1000)
+
+    def _get_lease(self) -> dict:
+        if self.store is not None:
+            return self.store.get_lease()
+        return self.table.get_item(Key={"launch_id": LEASE_KEY}, ConsistentRead=True).get("Item") or {}
+
+    def _acquire(self) -> bool:
+        now = self._now_ms()
+        if self.store is not None:
+            return self.store.acquire_lease(self.owner, now + int(self.lease_seconds * 1000), now)
+        try:
+            self.table.update_item(
+                Key={"launch_id": LEASE_KEY},
+                UpdateExpression="SET lease_owner = :owner, lease_expires_at = :expires",
+                ConditionExpression="attribute_not_exists(lease_owner) OR lease_expires_at < :now",
+                ExpressionAttributeValues={
+                    ":owner":   self.owner,
+                    ":expires": now + int(self.lease_seconds * 1000),
+                    ":now":     now,
+                },
+            )
+            return True
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                return False
+            raise
+
+    def _release(self, result: Optional[SyncResponse]) -> None:
+        if self.store is not None:
+            encoded = result.model_dump_json(exclude={"coalesced"}) if result is not None else None
+            if not self.store.release_lease(self.owner, self._now_ms(), encoded):
+                logger.warning("No se pudo liberar el lease de sync: lo tomó otra tarea")
+            return
+        try:
+            if result is None:
+                self.table.update_item(
+                    Key={"launch_id": LEASE_KEY},
+                    UpdateExpression="REMOVE lease_owner, lease_expires_at",
+                    ConditionExpression="lease_owner = :owner",
+                    ExpressionAttributeValues={":owner": self.owner},
+                )
+                return
+            self.table.update_item(
+                Key={"launch_id": LEASE_KEY},
+                UpdateExpression=(
+                    "SET completed_at = :now, last_result = :result "
+                    "REMOVE lease_owner, lease_expires_at"
+                ),
+                ConditionExpression="lease_owner = :owner",
+                ExpressionAttributeValues={
+                    ":owner":  self.owner,
+                    ":now":    self._now_ms(),
+                    ":result": result.model_dump_json(exclude={"coalesced"}),
+                },
+            )
+        except ClientError as exc:
+            # El lease expiró y otra tarea lo tomó; su resultado prevalece.
+            logger.warning("No se pudo liberar el lease de sync: %s", exc)
+
+    @staticmethod
+    def _decode(lease: dict) -> SyncResponse:
+        data = json.loads(lease["last_result"])
+        data["coalesced"] = True
+        return SyncResponse(**data)
+
+
+_coordinator: Optional[SyncCoordinator] = None
+_coordinator_lock = threading.Lock()
+
+
+def get_coordinator() -> SyncCoordinator:
+    """Coordinador compartido por todas las peticiones del proceso."""
+    global _coordinator
+    with _coordinator_lock:
+        if _coordinator is None:
+            _coordinator = SyncCoordinator()
+        return _coordinator
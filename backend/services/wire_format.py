@@ -0,0 +1,85 @@
+import json
+from enum import Enum
+from typing import Any, Iterable, Optional
+
+from fastapi import Response
+
+from backend.models.launch import Launch
+
+# Representación por columnas de un listado de lanzamientos
+COLUMNS_MEDIA_TYPE = "application/vnd.spacex.columns+json"
+
+# Columnas con pocos valores distintos que se repiten en casi todas las filas:
+# van como diccionario de valores + índice por fila
+DICTIONARY_COLUMNS = ("status", "rocket_name", "launchpad")
+
+FIELDS = tuple(Launch.model_fields)
+
+
+class WireFormat(str, Enum):
+    json    = "json"
+    columns = "columns"
+
+
+def negotiate(accept: Optional[str], requested: Optional[WireFormat]) -> WireFormat:
+    """
+    `format=` manda sobre `Accept`; sin ninguno de los dos, JSON de siempre.
+    Por `Accept` se sirven columnas si se nombran con `q` mayor que 0 y no
+    menor que la de JSON (`application/json`, `application/*` o `*/*`).
+    """
+    if requested is not None:
+        return requested
+    if not accept:
+        return WireFormat.json
+    quality = _accept_quality(accept)
+    columns = quality.get(COLUMNS_MEDIA_TYPE, 0.0)
+    plain = next((quality[m] for m in ("application/json", "application/*", "*/*") if m in quality), 0.0)
+    return WireFormat.columns if columns > 0 and columns >= plain else WireFormat.json
+
+
+def _accept_quality(accept: str) -> dict[str, float]:
+    """Media range → `q` de una cabecera `Accept` (1 por defecto, 0 si no es válida)."""
+    quality: dict[str, float] = {}
+    for media_range in accept.split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        if not media_type:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = min(max(float(value), 0.0), 1.0)
+                except ValueError:
+                    q = 0.0
+        quality[media_type.lower()] = q
+    return quality
+
+
+def encode_columns(launches: Iterable[Launch]) -> dict[str, Any]:
+    """
+    Lista de lanzamientos por columnas: cada campo aparece una vez con los
+    valores de todas las filas en orden. Las columnas de `DICTIONARY_COLUMNS`
+    van como `{"values": [...], "codes": [...]}`, con `values[codes[i]]` el
+    valor de la fila i.
+    """
+    rows = [launch.__dict__ for launch in launches]
+    columns: dict[str, Any] = {}
+    for field in FIELDS:
+        values = [row[field] for row in rows]
+        if field == "status":
+            values = [value.value for value in values]
+        if field in DICTIONARY_COLUMNS:
+            index: dict[Any, int] = {}
+            codes = [index.setdefault(value, len(index)) for value in values]
+            columns[field] = {"values": list(index), "codes": codes}
+        else:
+            columns[field] = values
+    return {"format": WireFormat.columns.value, "count": len(rows), "columns": columns}
+
+
+class ColumnsResponse(Response):
+    media_type = COLUMNS_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
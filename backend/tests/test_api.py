@@ -13,6 +13,7 @@ os.environ["AWS_SECRET_ACCESS_KEY"]= "testing"
 os.environ["LAMBDA_FUNCTION_NAME"] = "spacex-data-collector-test"
 
 from backend.main import app  # noqa: E402
+from backend.services.health_monitor import HealthMonitor  # noqa: E402
 
 client = TestClient(app)
 
@@ -37,30 +38,55 @@ SAMPLE_ITEM = {
 
 # ── Health ────────────────────────────────────────────────────────────────────
 
-@patch("backend.routers.health.DynamoService")
-def test_health_ok(mock_dynamo_cls):
-    mock = MagicMock()
-    mock.ping.return_value = True
-    mock_dynamo_cls.return_value = mock
+def _monitor(check, **kwargs):
+    return patch("backend.routers.health.get_health_monitor",
+                 return_value=HealthMonitor(check=check, **kwargs))
+
 
-    r = client.get("/health")
+def test_health_ok():
+    with _monitor(lambda: True):
+        r = client.get("/health")
     assert r.status_code == 200
     body = r.json()
     assert body["status"] == "ok"
     assert body["dynamodb"] == "ok"
+    assert body["stale"] is False
+    assert body["checked_at"]
 
 
-@patch("backend.routers.health.DynamoService")
-def test_health_degraded(mock_dynamo_cls):
-    mock = MagicMock()
-    mock.ping.side_effect = Exception("unreachable")
-    mock_dynamo_cls.return_value = mock
+def test_health_degraded():
+    def unreachable():
+        raise Exception("unreachable")
 
-    r = client.get("/health")
+    with _monitor(unreachable):
+        r = client.get("/health")
     assert r.status_code == 200
     assert r.json()["status"] == "degraded"
 
 
+def test_liveness_does_not_check_dynamo():
+    check = MagicMock()
+    with _monitor(check):
+        r = client.get("/health/live")
+    assert r.status_code == 200
+    assert r.json()["status"] == "ok"
+    check.assert_not_called()
+
+
+def test_readiness_503_when_dynamo_down():
+    with _monitor(lambda: False):
+        r = client.get("/health/ready")
+    assert r.status_code == 503
+    assert r.json()["dynamodb"] == "error"
+
+
+def test_readiness_503_when_check_is_stale():
+    with _monitor(lambda: True, stale_after=-1):
+        r = client.get("/health/ready")
+    assert r.status_code == 503
+    assert r.json()["stale"] is True
+
+
 # ── Root ──────────────────────────────────────────────────────────────────────
 
 def test_root():
@@ -71,7 +97,7 @@ def test_root():
 
 # ── Launches ──────────────────────────────────────────────────────────────────
 
-@patch("backend.routers.launches.DynamoService")
+@patch("backend.routers.launches.open_launch_service")
 def test_list_launches_returns_list(mock_cls):
     mock = MagicMock()
     mock.get_all.return_value = [SAMPLE_ITEM]
@@ -83,7 +109,7 @@ def test_list_launches_returns_list(mock_cls):
     assert isinstance(r.json(), list)
 
 
-@patch("backend.routers.launches.DynamoService")
+@patch("backend.routers.launches.open_launch_service")
 def test_list_launches_filtered_by_status(mock_cls):
     mock = MagicMock()
     mock.get_by_status.return_value = [SAMPLE_ITEM]
@@ -95,7 +121,7 @@ def test_list_launches_filtered_by_status(mock_cls):
     mock.get_by_status.assert_called_once_with("success")
 
 
-@patch("backend.routers.launches.DynamoService")
+@patch("backend.routers.launches.open_launch_service")
 def test_get_launch_by_id_found(mock_cls):
     mock = MagicMock()
     mock.get_by_id.return_value = SAMPLE_ITEM
@@ -106,7 +132,7 @@ def test_get_launch_by_id_found(mock_cls):
     assert r.status_code == 200
 
 
-@patch("backend.routers.launches.DynamoService")
+@patch("backend.routers.launches.open_launch_service")
 def test_get_launch_by_id_not_found(mock_cls):
     mock = MagicMock()
     mock.get_by_id.return_value = None
@@ -116,7 +142,21 @@ def test_get_launch_by_id_not_found(mock_cls):
     assert r.status_code == 404
 
 
-@patch("backend.routers.launches.DynamoService")
+
+@patch("backend.routers.launches.open_launch_service")
+def test_next_and_latest_are_not_taken_as_ids(mock_cls):
+    mock = MagicMock()
+    mock.get_view_launches.return_value = [SAMPLE_ITEM]
+    mock.to_launch.return_value = MagicMock(**SAMPLE_ITEM)
+    mock_cls.return_value = mock
+
+    assert client.get("/api/v1/launches/next?limit=3").status_code == 200
+    assert client.get("/api/v1/launches/latest").status_code == 200
+    assert mock.get_view_launches.call_args_list == [(("next", 3),), (("latest", 10),)]
+    mock.get_by_id.assert_not_called()
+
+
+@patch("backend.routers.launches.open_launch_service")
 def test_get_stats(mock_cls):
     from backend.models.launch import LaunchStats
     mock = MagicMock()
@@ -132,6 +172,54 @@ def test_get_stats(mock_cls):
     assert "success_rate" in body
 
 
+# ── Sync ──────────────────────────────────────────────────────────────────────
+
+@patch("backend.routers.sync.get_coordinator")
+def test_trigger_returns_coalesced_result(mock_get_coordinator):
+    from backend.models.launch import SyncResponse
+    mock_get_coordinator.return_value.run.return_value = SyncResponse(
+        total_fetched=2, inserted=0, updated=2, errors=0, coalesced=True
+    )
+
+    r = client.post("/api/v1/trigger")
+    assert r.status_code == 200
+    assert r.json()["coalesced"] is True
+
+
+@patch("backend.routers.sync.get_coordinator")
+def test_trigger_conflict_when_sync_in_progress(mock_get_coordinator):
+    from backend.services.sync_coordinator import SyncInProgressError
+    mock_get_coordinator.return_value.run.side_effect = SyncInProgressError("en curso")
+
+    r = client.post("/api/v1/trigger")
+    assert r.status_code == 409
+
+
+@patch("backend.routers.sync.boto3")
+@patch("backend.routers.sync.get_coordinator")
+def test_trigger_forwards_lambda_telemetry(mock_get_coordinator, mock_boto3):
+    import io
+    import json
+    mock_get_coordinator.return_value.run.side_effect = lambda fn: fn()
+    payload = {
+        "total_fetched": 2, "inserted": 2, "updated": 0, "errors": 0, "launches": [],
+        "telemetry": {
+            "duration_ms": 120.0,
+            "phases_ms": {"fetch": 80.0, "parse": 5.0, "map": 1.0, "diff": 10.0, "write": 20.0},
+            "container_peak_rss_mb": 90.5, "peak_traced_mb": None, "consumed_wcu": 6.0, "throttled": 0,
+        },
+    }
+    mock_boto3.client.return_value.invoke.return_value = {
+        "Payload": io.BytesIO(json.dumps(payload).encode()),
+    }
+
+    r = client.post("/api/v1/trigger")
+    assert r.status_code == 200
+    telemetry = r.json()["telemetry"]
+    assert telemetry["phases_ms"]["fetch"] == 80.0
+    assert telemetry["consumed_wcu"] == 6.0
+
+
 # ── Swagger ───────────────────────────────────────────────────────────────────
 
 def test_openapi_schema_accessible():
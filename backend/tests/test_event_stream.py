@@ -0,0 +1,162 @@
+"""Tests del canal SSE: broadcaster en proceso, watcher de syncs y endpoint."""
+import asyncio
+import os
+from unittest.mock import MagicMock, patch
+
+os.environ.setdefault("AWS_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.main import app  # noqa: E402
+from backend.services.event_stream import (  # noqa: E402
+    Event, EventBroadcaster, SyncEventWatcher, parse_event_id,
+)
+
+
+def _sync(gen, seq=0):
+    return Event(gen, seq, "sync", {"generation": gen})
+
+
+async def _read(stream, count, timeout=2.0):
+    chunks = []
+    async with asyncio.timeout(timeout):
+        while len(chunks) < count:
+            chunks.append((await anext(stream)).decode())
+    return chunks
+
+
+def test_event_ids_roundtrip():
+    assert parse_event_id("12-3") == (12, 3)
+    assert parse_event_id("7") == (7, 0)
+    assert parse_event_id("basura") is None
+    assert _sync(4).encode().startswith(b"id: 4-0\nevent: sync\n")
+
+
+def test_new_subscriber_receives_published_events_and_heartbeats():
+    async def scenario():
+        broadcaster = EventBroadcaster(heartbeat=0.05)
+        broadcaster.start_at(3)
+        stream = broadcaster.stream()
+        head = await _read(stream, 2)
+        assert head[0].startswith("retry:")
+        assert head[1].startswith("event: ready") and '"generation":3' in head[1]
+
+        reader = asyncio.ensure_future(_read(stream, 2))
+        await asyncio.sleep(0.01)
+        broadcaster.publish([_sync(4), Event(4, 1, "launch_status", {"launch_id": "a"})])
+        events = await reader
+        assert [c.splitlines()[0] for c in events] == ["id: 4-0", "id: 4-1"]
+        assert broadcaster.subscribers == 1
+
+        assert (await _read(stream, 1))[0] == ": ping\n\n"
+        await stream.aclose()
+        assert broadcaster.subscribers == 0
+
+    asyncio.run(scenario())
+
+
+def test_resume_replays_missed_events():
+    async def scenario():
+        broadcaster = EventBroadcaster()
+        broadcaster.start_at(1)
+        broadcaster.publish([_sync(2), _sync(3), _sync(4)])
+        chunks = await _read(broadcaster.stream("2-0"), 3)
+        assert [c.splitlines()[0] for c in chunks[1:]] == ["id: 3-0", "id: 4-0"]
+
+    asyncio.run(scenario())
+
+
+def test_resume_outside_buffer_sends_reset():
+    async def scenario():
+        broadcaster = EventBroadcaster(buffer_size=2)
+        broadcaster.start_at(1)
+        broadcaster.publish([_sync(2), _sync(3), _sync(4)])
+        chunks = await _read(broadcaster.stream("1-0"), 2)
+        assert chunks[1].startswith("event: reset") and '"generation":4' in chunks[1]
+
+    asyncio.run(scenario())
+
+
+def test_close_ends_open_streams():
+    async def scenario():
+        broadcaster = EventBroadcaster(heartbeat=10)
+        stream = broadcaster.stream()
+        await _read(stream, 2)
+        waiting = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0.01)
+        broadcaster.close()
+        async with asyncio.timeout(1):
+            try:
+                await waiting
+            except StopAsyncIteration:
+                return
+        raise AssertionError("el stream siguió abierto")
+
+    asyncio.run(scenario())
+
+
+class StubService:
+    def __init__(self):
+        self.generation = 5
+        self.items = {"a": {"launch_id": "a", "status": "upcoming", "mission_name": "A"},
+                      "b": {"launch_id": "b", "status": "upcoming", "mission_name": "B"}}
+        self.changelog = {}
+
+    def get_generation(self):
+        return self.generation
+
+    def get_all(self):
+        return [dict(i) for i in self.items.values()]
+
+    def get_by_ids(self, ids):
+        return [dict(self.items[i]) for i in ids if i in self.items]
+
+    def get_changelog(self, first, last):
+        return {g: e for g, e in self.changelog.items() if first <= g <= last}
+
+
+def test_watcher_publishes_sync_and_status_changes():
+    service = StubService()
+    broadcaster = EventBroadcaster()
+    watcher = SyncEventWatcher(broadcaster, service_factory=lambda: service, poll_interval=60)
+    assert watcher.poll() == 0                       # primera lectura: punto de partida
+
+    service.items["a"]["status"] = "success"
+    service.items["c"] = {"launch_id": "c", "status": "upcoming", "mission_name": "C"}
+    service.generation = 6
+    service.changelog[6] = {"generation": 6, "ids": ["a", "c"],
+                            "summary": {"inserted": 1, "updated": 1, "unchanged": 0}}
+    assert watcher.poll() == 2
+
+    sync, status = list(broadcaster._buffer)
+    assert sync.type == "sync" and sync.data["inserted"] == 1 and sync.data["full_reload"] is False
+    assert status.id == (6, 1)
+    assert status.data == {"generation": 6, "launch_id": "a", "mission_name": "A",
+                           "previous": "upcoming", "status": "success"}
+
+
+def test_watcher_rescans_when_changelog_is_missing():
+    service = StubService()
+    broadcaster = EventBroadcaster()
+    watcher = SyncEventWatcher(broadcaster, service_factory=lambda: service, poll_interval=60)
+    watcher.poll()
+    service.items["b"]["status"] = "failed"
+    service.generation = 7                           # sin historial para 6 y 7
+    watcher.poll()
+    types = [(e.type, e.data.get("full_reload")) for e in broadcaster._buffer]
+    assert types == [("sync", True), ("sync", True), ("launch_status", None)]
+
+
+def test_events_endpoint_replays_from_last_event_id():
+    broadcaster = EventBroadcaster()
+    broadcaster.start_at(1)
+    broadcaster.publish([_sync(2), _sync(3)])
+    broadcaster.close()                              # el stream termina tras el replay
+    with patch("backend.routers.events.get_broadcaster", return_value=broadcaster), \
+         patch("backend.routers.events.get_event_watcher", return_value=MagicMock()):
+        r = TestClient(app).get("/api/v1/events", headers={"Last-Event-ID": "2-0"})
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/event-stream")
+    assert "id: 3-0" in r.text and "id: 2-0" not in r.text
@@ -0,0 +1,57 @@
+"""Tests del chequeo de salud cacheado en segundo plano."""
+import time
+
+from backend.services.health_monitor import HealthMonitor
+
+
+class CountingCheck:
+    def __init__(self, result=True):
+        self.result = result
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def test_snapshot_is_served_from_cache():
+    check = CountingCheck()
+    monitor = HealthMonitor(check=check, interval=60)
+    for _ in range(100):
+        assert monitor.snapshot().dynamo_ok is True
+    assert check.calls == 1
+
+
+def test_background_thread_refreshes_state():
+    check = CountingCheck()
+    monitor = HealthMonitor(check=check, interval=0.01)
+    monitor.start()
+    try:
+        deadline = time.monotonic() + 2
+        while check.calls < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        check.result = False
+        time.sleep(0.05)
+        assert monitor.snapshot().dynamo_ok is False
+    finally:
+        monitor.stop()
+    assert check.calls >= 3
+    assert not monitor.running
+
+
+def test_failed_check_records_error():
+    monitor = HealthMonitor(check=CountingCheck(RuntimeError("timeout")), interval=60)
+    snap = monitor.snapshot()
+    assert snap.dynamo_ok is False
+    assert snap.error == "timeout"
+
+
+def test_snapshot_marks_stale_when_not_refreshed():
+    monitor = HealthMonitor(check=CountingCheck(), interval=60, stale_after=0.01)
+    monitor.refresh()
+    time.sleep(0.02)
+    snap = monitor.snapshot()
+    assert snap.stale is True
+    assert snap.age_seconds >= 0.01
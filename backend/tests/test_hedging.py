@@ -0,0 +1,147 @@
+"""Tests del control de latencia de cola: límite por petición y lecturas con hedging."""
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+os.environ.setdefault("AWS_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+import boto3  # noqa: E402
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from moto import mock_aws  # noqa: E402
+
+from backend.main import app  # noqa: E402
+from backend.services.deadline import (  # noqa: E402
+    DeadlineExceeded, DeadlineMiddleware, attach_deadline, deadline_scope, remaining,
+)
+from backend.services.dynamo_service import client_config  # noqa: E402
+from backend.services.hedging import HedgedReads, LatencyTracker  # noqa: E402
+from backend.services.metrics import DYNAMO_HEDGES_SENT, DYNAMO_HEDGES_WON  # noqa: E402
+
+
+def _warm(reads, operation="get_item", seconds=0.0, n=40):
+    for _ in range(n):
+        reads.tracker.observe(operation, seconds)
+
+
+class SlowFirstCall:
+    """La primera llamada tarda `slow` segundos; las siguientes responden ya."""
+
+    def __init__(self, slow):
+        self.slow = slow
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            first = self.calls == 1
+        if first:
+            time.sleep(self.slow)
+            return "original"
+        return "copia"
+
+
+def test_tracker_reports_quantile_after_min_samples():
+    tracker = LatencyTracker(quantile=0.95, min_samples=5)
+    for ms in range(1, 5):
+        tracker.observe("get_item", ms / 1000)
+    assert tracker.quantile("get_item") is None
+    for ms in range(5, 101):
+        tracker.observe("get_item", ms / 1000)
+    assert tracker.quantile("get_item") == pytest.approx(0.096)
+
+
+def test_hedge_wins_when_primary_is_slow():
+    reads = HedgedReads(enabled=True, min_delay_ms=5, max_ratio=1.0)
+    _warm(reads, seconds=0.001)
+    sent = DYNAMO_HEDGES_SENT.value(operation="get_item")
+    won = DYNAMO_HEDGES_WON.value(operation="get_item")
+
+    start = time.perf_counter()
+    assert reads.call("get_item", SlowFirstCall(slow=0.5)) == "copia"
+    assert time.perf_counter() - start < 0.3
+    assert DYNAMO_HEDGES_SENT.value(operation="get_item") == sent + 1
+    assert DYNAMO_HEDGES_WON.value(operation="get_item") == won + 1
+
+
+def test_fast_calls_are_not_hedged_and_ratio_is_capped():
+    reads = HedgedReads(enabled=True, min_delay_ms=50, max_ratio=0.1)
+    _warm(reads, seconds=0.001)
+    fn = MagicMock(return_value="ok")
+    for _ in range(20):
+        assert reads.call("get_item", fn) == "ok"
+    assert fn.call_count == 20                      # ninguna superó el retardo
+
+    calls = [SlowFirstCall(slow=0.08) for _ in range(5)]
+    for call in calls:
+        reads.call("get_item", call)
+    # 25 llamadas con un 10% de presupuesto → como mucho 2 copias
+    assert sum(c.calls - 1 for c in calls) == 2
+
+
+def test_failed_copy_waits_for_the_other():
+    reads = HedgedReads(enabled=True, min_delay_ms=5, max_ratio=1.0)
+    _warm(reads, seconds=0.001)
+    state = {"n": 0}
+
+    def fn():
+        state["n"] += 1
+        if state["n"] == 1:
+            time.sleep(0.05)
+            return "original"
+        raise RuntimeError("copia fallida")
+
+    assert reads.call("get_item", fn) == "original"
+
+
+def test_deadline_stops_waiting():
+    reads = HedgedReads(enabled=False)
+    with deadline_scope(0.05):
+        assert 0 < remaining() <= 0.05
+        start = time.perf_counter()
+        with pytest.raises(DeadlineExceeded):
+            reads.call("query", lambda: time.sleep(0.5))
+        assert time.perf_counter() - start < 0.3
+    assert remaining() is None
+
+
+def test_deadline_blocks_botocore_attempts():
+    assert client_config().retries == {"mode": "standard", "max_attempts": 3}
+    with mock_aws():
+        ddb = boto3.resource("dynamodb", region_name="us-east-1", config=client_config())
+        ddb.create_table(
+            TableName="launches", KeySchema=[{"AttributeName": "launch_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "launch_id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        attach_deadline(ddb)
+        table = ddb.Table("launches")
+        assert "Item" not in table.get_item(Key={"launch_id": "x"})
+        with deadline_scope(0.001):
+            time.sleep(0.01)
+            with pytest.raises(DeadlineExceeded):
+                table.get_item(Key={"launch_id": "x"})
+
+
+def test_api_returns_504_when_deadline_is_exceeded():
+    service = MagicMock()
+    service.get_by_id.side_effect = DeadlineExceeded("get_item")
+    client = TestClient(app)
+    with patch("backend.routers.launches.open_launch_service", return_value=service):
+        response = client.get("/api/v1/launches/abc")
+    assert response.status_code == 504
+
+
+def test_middleware_sets_deadline_per_request():
+    seen = []
+
+    async def inner(scope, receive, send):
+        seen.append(remaining())
+
+    asyncio.run(DeadlineMiddleware(inner, deadline_ms=200)({"type": "http"}, None, None))
+    assert 0 < seen[0] <= 0.2
@@ -0,0 +1,147 @@
+"""Tests de la caché LRU de detalle (aciertos, fallos negativos, invalidación por ID)."""
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+os.environ.setdefault("AWS_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.main import app  # noqa: E402
+from backend.services.event_stream import EventBroadcaster, SyncEventWatcher  # noqa: E402
+from backend.services.launch_cache import CACHE_NAME, LaunchCache  # noqa: E402
+from backend.services.metrics import CACHE_REQUESTS  # noqa: E402
+from sync_pipeline import VIEW_SIZE  # noqa: E402
+
+ITEMS = {lid: {"launch_id": lid, "mission_name": lid.upper(), "launch_date": f"2020-01-0{n}",
+               "status": "success"} for n, lid in enumerate(("a", "b", "c", "d"), start=1)}
+
+
+class CountingFetch:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, launch_id):
+        self.calls.append(launch_id)
+        return ITEMS.get(launch_id)
+
+
+def test_hits_and_negative_hits_skip_the_read():
+    cache, fetch = LaunchCache(max_entries=10, ttl=60, negative_ttl=60), CountingFetch()
+    hits = CACHE_REQUESTS.value(cache=CACHE_NAME, result="hit")
+
+    assert cache.get("a", fetch)["mission_name"] == "A"
+    assert cache.get("a", fetch)["mission_name"] == "A"
+    assert cache.get("zzz", fetch) is None
+    assert cache.get("zzz", fetch) is None
+    assert fetch.calls == ["a", "zzz"]
+    assert CACHE_REQUESTS.value(cache=CACHE_NAME, result="hit") == hits + 2
+
+
+def test_misses_expire_before_hits():
+    cache, fetch = LaunchCache(max_entries=10, ttl=60, negative_ttl=0.05), CountingFetch()
+    cache.get("a", fetch)
+    cache.get("zzz", fetch)
+    time.sleep(0.06)
+    cache.get("a", fetch)
+    cache.get("zzz", fetch)
+    assert fetch.calls == ["a", "zzz", "zzz"]
+
+
+def test_lru_evicts_least_recently_used():
+    cache, fetch = LaunchCache(max_entries=2, ttl=60, negative_ttl=60), CountingFetch()
+    cache.get("a", fetch)
+    cache.get("b", fetch)
+    cache.get("a", fetch)                            # "b" pasa a ser el más antiguo
+    cache.get("c", fetch)
+    assert len(cache) == 2
+    cache.get("a", fetch)
+    cache.get("b", fetch)
+    assert fetch.calls == ["a", "b", "c", "b"]
+
+
+def test_invalidate_by_id_and_in_flight_reads():
+    cache, fetch = LaunchCache(max_entries=10, ttl=60, negative_ttl=60), CountingFetch()
+    cache.get("a", fetch)
+    cache.get("b", fetch)
+    cache.invalidate(["a"])
+    cache.get("a", fetch)
+    cache.get("b", fetch)
+    assert fetch.calls == ["a", "b", "a"]
+
+    def stale_fetch(launch_id):
+        cache.invalidate([launch_id])                # la sync escribe mientras se lee
+        return {"launch_id": launch_id, "mission_name": "vieja"}
+
+    cache.get("c", stale_fetch)
+    assert cache.get("c", fetch)["mission_name"] == "C"
+
+
+def test_refresh_after_sync_prefetches_recent_launches():
+    cache = LaunchCache(max_entries=10, ttl=60, negative_ttl=60, prefetch_count=2)
+    service = MagicMock()
+    service.get_view_launches.return_value = [ITEMS["d"], ITEMS["c"]]
+    cache.refresh_after_sync(service, None)
+    service.get_view_launches.assert_called_once_with("latest", 2)
+    service.get_all.assert_not_called()
+
+    fetch = CountingFetch()
+    assert cache.get("d", fetch)["mission_name"] == "D"
+    assert fetch.calls == []
+
+
+def test_prefetch_is_capped_to_the_materialized_view():
+    cache = LaunchCache(max_entries=1000, ttl=60, negative_ttl=60, prefetch_count=VIEW_SIZE + 100)
+    service = MagicMock()
+    service.get_view_launches.return_value = []
+    cache.refresh_after_sync(service, ["a"])
+    service.get_view_launches.assert_called_once_with("latest", VIEW_SIZE)
+
+
+class StubService:
+    def __init__(self):
+        self.generation = 1
+        self.changelog = {}
+
+    def get_generation(self):
+        return self.generation
+
+    def get_all(self):
+        return [dict(i) for i in ITEMS.values()]
+
+    def get_by_ids(self, ids):
+        return [dict(ITEMS[i]) for i in ids if i in ITEMS]
+
+    def get_changelog(self, first, last):
+        return {g: e for g, e in self.changelog.items() if first <= g <= last}
+
+
+def test_watcher_invalidates_changed_ids_per_generation():
+    service, calls = StubService(), []
+    watcher = SyncEventWatcher(EventBroadcaster(), service_factory=lambda: service, poll_interval=60)
+    watcher.add_listener(lambda svc, ids: calls.append(ids))
+    watcher.poll()
+
+    service.generation = 2
+    service.changelog[2] = {"generation": 2, "ids": ["b", "a"]}
+    watcher.poll()
+    service.generation = 4                           # sin historial para 3
+    service.changelog[4] = {"generation": 4, "ids": ["c"]}
+    watcher.poll()
+    assert calls == [["a", "b"], None]
+
+
+def test_detail_endpoint_uses_cache():
+    cache = LaunchCache(max_entries=10, ttl=60, negative_ttl=60)
+    service = MagicMock()
+    service.get_by_id.side_effect = ITEMS.get
+    service.to_launch.side_effect = lambda item: item
+    client = TestClient(app)
+    with patch("backend.routers.launches.open_launch_service", return_value=service), \
+         patch("backend.routers.launches.get_launch_cache", return_value=cache):
+        for _ in range(3):
+            assert client.get("/api/v1/launches/a").status_code == 200
+            assert client.get("/api/v1/launches/bot-probe").status_code == 404
+    assert [c.args[0] for c in service.get_by_id.call_args_list] == ["a", "bot-probe"]
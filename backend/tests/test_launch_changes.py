@@ -0,0 +1,89 @@
+"""Tests del historial de cambios por generación y de GET /launches/changes."""
+import os
+from unittest.mock import patch
+
+os.environ.setdefault("AWS_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.main import app  # noqa: E402
+from backend.services.dynamo_service import DynamoService  # noqa: E402
+from benchmarks.fakes import InMemoryDynamoDB, synthetic_launches  # noqa: E402
+from sync_pipeline import DynamoBatchWriter, SyncPipeline  # noqa: E402
+
+TABLE = "spacex-launches-changes-test"
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    monkeypatch.setenv("DYNAMODB_TABLE", TABLE)
+    fake = InMemoryDynamoDB()
+    with patch("boto3.resource", return_value=fake):
+        yield fake
+
+
+def _sync(fake, launches):
+    writer = DynamoBatchWriter(fake, TABLE)
+    pipeline = SyncPipeline(writer)
+    summary = pipeline.run([lambda: launches])
+    summary["generation"] = writer.bump_generation(pipeline.changed_ids)
+    return summary
+
+
+def test_second_sync_only_records_changed_launches(fake):
+    launches = synthetic_launches(50)
+    first = _sync(fake, launches)
+    assert first["inserted"] == 50 and first["generation"] == 1
+
+    launches[3] = {**launches[3], "details": "Nuevo detalle"}
+    second = _sync(fake, launches)
+    assert second["updated"] == 1 and second["unchanged"] == 49
+
+    changes = DynamoService().get_changes(since=1)
+    assert changes["generation"] == 2 and changes["full_reload"] is False
+    assert [i["launch_id"] for i in changes["items"]] == [launches[3]["id"]]
+    assert DynamoService().get_changes(since=2)["items"] == []
+
+
+def test_full_reload_when_history_does_not_cover_since(fake):
+    launches = synthetic_launches(5)
+    _sync(fake, launches)
+    _sync(fake, launches)
+    service = DynamoService()
+    assert service.get_changes(since=0)["full_reload"] is True   # cliente sin datos
+    assert service.get_changes(since=9)["full_reload"] is True   # tabla reiniciada
+
+    fake.Table(TABLE).delete_item(Key={"launch_id": "#changes#2"})
+    assert service.get_changes(since=1)["full_reload"] is True   # historial podado
+
+
+def test_changes_endpoint(fake):
+    launches = synthetic_launches(10)
+    _sync(fake, launches)
+    launches[0] = {**launches[0], "name": "Renombrada"}
+    _sync(fake, launches)
+
+    client = TestClient(app)
+    body = client.get("/api/v1/launches/changes?since=1").json()
+    assert body["generation"] == 2
+    assert body["full_reload"] is False
+    assert [l["mission_name"] for l in body["launches"]] == ["Renombrada"]
+
+    body = client.get("/api/v1/launches/changes").json()
+    assert body["full_reload"] is True and body["launches"] == []
+
+
+def test_get_all_limit_skips_control_items(fake):
+    # Los items de control quedan delante en el orden del scan y cuentan en `Limit`
+    writer = DynamoBatchWriter(fake, TABLE)
+    for _ in range(6):
+        writer.bump_generation([])
+    _sync(fake, synthetic_launches(10))
+
+    service = DynamoService()
+    limited = service.get_all(limit=4)
+    assert len(limited) == 4 and not any(i["launch_id"].startswith("#") for i in limited)
+    assert len(service.get_all()) == 10
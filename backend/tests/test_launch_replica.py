@@ -0,0 +1,109 @@
+"""Tests de la réplica en memoria de la tabla de lanzamientos."""
+import os
+from unittest.mock import patch
+
+os.environ.setdefault("AWS_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.main import app  # noqa: E402
+from backend.services.launch_replica import LaunchRecord, LaunchReplica  # noqa: E402
+
+
+def _item(launch_id, status, date):
+    return {"launch_id": launch_id, "mission_name": f"M-{launch_id}", "launch_date": date,
+            "status": status, "flight_number": 1, "payloads": ["p1"]}
+
+
+ITEMS = [
+    _item("a", "success",  "2020-01-01T00:00:00.000Z"),
+    _item("b", "failed",   "2021-01-01T00:00:00.000Z"),
+    _item("c", "upcoming", "2030-01-01T00:00:00.000Z"),
+    _item("d", "success",  "2022-01-01T00:00:00.000Z"),
+]
+
+
+class StubService:
+    def __init__(self, items, generation=1):
+        self.items = items
+        self.generation = generation
+        self.scans = 0
+
+    def get_generation(self):
+        return self.generation
+
+    def get_all(self):
+        self.scans += 1
+        return list(self.items)
+
+
+def _replica(service, **kwargs):
+    replica = LaunchReplica(service_factory=lambda: service, poll_interval=60, **kwargs)
+    replica.refresh()
+    return replica
+
+
+def test_records_are_slotted_and_immutable():
+    record = LaunchRecord(ITEMS[0])
+    assert not hasattr(record, "__dict__")
+    assert record.flight_number == "1"
+    assert record.payloads == ("p1",)
+
+
+def test_indexes_by_id_status_and_date():
+    replica = _replica(StubService(ITEMS))
+    assert [r.launch_id for r in replica.get_all()] == ["c", "d", "b", "a"]
+    assert [r.launch_id for r in replica.get_all(limit=2)] == ["c", "d"]
+    assert [r.launch_id for r in replica.get_by_status("success")] == ["d", "a"]
+    assert replica.get_by_id("b").status == "failed"
+    assert replica.get_by_id("zzz") is None
+    assert [r.launch_id for r in replica.get_view_launches("next", 10)] == ["c"]
+    assert [r.launch_id for r in replica.get_view_launches("latest", 2)] == ["d", "b"]
+    stats = replica.get_stats()
+    assert (stats.total, stats.success, stats.failed, stats.upcoming) == (4, 2, 1, 1)
+    assert stats.success_rate == 66.7
+
+
+def test_reloads_only_when_generation_changes():
+    service = StubService(ITEMS, generation=3)
+    replica = _replica(service)
+    old = replica.snapshot
+
+    assert replica.refresh() is False
+    assert service.scans == 1
+
+    service.items = ITEMS[:2]
+    service.generation = 4
+    assert replica.refresh() is True
+    assert service.scans == 2
+    assert replica.generation == 4
+    assert replica.get_stats().total == 2
+    # La copia anterior no se modifica: se reemplaza entera
+    assert old.stats.total == 4
+
+
+def test_without_generation_reloads_by_age():
+    service = StubService(ITEMS, generation=None)
+    replica = _replica(service, max_age=0)
+    assert replica.refresh() is True
+    assert service.scans == 2
+
+
+def test_api_serves_from_replica_without_dynamo():
+    replica = _replica(StubService(ITEMS))
+    client = TestClient(app)
+    with patch("backend.routers.launches.get_replica", return_value=replica), \
+         patch("backend.routers.launches.open_launch_service", side_effect=AssertionError("sin red")):
+        listed = client.get("/api/v1/launches").json()
+        filtered = client.get("/api/v1/launches?status=success").json()
+        detail = client.get("/api/v1/launches/b")
+        missing = client.get("/api/v1/launches/zzz")
+        stats = client.get("/api/v1/launches/stats").json()
+
+    assert [l["launch_id"] for l in listed] == ["c", "d", "b", "a"]
+    assert [l["launch_id"] for l in filtered] == ["d", "a"]
+    assert detail.json()["status"] == "failed"
+    assert missing.status_code == 404
+    assert stats["total"] == 4
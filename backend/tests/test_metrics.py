@@ -0,0 +1,94 @@
+"""Tests para el registro de métricas Prometheus y el endpoint /metrics."""
+import os
+from unittest.mock import MagicMock, patch
+
+import boto3
+from fastapi.testclient import TestClient
+from moto import mock_aws
+
+os.environ["DYNAMODB_TABLE"]        = "spacex-launches-test"
+os.environ["AWS_REGION"]            = "us-east-1"
+os.environ["AWS_ACCESS_KEY_ID"]     = "testing"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+
+from backend.main import app  # noqa: E402
+from backend.services.metrics import (  # noqa: E402
+    DYNAMO_CALLS,
+    DYNAMO_SCAN_PAGES,
+    HTTP_REQUESTS,
+    Counter,
+    Histogram,
+    record_cache,
+    REGISTRY,
+)
+
+client = TestClient(app)
+
+
+def test_histogram_renders_cumulative_buckets():
+    h = Histogram("test_latency_seconds", "test", ("op",), buckets=(0.1, 1.0))
+    h.observe(0.05, op="a")
+    h.observe(0.5, op="a")
+    h.observe(5.0, op="a")
+    lines = h.render()
+    assert 'test_latency_seconds_bucket{op="a",le="0.1"} 1' in lines
+    assert 'test_latency_seconds_bucket{op="a",le="1"} 2' in lines
+    assert 'test_latency_seconds_bucket{op="a",le="+Inf"} 3' in lines
+    assert 'test_latency_seconds_count{op="a"} 3' in lines
+
+
+def test_counter_escapes_label_values():
+    c = Counter("test_total", "test", ("route",))
+    c.inc(route='/a"b')
+    assert 'test_total{route="/a\\"b"} 1' in c.render()
+
+
+def test_cache_hit_ratio_gauge():
+    record_cache("test-cache", hit=True)
+    record_cache("test-cache", hit=True)
+    record_cache("test-cache", hit=False)
+    assert 'cache_hit_ratio{cache="test-cache"} 0.666667' in REGISTRY.render()
+
+
+@patch("backend.routers.launches.open_launch_service")
+def test_metrics_endpoint_reports_route_templates(mock_cls):
+    mock = MagicMock()
+    mock.get_by_id.return_value = None
+    mock_cls.return_value = mock
+    labels = {"method": "GET", "route": "/api/v1/launches/{launch_id}", "status": "404"}
+    before = HTTP_REQUESTS.value(**labels)
+
+    client.get("/api/v1/launches/unknown-1")
+    client.get("/api/v1/launches/unknown-2")
+
+    r = client.get("/metrics")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain")
+    assert HTTP_REQUESTS.value(**labels) == before + 2
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/launches/{launch_id}"}' in r.text
+    assert "unknown-1" not in r.text
+
+
+@mock_aws
+def test_dynamo_service_records_calls_and_pages():
+    ddb = boto3.resource("dynamodb", region_name="us-east-1")
+    table = ddb.create_table(
+        TableName="spacex-launches-test",
+        KeySchema=[{"AttributeName": "launch_id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "launch_id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    table.put_item(Item={"launch_id": "a", "status": "success"})
+
+    from backend.services.dynamo_service import DynamoService
+    scans_before = DYNAMO_CALLS.value(operation="scan", outcome="ok")
+    pages_before = DYNAMO_SCAN_PAGES.count(operation="scan")
+    gets_before  = DYNAMO_CALLS.value(operation="get_item", outcome="ok")
+
+    service = DynamoService()
+    assert len(service.get_all()) == 1
+    assert service.get_by_id("a")["launch_id"] == "a"
+
+    assert DYNAMO_CALLS.value(operation="scan", outcome="ok") == scans_before + 1
+    assert DYNAMO_SCAN_PAGES.count(operation="scan") == pages_before + 1
+    assert DYNAMO_CALLS.value(operation="get_item", outcome="ok") == gets_before + 1
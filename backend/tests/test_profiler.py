@@ -0,0 +1,99 @@
+"""Tests del profiling bajo demanda (cabecera protegida y muestreo)."""
+import asyncio
+import pstats
+import time
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from backend.services.metrics import observe_dynamo
+from backend.services.profiler import ProfiledRoute, ProfilingMiddleware, profiled
+
+
+def _app(tmp_path, token="secreto", sample_rate=0.0):
+    @profiled
+    def dependency() -> str:
+        return "servicio"
+
+    router = APIRouter(route_class=ProfiledRoute)
+
+    @router.get("/items/{item_id}")
+    def read_item(item_id: str, service: Annotated[str, Depends(dependency)]) -> dict:
+        with observe_dynamo("get_item"):
+            time.sleep(0.01)
+        values = sorted(range(1000), key=lambda v: -v)
+        values.sort()
+        return {"id": item_id, "service": service}
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.add_middleware(ProfilingMiddleware, token=token, sample_rate=sample_rate,
+                       directory=str(tmp_path), keep=2)
+    return TestClient(app)
+
+
+def test_profiled_is_identity_when_disabled(monkeypatch):
+    monkeypatch.delenv("PROFILE_TOKEN", raising=False)
+    monkeypatch.delenv("PROFILE_SAMPLE_RATE", raising=False)
+
+    def endpoint():
+        return 1
+
+    assert profiled(endpoint) is endpoint
+
+
+def test_requests_without_valid_token_are_not_profiled(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROFILE_TOKEN", "secreto")
+    client = _app(tmp_path)
+    for headers in ({}, {"X-Profile": "otro"}):
+        r = client.get("/api/items/a", headers=headers)
+        assert r.json() == {"id": "a", "service": "servicio"}
+        assert "server-timing" not in r.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_header_returns_breakdown_and_stores_profile(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROFILE_TOKEN", "secreto")
+    client = _app(tmp_path)
+    r = client.get("/api/items/a", headers={"X-Profile": "secreto"})
+
+    assert r.status_code == 200
+    timing = r.headers["server-timing"]
+    assert timing.startswith("total;dur=") and "app;dur=" in timing
+    assert 'dynamodb-get_item;dur=' in timing and '"1 llamadas"' in timing
+    assert "sort;dur=" in timing
+    durations = dict(part.split(";")[:2] for part in timing.split(", "))
+    assert float(durations["app"][4:]) <= float(durations["total"][4:])
+
+    files = list(tmp_path.glob(f"*{r.headers['x-profile-id']}.prof"))
+    assert len(files) == 1 and "api_items_item_id" in files[0].name
+    functions = {f for (_, _, f) in pstats.Stats(str(files[0])).stats}
+    assert {"read_item", "dependency"} <= functions
+
+
+def test_sampling_stores_profiles_without_exposing_headers(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROFILE_TOKEN", "secreto")
+    client = _app(tmp_path, sample_rate=1.0)
+    for _ in range(3):
+        assert "server-timing" not in client.get("/api/items/a").headers
+    assert len(list(tmp_path.glob("*.prof"))) == 2          # PROFILE_KEEP poda los antiguos
+
+
+def test_profile_is_stored_outside_the_event_loop(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROFILE_TOKEN", "secreto")
+    client = _app(tmp_path)
+    loops = []
+    store = ProfilingMiddleware._store
+
+    def spy(self, profile, scope):
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+        store(self, profile, scope)
+
+    monkeypatch.setattr(ProfilingMiddleware, "_store", spy)
+    client.get("/api/items/a", headers={"X-Profile": "secreto"})
+    assert loops == [None]
+    assert len(list(tmp_path.glob("*.prof"))) == 1
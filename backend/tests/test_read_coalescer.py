@@ -0,0 +1,175 @@
+"""Tests del single-flight y stale-while-revalidate de lecturas."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.services.deadline import DeadlineExceeded, check_deadline, deadline_scope
+from backend.services.read_coalescer import CoalescedReads, ReadCoalescer
+
+
+class SlowFetch:
+    def __init__(self, delay=0.05, error=None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            n = self.calls
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [{"launch_id": f"v{n}"}]
+
+
+def _concurrent(fn, n=16):
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        return [f.result() for f in [pool.submit(fn) for _ in range(n)]]
+
+
+def test_concurrent_identical_reads_share_one_fetch():
+    fetch = SlowFetch()
+    coalescer = ReadCoalescer(ttl=0, stale=0)
+    results = _concurrent(lambda: coalescer.get(("get_all", None), fetch))
+    assert fetch.calls == 1
+    assert all(r == [{"launch_id": "v1"}] for r in results)
+    # Sin caché: la siguiente lectura vuelve a consultar
+    coalescer.get(("get_all", None), fetch)
+    assert fetch.calls == 2
+
+
+def test_different_keys_do_not_coalesce():
+    fetch = SlowFetch(delay=0)
+    coalescer = ReadCoalescer(ttl=0, stale=0)
+    coalescer.get(("get_by_status", "success"), fetch)
+    coalescer.get(("get_by_status", "failed"), fetch)
+    assert fetch.calls == 2
+
+
+def test_error_is_shared_and_not_cached():
+    fetch = SlowFetch(error=RuntimeError("throttled"))
+    coalescer = ReadCoalescer(ttl=60, stale=0)
+    errors = []
+
+    def call():
+        try:
+            coalescer.get("k", fetch)
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    _concurrent(call, n=8)
+    assert fetch.calls == 1 and len(errors) == 8
+    fetch.error = None
+    assert coalescer.get("k", fetch) == [{"launch_id": "v2"}]
+
+
+def test_ttl_serves_from_memory():
+    fetch = SlowFetch(delay=0)
+    coalescer = ReadCoalescer(ttl=60, stale=0)
+    for _ in range(5):
+        coalescer.get("k", fetch)
+    assert fetch.calls == 1
+
+
+def test_stale_while_revalidate_refreshes_in_background():
+    fetch = SlowFetch(delay=0.05)
+    coalescer = ReadCoalescer(ttl=0.01, stale=60)
+    assert coalescer.get("k", fetch) == [{"launch_id": "v1"}]
+    time.sleep(0.02)
+    # Vencido: todos reciben la copia anterior sin esperar, un solo refresco
+    start = time.perf_counter()
+    results = _concurrent(lambda: coalescer.get("k", fetch), n=8)
+    assert time.perf_counter() - start < 0.05
+    assert all(r == [{"launch_id": "v1"}] for r in results)
+    deadline = time.monotonic() + 2
+    while coalescer.get("k", fetch) != [{"launch_id": "v2"}] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert fetch.calls == 2
+
+
+def test_invalidate_discards_results_of_older_fetches():
+    coalescer = ReadCoalescer(ttl=60, stale=0)
+    started, release = threading.Event(), threading.Event()
+
+    def old_fetch():
+        started.set()
+        release.wait(2)
+        return "before-sync"
+
+    thread = threading.Thread(target=coalescer.get, args=("k", old_fetch))
+    thread.start()
+    started.wait(2)
+    coalescer.invalidate()
+    release.set()
+    thread.join()
+    assert coalescer.get("k", lambda: "after-sync") == "after-sync"
+
+
+@pytest.mark.parametrize("method,args", [("get_all", ()), ("get_by_status", ("success",)), ("get_stats", ())])
+def test_coalesced_reads_delegate(method, args):
+    class Service:
+        calls = 0
+
+        def _read(self, *a, **kw):
+            Service.calls += 1
+            time.sleep(0.05)
+            return [] if method != "get_stats" else "stats"
+
+        get_all = get_by_status = get_stats = _read
+
+    reads = CoalescedReads(Service(), ReadCoalescer(ttl=0, stale=0))
+    _concurrent(lambda: getattr(reads, method)(*args), n=8)
+    assert Service.calls == 1
+
+
+def test_follower_does_not_inherit_leader_deadline():
+    coalescer = ReadCoalescer(ttl=0, stale=0)
+    started = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        if len(calls) == 1:
+            started.set()
+            time.sleep(0.2)
+            check_deadline("scan")              # agota el límite de la petición líder
+        return ["ok"]
+
+    def leader_request():
+        with deadline_scope(0.05):
+            with pytest.raises(DeadlineExceeded):
+                coalescer.get(("get_all", None), fetch)
+
+    leader = threading.Thread(target=leader_request)
+    leader.start()
+    assert started.wait(2)
+    with deadline_scope(5):
+        assert coalescer.get(("get_all", None), fetch) == ["ok"]
+    leader.join()
+    assert len(calls) == 2
+
+
+def test_follower_waits_only_for_its_own_deadline():
+    coalescer = ReadCoalescer(ttl=0, stale=0)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_fetch():
+        started.set()
+        release.wait(5)
+        return ["ok"]
+
+    leader = threading.Thread(target=coalescer.get, args=(("get_all", None), slow_fetch))
+    leader.start()
+    assert started.wait(2)
+    try:
+        begin = time.monotonic()
+        with deadline_scope(0.1), pytest.raises(DeadlineExceeded):
+            coalescer.get(("get_all", None), slow_fetch)
+        assert time.monotonic() - begin < 1
+    finally:
+        release.set()
+        leader.join()
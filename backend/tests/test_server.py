@@ -0,0 +1,47 @@
+"""Tests del lanzador multi-worker (sin fork: solo las piezas en proceso)."""
+import asyncio
+import threading
+
+from backend.server import _CloseWhenDraining, default_workers
+
+
+async def _app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200,
+                "headers": [(b"content-type", b"text/plain"), (b"connection", b"keep-alive")]})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def _call(app) -> list[dict]:
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app({"type": "http"}, receive, send))
+    return sent
+
+
+def test_keep_alive_untouched_while_serving():
+    draining = threading.Event()
+    start = _call(_CloseWhenDraining(_app, draining))[0]
+    assert (b"connection", b"keep-alive") in start["headers"]
+
+
+def test_connection_close_while_draining():
+    draining = threading.Event()
+    draining.set()
+    sent = _call(_CloseWhenDraining(_app, draining))
+    headers = sent[0]["headers"]
+    assert (b"connection", b"close") in headers
+    assert (b"connection", b"keep-alive") not in headers
+    assert sent[1]["body"] == b"ok"
+
+
+def test_default_workers_from_env(monkeypatch):
+    monkeypatch.setenv("WEB_CONCURRENCY", "3")
+    assert default_workers() == 3
+    monkeypatch.delenv("WEB_CONCURRENCY")
+    assert default_workers() >= 1
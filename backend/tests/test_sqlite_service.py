@@ -0,0 +1,123 @@
+"""Tests del motor SQLite (STORAGE_BACKEND=sqlite): servicio, API y lease de sync."""
+import os
+
+os.environ.setdefault("AWS_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.main import app  # noqa: E402
+from backend.models.launch import SyncResponse  # noqa: E402
+from backend.services.dynamo_service import DynamoService  # noqa: E402
+from backend.services.launch_service import LaunchService, open_launch_service  # noqa: E402
+from backend.services.sqlite_service import SQLiteService  # noqa: E402
+from backend.services.sync_coordinator import SyncCoordinator  # noqa: E402
+from benchmarks.fakes import synthetic_launches  # noqa: E402
+from launch_store import SQLiteStore, get_sqlite_store  # noqa: E402
+from sync_pipeline import SyncPipeline, map_launch  # noqa: E402
+
+
+@pytest.fixture
+def sqlite_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("STORAGE_BACKEND", "sqlite")
+    monkeypatch.setenv("SQLITE_PATH", str(tmp_path / "launches.db"))
+    yield get_sqlite_store()
+
+
+def _sync(store, launches):
+    pipeline = SyncPipeline(store)
+    summary = pipeline.run([lambda: launches])
+    summary["generation"] = store.bump_generation(pipeline.changed_ids, summary)
+    return summary
+
+
+def test_factory_selects_engine(sqlite_env, monkeypatch):
+    assert isinstance(open_launch_service(), SQLiteService)
+    monkeypatch.setenv("STORAGE_BACKEND", "dynamodb")
+    assert isinstance(open_launch_service(), DynamoService)
+
+
+def test_incomplete_engine_fails_on_creation():
+    class Partial(LaunchService):
+        def get_all(self, limit=None):
+            return []
+
+    with pytest.raises(TypeError, match="get_view"):
+        Partial()
+
+
+def test_service_reads_and_changes(sqlite_env):
+    launches = synthetic_launches(40)
+    _sync(sqlite_env, launches)
+    launches[5] = {**launches[5], "details": "Nuevo detalle"}
+    _sync(sqlite_env, launches)
+
+    service = SQLiteService()
+    assert service.ping()
+    items = service.get_all()
+    assert len(items) == 40 and items[0]["launch_date"] >= items[-1]["launch_date"]
+    assert len(service.get_all(limit=7)) == 7
+    assert service.get_by_id(launches[5]["id"])["details"] == "Nuevo detalle"
+    assert service.get_by_id("no-existe") is None
+    assert all(i["status"] == "upcoming" for i in service.get_by_status("upcoming"))
+
+    stats = service.get_stats()
+    assert stats.total == 40
+    assert stats.success + stats.failed + stats.upcoming == 40
+
+    changes = service.get_changes(since=1)
+    assert changes["generation"] == 2 and not changes["full_reload"]
+    assert [i["launch_id"] for i in changes["items"]] == [launches[5]["id"]]
+    assert service.get_changes(since=0)["full_reload"] is True
+
+
+def test_api_serves_from_sqlite(sqlite_env):
+    launches = synthetic_launches(10)
+    _sync(sqlite_env, launches)
+    client = TestClient(app)
+
+    listed = client.get("/api/v1/launches").json()
+    assert len(listed) == 10
+    assert client.get(f"/api/v1/launches/{launches[0]['id']}").json()["mission_name"] == "Mission 0"
+    assert client.get("/api/v1/launches/stats").json()["total"] == 10
+    assert client.get("/api/v1/launches/changes?since=1").json()["generation"] == 1
+
+
+
+def test_views_are_served_from_the_published_item(sqlite_env):
+    launches = synthetic_launches(30)
+    sqlite_env.put_many(map_launch(launch) for launch in launches)
+    service = SQLiteService()
+    # Sin sync publicada no hay vista: se calcula por estado
+    fallback = service.get_view_launches("next", 5)
+
+    _sync(sqlite_env, launches)
+    client = TestClient(app)
+    upcoming = client.get("/api/v1/launches/next?limit=5").json()
+    latest = client.get("/api/v1/launches/latest").json()
+
+    assert [l["launch_id"] for l in upcoming] == [i["launch_id"] for i in fallback]
+    assert [l["launch_date"] for l in upcoming] == sorted(l["launch_date"] for l in upcoming)
+    assert {l["status"] for l in upcoming} == {"upcoming"}
+    assert len(latest) == 10 and {l["status"] for l in latest} <= {"success", "failed"}
+    assert [l["launch_date"] for l in latest] == sorted((l["launch_date"] for l in latest), reverse=True)
+    assert client.get("/api/v1/launches/latest?limit=500").status_code == 422
+
+
+def test_coordinator_lease_on_sqlite(tmp_path):
+    store = SQLiteStore(str(tmp_path / "lease.db"))
+    first = SyncCoordinator(store=store, min_interval=60, lease_seconds=5, poll_interval=0.01)
+    second = SyncCoordinator(store=store, min_interval=60, lease_seconds=5, poll_interval=0.01)
+    calls = []
+
+    def sync() -> SyncResponse:
+        calls.append(1)
+        return SyncResponse(total_fetched=3, inserted=3, updated=0, errors=0)
+
+    assert first.run(sync).coalesced is False
+    reused = second.run(sync)                       # dentro del intervalo mínimo
+    assert reused.coalesced is True and reused.inserted == 3
+    assert len(calls) == 1
+    assert "lease_owner" not in store.get_lease()
@@ -0,0 +1,194 @@
+"""Tests para el coalescing de sincronizaciones (SyncCoordinator) usando moto."""
+import os
+import threading
+import time
+
+import boto3
+import pytest
+from moto import mock_aws
+
+os.environ["AWS_ACCESS_KEY_ID"]     = "testing"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+os.environ["AWS_DEFAULT_REGION"]    = "us-east-1"
+
+from backend.models.launch import SyncResponse  # noqa: E402
+from backend.services.deadline import DeadlineExceeded, check_deadline, deadline_scope  # noqa: E402
+from backend.services.sync_coordinator import (  # noqa: E402
+    LEASE_KEY,
+    SyncCoordinator,
+    SyncInProgressError,
+    is_meta_item,
+)
+
+TABLE_NAME = "spacex-launches-test"
+
+
+@pytest.fixture
+def table():
+    with mock_aws():
+        ddb = boto3.resource("dynamodb", region_name="us-east-1")
+        t = ddb.create_table(
+            TableName=TABLE_NAME,
+            KeySchema=[{"AttributeName": "launch_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "launch_id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield t
+
+
+def _result(inserted: int = 1) -> SyncResponse:
+    return SyncResponse(total_fetched=inserted, inserted=inserted, updated=0, errors=0)
+
+
+def test_is_meta_item():
+    assert is_meta_item({"launch_id": LEASE_KEY})
+    assert not is_meta_item({"launch_id": "abc123"})
+
+
+def test_concurrent_calls_share_one_sync(table):
+    coordinator = SyncCoordinator(table=table, min_interval=0)
+    calls = []
+    started = threading.Event()
+
+    def slow_sync():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return _result(5)
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(coordinator.run(slow_sync)))
+    leader.start()
+    started.wait()
+    followers = [
+        threading.Thread(target=lambda: results.append(coordinator.run(slow_sync)))
+        for _ in range(3)
+    ]
+    for t in followers:
+        t.start()
+    for t in [leader, *followers]:
+        t.join()
+
+    assert len(calls) == 1
+    assert [r.inserted for r in results] == [5, 5, 5, 5]
+    assert sum(r.coalesced for r in results) == 3
+
+
+def test_min_interval_reuses_last_result(table):
+    coordinator = SyncCoordinator(table=table, min_interval=60)
+    calls = []
+
+    def sync():
+        calls.append(1)
+        return _result(len(calls))
+
+    first  = coordinator.run(sync)
+    second = coordinator.run(sync)
+
+    assert len(calls) == 1
+    assert first.coalesced is False
+    assert second.coalesced is True
+    assert second.inserted == first.inserted
+
+
+def test_lease_released_after_failure(table):
+    coordinator = SyncCoordinator(table=table, min_interval=0)
+
+    def failing_sync():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        coordinator.run(failing_sync)
+
+    lease = table.get_item(Key={"launch_id": LEASE_KEY}).get("Item", {})
+    assert "lease_owner" not in lease
+    assert coordinator.run(lambda: _result(2)).inserted == 2
+
+
+def test_waits_for_lease_held_by_other_task(table):
+    other = SyncCoordinator(table=table, min_interval=0)
+    assert other._acquire()
+
+    coordinator = SyncCoordinator(table=table, min_interval=0, poll_interval=0.05)
+    threading.Timer(0.2, other._release, args=(_result(7),)).start()
+
+    result = coordinator.run(lambda: pytest.fail("no debe sincronizar de nuevo"))
+    assert result.inserted == 7
+    assert result.coalesced is True
+
+
+def test_gives_up_when_lease_never_released(table):
+    other = SyncCoordinator(table=table, min_interval=0)
+    assert other._acquire()
+
+    coordinator = SyncCoordinator(table=table, min_interval=0, lease_seconds=0.2, poll_interval=0.05)
+    with pytest.raises(SyncInProgressError):
+        coordinator.run(_result)
+
+
+def test_follower_gives_up_with_sync_in_progress(table):
+    coordinator = SyncCoordinator(table=table, min_interval=0, lease_seconds=0.2)
+    started, release = threading.Event(), threading.Event()
+
+    def stuck_sync():
+        started.set()
+        release.wait(5)
+        return _result(1)
+
+    leader = threading.Thread(target=coordinator.run, args=(stuck_sync,))
+    leader.start()
+    assert started.wait(2)
+    try:
+        with pytest.raises(SyncInProgressError):
+            coordinator.run(stuck_sync)
+    finally:
+        release.set()
+        leader.join()
+
+
+def test_follower_does_not_inherit_leader_deadline(table):
+    coordinator = SyncCoordinator(table=table, min_interval=0)
+    started = threading.Event()
+    calls = []
+
+    def sync():
+        calls.append(1)
+        if len(calls) == 1:
+            started.set()
+            time.sleep(0.2)
+            check_deadline("sync")          # agota el límite de la petición líder
+        return _result(3)
+
+    def leader_request():
+        with deadline_scope(0.05):
+            with pytest.raises(DeadlineExceeded):
+                coordinator.run(sync)
+
+    leader = threading.Thread(target=leader_request)
+    leader.start()
+    assert started.wait(2)
+    result = coordinator.run(sync)          # sin límite propio: reintenta y obtiene resultado
+    leader.join()
+    assert result.inserted == 3 and len(calls) == 2
+
+
+def test_follower_waits_only_for_its_own_deadline(table):
+    coordinator = SyncCoordinator(table=table, min_interval=0)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_sync():
+        started.set()
+        release.wait(5)
+        return _result(1)
+
+    leader = threading.Thread(target=coordinator.run, args=(slow_sync,))
+    leader.start()
+    assert started.wait(2)
+    try:
+        begin = time.monotonic()
+        with deadline_scope(0.1), pytest.raises(DeadlineExceeded):
+            coordinator.run(slow_sync)
+        assert time.monotonic() - begin < 1
+    finally:
+        release.set()
+        leader.join()
@@ -0,0 +1,89 @@
+"""Tests del formato por columnas del listado (`format=columns` / `Accept`)."""
+import os
+from unittest.mock import MagicMock, patch
+
+os.environ.setdefault("AWS_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.main import app  # noqa: E402
+from backend.services.launch_service import LaunchService  # noqa: E402
+from backend.services.wire_format import (  # noqa: E402
+    COLUMNS_MEDIA_TYPE, WireFormat, encode_columns, negotiate,
+)
+
+client = TestClient(app)
+
+
+def _item(launch_id, date, status="success", rocket="Falcon 9", **extra):
+    return {"launch_id": launch_id, "mission_name": f"M-{launch_id}", "rocket_name": rocket,
+            "launch_date": date, "status": status, "launchpad": "LC-39A", "payloads": ["p"], **extra}
+
+
+def _decode(body):
+    """Lo mismo que `decodeColumns` en webapp/src/services/launchService.ts."""
+    columns = {}
+    for field, column in body["columns"].items():
+        if isinstance(column, dict):
+            column = [column["values"][code] for code in column["codes"]]
+        columns[field] = column
+    return [{field: columns[field][row] for field in columns} for row in range(body["count"])]
+
+
+def _service(items):
+    service = MagicMock()
+    service.get_all.return_value = items
+    service.to_launch = LaunchService.to_launch
+    return patch("backend.routers.launches.open_launch_service", return_value=service)
+
+
+def test_negotiate_prefers_query_parameter():
+    assert negotiate(None, None) is WireFormat.json
+    assert negotiate("application/json", None) is WireFormat.json
+    assert negotiate(f"{COLUMNS_MEDIA_TYPE}, application/json;q=0.9", None) is WireFormat.columns
+    assert negotiate(COLUMNS_MEDIA_TYPE, WireFormat.json) is WireFormat.json
+
+
+def test_negotiate_honours_quality_values():
+    assert negotiate(f"{COLUMNS_MEDIA_TYPE};q=0, application/json", None) is WireFormat.json
+    assert negotiate(f"{COLUMNS_MEDIA_TYPE};q=0", None) is WireFormat.json
+    assert negotiate(f"{COLUMNS_MEDIA_TYPE};q=0.5, application/json", None) is WireFormat.json
+    assert negotiate(f"application/json;q=0.4, {COLUMNS_MEDIA_TYPE};q=0.5", None) is WireFormat.columns
+    assert negotiate(f"{COLUMNS_MEDIA_TYPE};q=0.8, */*;q=0.1", None) is WireFormat.columns
+    assert negotiate(f"{COLUMNS_MEDIA_TYPE};q=abc", None) is WireFormat.json
+    assert negotiate(f"{COLUMNS_MEDIA_TYPE}-v2", None) is WireFormat.json
+
+
+def test_encode_columns_dictionary_encodes_repeated_values():
+    launches = [LaunchService.to_launch(i) for i in (
+        _item("a", "2024", "success"), _item("b", "2023", "failed", rocket="Falcon Heavy"),
+        _item("c", "2022", "success"),
+    )]
+    body = encode_columns(launches)
+    assert body["count"] == 3
+    assert body["columns"]["status"] == {"values": ["success", "failed"], "codes": [0, 1, 0]}
+    assert body["columns"]["rocket_name"] == {"values": ["Falcon 9", "Falcon Heavy"], "codes": [0, 1, 0]}
+    assert body["columns"]["launch_id"] == ["a", "b", "c"]
+    assert _decode(body) == [launch.model_dump(mode="json") for launch in launches]
+
+
+def test_list_negotiates_columns_and_round_trips():
+    items = [_item("a", "2020-01-01"), _item("b", "2021-01-01", "upcoming", details="Próximo")]
+    with _service(items):
+        plain = client.get("/api/v1/launches")
+        by_param = client.get("/api/v1/launches?format=columns")
+        by_accept = client.get("/api/v1/launches", headers={"Accept": COLUMNS_MEDIA_TYPE})
+
+    assert plain.headers["content-type"] == "application/json"
+    assert by_param.headers["content-type"] == COLUMNS_MEDIA_TYPE
+    assert by_accept.content == by_param.content
+    assert plain.headers["vary"] == by_param.headers["vary"] == "Accept"
+    assert _decode(by_param.json()) == plain.json()
+    assert len(by_param.content) < len(plain.content)
+
+
+def test_list_rejects_unknown_format():
+    with _service([]):
+        assert client.get("/api/v1/launches?format=xml").status_code == 422
@@ -0,0 +1,102 @@
+"""
+Ritmo de la carga masiva (`lambda/backfill.py`) frente a `upsert_launches`.
+
+Genera un volcado NDJSON con lanzamientos sintéticos y lo carga en DynamoDB en
+memoria con `--write-latency-ms` por BatchWriteItem (el viaje de red, que es
+lo que domina en DynamoDB real): una vez por el camino de la sync
+(`DynamoRepository.upsert_launches`) y otra por cada número de workers del
+backfill. Después exporta la tabla con 1 y con N segmentos de scan.
+
+    python -m benchmarks.backfill
+    python -m benchmarks.backfill --size 20000 --workers 1 4 8 16 --write-latency-ms 20
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Any
+
+import backend  # noqa: F401 - añade lambda/ al sys.path
+
+from benchmarks.fakes import InMemoryDynamoDB, synthetic_launches
+from benchmarks.run import TABLE_NAME, stand_in
+
+logger = logging.getLogger("benchmarks.backfill")
+
+
+def bench_backfill(size: int, workers: list[int], segments: int, write_latency: float,
+                   scan_latency: float) -> dict[str, dict]:
+    from backfill import export_items, load_dump, parallel_scan
+    from dynamo_repository import DynamoRepository
+    from sync_pipeline import DynamoBatchWriter
+    from write_governor import WriteGovernor
+
+    raw = synthetic_launches(size)
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        dump = os.path.join(tmp, "launches.ndjson")
+        with open(dump, "w", encoding="utf-8") as fh:
+            for launch in raw:
+                fh.write(json.dumps(launch) + "\n")
+
+        fake = InMemoryDynamoDB(write_latency=write_latency)
+        with stand_in(fake):
+            repository = DynamoRepository(TABLE_NAME)
+        start = time.perf_counter()
+        repository.upsert_launches(raw)
+        elapsed = time.perf_counter() - start
+        results[f"upsert_launches[{size}]"] = {"duration_ms": round(elapsed * 1000, 1),
+                                               "items_per_s": round(size / elapsed, 1)}
+        logger.info("upsert_launches: %8.1f ms", elapsed * 1000)
+
+        for count in workers:
+            fake = InMemoryDynamoDB(write_latency=write_latency)
+            summary = load_dump(dump, DynamoBatchWriter(fake, TABLE_NAME, WriteGovernor()), workers=count,
+                                progress_every=3600)
+            assert summary["written"] == size, summary
+            results[f"backfill.load[{size}]x{count}"] = {k: summary[k] for k in ("duration_ms", "items_per_s")}
+            logger.info("load %2d workers: %8.1f ms", count, summary["duration_ms"])
+
+        table = fake.Table(TABLE_NAME)
+        table.read_latency = lambda: scan_latency
+        for count in sorted({1, segments}):
+            summary = export_items(parallel_scan(table, count), os.path.join(tmp, f"export{count}.ndjson"),
+                                   progress_every=3600)
+            assert summary["exported"] == size, summary
+            results[f"backfill.export[{size}]x{count}"] = {k: summary[k] for k in ("duration_ms", "items_per_s")}
+            logger.info("export %2d segmentos: %8.1f ms", count, summary["duration_ms"])
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Ritmo de la carga masiva y la exportación")
+    parser.add_argument("--size", type=int, default=10_000, help="Lanzamientos del volcado")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--segments", type=int, default=8, help="Segmentos del scan paralelo")
+    parser.add_argument("--write-latency-ms", type=float, default=20.0,
+                        help="Latencia simulada por BatchWriteItem")
+    parser.add_argument("--scan-latency-ms", type=float, default=100.0,
+                        help="Latencia simulada por página de scan (1 MB)")
+    parser.add_argument("--output", help="Fichero JSON con los resultados")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    os.environ.setdefault("AWS_REGION", "us-east-1")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "local")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "local")
+
+    results: dict[str, Any] = bench_backfill(args.size, args.workers, args.segments,
+                                             args.write_latency_ms / 1000, args.scan_latency_ms / 1000)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    json.dump(results, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,382 @@
+"""
+Dobles en proceso para medir rendimiento sin red ni AWS.
+
+- `InMemoryDynamoDB`: sustituto de `boto3.resource("dynamodb")` con la parte de
+  la API que usan `DynamoService`, `DynamoRepository`, `DynamoBatchWriter` y
+  `SyncCoordinator`. Pagina los scans en trozos de 1 MB y reporta
+  `ConsumedCapacity` como DynamoDB (4 KB por RCU, 1 KB por WCU).
+  Con `write_latency` cada `batch_write_item` espera ese tiempo, como el
+  viaje de red a DynamoDB real; `read_latency` (una función que retorna
+  segundos) hace lo mismo en `get_item` y `query`.
+- `FakeSpaceXServer`: servidor HTTP local que sirve `/launches/past`,
+  `/launches/upcoming` y `/launches/query` con un dataset sintético.
+- `synthetic_launches()`: lanzamientos con la forma de la API SpaceX v4.
+"""
+import copy
+import json
+import math
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+
+from botocore.exceptions import ClientError
+
+PAGE_BYTES = 1024 * 1024
+
+
+# ─── Dataset sintético ───────────────────────────────────────────────────────
+
+def synthetic_launches(n: int, seed: int = 42, upcoming_ratio: float = 0.05) -> list[dict[str, Any]]:
+    """Genera `n` lanzamientos con la forma de la API SpaceX v4 (deterministas)."""
+    rng = random.Random(seed)
+    start = datetime(2006, 3, 24, tzinfo=timezone.utc)
+    launches = []
+    for i in range(n):
+        upcoming = i >= n * (1 - upcoming_ratio)
+        success = None if upcoming else rng.random() < 0.93
+        date = start + timedelta(hours=i * 175_000 / max(n, 1))
+        launches.append({
+            "id":            f"{i:024x}",
+            "name":          f"Mission {i}",
+            "date_utc":      date.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "rocket":        rng.choice(["5e9d0d95eda69973a809d1ec", "5e9d0d95eda69974db09d1ed"]),
+            "launchpad":     rng.choice(["5e9e4502f509094188566f88", "5e9e4501f509094ba4566f84",
+                                         "5e9e4502f509092b78566f87"]),
+            "flight_number": i + 1,
+            "details":       None if rng.random() < 0.4 else "Lorem ipsum " * rng.randint(5, 40),
+            "upcoming":      upcoming,
+            "success":       success,
+            "links": {
+                "patch":     {"small": f"https://images2.imgbox.com/{i}/s.png", "large": None},
+                "webcast":   f"https://youtu.be/{i:011d}" if rng.random() < 0.8 else None,
+                "article":   None,
+                "wikipedia": f"https://en.wikipedia.org/wiki/M{i}" if rng.random() < 0.5 else None,
+            },
+            "payloads":      [f"{rng.getrandbits(96):024x}" for _ in range(rng.randint(0, 3))],
+        })
+    return launches
+
+
+# ─── DynamoDB en memoria ─────────────────────────────────────────────────────
+
+def _item_size(item: dict[str, Any]) -> int:
+    return len(json.dumps(item, default=str))
+
+
+def _key_condition(expression) -> tuple[str, Any]:
+    """Extrae (atributo, valor) de un `Key(attr).eq(valor)` de boto3."""
+    spec = expression.get_expression()
+    if spec["operator"] != "=":
+        raise NotImplementedError(f"Operador no soportado: {spec['operator']}")
+    key, value = spec["values"]
+    return key.name, value
+
+
+class InMemoryTable:
+    def __init__(self, name: str, indexes: tuple[str, ...] = ("status", "launch_date"),
+                 read_latency: Optional[Callable[[], float]] = None):
+        self.name = name
+        self.read_latency = read_latency
+        self.table_status = "ACTIVE"
+        self.index_attributes = {f"{attr}-index": attr for attr in indexes}
+        self._items: dict[str, dict[str, Any]] = {}
+        self._sizes: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.calls: dict[str, int] = {}
+
+    def _count(self, operation: str) -> None:
+        self.calls[operation] = self.calls.get(operation, 0) + 1
+
+    @staticmethod
+    def _capacity(name: str, units: float, requested: Optional[str]) -> dict:
+        return {"ConsumedCapacity": {"TableName": name, "CapacityUnits": units}} if requested else {}
+
+    # ── Escrituras ────────────────────────────────────────────────────────────
+
+    def _store(self, item: dict[str, Any]) -> int:
+        key = item["launch_id"]
+        size = _item_size(item)
+        self._items[key] = copy.deepcopy(item)
+        self._sizes[key] = size
+        return max(1, math.ceil(size / 1024))
+
+    def put_item(self, Item: dict[str, Any], ReturnConsumedCapacity: Optional[str] = None,
+                 ConditionExpression=None, ExpressionAttributeValues=None, **_):
+        self._count("put_item")
+        with self._lock:
+            current = self._items.get(Item["launch_id"], {})
+            if ConditionExpression and not self._check(current, ConditionExpression,
+                                                       ExpressionAttributeValues or {}):
+                raise ClientError(
+                    {"Error": {"Code": "ConditionalCheckFailedException", "Message": "condition"}},
+                    "PutItem",
+                )
+            units = self._store(Item)
+        return self._capacity(self.name, units * (1 + len(self.index_attributes)), ReturnConsumedCapacity)
+
+    def update_item(self, Key, UpdateExpression, ExpressionAttributeValues=None,
+                    ConditionExpression=None, ReturnValues=None, **_):
+        """Soporta las expresiones que usa el proyecto: SET a = :x, ... / REMOVE a / ADD a :n."""
+        self._count("update_item")
+        values = ExpressionAttributeValues or {}
+        with self._lock:
+            item = copy.deepcopy(self._items.get(Key["launch_id"], dict(Key)))
+            if ConditionExpression and not self._check(item, ConditionExpression, values):
+                raise ClientError(
+                    {"Error": {"Code": "ConditionalCheckFailedException", "Message": "condition"}},
+                    "UpdateItem",
+                )
+            updated = set()
+            for action, body in re.findall(r"(SET|REMOVE|ADD)\s+(.*?)(?=\s+(?:SET|REMOVE|ADD)\s|$)",
+                                           UpdateExpression.strip()):
+                for clause in body.split(","):
+                    clause = clause.strip()
+                    if action == "SET":
+                        attr, placeholder = (p.strip() for p in clause.split("="))
+                        item[attr] = values[placeholder]
+                    elif action == "REMOVE":
+                        item.pop(clause, None)
+                    else:
+                        attr, placeholder = clause.split()
+                        item[attr] = item.get(attr, 0) + values[placeholder]
+                    updated.add(clause.split("=")[0].split()[0].strip())
+            self._store(item)
+        if ReturnValues == "UPDATED_NEW":
+            return {"Attributes": {k: item[k] for k in updated if k in item}}
+        if ReturnValues == "ALL_NEW":
+            return {"Attributes": dict(item)}
+        return {}
+
+    @staticmethod
+    def _check(item: dict, expression: str, values: dict) -> bool:
+        """Alternativas `OR` de condiciones (unidas por `AND`) sobre atributos: =, < y attribute_not_exists."""
+        def holds(condition: str) -> bool:
+            condition = condition.strip()
+            if condition.startswith("attribute_not_exists("):
+                return condition[21:-1] not in item
+            if " < " in condition:
+                attr, placeholder = (p.strip() for p in condition.split(" < "))
+                return attr in item and item[attr] < values[placeholder]
+            attr, placeholder = (p.strip() for p in condition.split(" = "))
+            return item.get(attr) == values[placeholder]
+
+        return any(all(holds(c) for c in alternative.strip().strip("()").split(" AND "))
+                   for alternative in expression.split(" OR "))
+
+    # ── Lecturas ──────────────────────────────────────────────────────────────
+
+    def delete_item(self, Key: dict[str, Any], ReturnConsumedCapacity: Optional[str] = None, **_):
+        self._count("delete_item")
+        with self._lock:
+            self._items.pop(Key["launch_id"], None)
+            size = self._sizes.pop(Key["launch_id"], 0)
+        units = max(1, math.ceil(size / 1024)) * (1 + len(self.index_attributes))
+        return self._capacity(self.name, units, ReturnConsumedCapacity)
+
+    def _wait(self) -> None:
+        if self.read_latency is not None:
+            time.sleep(self.read_latency())
+
+    def get_item(self, Key: dict[str, Any], ReturnConsumedCapacity: Optional[str] = None, **_):
+        self._count("get_item")
+        self._wait()
+        item = self._items.get(Key["launch_id"])
+        response: dict[str, Any] = self._capacity(self.name, 0.5, ReturnConsumedCapacity)
+        if item is not None:
+            response["Item"] = dict(item)
+        return response
+
+    def _page(self, keys: list[str], start_key: Optional[dict], limit: Optional[int],
+              requested: Optional[str]) -> dict[str, Any]:
+        start = 0
+        if start_key is not None:
+            start = keys.index(start_key["launch_id"]) + 1
+        items, size = [], 0
+        index = start
+        while index < len(keys) and size < PAGE_BYTES and (limit is None or len(items) < limit):
+            key = keys[index]
+            items.append(dict(self._items[key]))
+            size += self._sizes[key]
+            index += 1
+        response: dict[str, Any] = {"Items": items, "Count": len(items)}
+        response.update(self._capacity(self.name, math.ceil(size / 4096) / 2, requested))
+        if index < len(keys):
+            response["LastEvaluatedKey"] = {"launch_id": keys[index - 1]}
+        return response
+
+    def scan(self, ExclusiveStartKey: Optional[dict] = None, Limit: Optional[int] = None,
+             ReturnConsumedCapacity: Optional[str] = None, Segment: int = 0, TotalSegments: int = 1, **_):
+        self._count("scan")
+        self._wait()
+        # Scan paralelo: cada segmento ve una partición disjunta de las claves
+        keys = list(self._items)[Segment::TotalSegments]
+        return self._page(keys, ExclusiveStartKey, Limit, ReturnConsumedCapacity)
+
+    def query(self, IndexName: str, KeyConditionExpression, ExclusiveStartKey: Optional[dict] = None,
+              Limit: Optional[int] = None, ReturnConsumedCapacity: Optional[str] = None, **_):
+        self._count("query")
+        self._wait()
+        attr, value = _key_condition(KeyConditionExpression)
+        if self.index_attributes.get(IndexName) != attr:
+            raise ClientError({"Error": {"Code": "ValidationException", "Message": IndexName}}, "Query")
+        keys = [k for k, item in self._items.items() if item.get(attr) == value]
+        return self._page(keys, ExclusiveStartKey, Limit, ReturnConsumedCapacity)
+
+
+class InMemoryDynamoDB:
+    """Sustituto de `boto3.resource("dynamodb")` (solo lo que usa este proyecto)."""
+
+    def __init__(self, write_latency: float = 0.0,
+                 read_latency: Optional[Callable[[], float]] = None) -> None:
+        self.tables: dict[str, InMemoryTable] = {}
+        self.write_latency = write_latency
+        self.read_latency = read_latency
+
+    def Table(self, name: str) -> InMemoryTable:  # noqa: N802 - misma API que boto3
+        if name not in self.tables:
+            self.tables[name] = InMemoryTable(name, read_latency=self.read_latency)
+        return self.tables[name]
+
+    def batch_get_item(self, RequestItems: dict[str, Any], **_):
+        responses = {}
+        for name, request in RequestItems.items():
+            table = self.Table(name)
+            table._count("batch_get_item")
+            responses[name] = [
+                dict(table._items[key["launch_id"]]) for key in request["Keys"]
+                if key["launch_id"] in table._items
+            ]
+        return {"Responses": responses, "UnprocessedKeys": {}}
+
+    def batch_write_item(self, RequestItems: dict[str, Any], ReturnConsumedCapacity: Optional[str] = None):
+        if self.write_latency:
+            time.sleep(self.write_latency)
+        consumed = []
+        for name, requests in RequestItems.items():
+            table = self.Table(name)
+            table._count("batch_write_item")
+            units = 0
+            with table._lock:
+                for request in requests:
+                    units += table._store(request["PutRequest"]["Item"])
+            units *= 1 + len(table.index_attributes)
+            consumed.append({"TableName": name, "CapacityUnits": float(units)})
+        response: dict[str, Any] = {"UnprocessedItems": {}}
+        if ReturnConsumedCapacity:
+            response["ConsumedCapacity"] = consumed
+        return response
+
+    def seed(self, table_name: str, items: list[dict[str, Any]]) -> InMemoryTable:
+        """Carga items ya mapeados al esquema de DynamoDB."""
+        table = self.Table(table_name)
+        with table._lock:
+            for item in items:
+                table._store(item)
+        return table
+
+
+# ─── Servidor SpaceX falso ───────────────────────────────────────────────────
+
+def _matches(launch: dict[str, Any], query: dict[str, Any]) -> bool:
+    """Subconjunto del lenguaje de consulta de `/launches/query`: igualdad, $gte, $lt, $in."""
+    for attr, condition in query.items():
+        # La API filtra por el `_id` de MongoDB y lo devuelve como `id`
+        value = launch.get("id" if attr == "_id" else attr)
+        if not isinstance(condition, dict):
+            if value != condition:
+                return False
+            continue
+        if "$gte" in condition and (value is None or value < condition["$gte"]):
+            return False
+        if "$lt" in condition and (value is None or value >= condition["$lt"]):
+            return False
+        if "$in" in condition and value not in condition["$in"]:
+            return False
+    return True
+
+
+def query_page(launches: list[dict[str, Any]], query: dict[str, Any], options: dict[str, Any]) -> dict[str, Any]:
+    """Responde como `POST /v4/launches/query` (mongoose-paginate: `docs`, `totalDocs`...)."""
+    docs = [l for l in launches if _matches(l, query)]
+    for attr, direction in reversed(list((options.get("sort") or {}).items())):
+        docs.sort(key=lambda l: l.get(attr) or 0, reverse=direction in ("desc", -1))
+    total = len(docs)
+    if options.get("pagination") is False:
+        return {"docs": docs, "totalDocs": total, "limit": total, "page": 1, "totalPages": 1}
+    limit = int(options.get("limit", 10))
+    page = int(options.get("page", 1))
+    return {
+        "docs":       docs[(page - 1) * limit:page * limit],
+        "totalDocs":  total,
+        "limit":      limit,
+        "page":       page,
+        "totalPages": max(1, math.ceil(total / limit)),
+    }
+
+
+class FakeSpaceXServer:
+    """
+    Sirve `/v4/launches/past`, `/v4/launches/upcoming` y `POST /v4/launches/query`
+    desde memoria en un hilo.
+    """
+
+    def __init__(self, launches: list[dict[str, Any]]):
+        past     = json.dumps([l for l in launches if not l["upcoming"]]).encode()
+        upcoming = json.dumps([l for l in launches if l["upcoming"]]).encode()
+        routes = {"/v4/launches/past": past, "/v4/launches/upcoming": upcoming}
+        self.requests: list[str] = []
+        requests_seen = self.requests
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Cabeceras y cuerpo van en escrituras separadas: sin TCP_NODELAY la
+            # segunda petición por una conexión keep-alive espera ~40 ms al ACK retardado
+            disable_nagle_algorithm = True
+
+            def do_GET(self):  # noqa: N802 - API de http.server
+                requests_seen.append(f"GET {self.path}")
+                body = routes.get(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                self._send(body)
+
+            def do_POST(self):  # noqa: N802 - API de http.server
+                requests_seen.append(f"POST {self.path}")
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                if self.path != "/v4/launches/query":
+                    self.send_error(404)
+                    return
+                page = query_page(launches, request.get("query") or {}, request.get("options") or {})
+                self._send(json.dumps(page).encode())
+
+            def _send(self, body: bytes) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v4"
+
+    def __enter__(self) -> "FakeSpaceXServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,85 @@
+"""
+Tiempo de la sync completa de la Lambda según el número de workers (fan-out).
+
+Ejecuta `handler.lambda_handler` contra el servidor SpaceX falso y DynamoDB en
+memoria. Con 1 worker es la sync secuencial de siempre; con N > 1 el
+coordinador reparte el catálogo en N shards y los sincroniza a la vez con
+`LocalInvoker` (hilos en proceso, el mismo código que corre cada worker en
+Lambda). `--write-latency-ms` simula el viaje de red de cada BatchWriteItem,
+que es lo que domina en DynamoDB real.
+
+    python -m benchmarks.fanout
+    python -m benchmarks.fanout --size 10000 --workers 1 2 4 8 --write-latency-ms 20
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Any
+
+import backend  # noqa: F401 - añade lambda/ al sys.path
+
+from benchmarks.fakes import FakeSpaceXServer, InMemoryDynamoDB, synthetic_launches
+from benchmarks.run import TABLE_NAME, stand_in
+
+logger = logging.getLogger("benchmarks.fanout")
+
+
+def bench_fanout(size: int, workers: list[int], repeat: int, write_latency: float) -> dict[str, dict]:
+    raw = synthetic_launches(size)
+    results: dict[str, dict] = {}
+    with FakeSpaceXServer(raw) as server:
+        os.environ["SPACEX_BASE_URL"] = server.base_url
+        os.environ["DYNAMODB_TABLE"] = TABLE_NAME
+        # Después de fijar el entorno: el cliente lee la URL al importarse
+        from handler import lambda_handler
+
+        for count in workers:
+            runs = []
+            for _ in range(repeat):
+                fake = InMemoryDynamoDB(write_latency=write_latency)
+                with stand_in(fake):
+                    start = time.perf_counter()
+                    summary = lambda_handler({"fanout_workers": count}, None)
+                    runs.append((time.perf_counter() - start) * 1000)
+                assert summary["inserted"] == size, summary
+            results[f"sync.fanout[{size}]x{count}"] = {
+                "median_ms": round(statistics.median(runs), 1),
+                "min_ms":    round(min(runs), 1),
+                "runs":      repeat,
+            }
+            logger.info("%2d workers: %8.1f ms", count, results[f"sync.fanout[{size}]x{count}"]["median_ms"])
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Escalado de la sync con el número de workers")
+    parser.add_argument("--size", type=int, default=10_000, help="Lanzamientos del dataset")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--write-latency-ms", type=float, default=20.0,
+                        help="Latencia simulada por BatchWriteItem (0 = solo CPU)")
+    parser.add_argument("--output", help="Fichero JSON con los resultados")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")     # el handler ajusta el logger raíz
+    logger.setLevel(logging.INFO)
+    os.environ.setdefault("AWS_REGION", "us-east-1")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "local")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "local")
+
+    results: dict[str, Any] = bench_fanout(args.size, args.workers, args.repeat, args.write_latency_ms / 1000)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    json.dump(results, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
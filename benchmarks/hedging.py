@@ -0,0 +1,131 @@
+"""
+Latencia de cola de `DynamoService.get_by_id` con y sin hedging.
+
+DynamoDB en memoria con latencia de lectura de cola larga: casi todas las
+lecturas tardan `--base-ms` y una fracción `--slow-ratio` tarda `--slow-ms`
+(una partición o conexión lenta). Se mide p50/p95/p99 de las mismas lecturas
+en tres modos: sin nada (solo timeouts), con `DYNAMODB_HEDGE` y con un límite
+por petición (`REQUEST_DEADLINE_MS`), que corta la espera en lugar de taparla.
+
+    python -m benchmarks.hedging
+    python -m benchmarks.hedging --requests 3000 --slow-ratio 0.02 --slow-ms 300
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from typing import Any
+
+import backend  # noqa: F401 - añade lambda/ al sys.path
+
+from benchmarks.fakes import InMemoryDynamoDB, synthetic_launches
+from benchmarks.run import TABLE_NAME, stand_in
+
+logger = logging.getLogger("benchmarks.hedging")
+
+MODES = ("plain", "hedge", "deadline")
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def bench_hedging(requests: int, concurrency: int, base_ms: float, slow_ms: float,
+                  slow_ratio: float, deadline_ms: int, seed: int = 7) -> dict[str, dict]:
+    from backend.services.deadline import DeadlineExceeded, deadline_scope
+    from backend.services.dynamo_service import DynamoService
+    from backend.services.hedging import HedgedReads
+    from sync_pipeline import map_launch
+
+    items = [map_launch(l) for l in synthetic_launches(1000)]
+    ids = [i["launch_id"] for i in items]
+    results: dict[str, dict] = {}
+
+    for mode in MODES:
+        rng = random.Random(seed)
+        rng_lock = threading.Lock()
+
+        def latency() -> float:
+            with rng_lock:
+                slow = rng.random() < slow_ratio
+            return (slow_ms if slow else base_ms) / 1000
+
+        fake = InMemoryDynamoDB(read_latency=latency)
+        fake.seed(TABLE_NAME, items)
+        os.environ["DYNAMODB_TABLE"] = TABLE_NAME
+        with stand_in(fake):
+            service = DynamoService()
+        service.reads = HedgedReads(enabled=mode == "hedge", workers=concurrency * 2)
+        deadline = deadline_ms / 1000 if mode == "deadline" else None
+
+        samples: list[float] = []
+        timeouts = [0]
+        lock = threading.Lock()
+        plan = [ids[i % len(ids)] for i in range(requests)]
+
+        def worker(chunk: list[str]) -> None:
+            for launch_id in chunk:
+                start = time.perf_counter()
+                try:
+                    with deadline_scope(deadline):
+                        service.get_by_id(launch_id)
+                except DeadlineExceeded:
+                    with lock:
+                        timeouts[0] += 1
+                elapsed = (time.perf_counter() - start) * 1000
+                with lock:
+                    samples.append(elapsed)
+
+        threads = [threading.Thread(target=worker, args=(plan[i::concurrency],)) for i in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        service.reads.shutdown()
+
+        calls = fake.Table(TABLE_NAME).calls.get("get_item", 0)
+        results[f"get_by_id.{mode}"] = {
+            "p50_ms":    round(_percentile(samples, 0.50), 1),
+            "p95_ms":    round(_percentile(samples, 0.95), 1),
+            "p99_ms":    round(_percentile(samples, 0.99), 1),
+            "get_item":  calls,
+            "timeouts":  timeouts[0],
+            "requests":  requests,
+        }
+        logger.info("%-8s %s", mode, results[f"get_by_id.{mode}"])
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Latencia de cola de get_by_id con y sin hedging")
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--base-ms", type=float, default=3.0, help="Latencia habitual de GetItem")
+    parser.add_argument("--slow-ms", type=float, default=300.0, help="Latencia de una lectura lenta")
+    parser.add_argument("--slow-ratio", type=float, default=0.02, help="Fracción de lecturas lentas")
+    parser.add_argument("--deadline-ms", type=int, default=100, help="Límite por petición del modo deadline")
+    parser.add_argument("--output", help="Fichero JSON con los resultados")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    os.environ.setdefault("AWS_REGION", "us-east-1")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "local")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "local")
+
+    results: dict[str, Any] = bench_hedging(args.requests, args.concurrency, args.base_ms, args.slow_ms,
+                                            args.slow_ratio, args.deadline_ms)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    json.dump(results, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Coste de la sync completa frente a la sync "hot" (`{"mode": "hot"}`).
+
+Siembra la tabla con una sync completa y después cambia el catálogo como lo
+hace la API real entre dos disparos: un próximo lanzamiento cambia de fecha y
+otro despega (deja `/launches/upcoming`). Sobre ese estado mide cada modo por
+separado (misma tabla de partida): lanzamientos leídos de SpaceX, peticiones
+a DynamoDB, WCU y tiempo.
+
+    python -m benchmarks.hot_sync
+    python -m benchmarks.hot_sync --size 200 --upcoming-ratio 0.1
+"""
+import argparse
+import copy
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from functools import partial
+from typing import Any
+from unittest import mock
+
+import backend  # noqa: F401 - añade lambda/ al sys.path
+
+from benchmarks.fakes import FakeSpaceXServer, InMemoryDynamoDB, synthetic_launches
+from benchmarks.run import TABLE_NAME, stand_in
+
+logger = logging.getLogger("benchmarks.hot_sync")
+
+
+def _next_state(raw: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    launches = copy.deepcopy(raw)
+    upcoming = [l for l in launches if l["upcoming"]]
+    upcoming[0].update(upcoming=False, success=True)           # despega
+    upcoming[1]["date_utc"] = "2031-01-01T00:00:00.000Z"       # se retrasa
+    return launches
+
+
+def bench_hot_sync(size: int, upcoming_ratio: float, repeat: int) -> dict[str, dict]:
+    raw = synthetic_launches(size, upcoming_ratio=upcoming_ratio)
+    os.environ["DYNAMODB_TABLE"] = TABLE_NAME
+    with FakeSpaceXServer(raw) as server:
+        os.environ["SPACEX_BASE_URL"] = server.base_url
+        seeded = InMemoryDynamoDB()
+        with stand_in(seeded):
+            import handler
+            from spacex_client import SpaceXClient
+
+            handler.lambda_handler({}, None)
+    items = list(seeded.Table(TABLE_NAME)._items.values())
+
+    results: dict[str, dict] = {}
+    with FakeSpaceXServer(_next_state(raw)) as server:
+        for mode, event in (("full", {}), ("hot", {"mode": "hot"})):
+            runs = []
+            for _ in range(repeat):
+                fake = InMemoryDynamoDB()
+                fake.seed(TABLE_NAME, items)
+                # SPACEX_BASE_URL se lee al importar el cliente: el segundo servidor se inyecta
+                client = partial(SpaceXClient, server.base_url)
+                with stand_in(fake), mock.patch.object(handler, "SpaceXClient", client):
+                    start = time.perf_counter()
+                    summary = handler.lambda_handler(event, None)
+                    runs.append((time.perf_counter() - start) * 1000)
+            calls = fake.Table(TABLE_NAME).calls
+            results[f"sync.{mode}[{size}]"] = {
+                "median_ms":        round(statistics.median(runs), 1),
+                "fetched":          summary["total_fetched"],
+                "written":          summary["inserted"] + summary["updated"],
+                "query":            calls.get("query", 0),
+                "batch_get_item":   calls.get("batch_get_item", 0),
+                "batch_write_item": calls.get("batch_write_item", 0),
+                "consumed_wcu":     summary["telemetry"]["consumed_wcu"],
+            }
+            logger.info("%-4s %s", mode, results[f"sync.{mode}[{size}]"])
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Sync completa frente a sync hot")
+    parser.add_argument("--size", type=int, default=200, help="Lanzamientos del catálogo")
+    parser.add_argument("--upcoming-ratio", type=float, default=0.1, help="Fracción de próximos")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Fichero JSON con los resultados")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")     # el handler ajusta el logger raíz
+    logger.setLevel(logging.INFO)
+    os.environ.setdefault("AWS_REGION", "us-east-1")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "local")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "local")
+
+    results: dict[str, Any] = bench_hot_sync(args.size, args.upcoming_ratio, args.repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    json.dump(results, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
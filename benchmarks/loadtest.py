@@ -0,0 +1,222 @@
+"""
+Generador de carga para el backend FastAPI.
+
+Arranca `benchmarks.serve` (memoria, DynamoDB Local o SQLite) o apunta a un servidor
+existente (`--url`), ejecuta un escenario reproducible y reporta throughput y
+latencias p50/p95/p99 por ruta.
+
+El escenario (JSON) fija la semilla, el tamaño del dataset, la concurrencia,
+el número de peticiones y la mezcla de rutas. El plan de peticiones se genera
+entero a partir de la semilla, así que dos ejecuciones del mismo escenario
+envían exactamente las mismas peticiones.
+
+    python -m benchmarks.loadtest
+    python -m benchmarks.loadtest --concurrency 32 --requests 5000 --output load.json
+    python -m benchmarks.loadtest --backend dynamodb-local --endpoint http://localhost:8000
+    python -m benchmarks.loadtest --url http://localhost:8080      # servidor ya levantado
+"""
+import argparse
+import http.client
+import json
+import logging
+import math
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+logger = logging.getLogger("benchmarks.loadtest")
+
+DEFAULT_SCENARIO = Path(__file__).resolve().parent / "scenarios" / "mixed.json"
+STATUSES = ("success", "failed", "upcoming")
+BOOT_TIMEOUT = 300
+
+
+# ─── Plan de peticiones ──────────────────────────────────────────────────────
+
+def build_plan(scenario: dict[str, Any]) -> list[tuple[str, str, str]]:
+    """Lista determinista de (ruta, método, path) según la mezcla del escenario."""
+    rng = random.Random(scenario["seed"])
+    mix = scenario["mix"]
+    routes, weights = list(mix), [mix[r] for r in mix]
+    size = scenario["size"]
+
+    plan = []
+    for route in rng.choices(routes, weights=weights, k=scenario["requests"]):
+        if route == "list":
+            plan.append((route, "GET", "/api/v1/launches"))
+        elif route == "filter":
+            plan.append((route, "GET", f"/api/v1/launches?status={rng.choice(STATUSES)}"))
+        elif route == "detail":
+            # Mismos IDs que benchmarks.fakes.synthetic_launches
+            plan.append((route, "GET", f"/api/v1/launches/{rng.randrange(size):024x}"))
+        elif route == "stats":
+            plan.append((route, "GET", "/api/v1/launches/stats"))
+        elif route == "trigger":
+            plan.append((route, "POST", "/api/v1/trigger"))
+        else:
+            raise ValueError(f"Ruta desconocida en el escenario: {route}")
+    return plan
+
+
+# ─── Ejecución ───────────────────────────────────────────────────────────────
+
+def _worker(base_url: str, requests: list[tuple[str, str, str]], samples: list, timeout: float) -> None:
+    """Envía sus peticiones en orden sobre una conexión keep-alive."""
+    parts = urlsplit(base_url)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=timeout)
+    for route, method, path in requests:
+        start = time.perf_counter()
+        try:
+            conn.request(method, path)
+            response = conn.getresponse()
+            response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=timeout)
+            status = 0
+        samples.append((route, status, time.perf_counter() - start))
+    conn.close()
+
+
+def run_plan(base_url: str, plan: list[tuple[str, str, str]], concurrency: int,
+             timeout: float = 60.0) -> tuple[list[tuple[str, int, float]], float]:
+    """Reparte el plan en `concurrency` hilos (round-robin). Retorna muestras y duración."""
+    samples: list[tuple[str, int, float]] = []
+    threads = [
+        threading.Thread(target=_worker, args=(base_url, plan[i::concurrency], samples, timeout))
+        for i in range(concurrency)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples, time.perf_counter() - start
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Percentil por rango más cercano sobre valores ya ordenados."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples: list[tuple[str, int, float]], elapsed: float) -> dict[str, Any]:
+    """Throughput, errores y percentiles (ms) por ruta y totales."""
+    def stats(group: list[tuple[str, int, float]]) -> dict[str, Any]:
+        latencies = sorted(s[2] * 1000 for s in group)
+        statuses: dict[str, int] = {}
+        for _, status, _ in group:
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+        return {
+            "requests":       len(group),
+            "errors":         sum(1 for _, status, _ in group if status == 0 or status >= 500),
+            "statuses":       dict(sorted(statuses.items())),
+            "throughput_rps": round(len(group) / elapsed, 1) if elapsed else 0.0,
+            "mean_ms":        round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            "p50_ms":         round(percentile(latencies, 50), 2),
+            "p95_ms":         round(percentile(latencies, 95), 2),
+            "p99_ms":         round(percentile(latencies, 99), 2),
+            "max_ms":         round(latencies[-1], 2) if latencies else 0.0,
+        }
+
+    routes = sorted({s[0] for s in samples})
+    return {
+        "elapsed_seconds": round(elapsed, 2),
+        "total":           stats(samples),
+        "routes":          {route: stats([s for s in samples if s[0] == route]) for route in routes},
+    }
+
+
+# ─── Servidor ────────────────────────────────────────────────────────────────
+
+def wait_until_ready(base_url: str, process: subprocess.Popen | None, timeout: float = BOOT_TIMEOUT) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"El servidor terminó al arrancar (código {process.returncode})")
+        try:
+            with urllib.request.urlopen(f"{base_url}/health", timeout=2):
+                return
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.5)
+    raise TimeoutError(f"El servidor no respondió en {timeout:.0f}s")
+
+
+def boot_server(args: argparse.Namespace, size: int) -> subprocess.Popen:
+    command = [
+        sys.executable, "-m", "benchmarks.serve",
+        "--backend", args.backend, "--endpoint", args.endpoint,
+        "--size", str(size), "--port", str(args.port), "--workers", str(args.workers),
+    ]
+    logger.info("Arrancando backend: %s", " ".join(command[1:]))
+    return subprocess.Popen(command)
+
+
+def print_report(report: dict[str, Any]) -> None:
+    header = f"{'ruta':<10}{'reqs':>7}{'err':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'máx':>9}"
+    logger.info(header)
+    rows = list(report["routes"].items()) + [("TOTAL", report["total"])]
+    for route, s in rows:
+        logger.info("%-10s%7d%6d%9.1f%9.1f%9.1f%9.1f%9.1f", route, s["requests"], s["errors"],
+                    s["throughput_rps"], s["p50_ms"], s["p95_ms"], s["p99_ms"], s["max_ms"])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Prueba de carga del backend FastAPI")
+    parser.add_argument("--scenario", type=Path, default=DEFAULT_SCENARIO)
+    parser.add_argument("--size", type=int, help="Sobrescribe el tamaño del dataset del escenario")
+    parser.add_argument("--concurrency", type=int, help="Sobrescribe la concurrencia del escenario")
+    parser.add_argument("--requests", type=int, help="Sobrescribe el número de peticiones")
+    parser.add_argument("--backend", choices=("memory", "dynamodb-local", "sqlite"), default="memory")
+    parser.add_argument("--endpoint", default="http://localhost:8000", help="URL de DynamoDB Local")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=1, help="Workers del backend arrancado")
+    parser.add_argument("--url", help="Usar un servidor ya levantado en lugar de arrancar uno")
+    parser.add_argument("--output", type=Path, help="Archivo JSON con el reporte")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    scenario = json.loads(args.scenario.read_text())
+    for key in ("size", "concurrency", "requests"):
+        if getattr(args, key) is not None:
+            scenario[key] = getattr(args, key)
+
+    base_url = (args.url or f"http://127.0.0.1:{args.port}").rstrip("/")
+    process = None if args.url else boot_server(args, scenario["size"])
+    try:
+        wait_until_ready(base_url, process)
+
+        warmup = build_plan({**scenario, "requests": scenario.get("warmup_requests", 0)})
+        if warmup:
+            run_plan(base_url, warmup, scenario["concurrency"])
+
+        plan = build_plan(scenario)
+        logger.info("Escenario %s: %d peticiones, concurrencia %d, dataset %d",
+                    args.scenario.name, len(plan), scenario["concurrency"], scenario["size"])
+        samples, elapsed = run_plan(base_url, plan, scenario["concurrency"])
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=30)
+
+    report = {"scenario": scenario, "target": base_url, **summarize(samples, elapsed)}
+    print_report(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        logger.info("Reporte escrito en %s", args.output)
+    return 1 if report["total"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""
+Suite de benchmarks offline del camino caliente (sin AWS ni red externa).
+
+Mide con datasets sintéticos de 1k/10k/100k lanzamientos:
+
+- `repository.upsert[N]`     DynamoRepository.upsert_launches sobre tabla vacía
+- `sync.end_to_end[N]`       SpaceXClient (streaming) → SyncPipeline contra el servidor falso
+- `service.get_all[N]`       DynamoService.get_all (scan paginado)
+- `service.get_by_status[N]` DynamoService.get_by_status("success")
+- `service.get_stats[N]`     DynamoService.get_stats
+- `service.to_launch[N]`     DynamoService.to_launch sobre todos los items
+- `api.list[N]`, `api.list_by_status[N]`, `api.stats[N]`, `api.detail[N]`
+                             endpoints `/api/v1/launches` vía TestClient
+- `api.list_columns[N]`      `/api/v1/launches?format=columns` (lista por columnas)
+- `api.next[N]`, `api.latest[N]`
+                             `/api/v1/launches/next` y `/latest` (vistas `#view#*`)
+
+Con `--storage sqlite` los mismos casos corren contra el motor SQLite
+(`STORAGE_BACKEND=sqlite`, fichero temporal) con el prefijo `sqlite.`; sin
+umbrales propios, sirven para comparar ambos motores en la misma máquina.
+
+Uso (desde la raíz del repositorio):
+
+    python -m benchmarks.run                              # 1k, 10k, 100k
+    python -m benchmarks.run --sizes 1000 10000 --repeat 5
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --sizes 10000 --storage memory sqlite
+    python -m benchmarks.run --update-thresholds 2.0      # regenera umbrales
+
+Cada caso reporta min/mediana/máx en ms. Si la mediana supera el umbral de
+`benchmarks/thresholds.json` el proceso termina con código 1.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator
+from unittest import mock
+
+import boto3
+
+import backend  # noqa: F401 - añade lambda/ al sys.path
+
+from benchmarks.fakes import FakeSpaceXServer, InMemoryDynamoDB, synthetic_launches
+from launch_store import get_sqlite_store
+
+TABLE_NAME = "spacex-launches-bench"
+THRESHOLDS_FILE = Path(__file__).resolve().parent / "thresholds.json"
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+# `memory`: DynamoDB en memoria (InMemoryDynamoDB); `sqlite`: launch_store.SQLiteStore
+STORAGES = ("memory", "sqlite")
+# Umbral mínimo: evita falsos positivos por ruido en casos de pocos ms
+MIN_THRESHOLD_MS = 10.0
+
+logger = logging.getLogger("benchmarks")
+
+
+@contextmanager
+def stand_in(fake: InMemoryDynamoDB) -> Iterator[InMemoryDynamoDB]:
+    """Hace que `boto3.resource("dynamodb")` retorne el sustituto en memoria."""
+    with mock.patch.object(boto3, "resource", return_value=fake):
+        yield fake
+
+
+@contextmanager
+def sqlite_storage() -> Iterator[str]:
+    """`STORAGE_BACKEND=sqlite` sobre un fichero temporal."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "bench.db")
+        with mock.patch.dict(os.environ, {"STORAGE_BACKEND": "sqlite", "SQLITE_PATH": path}):
+            yield path
+        get_sqlite_store(path).close()
+
+
+def measure(fn: Callable[[], Any], repeat: int, setup: Callable[[], None] | None = None) -> dict[str, Any]:
+    """Ejecuta `fn` `repeat` veces (tras una pasada de calentamiento) y resume en ms."""
+    if setup:
+        setup()
+    fn()
+    runs = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms":    round(min(runs), 2),
+        "median_ms": round(statistics.median(runs), 2),
+        "max_ms":    round(max(runs), 2),
+        "runs":      repeat,
+    }
+
+
+# ─── Casos ───────────────────────────────────────────────────────────────────
+
+def bench_sync(size: int, raw: list[dict[str, Any]], repeat: int, storage: str = "memory") -> dict[str, dict]:
+    if storage == "sqlite":
+        with sqlite_storage():
+            return _bench_sync(size, raw, repeat, "sqlite.")
+    return _bench_sync(size, raw, repeat, "")
+
+
+def _bench_sync(size: int, raw: list[dict[str, Any]], repeat: int, prefix: str) -> dict[str, dict]:
+    from dynamo_repository import DynamoRepository
+    from spacex_client import SpaceXClient
+    from sync_pipeline import PipelineConfig, SyncPipeline
+
+    results = {}
+    state: dict[str, Any] = {}
+
+    def fresh_repository() -> None:
+        if prefix:
+            get_sqlite_store().clear()
+            state["repo"] = DynamoRepository(TABLE_NAME)
+            return
+        with stand_in(InMemoryDynamoDB()):
+            state["repo"] = DynamoRepository(TABLE_NAME)
+
+    results[f"{prefix}repository.upsert[{size}]"] = measure(
+        lambda: state["repo"].upsert_launches(raw), repeat, setup=fresh_repository,
+    )
+
+    with FakeSpaceXServer(raw) as server:
+        def end_to_end() -> None:
+            client = SpaceXClient(base_url=server.base_url)
+            SyncPipeline(state["repo"], PipelineConfig.from_env()).run(
+                [client.iter_past_launches, client.iter_upcoming_launches],
+            )
+
+        results[f"{prefix}sync.end_to_end[{size}]"] = measure(end_to_end, repeat, setup=fresh_repository)
+    return results
+
+
+def bench_reads(size: int, items: list[dict[str, Any]], repeat: int, storage: str = "memory") -> dict[str, dict]:
+    if storage == "sqlite":
+        from backend.services.sqlite_service import SQLiteService
+
+        with sqlite_storage():
+            get_sqlite_store().put_many(items)
+            get_sqlite_store().bump_generation(None)       # publica las vistas
+            return _bench_reads(size, items, repeat, SQLiteService(), "sqlite.")
+
+    from backend.services.dynamo_service import DynamoService
+    from sync_pipeline import DynamoBatchWriter
+
+    fake = InMemoryDynamoDB()
+    fake.seed(TABLE_NAME, items)
+    DynamoBatchWriter(fake, TABLE_NAME).bump_generation(None)
+    with stand_in(fake), mock.patch.dict(os.environ, {"DYNAMODB_TABLE": TABLE_NAME}):
+        return _bench_reads(size, items, repeat, DynamoService(), "")
+
+
+def _bench_reads(size: int, items: list[dict[str, Any]], repeat: int, service: Any, prefix: str) -> dict[str, dict]:
+    from fastapi.testclient import TestClient
+
+    from backend.main import app
+
+    detail_id = items[len(items) // 2]["launch_id"]
+    scanned = service.get_all()
+    client = TestClient(app)
+
+    def api(path: str) -> Callable[[], None]:
+        def call() -> None:
+            response = client.get(path)
+            assert response.status_code == 200, response.text
+        return call
+
+    return {
+        f"{prefix}service.get_all[{size}]":       measure(service.get_all, repeat),
+        f"{prefix}service.get_by_status[{size}]": measure(lambda: service.get_by_status("success"), repeat),
+        f"{prefix}service.get_stats[{size}]":     measure(service.get_stats, repeat),
+        f"{prefix}service.to_launch[{size}]":     measure(lambda: [service.to_launch(i) for i in scanned], repeat),
+        f"{prefix}api.list[{size}]":              measure(api("/api/v1/launches"), repeat),
+        f"{prefix}api.list_columns[{size}]":      measure(api("/api/v1/launches?format=columns"), repeat),
+        f"{prefix}api.list_by_status[{size}]":    measure(api("/api/v1/launches?status=success"), repeat),
+        f"{prefix}api.stats[{size}]":             measure(api("/api/v1/launches/stats"), repeat),
+        f"{prefix}api.detail[{size}]":            measure(api(f"/api/v1/launches/{detail_id}"), repeat),
+        f"{prefix}api.next[{size}]":              measure(api("/api/v1/launches/next"), repeat),
+        f"{prefix}api.latest[{size}]":            measure(api("/api/v1/launches/latest"), repeat),
+    }
+
+
+def run_suite(sizes: list[int], repeat: int, storages: tuple[str, ...] = ("memory",)) -> dict[str, Any]:
+    from sync_pipeline import map_launch
+
+    results: dict[str, dict] = {}
+    for size in sizes:
+        logger.info("Dataset de %d lanzamientos", size)
+        raw = synthetic_launches(size)
+        items = [map_launch(launch) for launch in raw]
+        for storage in storages:
+            results.update(bench_sync(size, raw, repeat, storage))
+            results.update(bench_reads(size, items, repeat, storage))
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python":    platform.python_version(),
+            "platform":  platform.platform(),
+            "sizes":     sizes,
+            "repeat":    repeat,
+            "storages":  list(storages),
+        },
+        "results": results,
+    }
+
+
+# ─── Umbrales ────────────────────────────────────────────────────────────────
+
+def check_thresholds(results: dict[str, dict], thresholds: dict[str, float]) -> list[str]:
+    """Retorna los casos cuya mediana supera su umbral (ms)."""
+    regressions = []
+    for case, limit in sorted(thresholds.items()):
+        measured = results.get(case)
+        if measured and measured["median_ms"] > limit:
+            regressions.append(f"{case}: {measured['median_ms']:.1f} ms > umbral {limit:.1f} ms")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks offline del camino caliente")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones medidas por caso")
+    parser.add_argument("--output", type=Path, help="Archivo JSON de resultados")
+    parser.add_argument("--storage", nargs="+", choices=STORAGES, default=["memory"],
+                        help="Motores a medir (sqlite añade los casos `sqlite.*`)")
+    parser.add_argument("--thresholds", type=Path, default=THRESHOLDS_FILE)
+    parser.add_argument("--update-thresholds", type=float, metavar="FACTOR",
+                        help="Reescribe los umbrales como mediana × FACTOR en lugar de comparar")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # El pipeline registra cada lote; aquí solo interesa el resumen
+    logging.getLogger("sync_pipeline").setLevel(logging.WARNING)
+    logging.getLogger("dynamo_repository").setLevel(logging.WARNING)
+    for name in ("spacex_client", "httpx"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    report = run_suite(args.sizes, args.repeat, tuple(args.storage))
+    results = report["results"]
+    for case, data in results.items():
+        logger.info("%-41s %10.2f ms  (min %.2f, máx %.2f)",
+                    case, data["median_ms"], data["min_ms"], data["max_ms"])
+
+    if args.update_thresholds:
+        thresholds = {case: round(max(data["median_ms"] * args.update_thresholds, MIN_THRESHOLD_MS), 1)
+                      for case, data in results.items()}
+        args.thresholds.write_text(json.dumps(thresholds, indent=2, sort_keys=True) + "\n")
+        logger.info("Umbrales actualizados en %s", args.thresholds)
+    else:
+        thresholds = json.loads(args.thresholds.read_text()) if args.thresholds.exists() else {}
+    report["regressions"] = check_thresholds(results, thresholds)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        logger.info("Resultados escritos en %s", args.output)
+
+    if report["regressions"]:
+        logger.error("Regresiones de rendimiento:\n  %s", "\n  ".join(report["regressions"]))
+        return 1
+    logger.info("Sin regresiones (%d umbrales comprobados)", len(thresholds))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Arranca `backend.main:app` con datos sembrados para pruebas de carga.
+
+- `--backend memory`: DynamoDB sustituido por `InMemoryDynamoDB` (sin Docker).
+- `--backend dynamodb-local`: usa DynamoDB Local (`--endpoint`); crea la tabla
+  si no existe y la siembra con BatchWriteItem.
+- `--backend sqlite`: `STORAGE_BACKEND=sqlite` sobre `--sqlite-path`; los
+  workers comparten el fichero (WAL) en lugar de una copia cada uno.
+
+En ambos modos levanta un servidor SpaceX falso con el mismo dataset y apunta
+`SPACEX_BASE_URL` a él, de modo que `POST /api/v1/trigger` ejecuta una sync
+local completa sin salir a internet.
+
+    python -m benchmarks.serve --backend memory --size 10000 --port 8765 --workers 2
+"""
+import argparse
+import logging
+import os
+import sys
+from unittest import mock
+
+import boto3
+
+from benchmarks.fakes import FakeSpaceXServer, InMemoryDynamoDB, synthetic_launches
+
+logger = logging.getLogger("benchmarks.serve")
+
+TABLE_NAME = "spacex-launches-load"
+
+
+def _create_table(dynamodb, table_name: str) -> None:
+    """Mismo esquema que docker-compose.yml / infra (PK + GSIs status y launch_date)."""
+    existing = boto3.client(
+        "dynamodb", region_name=dynamodb.meta.client.meta.region_name,
+        endpoint_url=dynamodb.meta.client.meta.endpoint_url,
+    ).list_tables()["TableNames"]
+    if table_name in existing:
+        return
+    table = dynamodb.create_table(
+        TableName=table_name,
+        KeySchema=[{"AttributeName": "launch_id", "KeyType": "HASH"}],
+        AttributeDefinitions=[
+            {"AttributeName": "launch_id",   "AttributeType": "S"},
+            {"AttributeName": "status",      "AttributeType": "S"},
+            {"AttributeName": "launch_date", "AttributeType": "S"},
+        ],
+        GlobalSecondaryIndexes=[
+            {"IndexName": f"{attr}-index",
+             "KeySchema": [{"AttributeName": attr, "KeyType": "HASH"}],
+             "Projection": {"ProjectionType": "ALL"}}
+            for attr in ("status", "launch_date")
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    table.wait_until_exists()
+
+
+def seed(backend: str, size: int, endpoint: str | None, table_name: str) -> list[dict]:
+    """Siembra la tabla y retorna el dataset crudo (formato SpaceX)."""
+    from sync_pipeline import map_launch
+
+    raw = synthetic_launches(size)
+    items = [map_launch(launch) for launch in raw]
+
+    if backend == "memory":
+        fake = InMemoryDynamoDB()
+        fake.seed(table_name, items)
+        real_resource = boto3.resource
+        # El parche vive lo que dure el proceso (y lo heredan los workers por fork)
+        mock.patch.object(
+            boto3, "resource",
+            side_effect=lambda name, *a, **kw: fake if name == "dynamodb" else real_resource(name, *a, **kw),
+        ).start()
+        return raw
+
+    if backend == "sqlite":
+        from launch_store import get_sqlite_store
+
+        store = get_sqlite_store()
+        store.clear()
+        store.put_many(items)
+        # Cada worker abre sus propias conexiones tras el fork
+        store.close()
+        return raw
+
+    dynamodb = boto3.resource("dynamodb", region_name=os.environ["AWS_REGION"], endpoint_url=endpoint)
+    _create_table(dynamodb, table_name)
+    with dynamodb.Table(table_name).batch_writer() as writer:
+        for item in items:
+            writer.put_item(Item=item)
+    return raw
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Backend sembrado para pruebas de carga")
+    parser.add_argument("--backend", choices=("memory", "dynamodb-local", "sqlite"), default="memory")
+    parser.add_argument("--endpoint", default="http://localhost:8000", help="URL de DynamoDB Local")
+    parser.add_argument("--sqlite-path", default="/tmp/spacex-load.db", help="Fichero del backend sqlite")
+    parser.add_argument("--size", type=int, default=10_000, help="Lanzamientos a sembrar")
+    parser.add_argument("--table", default=TABLE_NAME)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=1, help="Workers del lanzador backend.server")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+    os.environ.setdefault("AWS_REGION", "us-east-1")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "local")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "local")
+    os.environ["DYNAMODB_TABLE"] = args.table
+    # Con endpoint definido (o SQLite) el trigger usa el modo local (sin Lambda)
+    if args.backend == "sqlite":
+        os.environ["STORAGE_BACKEND"] = "sqlite"
+        os.environ["SQLITE_PATH"] = args.sqlite_path
+    else:
+        os.environ["DYNAMODB_ENDPOINT"] = args.endpoint if args.backend == "dynamodb-local" else "memory://"
+
+    import backend  # noqa: F401 - añade lambda/ al sys.path
+
+    logger.info("Sembrando %d lanzamientos (%s)...", args.size, args.backend)
+    raw = seed(args.backend, args.size, args.endpoint, args.table)
+
+    with FakeSpaceXServer(raw) as spacex:
+        os.environ["SPACEX_BASE_URL"] = spacex.base_url
+        # Importar la app después de fijar el entorno: los routers lo leen al importarse.
+        # Mismo lanzador que producción (preload + fork); con memoria cada
+        # worker hereda su propia copia de la tabla sembrada.
+        from backend.server import serve
+
+        return serve(workers=args.workers, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+Tamaño y tiempo de `/api/v1/launches` en JSON y por columnas (`format=columns`).
+
+Para cada tamaño siembra DynamoDB en memoria con lanzamientos sintéticos y
+mide, por formato: bytes del cuerpo (también comprimido con gzip, como lo
+serviría un proxy), mediana de la petición completa vía TestClient y mediana
+de solo la serialización de la lista ya construida.
+
+    python -m benchmarks.wire_format
+    python -m benchmarks.wire_format --sizes 1000 10000 --repeat 7
+"""
+import argparse
+import gzip
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable
+from unittest import mock
+
+import backend  # noqa: F401 - añade lambda/ al sys.path
+
+from benchmarks.fakes import InMemoryDynamoDB, synthetic_launches
+from benchmarks.run import TABLE_NAME, stand_in
+
+logger = logging.getLogger("benchmarks.wire_format")
+
+
+def _median_ms(fn: Callable[[], Any], repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(runs), 1)
+
+
+def bench_wire_format(sizes: list[int], repeat: int) -> dict[str, dict]:
+    from fastapi.testclient import TestClient
+
+    from backend.main import app
+    from backend.models.launch import Launch
+    from backend.services.dynamo_service import DynamoService
+    from backend.services.wire_format import ColumnsResponse, encode_columns
+    from pydantic import TypeAdapter
+    from sync_pipeline import map_launch
+
+    adapter = TypeAdapter(list[Launch])
+    serializers: dict[str, Callable[[list], bytes]] = {
+        # Solo el volcado de los modelos y json.dumps de la respuesta (FastAPI además
+        # revalida la lista contra `response_model`, que aquí no se cuenta)
+        "json":    lambda launches: json.dumps(adapter.dump_python(launches, mode="json"),
+                                               ensure_ascii=False, separators=(",", ":")).encode(),
+        "columns": lambda launches: ColumnsResponse(encode_columns(launches)).body,
+    }
+    results: dict[str, dict] = {}
+    for size in sizes:
+        items = [map_launch(l) for l in synthetic_launches(size)]
+        fake = InMemoryDynamoDB()
+        fake.seed(TABLE_NAME, items)
+        with stand_in(fake), mock.patch.dict(os.environ, {"DYNAMODB_TABLE": TABLE_NAME}):
+            client = TestClient(app)
+            launches = [DynamoService.to_launch(i) for i in items]
+            for name, query in (("json", ""), ("columns", "?format=columns")):
+                body = client.get(f"/api/v1/launches{query}").content
+                results[f"list.{name}[{size}]"] = {
+                    "bytes":        len(body),
+                    "gzip_bytes":   len(gzip.compress(body, 6)),
+                    "request_ms":   _median_ms(lambda: client.get(f"/api/v1/launches{query}"), repeat),
+                    "serialize_ms": _median_ms(lambda: serializers[name](launches), repeat),
+                }
+                logger.info("%-8s %6d: %s", name, size, results[f"list.{name}[{size}]"])
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Tamaño y tiempo del listado en JSON y por columnas")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Fichero JSON con los resultados")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    os.environ.setdefault("AWS_REGION", "us-east-1")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "local")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "local")
+
+    results: dict[str, Any] = bench_wire_format(args.sizes, args.repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    json.dump(results, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
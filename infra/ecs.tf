@@ -166,7 +166,7 @@ resource "aws_lb_target_group" "backend" {
     healthy_threshold   = 2
     interval            = 30
     matcher             = "200"
-    path                = "/health"
+    path                = "/health/ready"
     port                = "traffic-port"
     protocol            = "HTTP"
     timeout             = 5
@@ -209,14 +209,14 @@ resource "aws_lb_listener_rule" "api" {
   }
 }
 
-# Regla: /health → backend (para el health check del backend)
+# Regla: /health, /health/live, /health/ready → backend
 resource "aws_lb_listener_rule" "health" {
   listener_arn = aws_lb_listener.http.arn
   priority     = 90
 
   condition {
     path_pattern {
-      values = ["/health"]
+      values = ["/health", "/health/*"]
     }
   }
 
@@ -279,8 +279,8 @@ resource "aws_ecs_task_definition" "backend" {
   family                   = "spacex-backend-${var.environment}"
   requires_compatibilities = ["FARGATE"]
   network_mode             = "awsvpc"
-  cpu                      = "256"
-  memory                   = "512"
+  cpu                      = var.backend_task_cpu
+  memory                   = var.backend_task_memory
   execution_role_arn       = aws_iam_role.ecs_task_execution.arn
   task_role_arn            = aws_iam_role.ecs_task.arn
 
@@ -293,7 +293,9 @@ resource "aws_ecs_task_definition" "backend" {
       { name = "AWS_REGION",           value = var.aws_region },
       { name = "ENVIRONMENT",          value = var.environment },
       { name = "LAMBDA_FUNCTION_NAME", value = "${var.lambda_function_name}-${var.environment}" },
-      { name = "CORS_ORIGINS",         value = "*" }
+      { name = "CORS_ORIGINS",         value = "*" },
+      # Por defecto 1 worker por vCPU (backend_task_cpu / 1024), nunca menos de 1
+      { name = "WEB_CONCURRENCY",      value = tostring(coalesce(var.backend_workers, max(1, floor(tonumber(var.backend_task_cpu) / 1024)))) }
     ]
     logConfiguration = {
       logDriver = "awslogs"
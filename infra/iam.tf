@@ -27,6 +27,8 @@ resource "aws_iam_policy" "lambda_dynamo" {
         "dynamodb:GetItem",
         "dynamodb:Scan",
         "dynamodb:Query",
+        "dynamodb:DeleteItem",
+        "dynamodb:BatchGetItem",
         "dynamodb:BatchWriteItem"
       ]
       Resource = [
@@ -42,6 +44,27 @@ resource "aws_iam_role_policy_attachment" "lambda_dynamo_policy" {
   policy_arn = aws_iam_policy.lambda_dynamo.arn
 }
 
+# Una sync que no cabe en el timeout guarda su checkpoint y se reinvoca (asíncrono);
+# en modo fan-out el coordinador invoca a los workers (síncrono)
+resource "aws_iam_policy" "lambda_self_invoke" {
+  name        = "${var.lambda_function_name}-self-invoke-${var.environment}"
+  description = "Permite a la Lambda reinvocarse para continuar una sync desde su checkpoint"
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [{
+      Effect   = "Allow"
+      Action   = ["lambda:InvokeFunction"]
+      Resource = "arn:aws:lambda:${var.aws_region}:${data.aws_caller_identity.current.account_id}:function:${var.lambda_function_name}-${var.environment}"
+    }]
+  })
+}
+
+resource "aws_iam_role_policy_attachment" "lambda_self_invoke_policy" {
+  role       = aws_iam_role.lambda_exec.name
+  policy_arn = aws_iam_policy.lambda_self_invoke.arn
+}
+
 resource "aws_iam_role_policy_attachment" "lambda_basic_execution" {
   role       = aws_iam_role.lambda_exec.name
   policy_arn = "arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole"
@@ -109,6 +132,31 @@ resource "aws_iam_role_policy_attachment" "ecs_dynamo_read_policy" {
   policy_arn = aws_iam_policy.ecs_dynamo_read.arn
 }
 
+# El backend solo escribe el item de control `#sync-lease` (coalescing de /trigger)
+resource "aws_iam_policy" "ecs_sync_lease" {
+  name        = "${var.ecs_service_name}-sync-lease-${var.environment}"
+  description = "Permite al backend gestionar el lease de sincronizacion en DynamoDB"
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [{
+      Effect   = "Allow"
+      Action   = ["dynamodb:UpdateItem"]
+      Resource = aws_dynamodb_table.spacex_launches.arn
+      Condition = {
+        "ForAllValues:StringEquals" = {
+          "dynamodb:LeadingKeys" = ["#sync-lease"]
+        }
+      }
+    }]
+  })
+}
+
+resource "aws_iam_role_policy_attachment" "ecs_sync_lease_policy" {
+  role       = aws_iam_role.ecs_task.name
+  policy_arn = aws_iam_policy.ecs_sync_lease.arn
+}
+
 resource "aws_iam_policy" "ecs_lambda_invoke" {
   name        = "${var.ecs_service_name}-lambda-invoke-${var.environment}"
   description = "Permite al backend ECS invocar la Lambda de sincronizacion"
@@ -17,9 +17,10 @@ resource "aws_lambda_function" "spacex_collector" {
 
   environment {
     variables = {
-      DYNAMODB_TABLE = aws_dynamodb_table.spacex_launches.name
-      ENVIRONMENT    = var.environment
-      LOG_LEVEL      = "INFO"
+      DYNAMODB_TABLE      = aws_dynamodb_table.spacex_launches.name
+      ENVIRONMENT         = var.environment
+      LOG_LEVEL           = "INFO"
+      SYNC_FANOUT_WORKERS = tostring(var.lambda_fanout_workers)
     }
   }
 
@@ -56,6 +57,31 @@ resource "aws_lambda_permission" "allow_eventbridge" {
   source_arn    = aws_cloudwatch_event_rule.lambda_schedule.arn
 }
 
+# EventBridge rule para la sync "hot" (solo próximos lanzamientos), frecuente
+resource "aws_cloudwatch_event_rule" "lambda_hot_schedule" {
+  count               = var.lambda_hot_schedule_expression == "" ? 0 : 1
+  name                = "${var.lambda_function_name}-hot-schedule-${var.environment}"
+  description         = "Refresca los próximos lanzamientos de SpaceX"
+  schedule_expression = var.lambda_hot_schedule_expression
+}
+
+resource "aws_cloudwatch_event_target" "lambda_hot_target" {
+  count     = var.lambda_hot_schedule_expression == "" ? 0 : 1
+  rule      = aws_cloudwatch_event_rule.lambda_hot_schedule[0].name
+  target_id = "SpaceXCollectorLambdaHot"
+  arn       = aws_lambda_function.spacex_collector.arn
+  input     = jsonencode({ mode = "hot" })
+}
+
+resource "aws_lambda_permission" "allow_eventbridge_hot" {
+  count         = var.lambda_hot_schedule_expression == "" ? 0 : 1
+  statement_id  = "AllowExecutionFromEventBridgeHot"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.spacex_collector.function_name
+  principal     = "events.amazonaws.com"
+  source_arn    = aws_cloudwatch_event_rule.lambda_hot_schedule[0].arn
+}
+
 # API Gateway para invocación manual
 resource "aws_apigatewayv2_api" "lambda_api" {
   name          = "${var.lambda_function_name}-api-${var.environment}"
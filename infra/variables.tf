@@ -40,6 +40,18 @@ variable "lambda_schedule_expression" {
   default     = "rate(6 hours)"
 }
 
+variable "lambda_hot_schedule_expression" {
+  description = "Expresión de la sync \"hot\" (solo próximos lanzamientos); vacía = desactivada"
+  type        = string
+  default     = "rate(5 minutes)"
+}
+
+variable "lambda_fanout_workers" {
+  description = "Invocaciones worker en paralelo por sync (0 o 1 = sync secuencial)"
+  type        = number
+  default     = 0
+}
+
 variable "ecr_repository_name" {
   description = "Nombre del repositorio ECR"
   type        = string
@@ -70,6 +82,24 @@ variable "ecs_task_memory" {
   default     = "512"
 }
 
+variable "backend_task_cpu" {
+  description = "CPU asignada a la tarea del backend (en unidades)"
+  type        = string
+  default     = "256"
+}
+
+variable "backend_task_memory" {
+  description = "Memoria asignada a la tarea del backend (en MB)"
+  type        = string
+  default     = "512"
+}
+
+variable "backend_workers" {
+  description = "Workers del lanzador backend.server (WEB_CONCURRENCY); null = 1 por vCPU de la tarea (mínimo 1)"
+  type        = number
+  default     = null
+}
+
 variable "webapp_port" {
   description = "Puerto expuesto por la aplicación web"
   type        = number
@@ -0,0 +1,481 @@
+"""
+Carga masiva (backfill / restauración) y exportación de la tabla de lanzamientos
+sin pasar por la API SpaceX ni por la sync.
+
+    python lambda/backfill.py load launches.ndjson --table spacex-launches-dev --workers 8
+    python lambda/backfill.py load snapshot.ndjson.gz --table spacex-launches-dev --wcu-budget 500
+    python lambda/backfill.py export snapshot.ndjson.gz --table spacex-launches-dev --segments 8
+
+`load` acepta un array JSON o NDJSON (opcionalmente `.gz`) con lanzamientos
+crudos de la API (`id`, se mapean como en la sync) o items ya mapeados
+(`launch_id`, p. ej. un volcado de `export`). Varios workers envían
+BatchWriteItem a la vez a través del `WriteGovernor`; el avance se guarda en
+`<volcado>.checkpoint.json` y, si la carga se interrumpe, la siguiente
+ejecución continúa desde ahí (`--restart` empieza de cero). Al terminar se
+publica una generación nueva (`full_reload`) para que los lectores recarguen.
+
+`export` lee la tabla con un scan paralelo (`Segment` / `TotalSegments`) y la
+vuelca a NDJSON. Los items de control (`#sync-generation`, `#changes#...`) no
+se exportan ni se cargan: son estado de cada tabla.
+
+Con `STORAGE_BACKEND=sqlite` ambos modos trabajan sobre `SQLITE_PATH`.
+"""
+import argparse
+import gzip
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from decimal import Decimal
+from itertools import chain
+from typing import Any, Iterable, Iterator, Optional
+
+from launch_store import SQLITE, get_sqlite_store, open_launch_writer, storage_backend
+from sync_pipeline import MAX_BATCH_WRITE, content_hash, iter_json_array, map_launch
+from write_governor import WriteGovernor
+
+logger = logging.getLogger("backfill")
+
+CHUNK_SIZE = 1 << 16
+# Claves de los items de control (`#sync-generation`, `#changes#<gen>`, ...)
+META_PREFIX = "#"
+
+_DONE = object()
+
+
+# ── Lectura del volcado ──────────────────────────────────────────────────────
+
+def _iter_ndjson(chunks: Iterable[bytes]) -> Iterator[Any]:
+    pending = b""
+    line_number = 0
+    for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield _loads(line, line_number)
+    if pending.strip():
+        yield _loads(pending, line_number + 1)
+
+
+def _loads(line: bytes, line_number: int) -> Any:
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Línea {line_number} no es JSON válido: {exc}") from exc
+
+
+class DumpReader:
+    """Registros de un volcado (array JSON o NDJSON, `.gz` opcional) y su avance en bytes."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.size = os.path.getsize(path)
+        self._raw = open(path, "rb")
+        self._stream = gzip.GzipFile(fileobj=self._raw) if path.endswith(".gz") else self._raw
+
+    @property
+    def position(self) -> int:
+        """Bytes leídos del fichero (comprimidos si es `.gz`)."""
+        return self._raw.tell()
+
+    def __iter__(self) -> Iterator[Any]:
+        chunks = iter(lambda: self._stream.read(CHUNK_SIZE), b"")
+        head = b""
+        for chunk in chunks:
+            head += chunk
+            if head.strip():
+                break
+        chunks = chain([head], chunks)
+        if head.lstrip().startswith(b"["):
+            return iter_json_array(chunks)
+        return _iter_ndjson(chunks)
+
+    def close(self) -> None:
+        self._stream.close()
+        self._raw.close()
+
+
+def _decimals(value: Any) -> Any:
+    # boto3 no acepta float en los items
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    if isinstance(value, dict):
+        return {k: _decimals(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decimals(v) for v in value]
+    return value
+
+
+def to_item(record: Any) -> Optional[dict[str, Any]]:
+    """
+    Item de la tabla para un registro del volcado, o None si es un item de
+    control. Lanza ValueError si el registro no es un lanzamiento.
+    """
+    if not isinstance(record, dict):
+        raise ValueError(f"Se esperaba un objeto y se encontró {type(record).__name__}")
+    if record.get("launch_id"):
+        if str(record["launch_id"]).startswith(META_PREFIX):
+            return None
+        item = dict(record)
+    elif record.get("id"):
+        item = map_launch(record)
+    else:
+        raise ValueError("Registro sin launch_id ni id")
+    if not item.get("content_hash"):
+        item["content_hash"] = content_hash(item)
+    return _decimals(item)
+
+
+# ── Checkpoint ───────────────────────────────────────────────────────────────
+
+class Checkpoint:
+    """
+    Avance de una carga en un fichero JSON: cuántos registros del volcado
+    están ya escritos. Solo vale para el mismo fichero (ruta, tamaño y fecha
+    de modificación) y la misma tabla.
+    """
+
+    def __init__(self, path: str, dump_path: str, table: str) -> None:
+        self.path = path
+        stat = os.stat(dump_path)
+        self.fingerprint = {"input": os.path.abspath(dump_path), "size": stat.st_size,
+                            "mtime_ns": stat.st_mtime_ns, "table": table}
+
+    def load(self) -> int:
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                state = json.load(fh)
+        except FileNotFoundError:
+            return 0
+        if state.get("fingerprint") != self.fingerprint:
+            raise ValueError(f"El checkpoint {self.path} es de otro volcado o tabla; usa --restart")
+        return int(state.get("records", 0))
+
+    def save(self, records: int) -> None:
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"fingerprint": self.fingerprint, "records": records,
+                       "updated_at": int(time.time() * 1000)}, fh)
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class _Watermark:
+    """
+    Registros cubiertos por lotes terminados sin huecos. Los workers acaban
+    los lotes en cualquier orden; un lote fallido detiene la marca y se
+    reintenta al reanudar.
+    """
+
+    def __init__(self, start: int) -> None:
+        self.records = start
+        self._next = 0
+        self._done: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def complete(self, seq: int, end: int) -> None:
+        with self._lock:
+            self._done[seq] = end
+            while self._next in self._done:
+                self.records = self._done.pop(self._next)
+                self._next += 1
+
+
+# ── Progreso ─────────────────────────────────────────────────────────────────
+
+class Progress:
+    """Línea de log periódica con el avance, el ritmo en items/s y las WCU consumidas."""
+
+    def __init__(self, label: str, every: float = 5.0, total_bytes: Optional[int] = None,
+                 governor: Optional[WriteGovernor] = None) -> None:
+        self.label = label
+        self.every = every
+        self.total_bytes = total_bytes
+        self.governor = governor
+        self.started = time.perf_counter()
+        self._last = self.started
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def due(self) -> bool:
+        return time.perf_counter() - self._last >= self.every
+
+    def report(self, count: int, position: Optional[int] = None) -> None:
+        self._last = time.perf_counter()
+        parts = [f"{self.label} {count:,} items"]
+        if position is not None and self.total_bytes:
+            parts.append(f"{100 * position / self.total_bytes:.1f}%")
+        parts.append(f"{count / max(self.elapsed(), 1e-9):,.0f} items/s")
+        if self.governor is not None:
+            parts.append(f"{self.governor.consumed_wcu:,.0f} WCU")
+        logger.info(" · ".join(parts))
+
+
+# ── Carga ────────────────────────────────────────────────────────────────────
+
+def load_dump(path: str, writer, workers: int = 8, checkpoint: Optional[Checkpoint] = None,
+              progress_every: float = 5.0) -> dict[str, Any]:
+    """
+    Escribe los lanzamientos de `path` con `workers` hilos de BatchWriteItem.
+
+    Un hilo lee y agrupa en lotes de 25 (un duplicado dentro del lote se queda
+    con la última versión) y los workers los escriben en paralelo a través de
+    `writer.write_batch`. Retorna los conteos; `complete` es False si la carga
+    se interrumpió o quedaron lotes sin escribir (el checkpoint se conserva).
+    """
+    start_at = checkpoint.load() if checkpoint is not None else 0
+    if start_at:
+        logger.info("Reanudando %s desde el registro %d", path, start_at)
+    reader = DumpReader(path)
+    progress = Progress("cargados", progress_every, reader.size, getattr(writer, "governor", None))
+    batches: queue.Queue = queue.Queue(maxsize=workers * 2)
+    watermark = _Watermark(start_at)
+    stop = threading.Event()
+    lock = threading.Lock()
+    failures: list[BaseException] = []
+    counts = {"read": 0, "written": 0, "skipped": 0, "invalid": 0, "failed": 0}
+
+    def work() -> None:
+        while True:
+            task = batches.get()
+            if task is None:
+                return
+            seq, end, items = task
+            if stop.is_set():
+                continue                        # interrumpida: se descartan los lotes en cola
+            try:
+                failed = writer.write_batch(items)
+            except Exception as exc:
+                logger.error("Lote %d fallido: %s", seq, exc)
+                failures.append(exc)
+                stop.set()
+                continue
+            with lock:
+                counts["written"] += len(items) - len(failed)
+                counts["failed"] += len(failed)
+            if not failed:
+                watermark.complete(seq, end)
+
+    threads = [threading.Thread(target=work, name=f"backfill-{i}", daemon=True) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+
+    interrupted = False
+    seq = 0
+    batch: dict[str, dict[str, Any]] = {}
+    try:
+        for position, record in enumerate(reader, 1):
+            if stop.is_set():
+                break
+            if position <= start_at:
+                continue
+            counts["read"] += 1
+            try:
+                item = to_item(record)
+            except ValueError as exc:
+                counts["invalid"] += 1
+                logger.warning("Registro %d descartado: %s", position, exc)
+                continue
+            if item is None:
+                counts["skipped"] += 1
+                continue
+            batch[item["launch_id"]] = item
+            if len(batch) == MAX_BATCH_WRITE:
+                batches.put((seq, position, list(batch.values())))
+                seq, batch = seq + 1, {}
+            if progress.due():
+                progress.report(counts["written"], reader.position)
+                if checkpoint is not None:
+                    checkpoint.save(watermark.records)
+        else:
+            if batch:
+                batches.put((seq, position, list(batch.values())))
+    except KeyboardInterrupt:
+        interrupted = True
+        stop.set()
+        logger.warning("Interrumpida: esperando a los lotes en curso")
+    finally:
+        for _ in threads:
+            batches.put(None)
+        for thread in threads:
+            thread.join()
+        reader.close()
+
+    complete = not (interrupted or failures or counts["failed"])
+    if checkpoint is not None:
+        if complete:
+            checkpoint.clear()
+        else:
+            checkpoint.save(watermark.records)
+            logger.warning("Checkpoint guardado en %s (registro %d)", checkpoint.path, watermark.records)
+    progress.report(counts["written"], reader.size)
+    elapsed = progress.elapsed()
+    summary: dict[str, Any] = {
+        **counts,
+        "resumed_from":   start_at,
+        "records":        watermark.records,
+        "complete":       complete,
+        "interrupted":    interrupted,
+        "duration_ms":    round(elapsed * 1000, 1),
+        "items_per_s":    round(counts["written"] / max(elapsed, 1e-9), 1),
+    }
+    governor = getattr(writer, "governor", None)
+    if governor is not None:
+        summary["consumed_wcu"] = round(governor.consumed_wcu, 1)
+        summary["throttles"] = governor.throttle_count
+    if failures:
+        summary["error"] = str(failures[0])
+    return summary
+
+
+# ── Exportación ──────────────────────────────────────────────────────────────
+
+def parallel_scan(table, segments: int) -> Iterator[dict[str, Any]]:
+    """Items de `table` leídos con `segments` scans paralelos (un hilo por segmento)."""
+    pages: queue.Queue = queue.Queue(maxsize=segments * 2)
+
+    def scan(segment: int) -> None:
+        kwargs: dict[str, Any] = {"Segment": segment, "TotalSegments": segments}
+        try:
+            while True:
+                response = table.scan(**kwargs)
+                pages.put(response.get("Items", []))
+                if not response.get("LastEvaluatedKey"):
+                    break
+                kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        except Exception as exc:
+            pages.put(exc)
+        pages.put(_DONE)
+
+    for segment in range(segments):
+        threading.Thread(target=scan, args=(segment,), name=f"scan-{segment}", daemon=True).start()
+    running = segments
+    while running:
+        page = pages.get()
+        if page is _DONE:
+            running -= 1
+        elif isinstance(page, Exception):
+            raise page
+        else:
+            yield from page
+
+
+def _encode(value: Any) -> Any:
+    # Decimal (items de DynamoDB) y sets
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if isinstance(value, Decimal):
+        return int(value) if value == int(value) else float(value)
+    raise TypeError(f"{type(value).__name__} no es serializable")
+
+
+def export_items(items: Iterable[dict[str, Any]], path: str, progress_every: float = 5.0) -> dict[str, Any]:
+    """Escribe `items` (sin los de control) como NDJSON en `path`, de forma atómica."""
+    progress = Progress("exportados", progress_every)
+    exported = 0
+    tmp = f"{path}.tmp"
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(tmp, "wt", encoding="utf-8") as fh:
+        for item in items:
+            if str(item.get("launch_id", "")).startswith(META_PREFIX):
+                continue
+            fh.write(json.dumps(item, default=_encode, ensure_ascii=False, separators=(",", ":")))
+            fh.write("\n")
+            exported += 1
+            if progress.due():
+                progress.report(exported)
+    os.replace(tmp, path)
+    progress.report(exported)
+    elapsed = progress.elapsed()
+    return {"exported": exported, "duration_ms": round(elapsed * 1000, 1),
+            "items_per_s": round(exported / max(elapsed, 1e-9), 1)}
+
+
+# ── CLI ──────────────────────────────────────────────────────────────────────
+
+def _boto_kwargs(args: argparse.Namespace, pool: int) -> dict[str, Any]:
+    from botocore.config import Config
+
+    kwargs: dict[str, Any] = {"region_name": args.region,
+                              "config": Config(max_pool_connections=max(10, pool + 2))}
+    if args.endpoint:
+        kwargs["endpoint_url"] = args.endpoint
+    return kwargs
+
+
+def _publish(writer, summary: dict[str, Any]) -> None:
+    # Los lectores no pueden saber qué IDs cambiaron: recarga completa
+    generation = writer.bump_generation(None, {"total_fetched": summary["read"],
+                                               "errors": summary["invalid"] + summary["failed"]})
+    summary["generation"] = generation
+    logger.info("Publicada la generación %d", generation)
+
+
+def run_load(args: argparse.Namespace) -> int:
+    governor = WriteGovernor(wcu_budget=args.wcu_budget) if args.wcu_budget else WriteGovernor.from_env()
+    writer = open_launch_writer(args.table, governor, **_boto_kwargs(args, args.workers))
+    checkpoint = Checkpoint(args.checkpoint or f"{args.input}.checkpoint.json", args.input, args.table)
+    if args.restart:
+        checkpoint.clear()
+    summary = load_dump(args.input, writer, args.workers, checkpoint, args.progress_every)
+    if summary["written"]:
+        _publish(writer, summary)
+    json.dump(summary, sys.stdout, indent=2)
+    print()
+    if summary["interrupted"]:
+        return 130
+    return 0 if summary["complete"] and not summary["invalid"] else 1
+
+
+def run_export(args: argparse.Namespace) -> int:
+    if storage_backend() == SQLITE:
+        items: Iterable[dict[str, Any]] = get_sqlite_store().scan()
+    else:
+        import boto3
+
+        table = boto3.resource("dynamodb", **_boto_kwargs(args, args.segments)).Table(args.table)
+        items = parallel_scan(table, args.segments)
+    summary = export_items(items, args.output, args.progress_every)
+    json.dump(summary, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Carga masiva y exportación de la tabla de lanzamientos")
+    parser.add_argument("--table", default=os.environ.get("DYNAMODB_TABLE", "spacex-launches-dev"))
+    parser.add_argument("--region", default=os.environ.get("AWS_REGION", "us-east-1"))
+    parser.add_argument("--endpoint", default=os.environ.get("DYNAMODB_ENDPOINT"),
+                        help="Endpoint de DynamoDB (DynamoDB local)")
+    parser.add_argument("--progress-every", type=float, default=5.0, help="Segundos entre líneas de progreso")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    load = commands.add_parser("load", help="Carga un volcado JSON/NDJSON en la tabla")
+    load.add_argument("input", help="Volcado (.json, .ndjson, opcionalmente .gz)")
+    load.add_argument("--workers", type=int, default=8, help="Hilos de BatchWriteItem")
+    load.add_argument("--wcu-budget", type=float, help="WCU/s máximas (defecto: SYNC_WCU_BUDGET)")
+    load.add_argument("--checkpoint", help="Fichero de checkpoint (defecto: <input>.checkpoint.json)")
+    load.add_argument("--restart", action="store_true", help="Ignora el checkpoint y empieza de cero")
+
+    export = commands.add_parser("export", help="Vuelca la tabla a NDJSON con un scan paralelo")
+    export.add_argument("output", help="Fichero de salida (.ndjson, opcionalmente .gz)")
+    export.add_argument("--segments", type=int, default=8, help="Segmentos del scan paralelo")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    return run_load(args) if args.command == "load" else run_export(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
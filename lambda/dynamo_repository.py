@@ -1,116 +1,121 @@
 import logging
-from typing import Any
+import sqlite3
+from typing import Any, Callable, Iterable
 
 import boto3
 from boto3.dynamodb.conditions import Key
 from botocore.exceptions import BotoCoreError, ClientError
 
+from launch_store import SQLITE, get_sqlite_store, storage_backend
+from sync_pipeline import DynamoBatchWriter, PipelineConfig, SyncCheckpoint, SyncPipeline, map_launch
+from write_governor import WriteGovernor
+
 logger = logging.getLogger(__name__)
 
+# Prefijo de los items de control que comparten tabla (p. ej. `#sync-lease`)
+META_PREFIX = "#"
+
+# Errores del motor que se traducen a DynamoRepositoryError
+STORAGE_ERRORS = (BotoCoreError, ClientError, sqlite3.Error)
+
 
 class DynamoRepositoryError(Exception):
     """Error al interactuar con DynamoDB."""
 
 
 class DynamoRepository:
-    """Repositorio para gestionar lanzamientos de SpaceX en DynamoDB."""
+    """
+    Repositorio para gestionar lanzamientos de SpaceX en DynamoDB, o en SQLite
+    con `STORAGE_BACKEND=sqlite` (mismo contrato, fichero `SQLITE_PATH`).
+    """
 
-    def __init__(self, table_name: str, region: str = "us-east-1"):
+    def __init__(self, table_name: str, region: str = "us-east-1",
+                 governor: WriteGovernor | None = None, deadline: Callable[[], bool] | None = None):
         self.table_name = table_name
+        self.store = get_sqlite_store() if storage_backend() == SQLITE else None
+        if self.store is not None:
+            self.writer = self.store
+            return
         self.dynamodb = boto3.resource("dynamodb", region_name=region)
         self.table = self.dynamodb.Table(table_name)
+        # Con `deadline` las escrituras con throttling dejan de reintentarse a tiempo de guardar el checkpoint
+        self.writer = DynamoBatchWriter(self.dynamodb, table_name, governor=governor, deadline=deadline)
 
-    def upsert_launches(self, launches: list[dict[str, Any]]) -> dict[str, int]:
+    def upsert_launches(self, launches: Iterable[dict[str, Any]]) -> dict[str, int]:
         """
         Inserta o actualiza (upsert) una lista de lanzamientos en DynamoDB.
-        Retorna un resumen con conteos de inserted, updated y errors.
+        Retorna un resumen con conteos de inserted, updated, unchanged y errors.
         """
-        inserted = 0
-        updated = 0
-        errors = 0
-
-        for launch in launches:
-            try:
-                item = self._map_launch(launch)
-                launch_id = item["launch_id"]
-
-                # Comprobamos si ya existe
-                existing = self._get_by_id(launch_id)
-                if existing:
-                    self._update(item)
-                    updated += 1
-                    logger.debug("Actualizado: %s", launch_id)
-                else:
-                    self._put(item)
-                    inserted += 1
-                    logger.debug("Insertado: %s", launch_id)
-
-            except (BotoCoreError, ClientError) as exc:
-                logger.error("Error DynamoDB para launch %s: %s", launch.get("id"), exc)
-                errors += 1
-            except Exception as exc:
-                logger.error("Error inesperado para launch %s: %s", launch.get("id"), exc)
-                errors += 1
-
-        logger.info("Upsert completado - Insertados: %d, Actualizados: %d, Errores: %d",
-                    inserted, updated, errors)
-        return {"inserted": inserted, "updated": updated, "errors": errors}
+        result = SyncPipeline(self, PipelineConfig.from_env()).run([lambda: launches])
+        return {"inserted": result["inserted"], "updated": result["updated"],
+                "unchanged": result["unchanged"], "errors": result["errors"]}
+
+    # ── Contrato LaunchWriter (etapas diff/write de sync_pipeline) ───────────
+
+    def existing_ids(self, launch_ids: list[str]) -> dict[str, str | None]:
+        """Retorna los IDs que ya existen en la tabla con su `content_hash` (BatchGetItem)."""
+        return self.writer.existing_ids(launch_ids)
+
+    def write_batch(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Escribe un lote con BatchWriteItem; retorna los items no escritos."""
+        return self.writer.write_batch(items)
+
+    def bump_generation(self, changed_ids: list[str] | None = None,
+                        summary: dict[str, Any] | None = None) -> int:
+        """Marca una nueva generación de datos (`#sync-generation`) y su historial de cambios."""
+        try:
+            return self.writer.bump_generation(changed_ids, summary)
+        except STORAGE_ERRORS as exc:
+            raise DynamoRepositoryError(f"Error al actualizar la generación: {exc}") from exc
+
+    def load_checkpoint(self) -> SyncCheckpoint | None:
+        """Progreso de una sync interrumpida (`#sync-state`), si existe."""
+        try:
+            return self.writer.load_checkpoint()
+        except STORAGE_ERRORS as exc:
+            raise DynamoRepositoryError(f"Error al leer el checkpoint: {exc}") from exc
+
+    def save_checkpoint(self, checkpoint: SyncCheckpoint) -> bool:
+        try:
+            return self.writer.save_checkpoint(checkpoint)
+        except STORAGE_ERRORS as exc:
+            raise DynamoRepositoryError(f"Error al guardar el checkpoint: {exc}") from exc
+
+    def clear_checkpoint(self, run_id: str) -> None:
+        try:
+            self.writer.clear_checkpoint(run_id)
+        except STORAGE_ERRORS as exc:
+            raise DynamoRepositoryError(f"Error al borrar el checkpoint: {exc}") from exc
 
     def get_all_launches(self) -> list[dict[str, Any]]:
         """Obtiene todos los lanzamientos de la tabla."""
         try:
+            if self.store is not None:
+                return self.store.scan()
             response = self.table.scan()
             items = response.get("Items", [])
             # Paginación
             while "LastEvaluatedKey" in response:
                 response = self.table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
                 items.extend(response.get("Items", []))
-            return items
-        except (BotoCoreError, ClientError) as exc:
+            return [i for i in items if not str(i.get("launch_id", "")).startswith(META_PREFIX)]
+        except STORAGE_ERRORS as exc:
             raise DynamoRepositoryError(f"Error al escanear la tabla: {exc}") from exc
 
     def get_by_status(self, status: str) -> list[dict[str, Any]]:
-        """Obtiene lanzamientos filtrados por estado usando el GSI."""
+        """Obtiene lanzamientos filtrados por estado usando el GSI (o el índice SQLite)."""
         try:
+            if self.store is not None:
+                return self.store.query_status(status)
             response = self.table.query(
                 IndexName="status-index",
                 KeyConditionExpression=Key("status").eq(status),
             )
             return response.get("Items", [])
-        except (BotoCoreError, ClientError) as exc:
+        except STORAGE_ERRORS as exc:
             raise DynamoRepositoryError(f"Error al consultar por estado: {exc}") from exc
 
-    def _get_by_id(self, launch_id: str) -> dict[str, Any] | None:
-        response = self.table.get_item(Key={"launch_id": launch_id})
-        return response.get("Item")
-
-    def _put(self, item: dict[str, Any]) -> None:
-        self.table.put_item(Item=item)
-
-    def _update(self, item: dict[str, Any]) -> None:
-        self.table.put_item(Item=item)  # put_item hace upsert completo
-
     @staticmethod
     def _map_launch(launch: dict[str, Any]) -> dict[str, Any]:
         """Transforma el payload de la API SpaceX al esquema de DynamoDB."""
-        status = "upcoming"
-        if not launch.get("upcoming"):
-            success = launch.get("success")
-            status = "success" if success is True else "failed" if success is False else "unknown"
-
-        return {
-            "launch_id":        launch.get("id", ""),
-            "mission_name":     launch.get("name", ""),
-            "rocket_name":      launch.get("rocket", ""),   # ID resuelto en cliente si necesario
-            "launch_date":      launch.get("date_utc", ""),
-            "status":           status,
-            "launchpad":        launch.get("launchpad", ""),
-            "flight_number":    str(launch.get("flight_number", "")),
-            "details":          launch.get("details") or "",
-            "payloads":         launch.get("payloads", []),
-            "webcast_url":      launch.get("links", {}).get("webcast") or "",
-            "article_url":      launch.get("links", {}).get("article") or "",
-            "wikipedia_url":    launch.get("links", {}).get("wikipedia") or "",
-            "patch_small":      launch.get("links", {}).get("patch", {}).get("small") or "",
-            "patch_large":      launch.get("links", {}).get("patch", {}).get("large") or "",
-        }
+        return map_launch(launch)
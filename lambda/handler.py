@@ -1,63 +1,108 @@
 import json
 import logging
 import os
+import time
+from typing import Callable
+
+import boto3
 
 from spacex_client import SpaceXClient
 from dynamo_repository import DynamoRepository
+from sync_fanout import FANOUT_WORKERS, LambdaInvoker, LocalInvoker, merge_summaries, plan_shards, run_shards
+from sync_pipeline import CHANGELOG_MAX_IDS, PipelineConfig, SyncCheckpoint, SyncPipeline, resolve_status
+from sync_telemetry import SyncTelemetry, emit_emf
+from write_governor import WriteGovernor
 
 logger = logging.getLogger()
 logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 
+# Decodificación incremental de las respuestas de SpaceX (memoria pico constante)
+STREAMING = os.environ.get("SPACEX_STREAMING", "true").lower() != "false"
+
+# Presupuesto de tiempo: se deja de leer de SpaceX cuando quedan menos de
+# SYNC_TIME_RESERVE_MS, lo justo para escribir lo ya leído y guardar el checkpoint.
+# A partir de ahí tampoco se reintentan las escrituras con throttling: quedan
+# detrás del checkpoint para la siguiente invocación
+TIME_RESERVE_MS = int(os.environ.get("SYNC_TIME_RESERVE_MS", "15000"))
+SELF_INVOKE = os.environ.get("SYNC_SELF_INVOKE", "true").lower() != "false"
+MAX_INVOCATIONS = int(os.environ.get("SYNC_MAX_INVOCATIONS", "10"))
+# Un checkpoint más antiguo se descarta y la sync empieza de cero
+STATE_MAX_AGE_SECONDS = int(os.environ.get("SYNC_STATE_MAX_AGE_SECONDS", "3600"))
+# Sync "hot" (`{"mode": "hot"}`): solo próximos lanzamientos, pensada para un disparo frecuente
+HOT_MODE = "hot"
+
 
 def lambda_handler(event: dict, context) -> dict:
     """
     Punto de entrada de la Lambda.
     Soporta invocación automática (EventBridge) e invocación manual (API Gateway).
+
+    Si la sync no cabe en el tiempo restante guarda su progreso en `#sync-state`
+    y se reinvoca de forma asíncrona (`{"resume_run_id": ...}`); la siguiente
+    invocación, o el siguiente disparo, continúa desde ahí.
+
+    Con `SYNC_FANOUT_WORKERS` > 1 (o `{"fanout_workers": N}` en el evento) la
+    invocación actúa de coordinador: reparte el catálogo en N shards y los
+    sincroniza en paralelo, cada uno en su propia invocación (`{"shard": ...}`).
+
+    Con `{"mode": "hot"}` solo se sincronizan los próximos lanzamientos y los
+    que han dejado de serlo desde la ejecución anterior (ver `_sync_hot`).
     """
     logger.info("Iniciando recolección de datos de SpaceX")
     logger.info("Evento recibido: %s", json.dumps(event))
 
-    client = SpaceXClient()
-    repo = DynamoRepository(table_name=os.environ["DYNAMODB_TABLE"])
+    telemetry = SyncTelemetry()
+    client = SpaceXClient(telemetry=telemetry)
+    # Un worker recibe del coordinador su parte del presupuesto de WCU
+    governor = (WriteGovernor(wcu_budget=event["wcu_budget"]) if "wcu_budget" in event
+                else WriteGovernor.from_env())
+    repo = DynamoRepository(table_name=os.environ["DYNAMODB_TABLE"], governor=governor,
+                            deadline=_deadline(context, event.get("stop_at")))
 
     try:
-        # Obtener lanzamientos pasados y próximos
-        past_launches = client.get_past_launches()
-        upcoming_launches = client.get_upcoming_launches()
-        all_launches = past_launches + upcoming_launches
-
-        logger.info("Lanzamientos obtenidos: %d", len(all_launches))
-
-        # Upsert en DynamoDB
-        result = repo.upsert_launches(all_launches)
-
-        summary = {
-            "total_fetched": len(all_launches),
-            "inserted": result["inserted"],
-            "updated": result["updated"],
-            "errors": result["errors"],
-            "launches": [
-                {
-                    "launch_id": l.get("id"),
-                    "mission_name": l.get("name"),
-                    "launch_date": l.get("date_utc"),
-                    "status": _resolve_status(l),
-                }
-                for l in all_launches[:10]  # preview primeros 10
-            ],
-        }
+        if "shard" in event:
+            return _sync_shard(event, context, client, repo, governor, telemetry)
+        if event.get("mode") == HOT_MODE:
+            return _respond(event, _sync_hot(context, client, repo, governor, telemetry))
+        workers = int(event.get("fanout_workers") or FANOUT_WORKERS)
+        if workers > 1 and "resume_run_id" not in event:
+            return _respond(event, _fan_out(workers, context, client, repo, governor, telemetry))
 
-        logger.info("Resumen: %s", json.dumps(summary))
+        # fetch → map → diff → write solapados: pasados y próximos se descargan
+        # en paralelo y la escritura empieza antes de terminar la descarga
+        if STREAMING:
+            sources = [client.iter_past_launches, client.iter_upcoming_launches]
+        else:
+            sources = [client.get_past_launches, client.get_upcoming_launches]
+        checkpoint = _resume_point(repo, event)
+        if checkpoint is None:
+            return _respond(event, {"complete": True, "skipped": "checkpoint ya completado"})
 
-        # Si viene de API Gateway, devolver respuesta HTTP
-        if "requestContext" in event or "httpMethod" in event:
-            return {
-                "statusCode": 200,
-                "headers": {"Content-Type": "application/json"},
-                "body": json.dumps(summary),
-            }
+        pipeline = SyncPipeline(repo, PipelineConfig.from_env(), telemetry=telemetry)
+        result = pipeline.run(sources, checkpoint=checkpoint, should_stop=_deadline(context))
+        checkpoint.absorb(pipeline, result)
+        summary = {**checkpoint.counts, "launches": result["launches"],
+                   "complete": not pipeline.interrupted}
+
+        if pipeline.interrupted:
+            summary["checkpoint"] = {"run_id": checkpoint.run_id, "invocations": checkpoint.invocations,
+                                     "positions": checkpoint.positions}
+            _continue_later(repo, checkpoint, context)
+        else:
+            # Una sola generación por sync, con los cambios de todas sus invocaciones
+            summary["generation"] = repo.bump_generation(checkpoint.changed_ids, summary)
+            if checkpoint.invocations > 1:
+                repo.clear_checkpoint(checkpoint.run_id)
 
-        return summary
+        summary["telemetry"] = telemetry.snapshot(
+            consumed_wcu=governor.consumed_wcu, throttled=governor.throttle_count,
+        )
+        # Métricas de esta invocación (los conteos de `summary` son acumulados)
+        emit_emf(summary["telemetry"], result,
+                 getattr(context, "function_name", os.environ.get("AWS_LAMBDA_FUNCTION_NAME", "local")))
+
+        logger.info("Resumen: %s", json.dumps(summary))
+        return _respond(event, summary)
 
     except Exception as exc:
         logger.error("Error en la ejecución: %s", str(exc), exc_info=True)
@@ -68,15 +113,190 @@ def lambda_handler(event: dict, context) -> dict:
                 "body": json.dumps({"error": str(exc)}),
             }
         raise
+    finally:
+        telemetry.finish()
+
+
+def _respond(event: dict, summary: dict) -> dict:
+    # Si viene de API Gateway, devolver respuesta HTTP
+    if "requestContext" in event or "httpMethod" in event:
+        return {
+            "statusCode": 200,
+            "headers": {"Content-Type": "application/json"},
+            "body": json.dumps(summary),
+        }
+    return summary
+
+
+# ── Sync "hot" (solo próximos lanzamientos) ──────────────────────────────────
+
+def _sync_hot(context, client: SpaceXClient, repo: DynamoRepository,
+              governor: WriteGovernor, telemetry: SyncTelemetry) -> dict:
+    """
+    Sincroniza `/launches/upcoming` y los lanzamientos que salieron de ese
+    conjunto desde la ejecución anterior: los que la tabla aún tiene como
+    `upcoming` y la API ya no devuelve (se lanzaron, fallaron o se cancelaron),
+    que se piden en una sola consulta por ID. Los pasados no se releen.
+
+    Sin cambios no se publica generación, así que un disparo cada pocos
+    minutos no obliga a las réplicas a recargar.
+    """
+    upcoming = client.get_upcoming_launches()
+    stored = {item["launch_id"] for item in repo.get_by_status("upcoming")}
+    departed = sorted(stored - {launch.get("id") for launch in upcoming})
+    found: set[str] = set()
+
+    def departed_launches():
+        for launch in client.iter_query({"_id": {"$in": departed}}, {"pagination": False}):
+            found.add(launch.get("id"))
+            yield launch
+
+    sources = [lambda: upcoming]
+    if departed:
+        logger.info("Lanzamientos que dejaron de ser próximos: %s", departed)
+        sources.append(departed_launches)
+
+    pipeline = SyncPipeline(repo, PipelineConfig.from_env(), telemetry=telemetry)
+    result = pipeline.run(sources, should_stop=_deadline(context))
+    missing = sorted(set(departed) - found)
+    if missing and not pipeline.interrupted:
+        logger.warning("Lanzamientos próximos que ya no existen en la API: %s", missing)
+
+    summary = {**result, "mode": HOT_MODE, "departed": len(departed), "complete": not pipeline.interrupted}
+    if pipeline.changed_ids:
+        summary["generation"] = repo.bump_generation(pipeline.changed_ids, summary)
+    summary["telemetry"] = telemetry.snapshot(
+        consumed_wcu=governor.consumed_wcu, throttled=governor.throttle_count,
+    )
+    emit_emf(summary["telemetry"], result,
+             getattr(context, "function_name", os.environ.get("AWS_LAMBDA_FUNCTION_NAME", "local")))
+    logger.info("Resumen: %s", json.dumps({k: v for k, v in summary.items() if k != "launches"}))
+    return summary
+
+
+# ── Sync en paralelo (coordinador y workers) ─────────────────────────────────
+
+def _fan_out(workers: int, context, client: SpaceXClient, repo: DynamoRepository,
+             governor: WriteGovernor, telemetry: SyncTelemetry) -> dict:
+    """
+    Coordinador: planifica los shards, espera a los workers y publica una sola
+    generación con la unión de sus cambios. No usa checkpoint: un shard que no
+    termina (o falla) deja `complete: false` y lo completa la próxima sync.
+    """
+    shards = plan_shards(client, workers)
+    logger.info("Sync en paralelo: %d shards %s", len(shards), [s["query"] for s in shards])
+
+    extra: dict = {}
+    if governor.budget is not None:
+        # El presupuesto es de la tabla: se reparte entre los workers simultáneos
+        extra["wcu_budget"] = governor.budget / max(1, len(shards))
+    remaining = getattr(context, "get_remaining_time_in_millis", None)
+    if remaining is not None:
+        # Los workers dejan de leer a tiempo para que el coordinador publique la generación
+        extra["stop_at"] = int(time.time() * 1000) + remaining() - TIME_RESERVE_MS
+
+    results = run_shards(shards, _invoker(context), extra)
+    summary, changed_ids = merge_summaries(results, PipelineConfig.from_env().preview_size)
+    # Lo escrito se publica aunque algún shard haya fallado
+    summary["generation"] = repo.bump_generation(changed_ids, summary)
+
+    worker_telemetry = [r["telemetry"] for r in results if "telemetry" in r]
+    summary["telemetry"] = telemetry.snapshot(
+        consumed_wcu=sum(t["consumed_wcu"] for t in worker_telemetry),
+        throttled=sum(t["throttled"] for t in worker_telemetry),
+    )
+    logger.info("Resumen: %s", json.dumps(summary))
+    return summary
+
+
+def _sync_shard(event: dict, context, client: SpaceXClient, repo: DynamoRepository,
+                governor: WriteGovernor, telemetry: SyncTelemetry) -> dict:
+    """Worker: sincroniza un shard y retorna sus conteos y los IDs que cambió."""
+    shard = event["shard"]
+    pipeline = SyncPipeline(repo, PipelineConfig.from_env(), telemetry=telemetry)
+    result = pipeline.run([lambda: client.iter_query(shard["query"], shard.get("options"))],
+                          should_stop=_deadline(context, event.get("stop_at")))
+    result["complete"] = not pipeline.interrupted
+    result["changed_ids"] = pipeline.changed_ids if len(pipeline.changed_ids) <= CHANGELOG_MAX_IDS else None
+    result["telemetry"] = telemetry.snapshot(
+        consumed_wcu=governor.consumed_wcu, throttled=governor.throttle_count,
+    )
+    emit_emf(result["telemetry"], result,
+             getattr(context, "function_name", os.environ.get("AWS_LAMBDA_FUNCTION_NAME", "local")))
+    logger.info("Shard %d: %s", shard["index"],
+                json.dumps({k: v for k, v in result.items() if k not in ("launches", "changed_ids")}))
+    return result
+
+
+def _invoker(context):
+    """En Lambda cada shard es una invocación de esta función; fuera, un hilo del proceso."""
+    function = getattr(context, "invoked_function_arn", None)
+    if function:
+        timeout = context.get_remaining_time_in_millis() / 1000
+        return LambdaInvoker(function, timeout=timeout)
+    return LocalInvoker(lambda_handler)
+
+
+# ── Checkpoint y reanudación ─────────────────────────────────────────────────
+
+def _resume_point(repo: DynamoRepository, event: dict) -> SyncCheckpoint | None:
+    """
+    Checkpoint desde el que continuar: el guardado si hay una sync a medias,
+    uno nuevo si no. None si es una reinvocación de una sync que ya terminó.
+    """
+    state = repo.load_checkpoint()
+    if state is not None and time.time() - state.started_at / 1000 > STATE_MAX_AGE_SECONDS:
+        logger.warning("Checkpoint %s caducado: la sync empieza de cero", state.run_id)
+        repo.clear_checkpoint(state.run_id)
+        state = None
+
+    resume_run_id = event.get("resume_run_id")
+    if resume_run_id and (state is None or state.run_id != resume_run_id):
+        logger.info("La sync %s ya no tiene checkpoint: nada que reanudar", resume_run_id)
+        return None
+    if state is not None:
+        logger.info("Reanudando sync %s (invocación %d, posiciones %s)",
+                    state.run_id, state.invocations + 1, state.positions)
+        return state
+    return SyncCheckpoint()
+
+
+def _deadline(context, stop_at: int | None = None) -> Callable[[], bool] | None:
+    """
+    Condición de parada por tiempo: la del contexto de Lambda y, en un worker,
+    también la hora límite (epoch ms) que fija el coordinador.
+    """
+    remaining = getattr(context, "get_remaining_time_in_millis", None)
+    checks = []
+    if remaining is not None:
+        checks.append(lambda: remaining() < TIME_RESERVE_MS)
+    if stop_at is not None:
+        checks.append(lambda: time.time() * 1000 >= stop_at)
+    if not checks:
+        return None
+    return lambda: any(check() for check in checks)
+
+
+def _continue_later(repo: DynamoRepository, checkpoint: SyncCheckpoint, context) -> None:
+    """Guarda el progreso y, si procede, encadena una invocación asíncrona."""
+    if not repo.save_checkpoint(checkpoint):
+        logger.warning("Otra invocación ya avanzó la sync %s: no se reanuda desde aquí", checkpoint.run_id)
+        return
+    if checkpoint.invocations >= MAX_INVOCATIONS:
+        logger.error("Sync %s sin terminar tras %d invocaciones: continuará en el próximo disparo",
+                     checkpoint.run_id, checkpoint.invocations)
+        return
+    function = getattr(context, "invoked_function_arn", None)
+    if not SELF_INVOKE or not function:
+        return
+    boto3.client("lambda").invoke(
+        FunctionName=function,
+        InvocationType="Event",
+        Payload=json.dumps({"resume_run_id": checkpoint.run_id}),
+    )
+    logger.info("Sync %s continúa en una nueva invocación", checkpoint.run_id)
 
 
 def _resolve_status(launch: dict) -> str:
     """Determina el estado del lanzamiento basado en los datos de la API."""
-    if launch.get("upcoming"):
-        return "upcoming"
-    success = launch.get("success")
-    if success is True:
-        return "success"
-    if success is False:
-        return "failed"
-    return "unknown"
+    return resolve_status(launch)
@@ -1,12 +1,17 @@
 import logging
-from typing import Any
+import os
+from typing import Any, Iterator
 
 import requests
 
+from sync_pipeline import iter_json_array
+from sync_telemetry import SyncTelemetry
+
 logger = logging.getLogger(__name__)
 
-SPACEX_BASE_URL = "https://api.spacexdata.com/v4"
+SPACEX_BASE_URL = os.environ.get("SPACEX_BASE_URL", "https://api.spacexdata.com/v4")
 DEFAULT_TIMEOUT = 30
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 class SpaceXAPIError(Exception):
@@ -16,9 +21,11 @@ class SpaceXAPIError(Exception):
 class SpaceXClient:
     """Cliente HTTP para la API pública de SpaceX v4."""
 
-    def __init__(self, base_url: str = SPACEX_BASE_URL, timeout: int = DEFAULT_TIMEOUT):
+    def __init__(self, base_url: str = SPACEX_BASE_URL, timeout: int = DEFAULT_TIMEOUT,
+                 telemetry: SyncTelemetry | None = None):
         self.base_url = base_url
         self.timeout = timeout
+        self.telemetry = telemetry
         self.session = requests.Session()
         self.session.headers.update({"Content-Type": "application/json"})
 
@@ -37,16 +44,45 @@ class SpaceXClient:
         logger.info("Obteniendo todos los lanzamientos...")
         return self._get("/launches")
 
+    def iter_past_launches(self) -> Iterator[dict[str, Any]]:
+        """Como `get_past_launches`, pero decodifica la respuesta de forma incremental."""
+        logger.info("Obteniendo lanzamientos pasados (streaming)...")
+        return self._iter("/launches/past")
+
+    def iter_upcoming_launches(self) -> Iterator[dict[str, Any]]:
+        """Como `get_upcoming_launches`, pero decodifica la respuesta de forma incremental."""
+        logger.info("Obteniendo lanzamientos próximos (streaming)...")
+        return self._iter("/launches/upcoming")
+
     def get_launch_by_id(self, launch_id: str) -> dict[str, Any]:
         """Obtiene un lanzamiento específico por ID."""
         logger.info("Obteniendo lanzamiento ID: %s", launch_id)
         return self._get(f"/launches/{launch_id}")
 
+    def query_launches(self, query: dict[str, Any], options: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        `POST /launches/query` (filtro estilo MongoDB y paginación).
+        Retorna la página completa: `docs`, `totalDocs`, `page`, `totalPages`...
+        """
+        return self._post("/launches/query", {"query": query, "options": options or {}})
+
+    def iter_query(self, query: dict[str, Any], options: dict[str, Any] | None = None) -> Iterator[dict[str, Any]]:
+        """Lanzamientos de una consulta (p. ej. un shard de la sync en paralelo)."""
+        logger.info("Obteniendo lanzamientos de la consulta %s %s", query, options or {})
+        yield from self.query_launches(query, options)["docs"]
+
     def _get(self, path: str) -> Any:
         """Realiza una petición GET y maneja errores."""
+        return self._request("GET", path)
+
+    def _post(self, path: str, body: dict[str, Any]) -> Any:
+        """Realiza una petición POST con cuerpo JSON y maneja errores."""
+        return self._request("POST", path, json=body)
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> Any:
         url = f"{self.base_url}{path}"
         try:
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.Timeout as exc:
@@ -59,3 +95,26 @@ class SpaceXClient:
             ) from exc
         except requests.exceptions.JSONDecodeError as exc:
             raise SpaceXAPIError(f"Respuesta no es JSON válido desde {url}") from exc
+
+    def _iter(self, path: str) -> Iterator[dict[str, Any]]:
+        """
+        GET en modo streaming: produce los elementos del array JSON a medida que
+        llegan, sin cargar el cuerpo completo ni la lista decodificada en memoria.
+        """
+        url = f"{self.base_url}{path}"
+        try:
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                yield from iter_json_array(
+                    response.iter_content(chunk_size=STREAM_CHUNK_SIZE), self.telemetry
+                )
+        except requests.exceptions.Timeout as exc:
+            raise SpaceXAPIError(f"Timeout al conectar con {url}") from exc
+        except requests.exceptions.ConnectionError as exc:
+            raise SpaceXAPIError(f"Error de conexión con {url}") from exc
+        except requests.exceptions.HTTPError as exc:
+            raise SpaceXAPIError(
+                f"HTTP {exc.response.status_code} al llamar {url}: {exc.response.text}"
+            ) from exc
+        except (requests.exceptions.ChunkedEncodingError, ValueError) as exc:
+            raise SpaceXAPIError(f"Respuesta no es JSON válido desde {url}") from exc
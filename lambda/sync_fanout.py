@@ -0,0 +1,197 @@
+"""
+Sync en paralelo (fan-out): un coordinador reparte el catálogo de SpaceX en
+shards, lanza una invocación worker por shard y combina sus resúmenes.
+
+- `plan_shards()`: rangos de `flight_number` de tamaño parecido (`range`, por
+  defecto) o rangos de años por `date_utc` (`year`). Cada shard es una
+  consulta para `POST /launches/query`.
+- `LambdaInvoker`: invoca la propia función (`RequestResponse`) con
+  `{"shard": ...}`; `LocalInvoker` hace lo mismo en proceso (tests, benchmarks
+  y ejecución fuera de Lambda).
+- `run_shards()` / `merge_summaries()`: ejecutan los workers a la vez y
+  construyen un resumen con la misma forma que el de una sync secuencial.
+
+El coordinador publica una sola generación con los cambios de todos los
+workers; los workers solo escriben.
+"""
+import json
+import logging
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import boto3
+from botocore.config import Config
+
+from sync_pipeline import CHANGELOG_MAX_IDS, SUMMARY_COUNTS
+
+logger = logging.getLogger(__name__)
+
+# 0 o 1 = sync secuencial en una sola invocación
+FANOUT_WORKERS = int(os.environ.get("SYNC_FANOUT_WORKERS", "0"))
+SHARD_BY = os.environ.get("SYNC_SHARD_BY", "range")
+SHARD_STRATEGIES = ("range", "year")
+# Primer año con lanzamientos (Falcon 1, 2006)
+FIRST_YEAR = 2006
+
+Invoke = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+class FanoutError(Exception):
+    """Un worker de la sync en paralelo terminó con error."""
+
+
+# ── Planificación ─────────────────────────────────────────────────────────────
+
+def plan_shards(client, workers: int, by: str = SHARD_BY) -> list[dict[str, Any]]:
+    """
+    Divide el catálogo en hasta `workers` shards disjuntos que juntos lo cubren.
+    El primero y el último están abiertos por abajo y por arriba: un
+    lanzamiento publicado mientras tanto cae siempre en algún shard.
+    """
+    if by not in SHARD_STRATEGIES:
+        raise ValueError(f"SYNC_SHARD_BY desconocido: {by!r} (opciones: {', '.join(SHARD_STRATEGIES)})")
+    if by == "year":
+        bounds = _year_bounds(workers, datetime.now(timezone.utc).year)
+        attr = "date_utc"
+    else:
+        bounds = _flight_bounds(client, workers)
+        attr = "flight_number"
+    return [
+        {"index": index, "query": _range_query(attr, low, high), "options": {"pagination": False}}
+        for index, (low, high) in enumerate(bounds)
+    ]
+
+
+def _flight_bounds(client, workers: int) -> list[tuple[Any, Any]]:
+    """Rangos de `flight_number` con el mismo número de vuelos (son correlativos)."""
+    page = client.query_launches({}, {"sort": {"flight_number": "desc"}, "limit": 1,
+                                      "select": {"flight_number": 1}})
+    if not page["docs"]:
+        return [(None, None)]
+    highest = int(page["docs"][0]["flight_number"])
+    step = max(1, math.ceil(highest / max(1, workers)))
+    cuts = list(range(1 + step, highest + 1, step))
+    return list(zip([None, *cuts], [*cuts, None]))
+
+
+def _year_bounds(workers: int, current_year: int) -> list[tuple[Any, Any]]:
+    """
+    Grupos de años consecutivos (desde FIRST_YEAR hasta el año que viene).
+    Más simple de leer en los logs, pero desequilibrado: los primeros años
+    tienen muy pocos lanzamientos.
+    """
+    years = list(range(FIRST_YEAR, current_year + 2))
+    size = max(1, math.ceil(len(years) / max(1, workers)))
+    cuts = [f"{year}-01-01T00:00:00.000Z" for year in years[size::size]]
+    return list(zip([None, *cuts], [*cuts, None]))
+
+
+def _range_query(attr: str, low: Any, high: Any) -> dict[str, Any]:
+    condition = {}
+    if low is not None:
+        condition["$gte"] = low
+    if high is not None:
+        condition["$lt"] = high
+    return {attr: condition} if condition else {}
+
+
+# ── Invocación de los workers ─────────────────────────────────────────────────
+
+class LocalInvoker:
+    """Ejecuta el handler del worker en el propio proceso (un hilo por shard)."""
+
+    def __init__(self, handler: Callable[[dict[str, Any], Any], dict[str, Any]]):
+        self.handler = handler
+
+    def __call__(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return self.handler(payload, None)
+
+
+class LambdaInvoker:
+    """Invoca `function_name` de forma síncrona y retorna su resumen."""
+
+    def __init__(self, function_name: str, timeout: float = 900, client=None):
+        self.function_name = function_name
+        # Sin reintentos: un worker repetido reescribiría su shard a ciegas;
+        # si falla, el coordinador lo reporta y la próxima sync lo completa
+        self.client = client or boto3.client("lambda", config=Config(
+            read_timeout=timeout, connect_timeout=10, retries={"max_attempts": 0},
+        ))
+
+    def __call__(self, payload: dict[str, Any]) -> dict[str, Any]:
+        response = self.client.invoke(
+            FunctionName=self.function_name,
+            InvocationType="RequestResponse",
+            Payload=json.dumps(payload).encode(),
+        )
+        body = json.loads(response["Payload"].read() or b"null")
+        if response.get("FunctionError"):
+            message = body.get("errorMessage") if isinstance(body, dict) else body
+            raise FanoutError(f"{response['FunctionError']}: {message}")
+        return body
+
+
+def run_shards(shards: list[dict[str, Any]], invoke: Invoke,
+               extra: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+    """
+    Lanza un worker por shard a la vez y retorna sus resúmenes en el orden de
+    los shards. Un worker que falla no cancela al resto: su resultado lleva
+    `error` en lugar de conteos.
+    """
+    def call(shard: dict[str, Any]) -> dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            result = dict(invoke({"shard": shard, **(extra or {})}))
+        except Exception as exc:  # noqa: BLE001 - se reporta en el resumen del shard
+            logger.error("Shard %d falló: %s", shard["index"], exc)
+            result = {"error": str(exc)}
+        result["shard"] = shard["index"]
+        result["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    if not shards:
+        return []
+    with ThreadPoolExecutor(max_workers=len(shards), thread_name_prefix="sync-shard") as pool:
+        return list(pool.map(call, shards))
+
+
+# ── Resumen combinado ─────────────────────────────────────────────────────────
+
+def merge_summaries(results: list[dict[str, Any]],
+                    preview_size: int = 10) -> tuple[dict[str, Any], list[str] | None]:
+    """
+    Suma los conteos de los workers y une sus IDs cambiados.
+    Retorna (resumen, changed_ids); changed_ids es None si algún worker no
+    pudo informarlos (falló o superó CHANGELOG_MAX_IDS) o si en total lo
+    superan: la generación será entonces `full_reload`.
+    """
+    summary: dict[str, Any] = dict.fromkeys(SUMMARY_COUNTS, 0)
+    launches: list[dict[str, Any]] = []
+    changed: set[str] | None = set()
+    shards = []
+    for result in results:
+        shard = {"shard": result["shard"], "duration_ms": result.get("duration_ms")}
+        if "error" in result:
+            shard["error"] = result["error"]
+            changed = None
+        else:
+            for key in SUMMARY_COUNTS:
+                summary[key] += int(result.get(key, 0))
+                shard[key] = int(result.get(key, 0))
+            shard["complete"] = bool(result.get("complete", True))
+            launches.extend(result.get("launches") or [])
+            if changed is not None and result.get("changed_ids") is not None:
+                changed.update(result["changed_ids"])
+            else:
+                changed = None
+        shards.append(shard)
+
+    summary["launches"] = launches[:preview_size]
+    summary["complete"] = all("error" not in s and s["complete"] for s in shards)
+    summary["shards"] = shards
+    changed_ids = sorted(changed) if changed is not None and len(changed) <= CHANGELOG_MAX_IDS else None
+    return summary, changed_ids
@@ -0,0 +1,820 @@
+"""
+Motor ETL compartido por la Lambda y por el modo local del backend.
+
+    fetch ──► map ──► diff ──► write
+
+Cada etapa corre en su propio grupo de hilos y se comunica con la siguiente a
+través de una cola acotada: la escritura empieza mientras aún se descargan
+páginas y la memoria queda limitada por el tamaño de las colas. Con etapas
+solapadas el tiempo total tiende a max(etapa) en lugar de sum(etapas).
+
+Solo depende de la librería estándar y de `write_governor` / `sync_telemetry`
+(mismo directorio).
+"""
+import codecs
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Protocol
+
+from sync_telemetry import SyncTelemetry
+from write_governor import THROTTLING_ERRORS, WriteGovernor, estimate_wcu
+
+logger = logging.getLogger(__name__)
+
+SourceFn = Callable[[], Iterable[dict[str, Any]]]
+
+# Límites de la API de DynamoDB
+MAX_BATCH_WRITE = 25
+MAX_BATCH_GET = 100
+
+# Item de control con el número de generación de los datos: cada sync lo
+# incrementa y los lectores (réplicas en memoria del backend) lo comparan
+# con un GetItem en lugar de releer la tabla.
+GENERATION_KEY = "#sync-generation"
+
+# Historial de cambios: un item `#changes#<generación>` por sync con los IDs
+# insertados o actualizados. Se conservan las últimas CHANGELOG_RETENTION
+# generaciones; una sync con más de CHANGELOG_MAX_IDS cambios (o desconocidos)
+# se marca `full_reload` y obliga a los clientes a recargar todo.
+CHANGES_PREFIX = "#changes#"
+CHANGELOG_RETENTION = int(os.environ.get("SYNC_CHANGELOG_RETENTION", "50"))
+CHANGELOG_MAX_IDS = int(os.environ.get("SYNC_CHANGELOG_MAX_IDS", "1000"))
+SUMMARY_COUNTS = ("total_fetched", "inserted", "updated", "unchanged", "errors")
+
+# Progreso de una sync que no cabe en una invocación (ver `SyncCheckpoint`)
+SYNC_STATE_KEY = "#sync-state"
+
+# Vistas materializadas para las consultas más frecuentes del dashboard: los
+# VIEW_SIZE próximos lanzamientos y los VIEW_SIZE últimos completados, ya
+# ordenados, en un item `#view#<nombre>`. Los writers las actualizan al
+# publicar cada generación y el backend las sirve con un único GetItem.
+VIEW_PREFIX = "#view#"
+VIEW_SIZE = int(os.environ.get("SYNC_VIEW_SIZE", "25"))
+
+_DONE = object()
+
+
+# ─── Decodificación JSON incremental ─────────────────────────────────────────
+
+_JSON_WS = " \t\n\r"
+
+
+def iter_json_array(chunks: Iterable[bytes], telemetry: SyncTelemetry | None = None) -> Iterator[Any]:
+    """
+    Decodifica un array JSON de nivel superior a partir de trozos de bytes y
+    produce sus elementos uno a uno. Solo mantiene en memoria el trozo actual
+    y el elemento en curso, no el cuerpo completo ni la lista resultante.
+    Si se pasa `telemetry`, el tiempo de decodificación se acumula en "parse".
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    pos = 0
+    started = False
+    chunks = iter(chunks)
+    eof = False
+
+    while True:
+        while pos < len(buf) and buf[pos] in _JSON_WS:
+            pos += 1
+
+        if pos < len(buf):
+            char = buf[pos]
+            if not started:
+                if char != "[":
+                    raise ValueError(f"Se esperaba un array JSON y se encontró {char!r}")
+                started = True
+                pos += 1
+                continue
+            if char == "]":
+                return
+            if char == ",":
+                pos += 1
+                continue
+            started_at = time.perf_counter()
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                if telemetry is not None:
+                    telemetry.add("parse", time.perf_counter() - started_at)
+                # Un número al final del buffer puede continuar en el siguiente trozo
+                if end < len(buf) or eof or buf[pos] in "{[\"":
+                    yield value
+                    pos = end
+                    if pos > 65536:
+                        buf, pos = buf[pos:], 0
+                    continue
+        elif eof:
+            raise ValueError("Array JSON incompleto")
+
+        try:
+            buf += utf8.decode(next(chunks))
+        except StopIteration:
+            buf += utf8.decode(b"", final=True)
+            eof = True
+
+
+# ─── Mapeo SpaceX → DynamoDB ─────────────────────────────────────────────────
+
+def resolve_status(launch: dict[str, Any]) -> str:
+    """Determina el estado del lanzamiento basado en los datos de la API."""
+    if launch.get("upcoming"):
+        return "upcoming"
+    success = launch.get("success")
+    if success is True:
+        return "success"
+    if success is False:
+        return "failed"
+    return "unknown"
+
+
+def map_launch(launch: dict[str, Any]) -> dict[str, Any]:
+    """Transforma el payload de la API SpaceX al esquema de DynamoDB."""
+    links = launch.get("links") or {}
+    patch = links.get("patch") or {}
+    return {
+        "launch_id":        launch.get("id", ""),
+        "mission_name":     launch.get("name", ""),
+        "rocket_name":      launch.get("rocket", ""),   # ID resuelto en cliente si necesario
+        "launch_date":      launch.get("date_utc", ""),
+        "status":           resolve_status(launch),
+        "launchpad":        launch.get("launchpad", ""),
+        "flight_number":    str(launch.get("flight_number", "")),
+        "details":          launch.get("details") or "",
+        "payloads":         launch.get("payloads", []),
+        "webcast_url":      links.get("webcast") or "",
+        "article_url":      links.get("article") or "",
+        "wikipedia_url":    links.get("wikipedia") or "",
+        "patch_small":      patch.get("small") or "",
+        "patch_large":      patch.get("large") or "",
+    }
+
+
+def content_hash(item: dict[str, Any]) -> str:
+    """Huella del contenido mapeado: permite saltar los lanzamientos sin cambios."""
+    payload = {k: v for k, v in item.items() if k != "content_hash"}
+    return hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def changes_key(generation: int) -> str:
+    return f"{CHANGES_PREFIX}{generation}"
+
+
+# ─── Vistas materializadas (`#view#next`, `#view#latest`) ────────────────────
+
+@dataclass(frozen=True)
+class LaunchView:
+    """Lanzamientos de `statuses` ordenados por fecha, truncados a VIEW_SIZE."""
+
+    name:         str
+    statuses:     tuple[str, ...]
+    newest_first: bool
+
+    @property
+    def key(self) -> str:
+        return f"{VIEW_PREFIX}{self.name}"
+
+    def order(self, items: Iterable[dict[str, Any]], size: int) -> list[dict[str, Any]]:
+        """Los `size` primeros de `items` en el orden de la vista (desempate por ID)."""
+        pick = heapq.nlargest if self.newest_first else heapq.nsmallest
+        return pick(size, items, key=_view_order)
+
+    def merge(self, current: dict[str, Any] | None, changed_ids: list[str] | None,
+              changed: list[dict[str, Any]], size: int, generation: int) -> list[dict[str, Any]] | None:
+        """
+        Aplica a la vista publicada los lanzamientos cambiados en la sync que
+        publica `generation`. Retorna None si el resultado no es exacto y hay
+        que reconstruirla: sin vista previa, de otro tamaño o que no es la de
+        la generación anterior, con cambios desconocidos, o cuando un cambio
+        saca un lanzamiento de una vista llena (el hueco lo ocupa uno que no
+        está en ella) o lo manda más allá de su último elemento. Tampoco se
+        parte de una vista aproximada (`exact` False, ver `refresh_views`).
+        """
+        if current is None or changed_ids is None or int(current.get("size", 0)) != size:
+            return None
+        if not current.get("exact", True):
+            return None
+        if int(current.get("generation", 0)) != generation - 1:
+            return None
+        published = list(current.get("launches", []))
+        skip = set(changed_ids)
+        candidates = [i for i in published if i["launch_id"] not in skip]
+        candidates += [i for i in changed if i.get("status") in self.statuses]
+        merged = self.order(candidates, size)
+        if len(published) < size:
+            # La vista tenía todos los lanzamientos de sus estados
+            return merged
+        boundary = _view_order(published[-1])
+        if len(merged) < size or any(self._beyond(_view_order(i), boundary) for i in merged):
+            return None
+        return merged
+
+    def to_item(self, launches: list[dict[str, Any]], generation: int, size: int,
+                exact: bool = True) -> dict[str, Any]:
+        return {"launch_id": self.key, "generation": generation, "size": size, "exact": exact,
+                "updated_at": int(time.time() * 1000),
+                "launches": [{k: v for k, v in i.items() if k != "content_hash"} for i in launches]}
+
+    def _beyond(self, order: tuple[str, str], boundary: tuple[str, str]) -> bool:
+        return order < boundary if self.newest_first else order > boundary
+
+
+def _view_order(item: dict[str, Any]) -> tuple[str, str]:
+    return item.get("launch_date", ""), item.get("launch_id", "")
+
+
+LAUNCH_VIEWS = {
+    "next":   LaunchView("next", ("upcoming",), newest_first=False),
+    "latest": LaunchView("latest", ("success", "failed"), newest_first=True),
+}
+
+
+# ─── Configuración y contrato del writer ─────────────────────────────────────
+
+@dataclass
+class PipelineConfig:
+    """Concurrencia por etapa y tamaño de las colas entre etapas."""
+
+    queue_size:    int = 100
+    fetch_workers: int = 2
+    map_workers:   int = 1
+    diff_workers:  int = 1
+    write_workers: int = 2
+    batch_size:    int = MAX_BATCH_WRITE
+    preview_size:  int = 10
+
+    @classmethod
+    def from_env(cls) -> "PipelineConfig":
+        """Lee la configuración de variables `SYNC_*` (p. ej. `SYNC_WRITE_WORKERS`)."""
+        defaults = cls()
+        return cls(**{
+            name: int(os.environ.get(f"SYNC_{name.upper()}", getattr(defaults, name)))
+            for name in cls.__dataclass_fields__
+        })
+
+
+class LaunchWriter(Protocol):
+    """Destino de la etapa de escritura."""
+
+    def existing_ids(self, launch_ids: list[str]) -> set[str] | dict[str, str | None]:
+        """
+        Retorna el subconjunto de IDs que ya existen en el almacenamiento.
+        Si retorna un dict {id: content_hash}, los items cuya huella coincide
+        no se reescriben (cuentan como `unchanged`).
+        """
+
+    def write_batch(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Escribe un lote y retorna los items que no pudieron escribirse."""
+
+
+@dataclass
+class SyncCheckpoint:
+    """
+    Progreso acumulado de una sync partida en varias invocaciones.
+
+    `positions` guarda, por índice de fuente, cuántos lanzamientos del
+    principio ya están escritos (o sin cambios); al reanudar se descartan sin
+    mapear ni escribir y se reintenta desde el primero que no se escribió. Las
+    fuentes de `finished` no se vuelven a leer. Los conteos y los IDs cambiados
+    se suman entre invocaciones para publicar una sola generación al final.
+    """
+
+    run_id:      str = field(default_factory=lambda: uuid.uuid4().hex)
+    positions:   dict[int, int] = field(default_factory=dict)
+    finished:    set[int] = field(default_factory=set)
+    counts:      dict[str, int] = field(default_factory=lambda: dict.fromkeys(SUMMARY_COUNTS, 0))
+    # None = más de CHANGELOG_MAX_IDS cambios → la generación será full_reload
+    changed_ids: list[str] | None = field(default_factory=list)
+    invocations: int = 0
+    started_at:  int = field(default_factory=lambda: int(time.time() * 1000))
+
+    def absorb(self, pipeline: "SyncPipeline", summary: dict[str, Any]) -> None:
+        """Incorpora el resultado de una invocación."""
+        self.invocations += 1
+        self.positions.update(pipeline.positions)
+        self.finished |= pipeline.finished
+        for key in SUMMARY_COUNTS:
+            self.counts[key] += int(summary.get(key, 0))
+        if self.changed_ids is not None:
+            ids = set(self.changed_ids) | set(pipeline.changed_ids)
+            self.changed_ids = sorted(ids) if len(ids) <= CHANGELOG_MAX_IDS else None
+
+    def to_item(self) -> dict[str, Any]:
+        item: dict[str, Any] = {
+            "launch_id":   SYNC_STATE_KEY,
+            "run_id":      self.run_id,
+            "positions":   {str(k): v for k, v in self.positions.items()},
+            "finished":    sorted(self.finished),
+            "counts":      dict(self.counts),
+            "invocations": self.invocations,
+            "started_at":  self.started_at,
+            "updated_at":  int(time.time() * 1000),
+        }
+        if self.changed_ids is None:
+            item["full_reload"] = True
+        else:
+            item["changed_ids"] = list(self.changed_ids)
+        return item
+
+    @classmethod
+    def from_item(cls, item: dict[str, Any]) -> "SyncCheckpoint":
+        return cls(
+            run_id=item["run_id"],
+            positions={int(k): int(v) for k, v in (item.get("positions") or {}).items()},
+            finished={int(i) for i in item.get("finished") or []},
+            counts={k: int((item.get("counts") or {}).get(k, 0)) for k in SUMMARY_COUNTS},
+            changed_ids=None if item.get("full_reload") else list(item.get("changed_ids") or []),
+            invocations=int(item.get("invocations", 0)),
+            started_at=int(item.get("started_at", 0)),
+        )
+
+
+class WriteThrottledError(Exception):
+    """Un lote siguió con throttling tras `max_attempts` intentos."""
+
+
+class DynamoBatchWriter:
+    """
+    `LaunchWriter` sobre una tabla DynamoDB usando BatchGetItem/BatchWriteItem.
+
+    Las escrituras pasan por un `WriteGovernor`: respetan el presupuesto de WCU,
+    se concilian con `ConsumedCapacity` y, ante throttling (excepción o
+    `UnprocessedItems`), se reencolan con backoff exponencial hasta escribirse.
+    Con `max_attempts` el lote que lo agota lanza `WriteThrottledError` en
+    lugar de descartarse: la sync falla sin avanzar su checkpoint. Cuando
+    `deadline()` retorna True (p. ej. se acaba el tiempo de la Lambda) se
+    dejan de reintentar y se retornan como no escritos: el checkpoint queda
+    detrás de ellos y la siguiente invocación los reintenta.
+    """
+
+    def __init__(self, dynamodb, table_name: str, governor: WriteGovernor | None = None,
+                 max_attempts: int | None = None, deadline: Callable[[], bool] | None = None):
+        self.dynamodb = dynamodb
+        self.table_name = table_name
+        self.governor = governor or WriteGovernor.from_env()
+        self.max_attempts = max_attempts
+        self.deadline = deadline
+
+    def existing_ids(self, launch_ids: list[str]) -> dict[str, str | None]:
+        return {i["launch_id"]: i.get("content_hash")
+                for i in self._batch_get(launch_ids, "launch_id, content_hash")}
+
+    def _batch_get(self, keys: list[str], projection: str | None = None,
+                   consistent: bool = False) -> list[dict[str, Any]]:
+        found: list[dict[str, Any]] = []
+        for start in range(0, len(keys), MAX_BATCH_GET):
+            chunk: dict[str, Any] = {"Keys": [{"launch_id": k} for k in keys[start:start + MAX_BATCH_GET]]}
+            if projection:
+                chunk["ProjectionExpression"] = projection
+            if consistent:
+                chunk["ConsistentRead"] = True
+            request: dict[str, Any] | None = {self.table_name: chunk}
+            while request:
+                response = self.dynamodb.batch_get_item(RequestItems=request)
+                found.extend(response["Responses"].get(self.table_name, []))
+                request = response.get("UnprocessedKeys") or None
+        return found
+
+    def _query_status(self, status: str) -> Iterator[dict[str, Any]]:
+        from boto3.dynamodb.conditions import Key
+
+        table = self.dynamodb.Table(self.table_name)
+        kwargs: dict[str, Any] = {"IndexName": "status-index", "KeyConditionExpression": Key("status").eq(status)}
+        while True:
+            response = table.query(**kwargs)
+            yield from response.get("Items", [])
+            if "LastEvaluatedKey" not in response:
+                return
+            kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def write_batch(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        pending = [{"PutRequest": {"Item": item}} for item in items]
+        attempts = 0
+        while pending:
+            units = {id(req): estimate_wcu(req["PutRequest"]["Item"]) for req in pending}
+            reserved = self.governor.acquire(sum(units.values()))
+            try:
+                response = self.dynamodb.batch_write_item(
+                    RequestItems={self.table_name: pending},
+                    ReturnConsumedCapacity="TOTAL",
+                )
+            except Exception as exc:
+                self.governor.settle(reserved, 0, 0.0)
+                code = getattr(exc, "response", {}).get("Error", {}).get("Code")
+                if code not in THROTTLING_ERRORS:
+                    raise
+                unprocessed = pending
+            else:
+                unprocessed = response.get("UnprocessedItems", {}).get(self.table_name, [])
+                written = sum(units.values()) - sum(estimate_wcu(r["PutRequest"]["Item"]) for r in unprocessed)
+                consumed = [c.get("CapacityUnits", 0.0) for c in response.get("ConsumedCapacity", [])]
+                self.governor.settle(reserved, written, float(sum(consumed)) if consumed else None)
+
+            if not unprocessed:
+                self.governor.succeeded()
+                return []
+            attempts += 1
+            if self.max_attempts is not None and attempts >= self.max_attempts:
+                raise WriteThrottledError(
+                    f"{len(unprocessed)} items sin escribir tras {attempts} intentos con throttling"
+                )
+            if self.deadline is not None and self.deadline():
+                logger.warning("Sin tiempo para reintentar: %d items quedan para la siguiente invocación",
+                               len(unprocessed))
+                return [r["PutRequest"]["Item"] for r in unprocessed]
+            pending = unprocessed
+            self.governor.backoff()
+        return []
+
+    def bump_generation(self, changed_ids: list[str] | None = None,
+                        summary: dict[str, Any] | None = None) -> int:
+        """
+        Incrementa atómicamente `#sync-generation`, registra en `#changes#<gen>`
+        los IDs cambiados (None = desconocidos → full_reload) y los conteos de
+        la sync, y retorna la nueva generación.
+        """
+        table = self.dynamodb.Table(self.table_name)
+        now = int(time.time() * 1000)
+        response = table.update_item(
+            Key={"launch_id": GENERATION_KEY},
+            UpdateExpression="ADD generation :one SET updated_at = :now",
+            ExpressionAttributeValues={":one": 1, ":now": now},
+            ReturnValues="UPDATED_NEW",
+        )
+        generation = int(response["Attributes"]["generation"])
+
+        entry: dict[str, Any] = {"launch_id": changes_key(generation), "generation": generation, "created_at": now}
+        if changed_ids is None or len(changed_ids) > CHANGELOG_MAX_IDS:
+            entry["full_reload"] = True
+        else:
+            entry["ids"] = sorted(set(changed_ids))
+        if summary:
+            entry["summary"] = {k: int(summary.get(k, 0)) for k in SUMMARY_COUNTS}
+        try:
+            table.put_item(Item=entry)
+            if generation > CHANGELOG_RETENTION:
+                table.delete_item(Key={"launch_id": changes_key(generation - CHANGELOG_RETENTION)})
+        except Exception as exc:
+            # Sin historial los clientes solo pierden el delta: recargan todo
+            logger.warning("No se pudo registrar el historial de la generación %d: %s", generation, exc)
+        try:
+            self.refresh_views(changed_ids, generation)
+        except Exception as exc:
+            # El backend sigue sirviendo la vista anterior; como su generación ya no
+            # es la previa, la próxima sync la reconstruye en lugar de actualizarla
+            logger.warning("No se pudieron actualizar las vistas de la generación %d: %s", generation, exc)
+        return generation
+
+    def refresh_views(self, changed_ids: list[str] | None, generation: int) -> int:
+        """
+        Aplica los cambios de la sync a las vistas `#view#*`: un BatchGetItem
+        consistente trae las vistas publicadas y los lanzamientos cambiados,
+        tal como acaban de escribirse. Solo una vista que no admite la
+        actualización exacta (ver `LaunchView.merge`) se reconstruye
+        consultando el GSI por estado, que es eventualmente consistente: sus
+        resultados se corrigen con los cambiados leídos y, si no se conocen
+        los cambios, la vista queda marcada como aproximada y la próxima sync
+        la vuelve a reconstruir. Se reescriben siempre, para que su generación
+        indique sobre qué datos se calcularon, pero nunca encima de la de una
+        generación posterior. Retorna cuántas se reconstruyeron.
+        """
+        if changed_ids is not None and len(changed_ids) > CHANGELOG_MAX_IDS:
+            changed_ids = None
+        ids = sorted(set(changed_ids or ()))
+        views = list(LAUNCH_VIEWS.values())
+        found = {i["launch_id"]: i for i in self._batch_get([v.key for v in views] + ids, consistent=True)}
+        changed = [found[lid] for lid in ids if lid in found]
+
+        table = self.dynamodb.Table(self.table_name)
+        rebuilt = 0
+        for view in views:
+            launches = view.merge(found.get(view.key), changed_ids, changed, VIEW_SIZE, generation)
+            if launches is None:
+                # El GSI puede devolver aún el estado anterior de lo recién escrito
+                skip = set(ids)
+                indexed = (i for s in view.statuses for i in self._query_status(s) if i["launch_id"] not in skip)
+                fresh = (i for i in changed if i.get("status") in view.statuses)
+                launches = view.order(itertools.chain(indexed, fresh), VIEW_SIZE)
+                rebuilt += 1
+            try:
+                table.put_item(
+                    Item=view.to_item(launches, generation, VIEW_SIZE, exact=changed_ids is not None),
+                    ConditionExpression="attribute_not_exists(generation) OR generation < :g",
+                    ExpressionAttributeValues={":g": generation},
+                )
+            except Exception as exc:
+                if getattr(exc, "response", {}).get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                    raise
+                logger.info("La vista %s ya es de una generación posterior a %d", view.name, generation)
+        return rebuilt
+
+    # ── Checkpoint de syncs largas (`#sync-state`) ───────────────────────────
+
+    def load_checkpoint(self) -> SyncCheckpoint | None:
+        response = self.dynamodb.Table(self.table_name).get_item(
+            Key={"launch_id": SYNC_STATE_KEY}, ConsistentRead=True,
+        )
+        item = response.get("Item")
+        return SyncCheckpoint.from_item(item) if item else None
+
+    def save_checkpoint(self, checkpoint: SyncCheckpoint) -> bool:
+        """
+        Guarda el progreso. Condicional: no pisa el de otra sync ni uno más
+        avanzado de la misma (invocaciones duplicadas). Retorna False si perdió.
+        """
+        try:
+            self.dynamodb.Table(self.table_name).put_item(
+                Item=checkpoint.to_item(),
+                ConditionExpression="attribute_not_exists(launch_id) OR "
+                                    "(run_id = :run AND invocations < :inv)",
+                ExpressionAttributeValues={":run": checkpoint.run_id, ":inv": checkpoint.invocations},
+            )
+        except Exception as exc:
+            if getattr(exc, "response", {}).get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                raise
+            return False
+        return True
+
+    def clear_checkpoint(self, run_id: str) -> None:
+        try:
+            self.dynamodb.Table(self.table_name).delete_item(
+                Key={"launch_id": SYNC_STATE_KEY},
+                ConditionExpression="run_id = :run",
+                ExpressionAttributeValues={":run": run_id},
+            )
+        except Exception as exc:
+            if getattr(exc, "response", {}).get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                raise
+
+
+# ─── Motor ───────────────────────────────────────────────────────────────────
+
+class SyncPipeline:
+    """Ejecuta fetch → map → diff → write con etapas solapadas."""
+
+    def __init__(self, writer: LaunchWriter, config: PipelineConfig | None = None,
+                 telemetry: SyncTelemetry | None = None):
+        self.writer = writer
+        self.config = config or PipelineConfig()
+        self.telemetry = telemetry
+
+    def run(self, sources: list[SourceFn], checkpoint: SyncCheckpoint | None = None,
+            should_stop: Callable[[], bool] | None = None) -> dict[str, Any]:
+        """
+        Consume todas las fuentes y retorna un resumen con total_fetched,
+        inserted, updated, errors y un preview de los primeros lanzamientos.
+        Si una fuente falla se cancela el pipeline y se relanza su excepción.
+
+        Con `checkpoint` se salta lo ya procesado en invocaciones anteriores.
+        Cuando `should_stop()` retorna True se deja de leer de las fuentes y se
+        termina de escribir lo ya leído; `interrupted` queda en True y
+        `positions` / `finished` indican dónde reanudar: en el primer
+        lanzamiento de cada fuente que no llegó a escribirse. Sin interrupción,
+        los que fallan solo se cuentan en `errors`.
+        """
+        cfg = self.config
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._error: BaseException | None = None
+        self._should_stop = should_stop
+        self.positions: dict[int, int] = dict(checkpoint.positions) if checkpoint else {}
+        self.finished: set[int] = set(checkpoint.finished) if checkpoint else set()
+        # Posiciones leídas que aún no se escribieron (o que fallaron), por fuente
+        self._pending: dict[int, set[int]] = {}
+        self._counts = {"total_fetched": 0, "inserted": 0, "updated": 0, "unchanged": 0, "errors": 0}
+        # IDs insertados o actualizados (para el historial de la generación)
+        self.changed_ids: list[str] = []
+        self._preview: list[tuple[tuple[int, int], dict[str, Any]]] = []
+
+        raw_q:    queue.Queue = queue.Queue(maxsize=cfg.queue_size)
+        mapped_q: queue.Queue = queue.Queue(maxsize=cfg.queue_size)
+        write_q:  queue.Queue = queue.Queue(maxsize=max(1, cfg.queue_size // cfg.batch_size))
+
+        pending_sources: queue.SimpleQueue = queue.SimpleQueue()
+        for index, source in enumerate(sources):
+            if index not in self.finished:
+                pending_sources.put((index, source))
+
+        threads = (
+            self._spawn("fetch", cfg.fetch_workers, lambda: self._fetch(pending_sources, raw_q),
+                        raw_q, cfg.map_workers)
+            + self._spawn("map", cfg.map_workers, lambda: self._map(raw_q, mapped_q),
+                          mapped_q, cfg.diff_workers)
+            + self._spawn("diff", cfg.diff_workers, lambda: self._diff(mapped_q, write_q),
+                          write_q, cfg.write_workers)
+            + self._spawn("write", cfg.write_workers, lambda: self._write(write_q), None, 0)
+        )
+        for thread in threads:
+            thread.join()
+
+        if self._error is not None:
+            raise self._error
+        if len(self.finished) < len(sources) or self._stopping():
+            self._rewind()
+        self.interrupted = len(self.finished) < len(sources)
+
+        self._preview.sort(key=lambda entry: entry[0])
+        summary = dict(self._counts)
+        summary["launches"] = [p for _, p in self._preview[:cfg.preview_size]]
+        logger.info("Pipeline completado - Obtenidos: %d, Insertados: %d, Actualizados: %d, "
+                    "Sin cambios: %d, Errores: %d", summary["total_fetched"], summary["inserted"],
+                    summary["updated"], summary["unchanged"], summary["errors"])
+        return summary
+
+    # ── Infraestructura de etapas ─────────────────────────────────────────────
+
+    def _spawn(self, name: str, workers: int, target: Callable[[], None],
+               outbox: queue.Queue | None, downstream: int) -> list[threading.Thread]:
+        """Arranca `workers` hilos; el último en terminar cierra la cola de salida."""
+        remaining = [workers]
+
+        def run() -> None:
+            try:
+                target()
+            except BaseException as exc:  # noqa: BLE001 - se relanza al final de run()
+                self._fail(exc)
+            finally:
+                with self._lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last and outbox is not None:
+                    for _ in range(downstream):
+                        outbox.put(_DONE)
+
+        threads = [threading.Thread(target=run, name=f"sync-{name}-{i}", daemon=True)
+                   for i in range(workers)]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def _commit(self, seqs: Iterable[tuple[int, int]]) -> None:
+        """Marca como escritas (o sin cambios) las posiciones `(fuente, posición)`."""
+        with self._lock:
+            for index, position in seqs:
+                self._pending[index].discard(position)
+
+    def _rewind(self) -> None:
+        """Lleva cada fuente a su primera posición sin escribir, para reintentarla al reanudar."""
+        for index, pending in self._pending.items():
+            if pending:
+                self.positions[index] = min(pending)
+                self.finished.discard(index)
+
+    def _fail(self, exc: BaseException) -> None:
+        with self._lock:
+            if self._error is None:
+                self._error = exc
+        self._cancel.set()
+
+    def _timed(self, phase: str, started_at: float) -> None:
+        if self.telemetry is not None:
+            self.telemetry.add(phase, time.perf_counter() - started_at)
+
+    def _add(self, **deltas: int) -> None:
+        with self._lock:
+            for key, value in deltas.items():
+                self._counts[key] += value
+
+    # ── Etapas ────────────────────────────────────────────────────────────────
+
+    def _stopping(self) -> bool:
+        return self._should_stop is not None and self._should_stop()
+
+    def _fetch(self, sources: queue.SimpleQueue, outbox: queue.Queue) -> None:
+        while not self._cancel.is_set() and not self._stopping():
+            try:
+                index, source = sources.get_nowait()
+            except queue.Empty:
+                return
+            skip = self.positions.get(index, 0)
+            started_at = time.perf_counter()
+            launches = iter(source())
+            position = 0
+            while not self._cancel.is_set():
+                # Lo anterior a `skip` ya se escribió en una invocación previa
+                if position >= skip and self._stopping():
+                    break
+                try:
+                    launch = next(launches)
+                except StopIteration:
+                    with self._lock:
+                        self.finished.add(index)
+                    break
+                finally:
+                    self._timed("source", started_at)
+                if position >= skip:
+                    with self._lock:
+                        self._pending.setdefault(index, set()).add(position)
+                        self._counts["total_fetched"] += 1
+                    outbox.put(((index, position), launch))
+                position += 1
+                started_at = time.perf_counter()
+            with self._lock:
+                self.positions[index] = max(position, skip)
+
+    def _map(self, inbox: queue.Queue, outbox: queue.Queue) -> None:
+        preview_size = self.config.preview_size
+        while (entry := inbox.get()) is not _DONE:
+            if self._cancel.is_set():
+                continue
+            seq, launch = entry
+            started_at = time.perf_counter()
+            try:
+                item = map_launch(launch)
+                if not item["launch_id"]:
+                    raise ValueError("lanzamiento sin id")
+                item["content_hash"] = content_hash(item)
+            except Exception as exc:
+                logger.error("Error mapeando launch %s: %s", launch.get("id"), exc)
+                self._add(errors=1)
+                continue
+            finally:
+                self._timed("map", started_at)
+            if seq[1] < preview_size:
+                preview = {k: item[k] for k in ("launch_id", "mission_name", "launch_date", "status")}
+                with self._lock:
+                    self._preview.append((seq, preview))
+            outbox.put((seq, item))
+
+    def _diff(self, inbox: queue.Queue, outbox: queue.Queue) -> None:
+        batch: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+        def flush() -> None:
+            seqs = {item["launch_id"]: seq for seq, item in batch.values()}
+            items = [item for _, item in batch.values()]
+            batch.clear()
+            started_at = time.perf_counter()
+            try:
+                existing = self.writer.existing_ids([i["launch_id"] for i in items])
+            except Exception as exc:
+                logger.error("Error consultando IDs existentes: %s", exc)
+                self._add(errors=len(items))
+                return
+            finally:
+                self._timed("diff", started_at)
+            if isinstance(existing, dict):
+                changed = [i for i in items if existing.get(i["launch_id"], "") != i.get("content_hash")]
+                self._add(unchanged=len(items) - len(changed))
+                self._commit(seqs[lid] for lid in seqs.keys() - {i["launch_id"] for i in changed})
+                items = changed
+            if items:
+                outbox.put((items, existing, seqs))
+
+        while (entry := inbox.get()) is not _DONE:
+            if self._cancel.is_set():
+                continue
+            seq, item = entry
+            # BatchWriteItem no admite claves duplicadas en la misma petición
+            if item["launch_id"] in batch or len(batch) >= self.config.batch_size:
+                flush()
+            batch[item["launch_id"]] = (seq, item)
+        if batch and not self._cancel.is_set():
+            flush()
+
+    def _write(self, inbox: queue.Queue) -> None:
+        while (entry := inbox.get()) is not _DONE:
+            if self._cancel.is_set():
+                continue
+            items, existing, seqs = entry
+            started_at = time.perf_counter()
+            try:
+                failed = {i["launch_id"] for i in self.writer.write_batch(items)}
+            except WriteThrottledError as exc:
+                # No se cuentan como errores: la sync falla y no publica ni
+                # guarda un checkpoint que salte estos lanzamientos. El hilo
+                # sigue vaciando la cola para no bloquear a las etapas previas
+                self._fail(exc)
+                continue
+            except Exception as exc:
+                logger.error("Error escribiendo lote de %d lanzamientos: %s", len(items), exc)
+                failed = {i["launch_id"] for i in items}
+            finally:
+                self._timed("write", started_at)
+
+            inserted = updated = 0
+            written = []
+            for item in items:
+                launch_id = item["launch_id"]
+                if launch_id in failed:
+                    continue
+                written.append(launch_id)
+                if launch_id in existing:
+                    updated += 1
+                else:
+                    inserted += 1
+            self._add(inserted=inserted, updated=updated, errors=len(failed))
+            self._commit(seqs[lid] for lid in written)
+            with self._lock:
+                self.changed_ids.extend(written)
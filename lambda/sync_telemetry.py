@@ -0,0 +1,127 @@
+"""
+Telemetría de una sincronización: tiempo por fase, memoria pico y capacidad.
+
+La memoria residente pico (`container_peak_rss_mb`) es la del proceso desde
+que arrancó: en un contenedor de Lambda reutilizado puede venir de una
+invocación anterior. El pico propio de la invocación es `peak_traced_mb`
+(tracemalloc, con `SYNC_TRACEMALLOC=true`).
+
+Las fases se miden como tiempo acumulado de trabajo de cada etapa del
+pipeline (suma de todos sus hilos, sin contar esperas en colas):
+
+- fetch: espera de red al leer la respuesta de SpaceX
+- parse: decodificación JSON
+- map:   transformación al esquema de DynamoDB
+- diff:  consulta de IDs existentes (BatchGetItem)
+- write: escrituras BatchWriteItem (incluye esperas del WriteGovernor)
+
+`emit_emf()` publica los valores como CloudWatch Embedded Metric Format: una
+línea JSON en stdout que CloudWatch Logs convierte en métricas sin llamadas
+a PutMetricData.
+"""
+import json
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+EMF_NAMESPACE = "SpaceXLaunchSystem/Sync"
+PHASES = ("fetch", "parse", "map", "diff", "write")
+
+
+class SyncTelemetry:
+    """Acumula tiempos por fase (thread-safe) y memoria pico de una sync."""
+
+    def __init__(self, trace_memory: bool | None = None):
+        if trace_memory is None:
+            trace_memory = os.environ.get("SYNC_TRACEMALLOC", "false").lower() == "true"
+        self.trace_memory = trace_memory
+        self._lock = threading.Lock()
+        self._seconds: dict[str, float] = {}
+        self._started = time.perf_counter()
+        self._finished: float | None = None
+        self._traced_peak: int | None = None
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def add(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            self._seconds[phase] = self._seconds.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def finish(self) -> None:
+        """Cierra la medición (duración total y pico de tracemalloc)."""
+        if self._finished is not None:
+            return
+        self._finished = time.perf_counter()
+        if self.trace_memory and tracemalloc.is_tracing():
+            _, self._traced_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    def snapshot(self, consumed_wcu: float = 0.0, throttled: int = 0) -> dict[str, Any]:
+        """Resumen serializable que se adjunta al resultado de la sync."""
+        self.finish()
+        seconds = dict(self._seconds)
+        # La fase "source" mide el tiempo total dentro del iterador de SpaceX;
+        # lo que no es decodificación es espera de red.
+        source = seconds.pop("source", 0.0)
+        seconds["fetch"] = max(0.0, source - seconds.get("parse", 0.0))
+
+        # ru_maxrss es el pico de todo el proceso (no se reinicia entre invocaciones);
+        # está en KB en Linux (el runtime de Lambda) y en bytes en macOS
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        rss_mb = rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+        return {
+            "duration_ms":    round((self._finished - self._started) * 1000, 1),
+            "phases_ms":      {p: round(seconds.get(p, 0.0) * 1000, 1) for p in PHASES},
+            "container_peak_rss_mb": round(rss_mb, 1),
+            "peak_traced_mb":        (round(self._traced_peak / (1024 * 1024), 2)
+                                      if self._traced_peak is not None else None),
+            "consumed_wcu":          round(consumed_wcu, 2),
+            "throttled":             throttled,
+        }
+
+
+def emit_emf(snapshot: dict[str, Any], counts: dict[str, int], function_name: str) -> str:
+    """Escribe en stdout (y retorna) la línea EMF con la telemetría de la sync."""
+    values: dict[str, tuple[float, str]] = {
+        "SyncDuration":     (snapshot["duration_ms"], "Milliseconds"),
+        "ContainerPeakRSS": (snapshot["container_peak_rss_mb"], "Megabytes"),
+        "ConsumedWCU":      (snapshot["consumed_wcu"], "Count"),
+        "Throttled":        (snapshot["throttled"], "Count"),
+    }
+    for phase, ms in snapshot["phases_ms"].items():
+        values[f"{phase.capitalize()}Time"] = (ms, "Milliseconds")
+    for key in ("total_fetched", "inserted", "updated", "errors"):
+        values["".join(part.capitalize() for part in key.split("_"))] = (counts.get(key, 0), "Count")
+    if snapshot.get("peak_traced_mb") is not None:
+        values["PeakTraced"] = (snapshot["peak_traced_mb"], "Megabytes")
+
+    document = {
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [{
+                "Namespace":  EMF_NAMESPACE,
+                "Dimensions": [["FunctionName"]],
+                "Metrics":    [{"Name": name, "Unit": unit} for name, (_, unit) in values.items()],
+            }],
+        },
+        "FunctionName": function_name,
+        **{name: value for name, (value, _) in values.items()},
+    }
+    line = json.dumps(document)
+    # print y no logger: el formato del logger de Lambda antepone texto y EMF exige JSON puro
+    print(line, flush=True)
+    return line
@@ -6,6 +6,7 @@ import pytest
 from moto import mock_aws
 
 from dynamo_repository import DynamoRepository, DynamoRepositoryError
+from sync_pipeline import SyncCheckpoint
 
 TABLE_NAME = "spacex-launches-test"
 REGION = "us-east-1"
@@ -67,12 +68,21 @@ def test_upsert_updates_existing_launch(dynamodb_table, past_launch):
     """Debe actualizar un lanzamiento que ya existe."""
     repo = DynamoRepository(table_name=TABLE_NAME, region=REGION)
     repo.upsert_launches([past_launch])
-    # Segunda inserción del mismo ID → update
-    result = repo.upsert_launches([past_launch])
+    # Segunda inserción del mismo ID con contenido distinto → update
+    result = repo.upsert_launches([{**past_launch, "details": "Actualizado"}])
     assert result["updated"] == 1
     assert result["inserted"] == 0
 
 
+@mock_aws
+def test_upsert_skips_unchanged_launch(dynamodb_table, past_launch):
+    """Un lanzamiento idéntico al almacenado no se reescribe."""
+    repo = DynamoRepository(table_name=TABLE_NAME, region=REGION)
+    repo.upsert_launches([past_launch])
+    result = repo.upsert_launches([past_launch])
+    assert result == {"inserted": 0, "updated": 0, "unchanged": 1, "errors": 0}
+
+
 @mock_aws
 def test_upsert_maps_status_correctly(dynamodb_table, past_launch, upcoming_launch):
     """Debe mapear correctamente el estado de cada lanzamiento."""
@@ -100,3 +110,141 @@ def test_get_by_status_filters_correctly(dynamodb_table, sample_launches):
     repo.upsert_launches(sample_launches)
     upcoming = repo.get_by_status("upcoming")
     assert all(i["status"] == "upcoming" for i in upcoming)
+
+
+@mock_aws
+def test_bump_generation_increments_and_stays_out_of_scans(dynamodb_table, sample_launches):
+    """La generación es un contador atómico en un item de control."""
+    repo = DynamoRepository(table_name=TABLE_NAME, region=REGION)
+    repo.upsert_launches(sample_launches)
+    assert repo.bump_generation() == 1
+    assert repo.bump_generation() == 2
+    assert len(repo.get_all_launches()) == 2
+    assert repo.get_by_status("upcoming")[0]["launch_id"] != "#sync-generation"
+
+
+@mock_aws
+def test_bump_generation_records_changed_ids(dynamodb_table, monkeypatch):
+    """Cada generación deja su historial; las antiguas se podan y las grandes piden recarga."""
+    import sync_pipeline
+    monkeypatch.setattr(sync_pipeline, "CHANGELOG_RETENTION", 2)
+    monkeypatch.setattr(sync_pipeline, "CHANGELOG_MAX_IDS", 2)
+    repo = DynamoRepository(table_name=TABLE_NAME, region=REGION)
+
+    assert repo.bump_generation(["b", "a"]) == 1
+    assert repo.bump_generation(["a", "b", "c"]) == 2
+    assert repo.bump_generation(None) == 3
+
+    def entry(gen):
+        return repo.table.get_item(Key={"launch_id": f"#changes#{gen}"}).get("Item")
+
+    assert entry(1) is None                      # fuera de la retención
+    assert entry(2)["full_reload"] is True       # demasiados cambios
+    assert entry(3)["full_reload"] is True       # cambios desconocidos
+    assert repo.bump_generation(["z"]) == 4
+    assert entry(4)["ids"] == ["z"]
+    assert repo.get_all_launches() == []
+
+
+
+@mock_aws
+def test_bump_generation_publishes_launch_views(dynamodb_table, past_launch, upcoming_launch, monkeypatch):
+    """Las vistas #view#next / #view#latest se actualizan con los cambios de cada sync."""
+    import sync_pipeline
+    monkeypatch.setattr(sync_pipeline, "VIEW_SIZE", 2)
+    later = {**upcoming_launch, "id": "later", "date_utc": "2027-01-01T00:00:00.000Z"}
+    repo = DynamoRepository(table_name=TABLE_NAME, region=REGION)
+    repo.upsert_launches([past_launch, upcoming_launch, later])
+    repo.bump_generation([past_launch["id"], upcoming_launch["id"], "later"])
+
+    def view(name):
+        item = repo.table.get_item(Key={"launch_id": f"#view#{name}"})["Item"]
+        return [i["launch_id"] for i in item["launches"]], int(item["generation"])
+
+    assert view("next") == ([upcoming_launch["id"], "later"], 1)
+    assert view("latest") == ([past_launch["id"]], 1)
+
+    # El próximo despega: #view#latest se actualiza sin consultar; #view#next
+    # estaba llena y su hueco solo se cubre consultando el GSI
+    landed = {**upcoming_launch, "upcoming": False, "success": True}
+    repo.upsert_launches([landed])
+    queries = []
+    original = repo.writer._query_status
+    monkeypatch.setattr(repo.writer, "_query_status", lambda s: queries.append(s) or original(s))
+    repo.bump_generation([landed["id"]])
+    assert view("next") == (["later"], 2)
+    assert view("latest") == ([upcoming_launch["id"], past_launch["id"]], 2)
+    assert queries == ["upcoming"]
+
+    # Una vista que no es de la generación anterior no se actualiza: se reconstruye
+    repo.table.put_item(Item={**repo.table.get_item(Key={"launch_id": "#view#latest"})["Item"], "generation": 1})
+    queries.clear()
+    repo.bump_generation([])
+    assert queries == ["success", "failed"]
+    assert view("next") == (["later"], 3)
+    assert view("latest") == ([upcoming_launch["id"], past_launch["id"]], 3)
+    assert len(repo.get_all_launches()) == 3
+
+    # Sin los IDs cambiados la vista reconstruida es aproximada: la siguiente sync la rehace
+    repo.bump_generation(None)
+    queries.clear()
+    repo.bump_generation([])
+    assert queries == ["upcoming", "success", "failed"]
+
+
+@mock_aws
+def test_launch_views_ignore_stale_index_and_older_syncs(dynamodb_table, upcoming_launch, monkeypatch):
+    """Lo recién escrito manda sobre un GSI atrasado y una sync más antigua no pisa la vista."""
+    import sync_pipeline
+    monkeypatch.setattr(sync_pipeline, "VIEW_SIZE", 2)
+    later = {**upcoming_launch, "id": "later", "date_utc": "2027-01-01T00:00:00.000Z"}
+    latest = {**upcoming_launch, "id": "latest", "date_utc": "2028-01-01T00:00:00.000Z"}
+    repo = DynamoRepository(table_name=TABLE_NAME, region=REGION)
+    repo.upsert_launches([upcoming_launch, later, latest])
+    repo.bump_generation(None)
+    stale = repo.table.get_item(Key={"launch_id": upcoming_launch["id"]})["Item"]
+
+    # El GSI aún devuelve el lanzamiento como próximo tras escribirlo como completado
+    landed = {**upcoming_launch, "upcoming": False, "success": True}
+    repo.upsert_launches([landed])
+    original = repo.writer._query_status
+    monkeypatch.setattr(repo.writer, "_query_status",
+                        lambda s: iter(list(original(s)) + ([stale] if s == "upcoming" else [])))
+    generation = repo.bump_generation([landed["id"]])
+
+    def view(name):
+        item = repo.table.get_item(Key={"launch_id": f"#view#{name}"})["Item"]
+        return [i["launch_id"] for i in item["launches"]], int(item["generation"])
+
+    assert view("next") == (["later", "latest"], generation)
+    assert view("latest") == ([upcoming_launch["id"]], generation)
+
+    # Una sync anterior que termina tarde no sobrescribe las vistas
+    repo.writer.refresh_views(None, generation - 1)
+    assert view("next") == (["later", "latest"], generation)
+    assert view("latest") == ([upcoming_launch["id"]], generation)
+
+
+@mock_aws
+def test_checkpoint_roundtrip_and_guards(dynamodb_table):
+    """El checkpoint se guarda en `#sync-state` y no pisa el de otra sync ni uno más avanzado."""
+    repo = DynamoRepository(table_name=TABLE_NAME, region=REGION)
+    assert repo.load_checkpoint() is None
+
+    checkpoint = SyncCheckpoint(positions={0: 120}, finished={1}, changed_ids=["a", "b"], invocations=1)
+    checkpoint.counts["inserted"] = 2
+    assert repo.save_checkpoint(checkpoint) is True
+    loaded = repo.load_checkpoint()
+    assert (loaded.run_id, loaded.positions, loaded.finished) == (checkpoint.run_id, {0: 120}, {1})
+    assert loaded.changed_ids == ["a", "b"] and loaded.counts["inserted"] == 2
+
+    assert repo.save_checkpoint(SyncCheckpoint(invocations=1)) is False      # otra sync
+    assert repo.save_checkpoint(checkpoint) is False                          # misma invocación
+    checkpoint.invocations = 2
+    assert repo.save_checkpoint(checkpoint) is True
+
+    repo.clear_checkpoint("otra")
+    assert repo.load_checkpoint() is not None
+    repo.clear_checkpoint(checkpoint.run_id)
+    assert repo.load_checkpoint() is None
+    assert repo.get_all_launches() == []
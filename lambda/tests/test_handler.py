@@ -9,6 +9,7 @@ os.environ["DYNAMODB_TABLE"] = "spacex-launches-test"
 os.environ["LOG_LEVEL"] = "ERROR"
 
 from handler import lambda_handler, _resolve_status
+from sync_pipeline import SyncCheckpoint, content_hash, map_launch
 
 
 # ─── Tests de _resolve_status ────────────────────────────────────────────────
@@ -36,12 +37,15 @@ def test_resolve_status_unknown():
 def test_handler_returns_summary(mock_client_cls, mock_repo_cls, sample_launches):
     """El handler debe retornar un resumen con conteos correctos."""
     mock_client = MagicMock()
-    mock_client.get_past_launches.return_value = [sample_launches[0]]
-    mock_client.get_upcoming_launches.return_value = [sample_launches[1]]
+    mock_client.iter_past_launches.return_value = [sample_launches[0]]
+    mock_client.iter_upcoming_launches.return_value = [sample_launches[1]]
     mock_client_cls.return_value = mock_client
 
     mock_repo = MagicMock()
-    mock_repo.upsert_launches.return_value = {"inserted": 2, "updated": 0, "errors": 0}
+    mock_repo.load_checkpoint.return_value = None
+    mock_repo.existing_ids.return_value = set()
+    mock_repo.write_batch.return_value = []
+    mock_repo.bump_generation.return_value = 7
     mock_repo_cls.return_value = mock_repo
 
     result = lambda_handler({}, None)
@@ -49,6 +53,11 @@ def test_handler_returns_summary(mock_client_cls, mock_repo_cls, sample_launches
     assert result["total_fetched"] == 2
     assert result["inserted"] == 2
     assert result["errors"] == 0
+    assert result["generation"] == 7
+    mock_repo.bump_generation.assert_called_once()
+    assert set(result["telemetry"]["phases_ms"]) == {"fetch", "parse", "map", "diff", "write"}
+    assert "container_peak_rss_mb" in result["telemetry"]
+    assert "consumed_wcu" in result["telemetry"]
 
 
 @patch("handler.DynamoRepository")
@@ -57,12 +66,15 @@ def test_handler_returns_http_response_for_api_gateway(mock_client_cls, mock_rep
                                                         sample_launches):
     """Si viene de API Gateway debe retornar statusCode 200."""
     mock_client = MagicMock()
-    mock_client.get_past_launches.return_value = []
-    mock_client.get_upcoming_launches.return_value = []
+    mock_client.iter_past_launches.return_value = []
+    mock_client.iter_upcoming_launches.return_value = []
     mock_client_cls.return_value = mock_client
 
     mock_repo = MagicMock()
-    mock_repo.upsert_launches.return_value = {"inserted": 0, "updated": 0, "errors": 0}
+    mock_repo.load_checkpoint.return_value = None
+    mock_repo.existing_ids.return_value = set()
+    mock_repo.write_batch.return_value = []
+    mock_repo.bump_generation.return_value = 7
     mock_repo_cls.return_value = mock_repo
 
     event = {"requestContext": {"http": {"method": "POST"}}}
@@ -78,7 +90,7 @@ def test_handler_returns_http_response_for_api_gateway(mock_client_cls, mock_rep
 def test_handler_returns_500_on_error(mock_client_cls, mock_repo_cls):
     """Si ocurre un error debe retornar statusCode 500 cuando viene de API Gateway."""
     mock_client = MagicMock()
-    mock_client.get_past_launches.side_effect = Exception("API down")
+    mock_client.iter_past_launches.side_effect = Exception("API down")
     mock_client_cls.return_value = mock_client
 
     event = {"requestContext": {}}
@@ -87,3 +99,148 @@ def test_handler_returns_500_on_error(mock_client_cls, mock_repo_cls):
     assert result["statusCode"] == 500
     body = json.loads(result["body"])
     assert "error" in body
+
+
+# ─── Tests del checkpoint (syncs que no caben en una invocación) ─────────────
+
+class FakeContext:
+    """Contexto de Lambda cuyo tiempo restante baja con cada consulta."""
+
+    invoked_function_arn = "arn:aws:lambda:us-east-1:123:function:spacex"
+    function_name = "spacex"
+
+    def __init__(self, budget_ms):
+        self.remaining = budget_ms
+
+    def get_remaining_time_in_millis(self):
+        self.remaining -= 1000
+        return self.remaining
+
+
+def _launches(n):
+    return [{"id": f"L{i}", "name": f"M{i}", "upcoming": False, "success": True} for i in range(n)]
+
+
+def _repo():
+    repo = MagicMock()
+    repo.load_checkpoint.return_value = None
+    repo.existing_ids.return_value = set()
+    repo.write_batch.return_value = []
+    repo.save_checkpoint.return_value = True
+    repo.bump_generation.return_value = 3
+    return repo
+
+
+@patch("handler.boto3")
+@patch("handler.DynamoRepository")
+@patch("handler.SpaceXClient")
+def test_handler_checkpoints_and_reinvokes_before_deadline(mock_client_cls, mock_repo_cls, mock_boto3):
+    """Sin tiempo suficiente guarda el progreso y se reinvoca en vez de agotar el timeout."""
+    mock_client = MagicMock()
+    mock_client.iter_past_launches.side_effect = lambda: iter(_launches(40))
+    mock_client.iter_upcoming_launches.side_effect = lambda: iter([])
+    mock_client_cls.return_value = mock_client
+    repo = _repo()
+    mock_repo_cls.return_value = repo
+
+    result = lambda_handler({}, FakeContext(budget_ms=15000 + 10 * 1000))
+
+    assert result["complete"] is False
+    assert 0 < result["total_fetched"] < 40
+    repo.bump_generation.assert_not_called()
+    saved = repo.save_checkpoint.call_args[0][0]
+    assert saved.positions[0] == result["total_fetched"] and 0 not in saved.finished
+    payload = json.loads(mock_boto3.client.return_value.invoke.call_args.kwargs["Payload"])
+    assert payload == {"resume_run_id": saved.run_id}
+
+
+@patch("handler.boto3")
+@patch("handler.DynamoRepository")
+@patch("handler.SpaceXClient")
+def test_handler_resumes_from_checkpoint(mock_client_cls, mock_repo_cls, mock_boto3):
+    """La reanudación salta lo ya escrito y publica una sola generación con todos los cambios."""
+    mock_client = MagicMock()
+    mock_client.iter_past_launches.side_effect = lambda: iter(_launches(40))
+    mock_client.iter_upcoming_launches.side_effect = lambda: iter(_launches(0))
+    mock_client_cls.return_value = mock_client
+    repo = _repo()
+    state = SyncCheckpoint(positions={0: 25}, changed_ids=[f"L{i}" for i in range(25)], invocations=1)
+    state.counts.update(total_fetched=25, inserted=25)
+    repo.load_checkpoint.return_value = state
+    mock_repo_cls.return_value = repo
+
+    result = lambda_handler({"resume_run_id": state.run_id}, FakeContext(budget_ms=900_000))
+
+    assert result["complete"] is True
+    assert result["total_fetched"] == 40 and result["inserted"] == 40
+    written = [i["launch_id"] for call in repo.write_batch.call_args_list for i in call[0][0]]
+    assert sorted(written) == sorted(f"L{i}" for i in range(25, 40))
+    changed_ids, _ = repo.bump_generation.call_args[0]
+    assert len(changed_ids) == 40
+    repo.clear_checkpoint.assert_called_once_with(state.run_id)
+    mock_boto3.client.assert_not_called()
+
+
+@patch("handler.DynamoRepository")
+@patch("handler.SpaceXClient")
+def test_handler_ignores_reinvocation_of_finished_sync(mock_client_cls, mock_repo_cls):
+    """Una reinvocación cuyo checkpoint ya no existe no arranca una sync nueva."""
+    repo = _repo()
+    mock_repo_cls.return_value = repo
+
+    result = lambda_handler({"resume_run_id": "antiguo"}, None)
+
+    assert result["complete"] is True and "skipped" in result
+    mock_client_cls.return_value.iter_past_launches.assert_not_called()
+
+
+# ─── Tests de la sync "hot" (solo próximos) ──────────────────────────────────
+
+@patch("handler.DynamoRepository")
+@patch("handler.SpaceXClient")
+def test_hot_sync_fetches_upcoming_and_departed_only(mock_client_cls, mock_repo_cls, upcoming_launch,
+                                                     past_launch):
+    """Solo se piden los próximos y, por ID, los que dejaron de serlo; no los pasados."""
+    client = MagicMock()
+    client.get_upcoming_launches.return_value = [upcoming_launch]
+    client.iter_query.return_value = iter([past_launch])
+    mock_client_cls.return_value = client
+    repo = _repo()
+    repo.get_by_status.return_value = [{"launch_id": upcoming_launch["id"]}, {"launch_id": past_launch["id"]}]
+    mock_repo_cls.return_value = repo
+
+    result = lambda_handler({"mode": "hot"}, None)
+
+    assert result["mode"] == "hot" and result["complete"] is True
+    assert result["departed"] == 1 and result["total_fetched"] == 2 and result["generation"] == 3
+    repo.get_by_status.assert_called_once_with("upcoming")
+    client.iter_query.assert_called_once_with({"_id": {"$in": [past_launch["id"]]}}, {"pagination": False})
+    client.iter_past_launches.assert_not_called()
+    client.get_past_launches.assert_not_called()
+    written = {i["launch_id"]: i["status"] for call in repo.write_batch.call_args_list for i in call[0][0]}
+    assert written == {upcoming_launch["id"]: "upcoming", past_launch["id"]: "failed"}
+    changed_ids, _ = repo.bump_generation.call_args[0]
+    assert sorted(changed_ids) == sorted(written)
+    repo.load_checkpoint.assert_not_called()
+
+
+@patch("handler.DynamoRepository")
+@patch("handler.SpaceXClient")
+def test_hot_sync_without_changes_does_not_publish(mock_client_cls, mock_repo_cls, upcoming_launch):
+    """Sin cambios no hay escrituras ni generación nueva."""
+    client = MagicMock()
+    client.get_upcoming_launches.return_value = [upcoming_launch]
+    mock_client_cls.return_value = client
+    repo = _repo()
+    repo.get_by_status.return_value = [{"launch_id": upcoming_launch["id"]}]
+    item = map_launch(upcoming_launch)
+    repo.existing_ids.return_value = {item["launch_id"]: content_hash(item)}
+    mock_repo_cls.return_value = repo
+
+    result = lambda_handler({"mode": "hot"}, None)
+
+    assert (result["unchanged"], result["departed"]) == (1, 0)
+    assert "generation" not in result
+    client.iter_query.assert_not_called()
+    repo.write_batch.assert_not_called()
+    repo.bump_generation.assert_not_called()
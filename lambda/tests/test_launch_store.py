@@ -0,0 +1,128 @@
+"""Tests del almacenamiento SQLite (launch_store) y su selección por entorno."""
+import threading
+
+import pytest
+
+import launch_store
+from dynamo_repository import DynamoRepository
+from launch_store import SQLiteStore, open_launch_writer, storage_backend
+from sync_pipeline import SyncCheckpoint, SyncPipeline, changes_key, map_launch
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteStore(str(tmp_path / "launches.db"))
+    yield store
+    store.close()
+
+
+def _launches(prefix, n, upcoming=False):
+    year = 2030 if upcoming else 2020
+    return [{"id": f"{prefix}{i}", "name": f"M{i}", "date_utc": f"{year}-01-{i + 1:02d}T00:00:00Z",
+             "upcoming": upcoming, "success": None if upcoming else i % 2 == 0}
+            for i in range(n)]
+
+
+def test_schema_uses_wal_and_indexes(store):
+    conn = store._conn()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    plan = " ".join(str(r) for r in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT item FROM launches WHERE status = ? ORDER BY launch_date DESC", ("x",),
+    ))
+    assert "launches_status_date" in plan and "TEMP B-TREE" not in plan
+
+
+def test_pipeline_writes_and_skips_unchanged(store):
+    first = SyncPipeline(store).run([lambda: _launches("a", 4), lambda: _launches("u", 2, upcoming=True)])
+    assert (first["inserted"], first["updated"], first["errors"]) == (6, 0, 0)
+
+    launches = _launches("a", 4)
+    launches[0]["name"] = "Renombrada"
+    second = SyncPipeline(store).run([lambda: launches])
+    assert (second["inserted"], second["updated"], second["unchanged"]) == (0, 1, 3)
+
+    assert [i["launch_id"] for i in store.scan()] == ["u1", "u0", "a3", "a2", "a1", "a0"]
+    assert [i["launch_id"] for i in store.query_status("upcoming")] == ["u1", "u0"]
+    assert store.get_launch("a0")["mission_name"] == "Renombrada"
+    assert {i["launch_id"] for i in store.get_launches(["a1", "zz", "u0"])} == {"a1", "u0"}
+    assert store.count_by_status() == {"success": 2, "failed": 2, "upcoming": 2}
+
+
+def test_bump_generation_keeps_bounded_changelog(store, monkeypatch):
+    monkeypatch.setattr(launch_store, "CHANGELOG_RETENTION", 2)
+    assert store.get_generation() is None
+    assert store.bump_generation(["b", "a"], {"inserted": 2}) == 1
+    store.bump_generation(None)
+    assert store.bump_generation([]) == 3
+
+    assert store.get_generation() == 3
+    assert store.get_meta(changes_key(1)) is None
+    entries = {e["generation"]: e for e in store.get_meta_many([changes_key(2), changes_key(3)])}
+    assert entries[2]["full_reload"] is True and entries[3]["ids"] == []
+    assert store.scan() == []                       # los items de control no son lanzamientos
+
+
+
+def test_bump_generation_rebuilds_launch_views(store, monkeypatch):
+    monkeypatch.setattr(launch_store, "VIEW_SIZE", 3)
+    store.put_many(map_launch(launch) for launch in _launches("a", 5) + _launches("u", 4, upcoming=True))
+    store.bump_generation(None)
+
+    assert [i["launch_id"] for i in store.get_meta("#view#next")["launches"]] == ["u0", "u1", "u2"]
+    latest = store.get_meta("#view#latest")
+    assert [i["launch_id"] for i in latest["launches"]] == ["a4", "a3", "a2"]
+    assert latest["generation"] == 1 and latest["size"] == 3
+    assert "content_hash" not in latest["launches"][0]
+
+
+def test_checkpoint_guards(store):
+    checkpoint = SyncCheckpoint(invocations=1, positions={0: 100})
+    assert store.save_checkpoint(checkpoint)
+    assert not store.save_checkpoint(SyncCheckpoint(invocations=5))          # otra sync
+    assert not store.save_checkpoint(checkpoint)                              # misma invocación
+    checkpoint.invocations = 2
+    assert store.save_checkpoint(checkpoint)
+    assert store.load_checkpoint().positions == {0: 100}
+
+    store.clear_checkpoint("otra")
+    assert store.load_checkpoint() is not None
+    store.clear_checkpoint(checkpoint.run_id)
+    assert store.load_checkpoint() is None
+
+
+def test_lease_is_exclusive_until_released_or_expired(store):
+    assert store.acquire_lease("a", expires_at=2_000, now=1_000)
+    assert not store.acquire_lease("b", expires_at=3_000, now=1_500)
+    assert not store.release_lease("b")
+    assert store.release_lease("a", completed_at=1_600, result='{"ok":1}')
+    assert store.get_lease()["last_result"] == '{"ok":1}'
+
+    assert store.acquire_lease("b", expires_at=2_000, now=1_700)
+    assert store.acquire_lease("c", expires_at=4_000, now=2_001)          # expiró
+    assert store.get_lease()["lease_owner"] == "c"
+
+
+def test_concurrent_writers_do_not_lose_generations(store):
+    threads = [threading.Thread(target=lambda: [store.bump_generation([]) for _ in range(10)])
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert store.get_generation() == 40
+
+
+def test_backend_is_selected_by_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("STORAGE_BACKEND", "sqlite")
+    monkeypatch.setenv("SQLITE_PATH", str(tmp_path / "env.db"))
+    assert storage_backend() == "sqlite"
+    assert open_launch_writer("tabla") is launch_store.get_sqlite_store()
+
+    repo = DynamoRepository(table_name="tabla")
+    assert repo.upsert_launches(_launches("r", 3)) == {"inserted": 3, "updated": 0, "unchanged": 0, "errors": 0}
+    assert len(repo.get_all_launches()) == 3
+    assert repo.bump_generation(["r0"]) == 1
+
+    monkeypatch.setenv("STORAGE_BACKEND", "postgres")
+    with pytest.raises(ValueError):
+        storage_backend()
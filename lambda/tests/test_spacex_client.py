@@ -63,3 +63,41 @@ def test_get_launch_by_id(requests_mock, past_launch):
     client = SpaceXClient()
     result = client.get_launch_by_id(lid)
     assert result["id"] == lid
+
+
+# ─── Streaming ───────────────────────────────────────────────────────────────
+
+def test_iter_past_launches_streams_items(requests_mock, past_launch, upcoming_launch):
+    """Debe producir los lanzamientos uno a uno desde la respuesta."""
+    requests_mock.get(f"{BASE_URL}/launches/past", json=[past_launch, upcoming_launch])
+    client = SpaceXClient()
+    result = client.iter_past_launches()
+    assert not isinstance(result, list)
+    assert [l["id"] for l in result] == [past_launch["id"], upcoming_launch["id"]]
+
+
+def test_iter_raises_on_http_error(requests_mock):
+    """Debe lanzar SpaceXAPIError también en modo streaming."""
+    requests_mock.get(f"{BASE_URL}/launches/upcoming", status_code=503, text="unavailable")
+    client = SpaceXClient()
+    with pytest.raises(SpaceXAPIError):
+        list(client.iter_upcoming_launches())
+
+
+def test_iter_raises_on_truncated_body(requests_mock):
+    """Un cuerpo cortado a mitad de array debe reportarse como JSON inválido."""
+    requests_mock.get(f"{BASE_URL}/launches/past", text='[{"id": "a"}, {"id": ')
+    client = SpaceXClient()
+    with pytest.raises(SpaceXAPIError, match="JSON"):
+        list(client.iter_past_launches())
+
+
+def test_query_launches_posts_filter_and_options(requests_mock, past_launch):
+    """Debe enviar la consulta por POST y producir los `docs` de la página."""
+    requests_mock.post(f"{BASE_URL}/launches/query", json={"docs": [past_launch], "totalDocs": 1})
+    client = SpaceXClient()
+    docs = list(client.iter_query({"flight_number": {"$lt": 10}}, {"pagination": False}))
+    assert docs[0]["id"] == past_launch["id"]
+    assert requests_mock.last_request.json() == {
+        "query": {"flight_number": {"$lt": 10}}, "options": {"pagination": False},
+    }
@@ -0,0 +1,130 @@
+"""Tests de la sync en paralelo: planificación de shards, workers y resumen combinado."""
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+os.environ.setdefault("DYNAMODB_TABLE", "spacex-launches-test")
+
+from handler import lambda_handler  # noqa: E402
+from launch_store import get_sqlite_store  # noqa: E402
+from sync_fanout import (  # noqa: E402
+    FanoutError, LambdaInvoker, LocalInvoker, merge_summaries, plan_shards, run_shards, _year_bounds,
+)
+
+LAUNCHES = [{"id": f"L{i:03d}", "name": f"M{i}", "flight_number": i + 1,
+             "date_utc": f"{2006 + i // 6}-06-01T00:00:00.000Z",
+             "upcoming": i >= 110, "success": None if i >= 110 else i % 3 != 0}
+            for i in range(120)]
+
+
+class FakeQueryClient:
+    """`query_launches` / `iter_query` sobre una lista (solo $gte y $lt)."""
+
+    def __init__(self, launches):
+        self.launches = launches
+        self.queries = []
+
+    def query_launches(self, query, options=None):
+        options = options or {}
+        docs = [l for l in self.launches if all(
+            ("$gte" not in c or l[attr] >= c["$gte"]) and ("$lt" not in c or l[attr] < c["$lt"])
+            for attr, c in query.items()
+        )]
+        if options.get("sort") == {"flight_number": "desc"}:
+            docs = sorted(docs, key=lambda l: -l["flight_number"])
+        if "limit" in options:
+            docs = docs[:options["limit"]]
+        return {"docs": docs, "totalDocs": len(docs)}
+
+    def iter_query(self, query, options=None):
+        self.queries.append(query)
+        return iter(self.query_launches(query, options)["docs"])
+
+
+def _covered(client, shards):
+    ids = [l["id"] for s in shards for l in client.query_launches(s["query"])["docs"]]
+    return sorted(ids)
+
+
+@pytest.mark.parametrize("workers", [1, 3, 4, 7])
+def test_flight_shards_are_disjoint_balanced_and_complete(workers):
+    client = FakeQueryClient(LAUNCHES)
+    shards = plan_shards(client, workers, by="range")
+    assert len(shards) == workers
+    assert _covered(client, shards) == sorted(l["id"] for l in LAUNCHES)
+    sizes = [len(client.query_launches(s["query"])["docs"]) for s in shards]
+    assert max(sizes) - min(sizes) <= 120 // workers
+
+
+def test_year_shards_cover_everything():
+    client = FakeQueryClient(LAUNCHES)
+    shards = plan_shards(client, 4, by="year")
+    assert _covered(client, shards) == sorted(l["id"] for l in LAUNCHES)
+    assert _year_bounds(2, 2025)[0] == (None, "2017-01-01T00:00:00.000Z")
+    with pytest.raises(ValueError):
+        plan_shards(client, 4, by="mes")
+
+
+def test_merge_sums_counts_and_unions_changed_ids():
+    results = [
+        {"shard": 0, "total_fetched": 3, "inserted": 2, "updated": 1, "unchanged": 0, "errors": 0,
+         "launches": [{"launch_id": "a"}], "changed_ids": ["b", "a"], "complete": True},
+        {"shard": 1, "total_fetched": 2, "inserted": 0, "updated": 0, "unchanged": 2, "errors": 0,
+         "launches": [{"launch_id": "c"}], "changed_ids": [], "complete": False},
+    ]
+    summary, changed = merge_summaries(results, preview_size=1)
+    assert (summary["total_fetched"], summary["inserted"], summary["unchanged"]) == (5, 2, 2)
+    assert summary["launches"] == [{"launch_id": "a"}]
+    assert summary["complete"] is False
+    assert changed == ["a", "b"]
+
+    summary, changed = merge_summaries(results + [{"shard": 2, "error": "timeout"}])
+    assert changed is None                          # cambios desconocidos → full_reload
+    assert summary["shards"][2] == {"shard": 2, "duration_ms": None, "error": "timeout"}
+
+
+def test_run_shards_reports_failures_without_cancelling_others():
+    def invoke(payload):
+        if payload["shard"]["index"] == 1:
+            raise FanoutError("Unhandled: boom")
+        return {"total_fetched": 1, "budget": payload.get("wcu_budget")}
+
+    results = run_shards([{"index": i} for i in range(3)], invoke, {"wcu_budget": 5})
+    assert [r["shard"] for r in results] == [0, 1, 2]
+    assert results[0]["budget"] == 5 and "boom" in results[1]["error"]
+
+
+def test_lambda_invoker_raises_on_function_error():
+    client = MagicMock()
+    client.invoke.return_value = {"FunctionError": "Unhandled",
+                                  "Payload": MagicMock(read=lambda: b'{"errorMessage": "boom"}')}
+    with pytest.raises(FanoutError, match="boom"):
+        LambdaInvoker("arn:fn", client=client)({"shard": {"index": 0}})
+    assert client.invoke.call_args.kwargs["InvocationType"] == "RequestResponse"
+
+
+@patch("handler.SpaceXClient")
+def test_handler_fans_out_and_publishes_one_generation(mock_client_cls, tmp_path, monkeypatch):
+    monkeypatch.setenv("STORAGE_BACKEND", "sqlite")
+    monkeypatch.setenv("SQLITE_PATH", str(tmp_path / "fanout.db"))
+    client = FakeQueryClient(LAUNCHES)
+    mock_client_cls.return_value = client
+
+    summary = lambda_handler({"fanout_workers": 4}, None)
+
+    assert (summary["total_fetched"], summary["inserted"], summary["errors"]) == (120, 120, 0)
+    assert summary["complete"] is True and len(summary["shards"]) == 4
+    assert len(client.queries) == 4
+    store = get_sqlite_store()
+    assert store.get_generation() == summary["generation"] == 1
+    assert store.count_by_status()["upcoming"] == 10
+
+    again = lambda_handler({"fanout_workers": 2}, None)
+    assert (again["unchanged"], again["generation"]) == (120, 2)
+
+
+def test_local_invoker_calls_handler_in_process():
+    handler = MagicMock(return_value={"ok": True})
+    assert LocalInvoker(handler)({"shard": {"index": 0}}) == {"ok": True}
+    handler.assert_called_once_with({"shard": {"index": 0}}, None)
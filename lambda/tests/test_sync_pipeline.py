@@ -0,0 +1,249 @@
+"""Tests unitarios para el motor ETL compartido (sync_pipeline)."""
+import json
+import threading
+import time
+import tracemalloc
+
+import pytest
+
+from sync_pipeline import (
+    LAUNCH_VIEWS, PipelineConfig, SyncCheckpoint, SyncPipeline, iter_json_array, map_launch, resolve_status,
+)
+
+
+class FakeWriter:
+    """Writer en memoria que registra los lotes recibidos."""
+
+    def __init__(self, existing=(), fail_ids=(), write_delay=0.0):
+        self.store = {lid: {"launch_id": lid} for lid in existing}
+        self.fail_ids = set(fail_ids)
+        self.write_delay = write_delay
+        self.batches = []
+        self.first_write_at = None
+        self.lock = threading.Lock()
+
+    def existing_ids(self, launch_ids):
+        return {lid for lid in launch_ids if lid in self.store}
+
+    def write_batch(self, items):
+        time.sleep(self.write_delay)
+        with self.lock:
+            if self.first_write_at is None:
+                self.first_write_at = time.monotonic()
+            self.batches.append([i["launch_id"] for i in items])
+            failed = [i for i in items if i["launch_id"] in self.fail_ids]
+            for item in items:
+                if item not in failed:
+                    self.store[item["launch_id"]] = item
+        return failed
+
+
+def _launches(prefix, n):
+    return [{"id": f"{prefix}{i}", "name": f"M{i}", "upcoming": False, "success": True}
+            for i in range(n)]
+
+
+def test_map_launch_uses_resolved_status(past_launch):
+    item = map_launch(past_launch)
+    assert item["launch_id"] == past_launch["id"]
+    assert item["status"] == resolve_status(past_launch) == "failed"
+    assert item["article_url"] == ""
+
+
+def test_counts_inserted_and_updated():
+    writer = FakeWriter(existing=["a0", "a1"])
+    summary = SyncPipeline(writer).run([lambda: _launches("a", 5), lambda: _launches("b", 3)])
+    assert summary["total_fetched"] == 8
+    assert summary["inserted"] == 6
+    assert summary["updated"] == 2
+    assert summary["errors"] == 0
+    assert len(writer.store) == 8
+
+
+class HashingWriter(FakeWriter):
+    """Writer que informa la huella almacenada de cada item existente."""
+
+    def existing_ids(self, launch_ids):
+        return {lid: self.store[lid].get("content_hash") for lid in launch_ids if lid in self.store}
+
+
+def test_unchanged_items_are_not_rewritten():
+    writer = HashingWriter()
+    SyncPipeline(writer).run([lambda: _launches("a", 5)])
+    writer.batches.clear()
+
+    changed = _launches("a", 5)
+    changed[2]["name"] = "Renombrada"
+    pipeline = SyncPipeline(writer)
+    summary = pipeline.run([lambda: changed + _launches("b", 1)])
+    assert summary["unchanged"] == 4
+    assert summary["updated"] == 1
+    assert summary["inserted"] == 1
+    assert sorted(pipeline.changed_ids) == ["a2", "b0"]
+    assert writer.batches == [["a2", "b0"]]
+
+
+def test_failed_items_and_unmappable_launches_are_errors():
+    writer = FakeWriter(fail_ids=["a1"])
+    launches = _launches("a", 3) + [{"name": "sin id"}]
+    summary = SyncPipeline(writer).run([lambda: launches])
+    assert summary["inserted"] == 2
+    assert summary["errors"] == 2
+
+
+def test_batches_respect_size_and_unique_ids():
+    writer = FakeWriter()
+    config = PipelineConfig(batch_size=4, write_workers=1)
+    SyncPipeline(writer, config).run([lambda: _launches("a", 10) + _launches("a", 2)])
+    assert all(len(b) <= 4 and len(set(b)) == len(b) for b in writer.batches)
+
+
+def test_preview_keeps_source_order():
+    summary = SyncPipeline(FakeWriter()).run([lambda: _launches("a", 3), lambda: _launches("b", 20)])
+    ids = [p["launch_id"] for p in summary["launches"]]
+    assert ids[:3] == ["a0", "a1", "a2"]
+    assert len(ids) == 10
+
+
+def test_writes_start_before_fetch_finishes():
+    def slow_source():
+        for launch in _launches("a", 60):
+            time.sleep(0.002)
+            yield launch
+        slow_source.finished_at = time.monotonic()
+
+    writer = FakeWriter()
+    SyncPipeline(writer, PipelineConfig(batch_size=10)).run([slow_source])
+    assert writer.first_write_at < slow_source.finished_at
+
+
+def test_stop_and_resume_process_every_launch_once():
+    writer = FakeWriter()
+    sources = [lambda: _launches("a", 30), lambda: _launches("b", 30)]
+    calls = []
+    first = SyncPipeline(writer, PipelineConfig(fetch_workers=1))
+    summary = first.run(sources, should_stop=lambda: calls.append(1) or len(calls) > 40)
+    assert first.interrupted
+    assert summary["total_fetched"] == sum(first.positions.values()) < 60
+
+    checkpoint = SyncCheckpoint()
+    checkpoint.absorb(first, summary)
+    second = SyncPipeline(writer, PipelineConfig(fetch_workers=1))
+    rest = second.run(sources, checkpoint=checkpoint)
+    assert not second.interrupted and second.finished == {0, 1}
+    assert summary["total_fetched"] + rest["total_fetched"] == 60
+    written = [lid for batch in writer.batches for lid in batch]
+    assert sorted(written) == sorted(writer.store) and len(written) == 60
+
+    checkpoint.absorb(second, rest)
+    assert checkpoint.counts["inserted"] == 60 and len(checkpoint.changed_ids) == 60
+
+
+def test_checkpoint_stays_behind_launches_that_were_not_written():
+    writer = FakeWriter(fail_ids=["a3"])
+    sources = [lambda: _launches("a", 30), lambda: _launches("b", 5)]
+    calls = []
+    first = SyncPipeline(writer, PipelineConfig(fetch_workers=1))
+    summary = first.run(sources, should_stop=lambda: calls.append(1) or len(calls) > 20)
+    assert first.interrupted and summary["errors"] == 1
+    # a0-a2 están escritos; a3 falló y se reintenta al reanudar
+    assert first.positions[0] == 3 and 0 not in first.finished
+
+    checkpoint = SyncCheckpoint()
+    checkpoint.absorb(first, summary)
+    writer.fail_ids.clear()
+    second = SyncPipeline(writer, PipelineConfig(fetch_workers=1))
+    second.run(sources, checkpoint=checkpoint)
+    assert not second.interrupted and second.finished == {0, 1}
+    assert len(writer.store) == 35 and "a3" in writer.store
+
+
+def test_checkpoint_drops_changed_ids_beyond_changelog_limit(monkeypatch):
+    import sync_pipeline
+    monkeypatch.setattr(sync_pipeline, "CHANGELOG_MAX_IDS", 5)
+    pipeline = SyncPipeline(FakeWriter())
+    summary = pipeline.run([lambda: _launches("a", 6)])
+    checkpoint = SyncCheckpoint()
+    checkpoint.absorb(pipeline, summary)
+    assert checkpoint.changed_ids is None
+    assert SyncCheckpoint.from_item(checkpoint.to_item()).changed_ids is None
+
+
+
+def _view_item(lid, date, status="success"):
+    return {"launch_id": lid, "launch_date": date, "status": status}
+
+
+def test_launch_view_merge_is_exact_or_asks_for_rebuild():
+    latest = LAUNCH_VIEWS["latest"]
+    published = latest.to_item([_view_item("d", "2024"), _view_item("c", "2023"), _view_item("b", "2022")], 1, 3)
+    assert [i["launch_id"] for i in published["launches"]] == ["d", "c", "b"]
+
+    def merge(changed, size=3):
+        ids = [i["launch_id"] for i in changed]
+        merged = latest.merge(published, ids, changed, size, 2)
+        return None if merged is None else [i["launch_id"] for i in merged]
+
+    assert merge([]) == ["d", "c", "b"]
+    assert merge([_view_item("e", "2025")]) == ["e", "d", "c"]             # entra uno nuevo
+    assert merge([_view_item("c", "2026")]) == ["c", "d", "b"]             # cambia de fecha
+    assert merge([_view_item("x", "2020", "upcoming")]) == ["d", "c", "b"]  # otro estado
+    assert merge([_view_item("c", "2031", "upcoming")]) is None            # sale: el hueco es de otro
+    assert merge([_view_item("d", "2021")]) is None                        # pasa del último
+    assert merge([], size=5) is None                                       # otro tamaño
+    assert latest.merge(published, None, [], 3, 2) is None                 # cambios desconocidos
+    assert latest.merge(None, [], [], 3, 2) is None                        # sin vista
+    assert latest.merge(published, [], [], 3, 3) is None                   # falta una generación
+
+    # Una vista que no estaba llena contiene todos los lanzamientos de sus estados
+    short = latest.to_item([_view_item("b", "2022")], 1, 3)
+    gone = [_view_item("b", "2031", "upcoming")]
+    assert latest.merge(short, ["b"], gone, 3, 2) == []
+    upcoming = LAUNCH_VIEWS["next"].to_item([_view_item("u", "2030", "upcoming")], 1, 3)
+    merged = LAUNCH_VIEWS["next"].merge(upcoming, ["v"], [_view_item("v", "2029", "upcoming")], 3, 2)
+    assert [i["launch_id"] for i in merged] == ["v", "u"]
+
+
+def test_source_error_is_raised():
+    def broken():
+        raise RuntimeError("API down")
+
+    with pytest.raises(RuntimeError, match="API down"):
+        SyncPipeline(FakeWriter()).run([broken, lambda: _launches("a", 3)])
+
+
+# ─── iter_json_array ─────────────────────────────────────────────────────────
+
+def _chunked(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 4096])
+def test_iter_json_array_handles_any_chunk_boundary(size):
+    payload = [{"id": "ñandú", "n": 12345, "links": {"patch": None}}, 7, "x", [1, 2], True]
+    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    assert list(iter_json_array(_chunked(data, size))) == payload
+
+
+def test_iter_json_array_empty_and_invalid():
+    assert list(iter_json_array([b" [ ] "])) == []
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"id": 1}']))
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'[{"id": 1},']))
+
+
+def test_iter_json_array_peak_memory_independent_of_body_size():
+    """La memoria pico depende del trozo y del elemento, no del total."""
+    def peak_for(n):
+        data = json.dumps(_launches("a", n)).encode()
+        chunks = _chunked(data, 4096)
+        tracemalloc.start()
+        for _ in iter_json_array(chunks):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    small, large = peak_for(500), peak_for(5000)
+    assert large < small * 2
@@ -0,0 +1,58 @@
+"""Tests unitarios para la telemetría de sincronización."""
+import json
+
+from sync_pipeline import SyncPipeline, iter_json_array
+from sync_telemetry import PHASES, SyncTelemetry, emit_emf
+
+
+def test_snapshot_separates_network_from_parse():
+    telemetry = SyncTelemetry(trace_memory=False)
+    telemetry.add("source", 0.5)
+    telemetry.add("parse", 0.2)
+    telemetry.add("write", 0.1)
+    telemetry.add("write", 0.1)
+    snap = telemetry.snapshot(consumed_wcu=12.5, throttled=1)
+    assert snap["phases_ms"]["fetch"] == 300.0
+    assert snap["phases_ms"]["parse"] == 200.0
+    assert snap["phases_ms"]["write"] == 200.0
+    assert set(snap["phases_ms"]) == set(PHASES)
+    assert snap["consumed_wcu"] == 12.5
+    assert snap["container_peak_rss_mb"] > 0
+    assert snap["peak_traced_mb"] is None
+
+
+def test_tracemalloc_peak_when_enabled():
+    telemetry = SyncTelemetry(trace_memory=True)
+    data = [bytearray(1024) for _ in range(1000)]
+    snap = telemetry.snapshot()
+    del data
+    assert snap["peak_traced_mb"] >= 0.9
+
+
+def test_pipeline_and_decoder_record_phases():
+    class Writer:
+        def existing_ids(self, ids):
+            return set()
+
+        def write_batch(self, items):
+            return []
+
+    telemetry = SyncTelemetry(trace_memory=False)
+    body = json.dumps([{"id": str(i), "name": "x"} for i in range(5000)]).encode()
+    SyncPipeline(Writer(), telemetry=telemetry).run([lambda: iter_json_array([body], telemetry)])
+    phases = telemetry.snapshot()["phases_ms"]
+    assert phases["parse"] > 0
+    assert phases["map"] > 0
+    assert phases["write"] >= 0
+
+
+def test_emit_emf_writes_valid_document(capsys):
+    snap = SyncTelemetry(trace_memory=False).snapshot(consumed_wcu=3.0)
+    emit_emf(snap, {"total_fetched": 2, "inserted": 1, "updated": 1, "errors": 0}, "fn-test")
+    doc = json.loads(capsys.readouterr().out.strip())
+    directive = doc["_aws"]["CloudWatchMetrics"][0]
+    names = {m["Name"] for m in directive["Metrics"]}
+    assert {"SyncDuration", "FetchTime", "WriteTime", "ConsumedWCU", "TotalFetched", "ContainerPeakRSS"} <= names
+    assert all(name in doc for name in names)
+    assert doc["FunctionName"] == "fn-test"
+    assert directive["Dimensions"] == [["FunctionName"]]
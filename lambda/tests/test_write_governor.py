@@ -0,0 +1,209 @@
+"""Tests unitarios para WriteGovernor y su uso en DynamoBatchWriter."""
+import threading
+import time
+
+import pytest
+from botocore.exceptions import ClientError
+
+from sync_pipeline import DynamoBatchWriter, PipelineConfig, SyncPipeline, WriteThrottledError
+from write_governor import WriteGovernor, estimate_wcu
+
+
+class FakeClock:
+    """Reloj manual: `sleep` avanza el tiempo sin esperar."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _governor(budget=None, **kwargs):
+    clock = FakeClock()
+    return WriteGovernor(wcu_budget=budget, clock=clock, sleep=clock.sleep, **kwargs), clock
+
+
+def test_estimate_wcu_rounds_up_per_kb():
+    assert estimate_wcu({"launch_id": "a"}) == 1
+    assert estimate_wcu({"launch_id": "a", "details": "x" * 2500}) == 3
+
+
+def test_unlimited_governor_never_waits():
+    governor, clock = _governor()
+    for _ in range(100):
+        governor.acquire(25)
+    assert clock.sleeps == []
+
+
+def test_budget_limits_sustained_rate():
+    governor, clock = _governor(budget=10)
+    for _ in range(10):
+        reserved = governor.acquire(5)
+        governor.settle(reserved, 5, None)
+    # 50 WCU a 10 WCU/s con burst de 1s → ~4s de espera
+    assert clock.now == pytest.approx(4.0, rel=0.01)
+
+
+def test_consumed_capacity_adjusts_cost_factor():
+    governor, _ = _governor(budget=100)
+    reserved = governor.acquire(10)
+    governor.settle(reserved, 10, 30.0)    # 2 GSIs → el triple de lo estimado
+    assert governor.acquire(10) > 10
+    assert governor.consumed_wcu == 30.0
+
+
+def test_throttling_halves_rate_and_recovers():
+    governor, _ = _governor(budget=40)
+    governor.backoff()
+    governor.backoff()
+    assert governor.rate == 10
+    assert governor.throttle_count == 2
+    for _ in range(10):
+        governor.succeeded()
+    assert governor.rate == 40
+
+
+def test_backoff_grows_exponentially_up_to_cap():
+    governor, clock = _governor(base_backoff=0.1, max_backoff=0.4)
+    for _ in range(5):
+        governor.backoff()
+    assert clock.sleeps[0] <= 0.1
+    assert all(s <= 0.4 for s in clock.sleeps)
+    assert clock.sleeps[-1] >= 0.2
+
+
+# ─── DynamoBatchWriter ───────────────────────────────────────────────────────
+
+class ThrottlingDynamo:
+    """Simula BatchWriteItem con throttling inicial y UnprocessedItems."""
+
+    def __init__(self, throttle_calls=1, unprocessed_calls=1):
+        self.throttle_calls = throttle_calls
+        self.unprocessed_calls = unprocessed_calls
+        self.written = []
+
+    def batch_write_item(self, RequestItems, ReturnConsumedCapacity):
+        (table, requests), = RequestItems.items()
+        if self.throttle_calls:
+            self.throttle_calls -= 1
+            raise ClientError(
+                {"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "slow down"}},
+                "BatchWriteItem",
+            )
+        done, rest = requests, []
+        if self.unprocessed_calls:
+            self.unprocessed_calls -= 1
+            done, rest = requests[:1], requests[1:]
+        self.written.extend(r["PutRequest"]["Item"]["launch_id"] for r in done)
+        return {
+            "UnprocessedItems": {table: rest} if rest else {},
+            "ConsumedCapacity": [{"TableName": table, "CapacityUnits": 3.0 * len(done)}],
+        }
+
+
+def test_writer_requeues_throttled_items_without_dropping():
+    governor, _ = _governor(budget=50)
+    dynamo = ThrottlingDynamo(throttle_calls=2, unprocessed_calls=1)
+    writer = DynamoBatchWriter(dynamo, "t", governor=governor)
+
+    failed = writer.write_batch([{"launch_id": f"l{i}"} for i in range(5)])
+
+    assert failed == []
+    assert sorted(dynamo.written) == [f"l{i}" for i in range(5)]
+    assert governor.throttle_count == 3
+    assert governor.consumed_wcu == 15.0
+
+
+def test_writer_keeps_retrying_under_sustained_throttling():
+    governor, clock = _governor(max_backoff=1.0)
+    dynamo = ThrottlingDynamo(throttle_calls=40, unprocessed_calls=5)
+    writer = DynamoBatchWriter(dynamo, "t", governor=governor)
+
+    assert writer.write_batch([{"launch_id": f"l{i}"} for i in range(8)]) == []
+    assert sorted(dynamo.written) == sorted(f"l{i}" for i in range(8))
+    assert governor.throttle_count == 45
+    assert max(clock.sleeps) <= 1.0
+
+
+def test_writer_bound_fails_the_sync_instead_of_dropping():
+    governor, _ = _governor()
+    writer = DynamoBatchWriter(ThrottlingDynamo(throttle_calls=99), "t",
+                               governor=governor, max_attempts=3)
+    with pytest.raises(WriteThrottledError):
+        writer.write_batch([{"launch_id": "a"}])
+
+    class Store:
+        def existing_ids(self, launch_ids):
+            return {}
+
+        write_batch = writer.write_batch
+
+    pipeline = SyncPipeline(Store())
+    with pytest.raises(WriteThrottledError):
+        pipeline.run([lambda: [{"id": "a", "name": "A", "date_utc": "2020-01-01T00:00:00Z"}]])
+    assert pipeline.changed_ids == []
+
+
+def test_writer_stops_retrying_at_deadline_and_keeps_checkpoint_behind():
+    governor, _ = _governor()
+    dynamo = ThrottlingDynamo(throttle_calls=1000)             # throttling sostenido
+    late = lambda: dynamo.throttle_calls < 1000                 # noqa: E731 - sin tiempo tras el 1er intento
+    writer = DynamoBatchWriter(dynamo, "t", governor=governor, deadline=late)
+
+    class Store:
+        def existing_ids(self, launch_ids):
+            return {}
+
+        write_batch = writer.write_batch
+
+    launches = [{"id": f"l{n}", "name": str(n), "date_utc": "2020-01-01T00:00:00Z"} for n in range(5)]
+    pipeline = SyncPipeline(Store(), PipelineConfig(fetch_workers=1))
+    summary = pipeline.run([lambda: launches], should_stop=late)
+
+    assert dynamo.throttle_calls == 999 and dynamo.written == []
+    assert pipeline.interrupted and pipeline.positions == {0: 0} and pipeline.finished == set()
+    assert pipeline.changed_ids == [] and summary["errors"] == 5
+
+
+def test_always_throttled_writer_fails_the_run_without_hanging():
+    class Throttled:
+        def existing_ids(self, launch_ids):
+            return {}
+
+        def write_batch(self, items):
+            time.sleep(0.05)                # la cola de escritura se llena mientras tanto
+            raise WriteThrottledError("sin capacidad")
+
+    # Muchos más lotes que huecos en la cola de escritura
+    launches = [{"id": f"l{n}", "name": str(n), "date_utc": "2020-01-01T00:00:00Z"} for n in range(200)]
+    pipeline = SyncPipeline(Throttled(), PipelineConfig(queue_size=4, batch_size=1, write_workers=1))
+    outcome = []
+
+    def run():
+        try:
+            pipeline.run([lambda: launches])
+        except WriteThrottledError as exc:
+            outcome.append(exc)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive(), "el pipeline quedó bloqueado"
+    assert len(outcome) == 1 and pipeline.changed_ids == []
+
+
+def test_writer_propagates_non_throttling_errors():
+    class Broken:
+        def batch_write_item(self, **_):
+            raise ClientError({"Error": {"Code": "ValidationException", "Message": "bad"}},
+                              "BatchWriteItem")
+
+    governor, _ = _governor()
+    with pytest.raises(ClientError):
+        DynamoBatchWriter(Broken(), "t", governor=governor).write_batch([{"launch_id": "a"}])
@@ -0,0 +1,161 @@
+"""
+Control adaptativo del ritmo de escritura de las syncs.
+
+`WriteGovernor` es un token bucket expresado en WCU/s:
+
+- `acquire(units)` bloquea hasta que haya capacidad dentro del presupuesto.
+- `settle(...)` concilia lo reservado con el `ConsumedCapacity` real devuelto
+  por DynamoDB (incluye los GSIs) y ajusta el coste estimado por item.
+- `throttled()` reduce el ritmo a la mitad (AIMD) y devuelve el backoff
+  exponencial con jitter a esperar; `succeeded()` lo recupera gradualmente.
+
+Sin presupuesto (`wcu_budget=None`, tablas on-demand) no limita el ritmo pero
+sigue aplicando backoff ante throttling.
+"""
+import json
+import logging
+import math
+import os
+import random
+import threading
+import time
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# Errores de DynamoDB que indican falta de capacidad (reintentables)
+THROTTLING_ERRORS = frozenset({
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+})
+
+
+def estimate_wcu(item: dict[str, Any]) -> int:
+    """WCU de un PutItem: 1 por cada KB (redondeado hacia arriba) del item."""
+    size = len(json.dumps(item, default=str).encode("utf-8"))
+    return max(1, math.ceil(size / 1024))
+
+
+class WriteGovernor:
+    """Token bucket de WCU con backoff exponencial y ajuste por capacidad consumida."""
+
+    def __init__(
+        self,
+        wcu_budget: float | None = None,
+        burst_seconds: float = 1.0,
+        min_rate: float = 1.0,
+        base_backoff: float = 0.05,
+        max_backoff: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.budget = wcu_budget
+        self.burst_seconds = burst_seconds
+        self.min_rate = min_rate
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._sleep = sleep
+
+        self._lock = threading.Lock()
+        self._rate = wcu_budget
+        self._tokens = (wcu_budget or 0.0) * burst_seconds
+        self._updated = clock()
+        self._cost_factor = 1.0
+        self._consecutive_throttles = 0
+
+        self.consumed_wcu = 0.0
+        self.throttle_count = 0
+        self.waited_seconds = 0.0
+
+    @classmethod
+    def from_env(cls) -> "WriteGovernor":
+        """Presupuesto en `SYNC_WCU_BUDGET` (WCU/s); vacío = sin límite."""
+        budget = os.environ.get("SYNC_WCU_BUDGET")
+        return cls(wcu_budget=float(budget) if budget else None)
+
+    @property
+    def rate(self) -> float | None:
+        """Ritmo actual permitido en WCU/s (None = sin límite)."""
+        return self._rate
+
+    # ── Token bucket ──────────────────────────────────────────────────────────
+
+    def acquire(self, units: float) -> float:
+        """
+        Reserva capacidad para `units` WCU estimados, esperando si hace falta.
+        Retorna el coste reservado (ya corregido por el factor observado).
+        """
+        cost = units * self._cost_factor
+        if self._rate is None:
+            return cost
+
+        while True:
+            with self._lock:
+                self._refill()
+                # Un lote mayor que el burst no debe bloquear para siempre
+                needed = min(cost, self._rate * self.burst_seconds)
+                if self._tokens >= needed:
+                    self._tokens -= cost
+                    return cost
+                wait = (needed - self._tokens) / self._rate
+                self.waited_seconds += wait
+            self._sleep(wait)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        capacity = self._rate * self.burst_seconds
+        self._tokens = min(capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def settle(self, reserved: float, units_written: float, consumed: float | None) -> None:
+        """
+        Concilia la capacidad reservada con la realmente usada: devuelve la
+        reserva y descuenta el `ConsumedCapacity` (o la estimación si DynamoDB
+        no lo reporta). Los items no procesados quedan así reembolsados.
+        """
+        with self._lock:
+            actual = consumed if consumed is not None else units_written * self._cost_factor
+            self.consumed_wcu += actual
+            if consumed is not None and units_written > 0:
+                # Media móvil: suaviza lotes con tamaños de item muy distintos
+                self._cost_factor = 0.7 * self._cost_factor + 0.3 * (consumed / units_written)
+            if self._rate is not None:
+                self._tokens += reserved - actual
+
+    # ── Throttling ────────────────────────────────────────────────────────────
+
+    def throttled(self) -> float:
+        """Registra un throttling y retorna cuántos segundos esperar antes de reintentar."""
+        with self._lock:
+            self.throttle_count += 1
+            self._consecutive_throttles += 1
+            if self._rate is not None:
+                self._rate = max(self.min_rate, self._rate / 2)
+                self._tokens = min(self._tokens, 0.0)
+            backoff = min(self.max_backoff, self.base_backoff * 2 ** (self._consecutive_throttles - 1))
+        delay = random.uniform(backoff / 2, backoff)
+        logger.warning("Throttling en escritura; reintento en %.2fs (ritmo %s WCU/s)", delay, self._rate)
+        return delay
+
+    def succeeded(self) -> None:
+        """Escritura completa sin throttling: recupera el ritmo de forma aditiva."""
+        with self._lock:
+            self._consecutive_throttles = 0
+            if self._rate is not None and self.budget is not None and self._rate < self.budget:
+                self._rate = min(self.budget, self._rate + max(1.0, self.budget * 0.1))
+
+    def backoff(self) -> None:
+        """Atajo: registra el throttling y espera el backoff correspondiente."""
+        delay = self.throttled()
+        with self._lock:
+            self.waited_seconds += delay
+        self._sleep(delay)
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "consumed_wcu":   round(self.consumed_wcu, 2),
+            "throttled":      self.throttle_count,
+            "waited_seconds": round(self.waited_seconds, 3),
+        }
@@ -1,6 +1,7 @@
-import { useState, useEffect, useCallback } from 'react'
+import { useState, useEffect, useCallback, useRef } from 'react'
 import { launchService } from '@/services/launchService'
 import { filterLaunches } from '@/utils/filterLaunches'
+import { mergeLaunches } from '@/utils/mergeLaunches'
 import type { Launch, LaunchFilters, LaunchStats } from '@/types/launch'
 
 const DEFAULT_FILTERS: LaunchFilters = {
@@ -18,14 +19,23 @@ export function useLaunches() {
   const [loading, setLoading] = useState(true)
   const [syncing, setSyncing] = useState(false)
   const [error, setError] = useState<string | null>(null)
+  // Generación de datos que ya tiene el cliente: los refrescos piden solo el delta
+  const generationRef = useRef<number | null>(null)
 
   const fetchLaunches = useCallback(async () => {
     try {
-      setLoading(true)
+      const since = generationRef.current
+      // Los refrescos incrementales (p. ej. tras un evento SSE) no muestran el spinner
+      if (since === null) setLoading(true)
       setError(null)
-      const data = await launchService.getAllLaunches()
-      setLaunches(data)
-      setStats(launchService.computeStats(data))
+      // La generación se lee antes que la lista: una sync intermedia llega en el próximo delta
+      const changes = await launchService.getChanges(since ?? 0)
+      if (since === null || changes.full_reload) {
+        setLaunches(await launchService.getAllLaunches())
+      } else {
+        setLaunches((prev) => mergeLaunches(prev, changes.launches))
+      }
+      generationRef.current = changes.generation
     } catch (err) {
       setError('Error al cargar los lanzamientos. Verifica la conexión.')
       console.error(err)
@@ -52,10 +62,20 @@ export function useLaunches() {
     setFiltered(filterLaunches(launches, filters))
   }, [launches, filters])
 
+  useEffect(() => {
+    setStats(launchService.computeStats(launches))
+  }, [launches])
+
   useEffect(() => {
     fetchLaunches()
   }, [fetchLaunches])
 
+  // Push del backend: cada sync terminada dispara un refresco incremental
+  useEffect(() => launchService.subscribeEvents({
+    onSync: () => { fetchLaunches() },
+    onReset: () => { fetchLaunches() },
+  }), [fetchLaunches])
+
   return {
     launches: filtered,
     allLaunches: launches,
@@ -1,7 +1,7 @@
-import { describe, it, expect, vi, beforeEach } from 'vitest'
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest'
 import axios from 'axios'
-import { launchService } from './launchService'
-import type { Launch } from '@/types/launch'
+import { decodeColumns, launchService } from './launchService'
+import type { Launch, LaunchColumns } from '@/types/launch'
 
 // ── Fixtures ──────────────────────────────────────────────────────────────────
 
@@ -99,3 +99,72 @@ describe('launchService.getAllLaunches', () => {
     expect(svc.computeStats(mockData)).toMatchObject({ total: 1, success: 1 })
   })
 })
+
+// ── decodeColumns ─────────────────────────────────────────────────────────────
+
+describe('decodeColumns', () => {
+  it('reconstruye las filas con las columnas de diccionario', () => {
+    const launches = [
+      makeLaunch({ launch_id: '1', status: 'success', payloads: ['p1'] }),
+      makeLaunch({ launch_id: '2', status: 'upcoming', rocket_name: 'Starship' }),
+      makeLaunch({ launch_id: '3', status: 'success' }),
+    ]
+    const plain = (field: keyof Launch) => launches.map((l) => l[field])
+    const payload = {
+      format: 'columns',
+      count: 3,
+      columns: {
+        launch_id: plain('launch_id'),
+        mission_name: plain('mission_name'),
+        rocket_name: { values: ['Falcon 9', 'Starship'], codes: [0, 1, 0] },
+        launch_date: plain('launch_date'),
+        status: { values: ['success', 'upcoming'], codes: [0, 1, 0] },
+        launchpad: { values: ['KSC LC-39A'], codes: [0, 0, 0] },
+        flight_number: plain('flight_number'),
+        details: plain('details'),
+        payloads: plain('payloads'),
+        webcast_url: plain('webcast_url'),
+        article_url: plain('article_url'),
+        wikipedia_url: plain('wikipedia_url'),
+        patch_small: plain('patch_small'),
+        patch_large: plain('patch_large'),
+      },
+    } as LaunchColumns
+
+    expect(decodeColumns(payload)).toEqual(launches)
+  })
+
+  it('retorna una lista vacía sin filas', () => {
+    const empty = { format: 'columns', count: 0, columns: {} } as LaunchColumns
+    expect(decodeColumns(empty)).toEqual([])
+  })
+})
+
+// ── subscribeEvents ───────────────────────────────────────────────────────────
+
+describe('launchService.subscribeEvents', () => {
+  afterEach(() => { vi.unstubAllGlobals() })
+
+  it('no hace nada si el entorno no soporta EventSource', () => {
+    vi.stubGlobal('EventSource', undefined)
+    const unsubscribe = launchService.subscribeEvents({ onSync: vi.fn() })
+    expect(() => unsubscribe()).not.toThrow()
+  })
+
+  it('despacha los eventos sync y cierra la conexión', () => {
+    const listeners: Record<string, (e: { data: string }) => void> = {}
+    const close = vi.fn()
+    vi.stubGlobal('EventSource', vi.fn().mockImplementation(() => ({
+      addEventListener: (type: string, fn: (e: { data: string }) => void) => { listeners[type] = fn },
+      close,
+    })))
+
+    const onSync = vi.fn()
+    const unsubscribe = launchService.subscribeEvents({ onSync })
+    listeners.sync({ data: '{"generation":7,"full_reload":false,"updated":2}' })
+    expect(onSync).toHaveBeenCalledWith({ generation: 7, full_reload: false, updated: 2 })
+
+    unsubscribe()
+    expect(close).toHaveBeenCalled()
+  })
+})
@@ -1,5 +1,7 @@
 import axios from 'axios'
-import type { Launch, LaunchStats } from '@/types/launch'
+import type {
+  DictionaryColumn, Launch, LaunchChanges, LaunchColumns, LaunchStats, LaunchStatusEvent, SyncEvent,
+} from '@/types/launch'
 
 const BASE_URL = import.meta.env.VITE_API_BASE_URL || '/api/v1'
 
@@ -9,13 +11,71 @@ const api = axios.create({
   headers: { 'Content-Type': 'application/json' },
 })
 
+/** Lista por columnas del backend; se pide con `Accept` y se acepta JSON de siempre */
+export const COLUMNS_MEDIA_TYPE = 'application/vnd.spacex.columns+json'
+
+/** Reconstruye los lanzamientos de una respuesta por columnas */
+export function decodeColumns(payload: LaunchColumns): Launch[] {
+  const fields = Object.keys(payload.columns) as (keyof Launch)[]
+  const columns = fields.map((field) => {
+    const column = payload.columns[field]
+    if (Array.isArray(column)) return column
+    const { values, codes } = column as DictionaryColumn<unknown>
+    return codes.map((code) => values[code])
+  })
+  const launches: Launch[] = new Array(payload.count)
+  for (let row = 0; row < payload.count; row++) {
+    const launch: Record<string, unknown> = {}
+    for (let f = 0; f < fields.length; f++) launch[fields[f]] = columns[f][row]
+    launches[row] = launch as unknown as Launch
+  }
+  return launches
+}
+
 export const launchService = {
   /** Obtiene todos los lanzamientos desde el backend/API Gateway */
   async getAllLaunches(): Promise<Launch[]> {
-    const { data } = await api.get<Launch[]>('/launches')
+    const { data } = await api.get<Launch[] | LaunchColumns>('/launches', {
+      headers: { Accept: `${COLUMNS_MEDIA_TYPE}, application/json;q=0.9` },
+    })
+    return Array.isArray(data) ? data : decodeColumns(data)
+  },
+
+  /** Próximos lanzamientos por fecha ascendente (vista precalculada en cada sync) */
+  async getNextLaunches(limit = 10): Promise<Launch[]> {
+    const { data } = await api.get<Launch[]>('/launches/next', { params: { limit } })
     return data
   },
 
+  /** Últimos lanzamientos completados, el más reciente primero (vista precalculada) */
+  async getLatestLaunches(limit = 10): Promise<Launch[]> {
+    const { data } = await api.get<Launch[]>('/launches/latest', { params: { limit } })
+    return data
+  },
+
+  /** Lanzamientos insertados o actualizados desde la generación `since` (0 = ninguna) */
+  async getChanges(since: number): Promise<LaunchChanges> {
+    const { data } = await api.get<LaunchChanges>('/launches/changes', { params: { since } })
+    return data
+  },
+
+  /**
+   * Se suscribe al canal SSE del backend. El navegador reconecta solo y
+   * reanuda con `Last-Event-ID`. Retorna la función que cierra la conexión.
+   */
+  subscribeEvents(handlers: {
+    onSync?: (event: SyncEvent) => void
+    onLaunchStatus?: (event: LaunchStatusEvent) => void
+    onReset?: () => void
+  }): () => void {
+    if (typeof EventSource === 'undefined') return () => {}
+    const source = new EventSource(`${BASE_URL}/events`)
+    source.addEventListener('sync', (e) => handlers.onSync?.(JSON.parse((e as MessageEvent).data)))
+    source.addEventListener('launch_status', (e) => handlers.onLaunchStatus?.(JSON.parse((e as MessageEvent).data)))
+    source.addEventListener('reset', () => handlers.onReset?.())
+    return () => source.close()
+  },
+
   /** Invoca la Lambda manualmente para refrescar los datos */
   async triggerSync(): Promise<{ total_fetched: number; inserted: number; updated: number }> {
     const { data } = await api.post('/trigger')
@@ -17,6 +17,47 @@ export interface Launch {
   patch_large: string
 }
 
+/** Columna codificada por diccionario: el valor de la fila i es `values[codes[i]]` */
+export interface DictionaryColumn<T = string> {
+  values: T[]
+  codes: number[]
+}
+
+/** Respuesta de GET /launches?format=columns (`application/vnd.spacex.columns+json`) */
+export interface LaunchColumns {
+  format: 'columns'
+  count: number
+  columns: { [K in keyof Launch]: Launch[K][] | DictionaryColumn<Launch[K]> }
+}
+
+/** Respuesta de GET /launches/changes */
+export interface LaunchChanges {
+  generation: number | null
+  since: number
+  full_reload: boolean
+  launches: Launch[]
+}
+
+/** Evento `sync` de GET /events: terminó una sync y hay una generación nueva */
+export interface SyncEvent {
+  generation: number
+  full_reload: boolean
+  total_fetched?: number
+  inserted?: number
+  updated?: number
+  unchanged?: number
+  errors?: number
+}
+
+/** Evento `launch_status` de GET /events */
+export interface LaunchStatusEvent {
+  generation: number
+  launch_id: string
+  mission_name: string
+  previous: LaunchStatus
+  status: LaunchStatus
+}
+
 export interface LaunchFilters {
   status: LaunchStatus | 'all'
   search: string
@@ -0,0 +1,52 @@
+import { describe, it, expect } from 'vitest'
+import { mergeLaunches } from './mergeLaunches'
+import type { Launch } from '@/types/launch'
+
+// ── Fixtures ──────────────────────────────────────────────────────────────────
+
+const makeLaunch = (overrides: Partial<Launch> = {}): Launch => ({
+  launch_id:    'id-001',
+  mission_name: 'Default Mission',
+  rocket_name:  'Falcon 9',
+  launch_date:  '2024-06-15T10:00:00.000Z',
+  status:       'success',
+  launchpad:    'KSC LC-39A',
+  flight_number:'1',
+  details:      '',
+  payloads:     [],
+  webcast_url:  '',
+  article_url:  '',
+  wikipedia_url:'',
+  patch_small:  '',
+  patch_large:  '',
+  ...overrides,
+})
+
+const CURRENT: Launch[] = [
+  makeLaunch({ launch_id: '1', status: 'upcoming', launch_date: '2026-05-01T00:00:00.000Z' }),
+  makeLaunch({ launch_id: '2', status: 'success',  launch_date: '2024-03-01T00:00:00.000Z' }),
+]
+
+// ── mergeLaunches ─────────────────────────────────────────────────────────────
+
+describe('mergeLaunches', () => {
+  it('retorna la misma lista si no hay cambios', () => {
+    expect(mergeLaunches(CURRENT, [])).toBe(CURRENT)
+  })
+
+  it('reemplaza los lanzamientos actualizados por launch_id', () => {
+    const result = mergeLaunches(CURRENT, [makeLaunch({ launch_id: '1', status: 'success', launch_date: '2026-05-01T00:00:00.000Z' })])
+    expect(result).toHaveLength(2)
+    expect(result.find((l) => l.launch_id === '1')?.status).toBe('success')
+  })
+
+  it('agrega los nuevos y mantiene el orden por fecha descendente', () => {
+    const result = mergeLaunches(CURRENT, [makeLaunch({ launch_id: '3', launch_date: '2025-01-01T00:00:00.000Z' })])
+    expect(result.map((l) => l.launch_id)).toEqual(['1', '3', '2'])
+  })
+
+  it('no modifica la lista original', () => {
+    mergeLaunches(CURRENT, [makeLaunch({ launch_id: '3' })])
+    expect(CURRENT).toHaveLength(2)
+  })
+})
@@ -0,0 +1,19 @@
+import type { Launch } from '@/types/launch'
+
+/**
+ * Aplica un delta de lanzamientos (insertados o actualizados) sobre la lista
+ * actual, reemplazando por `launch_id`. Función pura: retorna una lista nueva
+ * ordenada por fecha descendente.
+ */
+export function mergeLaunches(current: Launch[], changed: Launch[]): Launch[] {
+  if (changed.length === 0) return current
+
+  const byId = new Map(current.map((l) => [l.launch_id, l]))
+  for (const launch of changed) {
+    byId.set(launch.launch_id, launch)
+  }
+
+  return [...byId.values()].sort(
+    (a, b) => new Date(b.launch_date).getTime() - new Date(a.launch_date).getTime(),
+  )
+}